@@ -8,6 +8,8 @@ def pytest_addoption(parser):
                     help="run verilog translation, " )
   parser.addoption( "--dump-vcd", action="store_true",
                     help="dump vcd for each test" )
+  parser.addoption( "--soak-nmsgs", action="store", default=0, type=int,
+                    help="number of random messages for soak tests, 0 skips them" )
 
 @pytest.fixture
 def test_verilog(request):
@@ -24,6 +26,23 @@ def dump_vcd(request):
   else:
     return ''
 
+@pytest.fixture
+def soak_nmsgs(request):
+  """Number of messages to stream through the DUT in soak tests."""
+  return request.config.option.soak_nmsgs
+
+@pytest.fixture(scope="session", autouse=True)
+def translation_cache(tmpdir_factory):
+  """Keep the translation cache of the tests in a temporary directory."""
+  import os
+  old = os.environ.get( "PYMTL_TRANSLATION_CACHE" )
+  os.environ["PYMTL_TRANSLATION_CACHE"] = str( tmpdir_factory.mktemp( "translation" ) )
+  yield
+  if old is None:
+    del os.environ["PYMTL_TRANSLATION_CACHE"]
+  else:
+    os.environ["PYMTL_TRANSLATION_CACHE"] = old
+
 def pytest_configure(config):
   import sys
   sys._called_from_test = True
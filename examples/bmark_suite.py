@@ -0,0 +1,358 @@
+"""
+==========================================================================
+bmark_suite.py
+==========================================================================
+Benchmark suite for the processor and accelerator examples. Every
+configuration runs one ubmark on one processor (and optionally one
+accelerator), possibly translated and imported, and records
+
+ - cycles and insts : simulated cycles and committed instructions
+ - cpi              : cycles per instruction
+ - wall_time        : host seconds spent ticking the simulator, which
+                      excludes elaboration, translation, and loading
+ - cycles_per_sec   : simulated cycles per host second
+
+A run of the suite is appended as one entry to a JSON history file
+together with a timestamp, the host, and the git revision. Results can be
+compared against a baseline, which is either the previous entry of the
+history or another history file. A configuration regresses if it takes
+more simulated cycles than the baseline (beyond cycles_tol), if its
+simulation speed dropped by more than speed_tol, or if it failed
+verification. A configuration that raises an exception, e.g. in
+translation, is recorded as failed together with the error, and the
+remaining configurations still run.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import traceback
+
+#-------------------------------------------------------------------------
+# Configurations
+#-------------------------------------------------------------------------
+# Processor and accelerator implementations are given by name and only
+# imported when a configuration is run, so listing the suite is cheap.
+
+proc_impls = {
+  "fl"     : ( "examples.ex03_proc.ProcFL",          "ProcFL"           ),
+  "cl"     : ( "examples.ex03_proc.ProcCL",          "ProcCL"           ),
+  "cl-dual": ( "examples.ex03_proc.ProcDualIssueCL", "ProcDualIssueCL"  ),
+  "rtl"    : ( "examples.ex03_proc.ProcRTL",         "ProcRTL"          ),
+  "rtl-xm" : ( "examples.ex03_proc.ProcPipeRTL",     "ProcPipeRTL_1f0m" ),
+  "rtl-2f" : ( "examples.ex03_proc.ProcPipeRTL",     "ProcPipeRTL_2f1m" ),
+  "rtl-2m" : ( "examples.ex03_proc.ProcPipeRTL",     "ProcPipeRTL_1f2m" ),
+}
+
+xcel_impls = {
+  "null"     : ( "examples.ex03_proc.NullXcel",             "NullXcelRTL"          ),
+  "fl"       : ( "examples.ex04_xcel.ChecksumXcelFL",       "ChecksumXcelFL"       ),
+  "cl"       : ( "examples.ex04_xcel.ChecksumXcelCL",       "ChecksumXcelCL"       ),
+  "rtl"      : ( "examples.ex04_xcel.ChecksumXcelRTL",      "ChecksumXcelRTL"      ),
+  "fl-queue" : ( "examples.ex04_xcel.ChecksumXcelQueueFL",  "ChecksumXcelQueueFL"  ),
+  "cl-queue" : ( "examples.ex04_xcel.ChecksumXcelQueueCL",  "ChecksumXcelQueueCL"  ),
+  "rtl-queue": ( "examples.ex04_xcel.ChecksumXcelQueueRTL", "ChecksumXcelQueueRTL" ),
+  "fl-wide"  : ( "examples.ex04_xcel.ChecksumXcelQueueFL",  "ChecksumXcelQueueFL"  ),
+  "cl-wide"  : ( "examples.ex04_xcel.ChecksumXcelQueueCL",  "ChecksumXcelQueueCL"  ),
+  "rtl-wide" : ( "examples.ex04_xcel.ChecksumXcelQueueRTL", "ChecksumXcelQueueRTL" ),
+  "fl-multi" : ( "examples.ex04_xcel.ChecksumXcelFL",       "ChecksumXcelFL"       ),
+  "cl-multi" : ( "examples.ex04_xcel.ChecksumXcelCL",       "ChecksumXcelCL"       ),
+  "rtl-multi": ( "examples.ex04_xcel.ChecksumXcelRTL",      "ChecksumXcelRTL"      ),
+  "fl-mul"   : ( "examples.ex04_xcel.MulXcelFL",            "MulXcelFL"            ),
+  "cl-mul"   : ( "examples.ex04_xcel.MulXcelCL",            "MulXcelCL"            ),
+  "rtl-mul"  : ( "examples.ex04_xcel.MulXcelRTL",           "MulXcelRTL"           ),
+}
+
+# The wide accelerators are the queued ones on a 128-bit interface
+
+def xcel_nbits( xcel ):
+  return 128 if xcel.endswith( "-wide" ) else 32
+
+# The multi accelerators are four copies behind an xcel router
+
+def xcel_nxcels( xcel ):
+  return 4 if xcel.endswith( "-multi" ) else 1
+
+bmarks = {
+  "vvadd-unopt"     : ( "examples.ex03_proc.ubmark.proc_ubmark_vvadd_unopt",      "ubmark_vvadd_unopt"      ),
+  "vvadd-opt"       : ( "examples.ex03_proc.ubmark.proc_ubmark_vvadd_opt",        "ubmark_vvadd_opt"        ),
+  "cksum"           : ( "examples.ex03_proc.ubmark.proc_ubmark_cksum_roll",       "ubmark_cksum_roll"       ),
+  "cksum-xcel"      : ( "examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_roll",  "ubmark_cksum_xcel_roll"  ),
+  "cksum-xcel-blk"  : ( "examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_blk",   "ubmark_cksum_xcel_blk"   ),
+  "cksum-xcel-wide" : ( "examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_wide",  "ubmark_cksum_xcel_wide"  ),
+  "cksum-xcel-multi": ( "examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_multi", "ubmark_cksum_xcel_multi" ),
+  "memcpy"          : ( "examples.ex03_proc.ubmark.proc_ubmark_memcpy",           "ubmark_memcpy"           ),
+  "stride"          : ( "examples.ex03_proc.ubmark.proc_ubmark_stride",           "ubmark_stride"           ),
+  "reduce"          : ( "examples.ex03_proc.ubmark.proc_ubmark_reduce",           "ubmark_reduce"           ),
+  "ptrchase"        : ( "examples.ex03_proc.ubmark.proc_ubmark_ptrchase",         "ubmark_ptrchase"         ),
+  "bsearch"         : ( "examples.ex03_proc.ubmark.proc_ubmark_bsearch",          "ubmark_bsearch"          ),
+  "mmult"           : ( "examples.ex03_proc.ubmark.proc_ubmark_mmult",            "ubmark_mmult"            ),
+  "mmult-xcel"      : ( "examples.ex04_xcel.ubmark.proc_ubmark_mmult_xcel",       "ubmark_mmult_xcel"       ),
+}
+
+def _import( path_and_name ):
+  path, name = path_and_name
+  return getattr( __import__( path, fromlist=[ name ] ), name )
+
+# A configuration with a size runs on a generated dataset of that size
+# instead of the default one of the ubmark.
+
+class BmarkConfig( object ):
+
+  def __init__( self, bmark, proc, xcel=None, translate=False,
+                size=None, seed=0 ):
+    self.bmark     = bmark
+    self.proc      = proc
+    self.xcel      = xcel
+    self.translate = translate
+    self.size      = size
+    self.seed      = seed
+
+  @property
+  def name( self ):
+    name = "{}/{}".format( self.bmark, self.proc )
+    if self.xcel is not None:
+      name += "+{}".format( self.xcel )
+    if self.translate:
+      name += "/translate"
+    if self.size is not None:
+      name += "@{}".format( self.size )
+    return name
+
+#-------------------------------------------------------------------------
+# gen_bmark_configs
+#-------------------------------------------------------------------------
+# Every ubmark on every processor, plus the checksum ubmark with every
+# accelerator, the block checksum ubmarks with the queued, wide, and
+# multiple accelerators, and the matrix multiplication ubmark with and
+# without the multiply accelerator.
+# The RTL processors with other pipeline depths run every ubmark so that
+# their CPI can be compared with the one of rtl.
+# Only RTL models can be translated.
+
+def gen_bmark_configs( translate=True ):
+  configs = []
+
+  for bmark in [ "vvadd-unopt", "vvadd-opt", "cksum", "memcpy", "stride",
+                 "reduce", "ptrchase", "bsearch", "mmult" ]:
+    for proc in [ "fl", "cl", "cl-dual", "rtl", "rtl-xm", "rtl-2f", "rtl-2m" ]:
+      configs.append( BmarkConfig( bmark, proc ) )
+    if translate:
+      configs.append( BmarkConfig( bmark, "rtl", translate=True ) )
+
+  # The accelerator is only wrapped with single-issue processors
+
+  for proc in [ "fl", "cl", "rtl" ]:
+    configs.append( BmarkConfig( "cksum", proc, "null" ) )
+    for xcel in [ "fl", "cl", "rtl" ]:
+      configs.append( BmarkConfig( "cksum-xcel", proc, xcel ) )
+    for xcel in [ "fl-queue", "cl-queue", "rtl-queue" ]:
+      configs.append( BmarkConfig( "cksum-xcel-blk", proc, xcel ) )
+    for xcel in [ "fl-wide", "cl-wide", "rtl-wide" ]:
+      configs.append( BmarkConfig( "cksum-xcel-wide", proc, xcel ) )
+    for xcel in [ "fl-multi", "cl-multi", "rtl-multi" ]:
+      configs.append( BmarkConfig( "cksum-xcel-multi", proc, xcel ) )
+    configs.append( BmarkConfig( "mmult", proc, "null" ) )
+    for xcel in [ "fl-mul", "cl-mul", "rtl-mul" ]:
+      configs.append( BmarkConfig( "mmult-xcel", proc, xcel ) )
+
+  if translate:
+    configs.append( BmarkConfig( "cksum-xcel", "rtl", "rtl", translate=True ) )
+    configs.append( BmarkConfig( "cksum-xcel-blk", "rtl", "rtl-queue", translate=True ) )
+    configs.append( BmarkConfig( "cksum-xcel-wide", "rtl", "rtl-wide", translate=True ) )
+    configs.append( BmarkConfig( "cksum-xcel-multi", "rtl", "rtl-multi", translate=True ) )
+    configs.append( BmarkConfig( "mmult-xcel", "rtl", "rtl-mul", translate=True ) )
+
+  return configs
+
+#-------------------------------------------------------------------------
+# run_bmark_config
+#-------------------------------------------------------------------------
+
+def run_bmark_config( config, limit=1000000 ):
+  from pymtl3.passes import DynamicSim
+
+  bmark     = _import( bmarks[ config.bmark ] )
+  proc_cls  = _import( proc_impls[ config.proc ] )
+  if config.size is not None:
+    bmark = bmark.scaled( config.size, config.seed )
+  mem_image = bmark.gen_mem_image()
+
+  if config.xcel is None:
+    from examples.ex03_proc.test.harness import TestHarness
+    model = TestHarness( proc_cls )
+    dut   = lambda m: m.proc
+  else:
+    from examples.ex04_xcel.test.harness import TestHarness
+    model = TestHarness( proc_cls, _import( xcel_impls[ config.xcel ] ),
+                         False, 0, 0, 0, 1, xcel_nbits( config.xcel ),
+                         xcel_nxcels( config.xcel ) )
+    dut   = lambda m: m.dut
+
+  if config.translate:
+    from examples.translation_cache import cached_translate, cached_import
+    model.elaborate()
+    dut( model ).yosys_translate = True
+    dut( model ).yosys_import    = True
+    cached_translate( model, verbose=False )
+    model = cached_import( model )
+
+  model.apply( DynamicSim )
+  model.load( mem_image )
+  model.sim_reset()
+
+  ncycles = 0
+  ninsts  = 0
+
+  start = time.time()
+  while not model.done() and ncycles < limit:
+    model.tick()
+    ninsts  += int( model.commit_inst )
+    ncycles += 1
+  wall_time = time.time() - start
+
+  passed = ncycles < limit and bool( bmark.verify( model.mem.mem.mem ) )
+
+  return {
+    "name"          : config.name,
+    "passed"        : passed,
+    "cycles"        : ncycles,
+    "insts"         : ninsts,
+    "cpi"           : ncycles / float( ninsts ) if ninsts else None,
+    "wall_time"     : wall_time,
+    "cycles_per_sec": ncycles / wall_time if wall_time > 0 else None,
+  }
+
+#-------------------------------------------------------------------------
+# try_bmark_config
+#-------------------------------------------------------------------------
+# Like run_bmark_config, but an exception only fails this configuration.
+# The result then carries the last line of the traceback as error.
+
+def try_bmark_config( config, limit=1000000, verbose=False ):
+  try:
+    return run_bmark_config( config, limit )
+  except Exception:
+    if verbose:
+      traceback.print_exc()
+    return {
+      "name"          : config.name,
+      "passed"        : False,
+      "error"         : traceback.format_exc().strip().splitlines()[-1],
+      "cycles"        : 0,
+      "insts"         : 0,
+      "cpi"           : None,
+      "wall_time"     : 0.0,
+      "cycles_per_sec": None,
+    }
+
+#-------------------------------------------------------------------------
+# History
+#-------------------------------------------------------------------------
+
+def get_git_revision():
+  try:
+    with open( os.devnull, "w" ) as devnull:
+      return subprocess.check_output(
+        [ "git", "rev-parse", "--short", "HEAD" ], stderr=devnull,
+        cwd=os.path.dirname( os.path.abspath( __file__ ) ) ).decode( "utf-8" ).strip()
+  except ( OSError, subprocess.CalledProcessError ):
+    return None
+
+def make_history_entry( results ):
+  return {
+    "timestamp": time.strftime( "%Y-%m-%dT%H:%M:%S" ),
+    "host"     : platform.node(),
+    "python"   : platform.python_version(),
+    "revision" : get_git_revision(),
+    "results"  : results,
+  }
+
+def load_history( path ):
+  if not os.path.exists( path ):
+    return []
+  with open( path ) as f:
+    return json.load( f )
+
+# The new history is written to a temporary file next to path and renamed
+# over it, so an interrupted run leaves the old history intact. A history
+# that cannot be parsed is never overwritten.
+
+def append_history( path, entry ):
+  history = load_history( path )
+  history.append( entry )
+
+  fd, tmp_path = tempfile.mkstemp( prefix=".tmp-",
+                                   dir=os.path.dirname( os.path.abspath( path ) ) )
+  try:
+    with os.fdopen( fd, "w" ) as f:
+      json.dump( history, f, indent=2, sort_keys=True )
+    os.rename( tmp_path, path )
+  finally:
+    if os.path.exists( tmp_path ):
+      os.remove( tmp_path )
+
+  return history
+
+#-------------------------------------------------------------------------
+# find_regressions
+#-------------------------------------------------------------------------
+# Compare results against the results of a baseline entry. Returns a
+# list of ( name, reason ) pairs. Configurations missing from the
+# baseline are never flagged.
+
+def find_regressions( results, baseline, cycles_tol=0.0, speed_tol=0.2 ):
+  base = { x["name"]: x for x in baseline }
+  regressions = []
+
+  for result in results:
+    name = result["name"]
+
+    if not result["passed"]:
+      regressions.append( ( name, result.get( "error", "failed" ) ) )
+      continue
+
+    if name not in base or not base[ name ]["passed"]:
+      continue
+    ref = base[ name ]
+
+    if result["cycles"] > ref["cycles"] * ( 1 + cycles_tol ):
+      regressions.append( ( name, "cycles {} -> {}".format(
+                            ref["cycles"], result["cycles"] ) ) )
+
+    if result["cycles_per_sec"] and ref["cycles_per_sec"] and \
+       result["cycles_per_sec"] < ref["cycles_per_sec"] * ( 1 - speed_tol ):
+      regressions.append( ( name, "cycles/sec {:.0f} -> {:.0f}".format(
+                            ref["cycles_per_sec"], result["cycles_per_sec"] ) ) )
+
+  return regressions
+
+#-------------------------------------------------------------------------
+# print_results
+#-------------------------------------------------------------------------
+
+def print_results( results, regressions=() ):
+  flagged = set( [ name for name, _ in regressions ] )
+
+  print( "  {:<32} {:>9} {:>9} {:>6} {:>9} {:>11}".format(
+         "config", "cycles", "insts", "CPI", "wall(s)", "cycles/sec" ) )
+
+  for x in results:
+    print( "{} {:<32} {:>9} {:>9} {:>6} {:>9.2f} {:>11}".format(
+           "!" if x["name"] in flagged else " ", x["name"], x["cycles"], x["insts"],
+           "-" if x["cpi"] is None else "{:.2f}".format( x["cpi"] ),
+           x["wall_time"],
+           "-" if x["cycles_per_sec"] is None else "{:.0f}".format( x["cycles_per_sec"] ) ) )
+
+  if regressions:
+    print()
+    print( "  Regressions" )
+    for name, reason in regressions:
+      print( "  {:<32} {}".format( name, reason ) )
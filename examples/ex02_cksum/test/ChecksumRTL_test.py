@@ -9,6 +9,11 @@ Author : Yanghui Ou
 """
 from __future__ import absolute_import, division, print_function
 
+import random
+import struct
+
+import pytest
+
 from pymtl3 import *
 from pymtl3.passes.yosys import TranslationPass, ImportPass
 from pymtl3.stdlib.test import TestSinkCL, TestSrcCL
@@ -16,6 +21,7 @@ from pymtl3.stdlib.test import TestSinkCL, TestSrcCL
 from ..ChecksumFL import checksum
 from ..ChecksumRTL import ChecksumRTL, StepUnit
 from ..utils import b128_to_words, words_to_b128
+from .stream_srcsink import StreamSinkRTL, StreamSrcRTL
 
 #-------------------------------------------------------------------------
 # Unit test the step unit
@@ -84,6 +90,46 @@ class ChecksumRTL_Tests( BaseTests ):
   def cksum_func( s, words ):
     return checksum_rtl( words )
 
+#-------------------------------------------------------------------------
+# Streaming test harness
+#-------------------------------------------------------------------------
+# StreamTestHarness takes packed buffers instead of lists of Bits, see
+# stream_srcsink.py. gen_stream generates nmsgs random messages together
+# with the expected results.
+
+class StreamTestHarness( Component ):
+  def construct( s, DutType, src_msgs, sink_msgs ):
+
+    s.src  = StreamSrcRTL( src_msgs )
+    s.dut  = DutType()
+    s.sink = StreamSinkRTL( sink_msgs )
+
+    s.connect_pairs(
+      s.src.send, s.dut.recv,
+      s.dut.send, s.sink.recv,
+    )
+
+  def done( s ):
+    return s.src.done() and s.sink.done()
+
+  def line_trace( s ):
+    return "{}>{}>{}".format(
+      s.src.line_trace(), s.dut.line_trace(), s.sink.line_trace()
+    )
+
+def gen_stream( nmsgs, seed=0xdeadbeef ):
+  rng       = random.Random( seed )
+  src_msgs  = bytearray( nmsgs*16 )
+  sink_msgs = bytearray( nmsgs*4  )
+
+  for i in range( nmsgs ):
+    bits  = Bits128( rng.getrandbits( 128 ) )
+    value = int( bits )
+    struct.pack_into( "<QQ", src_msgs, i*16, value & ( (1 << 64) - 1 ), value >> 64 )
+    struct.pack_into( "<I", sink_msgs, i*4, int( checksum( b128_to_words( bits ) ) ) )
+
+  return src_msgs, sink_msgs
+
 #-------------------------------------------------------------------------
 # Reuse src/sink based tests from CL test suite to test simulation
 #-------------------------------------------------------------------------
@@ -142,3 +188,63 @@ class ChecksumRTLSrcSink_Tests( BaseSrcSinkTests ):
 
     # Check timeout
     assert ncycles < max_cycles
+
+  # Same as run_sim but without the line trace, for long streams
+
+  def run_stream( s, th, max_cycles ):
+    th.elaborate()
+    th.apply( SimulationPass )
+    ncycles = 0
+    th.sim_reset()
+
+    while not th.done() and ncycles < max_cycles:
+      th.tick()
+      ncycles += 1
+
+    assert ncycles < max_cycles
+
+  #-----------------------------------------------------------------------
+  # test_srcsink_stream
+  #-----------------------------------------------------------------------
+
+  def test_srcsink_stream( s ):
+    src_msgs, sink_msgs = gen_stream( 500 )
+
+    th = StreamTestHarness( s.DutType, src_msgs, sink_msgs )
+    s.run_stream( th, 1000 )
+    th.sink.check()
+
+  #-----------------------------------------------------------------------
+  # test_srcsink_stream_mismatch
+  #-----------------------------------------------------------------------
+  # Corrupt some expected results and make sure the sink finds them
+
+  def test_srcsink_stream_mismatch( s ):
+    src_msgs, sink_msgs = gen_stream( 100 )
+    sink_msgs[ 7*4 ]  ^= 0x1
+    sink_msgs[ 42*4 ] ^= 0x1
+
+    th = StreamTestHarness( s.DutType, src_msgs, sink_msgs )
+    s.run_stream( th, 1000 )
+
+    assert [ x[0] for x in th.sink.mismatches() ] == [ 7, 42 ]
+    assert [ x[0] for x in th.sink.mismatches( limit=1 ) ] == [ 7 ]
+    with pytest.raises( AssertionError ):
+      th.sink.check()
+
+  #-----------------------------------------------------------------------
+  # test_srcsink_stream_soak
+  #-----------------------------------------------------------------------
+  # Only runs with --soak-nmsgs N
+
+  def test_srcsink_stream_soak( s, soak_nmsgs ):
+    if not soak_nmsgs:
+      pytest.skip( "use --soak-nmsgs to run the soak test" )
+
+    seed = random.getrandbits( 32 )
+    print( "soak test seed = {:#x}".format( seed ) )
+    src_msgs, sink_msgs = gen_stream( soak_nmsgs, seed )
+
+    th = StreamTestHarness( s.DutType, src_msgs, sink_msgs )
+    s.run_stream( th, 2*soak_nmsgs + 100 )
+    th.sink.check()
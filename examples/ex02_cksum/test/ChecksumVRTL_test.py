@@ -10,7 +10,7 @@ Author : Yanghui Ou
 from __future__ import absolute_import, division, print_function
 
 from pymtl3 import *
-from pymtl3.passes.yosys import TranslationPass, ImportPass
+from examples.translation_cache import cached_translate, cached_import
 from pymtl3.stdlib.test import TestSinkCL, TestSrcCL
 
 from ..ChecksumFL import checksum
@@ -37,8 +37,8 @@ def checksum_vrtl( words ):
   # backend
   dut.yosys_translate = True
   dut.yosys_import = True
-  dut.apply( TranslationPass() )
-  dut = ImportPass()( dut )
+  cached_translate( dut )
+  dut = cached_import( dut )
 
   # Create a simulator
   dut.elaborate()
@@ -0,0 +1,166 @@
+"""
+==========================================================================
+stream_srcsink.py
+==========================================================================
+Streaming test source and sink with RTL interfaces for pushing a large
+number of messages through the checksum unit.
+
+TestSrcCL/TestSinkCL keep their messages as lists of Bits objects, go
+through a CL/RTL adapter, and compare every result as it arrives. Here
+the messages stay packed in a buffer instead: the source takes any
+object that supports the buffer protocol (bytes, bytearray, memoryview,
+a NumPy array, ...) holding 16 bytes per message, and the sink takes a
+buffer of 4-byte expected results. Both are little-endian, so a NumPy
+array of shape (N,4) with dtype "<u4" holds one message per row with
+the least significant word first.
+
+The sink only records what it receives. Comparing against the expected
+results happens in check() or mismatches() once the run is over, which
+compares the whole stream in one go and only unpacks the chunks that
+actually differ.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import struct
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import RecvIfcRTL, SendIfcRTL
+
+#-------------------------------------------------------------------------
+# Helpers
+#-------------------------------------------------------------------------
+
+def _nbytes( buf ):
+  view   = memoryview( buf )
+  nbytes = view.itemsize
+  for x in view.shape:
+    nbytes *= x
+  return nbytes
+
+#-------------------------------------------------------------------------
+# StreamSrcRTL
+#-------------------------------------------------------------------------
+
+class StreamSrcRTL( Component ):
+
+  def construct( s, msgs ):
+
+    s.send = SendIfcRTL( Bits128 )
+
+    assert _nbytes( msgs ) % 16 == 0
+
+    s.msgs  = msgs
+    s.nmsgs = _nbytes( msgs ) // 16
+    s.idx   = 0
+
+    @s.update
+    def up_src_send():
+      if not s.reset and s.send.rdy and s.idx < s.nmsgs:
+        lo, hi = struct.unpack_from( "<QQ", s.msgs, s.idx*16 )
+        s.send.en  = b1(1)
+        s.send.msg = Bits128( ( hi << 64 ) | lo )
+        s.idx += 1
+      else:
+        s.send.en  = b1(0)
+
+  def done( s ):
+    return s.idx >= s.nmsgs
+
+  def line_trace( s ):
+    return "{}".format( s.send )
+
+#-------------------------------------------------------------------------
+# StreamSinkRTL
+#-------------------------------------------------------------------------
+
+class StreamSinkRTL( Component ):
+
+  def construct( s, expected ):
+
+    s.recv = RecvIfcRTL( Bits32 )
+
+    assert _nbytes( expected ) % 4 == 0
+
+    s.expected = memoryview( expected ).tobytes()
+    s.nmsgs    = len( s.expected ) // 4
+    s.received = bytearray()
+
+    @s.update
+    def up_sink_rdy():
+      s.recv.rdy = b1(1)
+
+    @s.update
+    def up_sink_recv():
+      if not s.reset and s.recv.en:
+        s.received.extend( struct.pack( "<I", int( s.recv.msg ) ) )
+
+  def num_received( s ):
+    return len( s.received ) // 4
+
+  def done( s ):
+    return s.num_received() >= s.nmsgs
+
+  #-----------------------------------------------------------------------
+  # mismatches
+  #-----------------------------------------------------------------------
+  # Returns up to limit ( index, expected, received ) tuples, where a
+  # missing message on either side shows up as None.
+
+  def mismatches( s, limit=None, chunk_nmsgs=4096 ):
+
+    received = bytes( s.received )
+
+    if received == s.expected:
+      return []
+
+    ret = []
+    nmsgs = min( len( received ), len( s.expected ) ) // 4
+
+    for base in range( 0, nmsgs, chunk_nmsgs ):
+      n   = min( chunk_nmsgs, nmsgs - base )
+      lo  = base * 4
+      hi  = lo + n * 4
+      if received[lo:hi] == s.expected[lo:hi]:
+        continue
+
+      fmt = "<{}I".format( n )
+      for i, ( ref, msg ) in enumerate( zip( struct.unpack( fmt, s.expected[lo:hi] ),
+                                             struct.unpack( fmt, received[lo:hi] ) ) ):
+        if ref != msg:
+          ret.append( ( base + i, ref, msg ) )
+          if limit is not None and len( ret ) >= limit:
+            return ret
+
+    # Messages that were only expected or only received
+
+    for i in range( nmsgs, max( len( received ), len( s.expected ) ) // 4 ):
+      if limit is not None and len( ret ) >= limit:
+        break
+      ref = s.expected[i*4:i*4+4]
+      msg = received  [i*4:i*4+4]
+      ret.append( ( i, struct.unpack( "<I", ref )[0] if ref else None,
+                       struct.unpack( "<I", msg )[0] if msg else None ) )
+
+    return ret
+
+  #-----------------------------------------------------------------------
+  # check
+  #-----------------------------------------------------------------------
+
+  def check( s, limit=10 ):
+
+    def fmt( x ):
+      return "-" if x is None else "{:08x}".format( x )
+
+    errors = s.mismatches( limit )
+    if errors:
+      raise AssertionError( "Stream sink received {} messages, expected {}. "
+        "First mismatches:\n{}".format( s.num_received(), s.nmsgs,
+        "\n".join( [ "  [{}] expected {} received {}".format( i, fmt(ref), fmt(msg) )
+                     for i, ref, msg in errors ] ) ) )
+
+  def line_trace( s ):
+    return "{}".format( s.recv )
@@ -13,6 +13,7 @@ from pymtl3 import *
 from pymtl3.stdlib.ifcs import RecvIfcRTL, SendIfcRTL
 from pymtl3.stdlib.rtl import RegRst
 
+from .perf_counters import counter_hazard_base, counter_nhazards
 from .TinyRV0InstRTL import *
 
 # State Constants
@@ -147,3 +148,126 @@ class AluRTL( Component ):
   def line_trace( s ):
     op_dict = { 0:" +", 1:"c0", 2:"c1", 3:"<< ", 4:" &"}
     return "[{}({} ){} >>> {}]".format( s.in0, op_dict[int(s.fn)], s.in1, s.out )
+
+#-------------------------------------------------------------------------
+# PerfCounters
+#-------------------------------------------------------------------------
+# A bank of 32 performance counters. The counter map is the same as the
+# one used by the FL and CL processors (see perf_counters.py): cycles at
+# 0, committed instructions at 2, per-opcode counts at 3-13, stall
+# causes at 16-20, and the per-stage hazards of ProcCtrl at 21-31. The
+# counters are read combinationally through raddr. The whole bank is
+# also exposed on dump, counter i in bits [32*i,32*i+32), so that a
+# simulator can read all of them through a single port. Unlike raddr,
+# dump already includes the events of the current cycle, so an
+# instruction counts as soon as it commits, like in the FL and CL
+# processors.
+#
+# With hazards=False the hazard counters are not built at all, they read
+# 0 through both raddr and dump.
+
+class PerfCountersRTL( Component ):
+
+  def construct( s, hazards=True ):
+
+    s.commit_inst = InPort( Bits1 )
+    s.commit_type = InPort( Bits8 )
+
+    s.stall_imem  = InPort( Bits1 )
+    s.stall_dmem  = InPort( Bits1 )
+    s.stall_mngr  = InPort( Bits1 )
+    s.stall_xcel  = InPort( Bits1 )
+    s.squash      = InPort( Bits1 )
+    s.hazards     = InPort( mk_bits( counter_nhazards ) )
+
+    s.raddr       = InPort ( Bits5  )
+    s.rdata       = OutPort( Bits32 )
+
+    s.dump        = OutPort( mk_bits( 32*32 ) )
+
+    nregs    = 32 if hazards else counter_hazard_base
+    nhazards = counter_nhazards if hazards else 0
+
+    s.counters      = [ Wire( Bits32 ) for _ in range(nregs) ]
+    s.counters_next = [ Wire( Bits32 ) for _ in range(nregs) ]
+
+    for i in range(nregs):
+      s.connect( s.dump[i*32:(i+1)*32], s.counters_next[i] )
+
+    if not hazards:
+      zeros_lo   = nregs*32
+      zeros_hi   = 32*32
+      dump_zeros = mk_bits( zeros_hi - zeros_lo )( 0 )
+
+      @s.update
+      def comb_dump_zeros():
+        s.dump[zeros_lo:zeros_hi] = dump_zeros
+
+    # Map the committed instruction type to its counter
+
+    s.inst_val = Wire( Bits1 )
+    s.inst_idx = Wire( Bits5 )
+
+    @s.update
+    def comb_inst_idx():
+      s.inst_val = b1(1)
+      s.inst_idx = b5(0)
+
+      if   s.commit_type == NOP  : s.inst_idx = b5(3)
+      elif s.commit_type == LW   : s.inst_idx = b5(4)
+      elif s.commit_type == SW   : s.inst_idx = b5(5)
+      elif s.commit_type == SLL  : s.inst_idx = b5(6)
+      elif s.commit_type == SRL  : s.inst_idx = b5(7)
+      elif s.commit_type == ADD  : s.inst_idx = b5(8)
+      elif s.commit_type == ADDI : s.inst_idx = b5(9)
+      elif s.commit_type == AND  : s.inst_idx = b5(10)
+      elif s.commit_type == BNE  : s.inst_idx = b5(11)
+      elif s.commit_type == CSRR : s.inst_idx = b5(12)
+      elif s.commit_type == CSRRX: s.inst_idx = b5(12)
+      elif s.commit_type == CSRW : s.inst_idx = b5(13)
+      else:                        s.inst_val = b1(0)
+
+    # The counter values at the end of this cycle, including the events
+    # of this cycle. The registers latch them at the clock edge.
+
+    @s.update
+    def comb_counters_next():
+      for i in range(nregs):
+        s.counters_next[i] = s.counters[i]
+
+      s.counters_next[0] = s.counters[0] + b32(1)
+
+      if s.commit_inst:
+        s.counters_next[2] = s.counters[2] + b32(1)
+        if s.inst_val:
+          s.counters_next[s.inst_idx] = s.counters[s.inst_idx] + b32(1)
+
+      if s.stall_imem: s.counters_next[16] = s.counters[16] + b32(1)
+      if s.stall_dmem: s.counters_next[17] = s.counters[17] + b32(1)
+      if s.stall_mngr: s.counters_next[18] = s.counters[18] + b32(1)
+      if s.stall_xcel: s.counters_next[19] = s.counters[19] + b32(1)
+      if s.squash:     s.counters_next[20] = s.counters[20] + b32(1)
+
+      for i in range(nhazards):
+        if s.hazards[i]:
+          s.counters_next[21+i] = s.counters[21+i] + b32(1)
+
+    @s.update_on_edge
+    def up_counters():
+      if s.reset:
+        for i in range(nregs):
+          s.counters[i] = b32(0)
+      else:
+        for i in range(nregs):
+          s.counters[i] = s.counters_next[i]
+
+    if hazards:
+      @s.update
+      def comb_rdata():
+        s.rdata = s.counters[s.raddr]
+
+    else:
+      @s.update
+      def comb_rdata():
+        if s.raddr < b5(nregs): s.rdata = s.counters[s.raddr]
+        else:                   s.rdata = b32(0)
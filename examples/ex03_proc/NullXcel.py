@@ -19,7 +19,7 @@ class NullXcelRTL(Component):
 
   def construct( s, nbits=32 ):
 
-    dtype = mk_bits(32)
+    dtype = mk_bits(nbits)
     XcelMsgType_WRITE = XcelMsgType.WRITE
     xreq_class, xresp_class = mk_xcel_msg( 5,nbits )
 
@@ -20,6 +20,7 @@ from pymtl3.stdlib.ifcs.mem_ifcs import MemMasterIfcCL, MemMasterIfcFL
 from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcCL
 from pymtl3.stdlib.ifcs.XcelMsg import XcelMsgType, mk_xcel_msg
 
+from .perf_counters import PerfCounters, is_counter_csr
 from .tinyrv0_encoding import disassemble_inst, RegisterFile, TinyRV0Inst
 
 class DXM_W(Enum):
@@ -35,10 +36,15 @@ class PipelineStatus(Enum):
 
 class ProcCL( Component ):
 
-  def construct( s ):
+  # xcel_nbits is the data width of the accelerator interface. With a
+  # 128-bit interface csrw to 0x7A0-0x7BF sends R[rs1+3:rs1] at once,
+  # with the register numbers wrapping around like in ProcRTL.
+
+  def construct( s, xcel_nbits=32 ):
 
     memreq_cls, memresp_cls = mk_mem_msg( 8,32,32 )
-    xreq_class, xresp_class = mk_xcel_msg(5,32)
+    xreq_class, xresp_class = mk_xcel_msg(5,xcel_nbits)
+    XcelDataType = mk_bits( xcel_nbits )
 
     # Interface
 
@@ -69,6 +75,11 @@ class ProcCL( Component ):
     s.DXM_status = PipelineStatus.idle
     s.W_status   = PipelineStatus.idle
 
+    # Performance counters. Instructions are counted when DXM issues them
+    # since nop and bne never reach W with their name.
+
+    s.stats = PerfCounters()
+
     @s.update
     def F():
       s.F_status = PipelineStatus.idle
@@ -89,19 +100,28 @@ class ProcCL( Component ):
         s.pc += 4
       else:
         s.F_status = PipelineStatus.stall
+        if not s.imem.req.rdy():
+          s.stats.stall( "imem" )
 
     s.redirected_pc_DXM = -1
 
     s.raw_inst = b32(0)
+    s.pc_DXM   = None # profiler
 
     @s.update
     def DXM():
       s.redirected_pc_DXM = -1
       s.DXM_status = PipelineStatus.idle
+      s.pc_DXM     = None
+
+      if s.F_DXM_queue.deq.rdy() and not s.imemresp_q.deq.rdy():
+        s.stats.stall( "imem" )
 
       if s.F_DXM_queue.deq.rdy() and s.imemresp_q.deq.rdy():
+        s.pc_DXM = s.F_DXM_queue.peek()
 
         if not s.DXM_W_queue.enq.rdy():
+          s.raw_inst   = s.imemresp_q.peek().data
           s.DXM_status = PipelineStatus.stall
         else:
           pc = s.F_DXM_queue.peek()
@@ -113,7 +133,7 @@ class ProcCL( Component ):
           s.DXM_status = PipelineStatus.work
 
           if inst_name == "nop":
-            pass
+            s.DXM_W_queue.enq( None )
           elif inst_name == "add":
             s.DXM_W_queue.enq( (inst.rd, s.R[ inst.rs1 ] + s.R[ inst.rs2 ], DXM_W.arith) )
           elif inst_name == "sll":
@@ -139,6 +159,7 @@ class ProcCL( Component ):
               s.DXM_W_queue.enq( (0, 0, DXM_W.mem) )
             else:
               s.DXM_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
 
           elif inst_name == "lw":
             if s.dmem.req.rdy():
@@ -148,6 +169,7 @@ class ProcCL( Component ):
               s.DXM_W_queue.enq( (inst.rd, 0, DXM_W.mem) )
             else:
               s.DXM_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
 
           elif inst_name == "bne":
             if s.R[ inst.rs1 ] != s.R[ inst.rs2 ]:
@@ -161,25 +183,42 @@ class ProcCL( Component ):
 
             elif 0x7E0 <= inst.csrnum <= 0x7FF:
               if s.xcel.req.rdy():
-                s.xcel.req( xreq_class( XcelMsgType.WRITE, inst.csrnum[0:5], s.R[inst.rs1]) )
+                s.xcel.req( xreq_class( XcelMsgType.WRITE, inst.csrnum[0:5], XcelDataType( s.R[inst.rs1] ) ) )
+                s.DXM_W_queue.enq( (0, 0, DXM_W.xcel) )
+              else:
+                s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "xcel" )
+
+            elif 0x7A0 <= inst.csrnum <= 0x7BF and xcel_nbits == 128:
+              if s.xcel.req.rdy():
+                rs1 = int( inst.rs1 )
+                s.xcel.req( xreq_class( XcelMsgType.WRITE, inst.csrnum[0:5],
+                                        concat( s.R[(rs1+3) & 31], s.R[(rs1+2) & 31],
+                                                s.R[(rs1+1) & 31], s.R[rs1] ) ) )
                 s.DXM_W_queue.enq( (0, 0, DXM_W.xcel) )
               else:
                 s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "xcel" )
           elif inst_name == "csrr":
             if inst.csrnum == 0xFC0: # CSR: mngr2proc
               if s.mngr2proc_q.deq.rdy():
                 s.DXM_W_queue.enq( (inst.rd, s.mngr2proc_q.deq(), DXM_W.arith) )
               else:
                 s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "mngr" )
             elif 0x7E0 <= inst.csrnum <= 0x7FF:
               if s.xcel.req.rdy():
-                s.xcel.req( xreq_class( XcelMsgType.READ, inst.csrnum[0:5], s.R[inst.rs1]) )
+                s.xcel.req( xreq_class( XcelMsgType.READ, inst.csrnum[0:5], XcelDataType( s.R[inst.rs1] ) ) )
                 s.DXM_W_queue.enq( (inst.rd, 0, DXM_W.xcel) )
               else:
                 s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "xcel" )
+            elif is_counter_csr( inst.csrnum ):
+              s.DXM_W_queue.enq( (inst.rd, s.stats.read( inst.csrnum ), DXM_W.arith) )
 
           # If we execute any instruction, we pop from queues
           if s.DXM_status == PipelineStatus.work:
+            s.stats.commit( inst_name )
             s.F_DXM_queue.deq()
             s.imemresp_q.deq()
 
@@ -207,17 +246,19 @@ class ProcCL( Component ):
 
             else:
               s.W_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
 
           elif entry_type == DXM_W.xcel:
             if s.xcelresp_q.deq.rdy():
               if rd > 0: # csrr
-                s.R[ rd ] = Bits32( s.xcelresp_q.deq().data )
+                s.R[ rd ] = s.xcelresp_q.deq().data[0:32]
               else: # csrw
                 s.xcelresp_q.deq()
 
               s.W_status = PipelineStatus.work
             else:
               s.W_status = PipelineStatus.stall
+              s.stats.stall( "xcel" )
 
           elif entry_type == DXM_W.mngr:
             if s.proc2mngr.rdy():
@@ -225,6 +266,7 @@ class ProcCL( Component ):
               s.W_status = PipelineStatus.work
             else:
               s.W_status = PipelineStatus.stall
+              s.stats.stall( "mngr" )
 
           else: # other WB insts
             assert entry_type == DXM_W.arith
@@ -238,6 +280,70 @@ class ProcCL( Component ):
         s.DXM_W_queue.deq()
         s.commit_inst = Bits1(1)
 
+    # Close the cycle once every stage has reported its stalls
+
+    @s.update
+    def up_stats():
+      if s.reset:
+        s.stats.reset()
+      else:
+        s.stats.tick()
+
+    s.add_constraints(
+      U(F)   < U(up_stats),
+      U(DXM) < U(up_stats),
+      U(W)   < U(up_stats),
+    )
+
+  #-----------------------------------------------------------------------
+  # perf_counters
+  #-----------------------------------------------------------------------
+
+  def perf_counters( s ):
+    return list( s.stats.counters )
+
+  #-----------------------------------------------------------------------
+  # arch_regs
+  #-----------------------------------------------------------------------
+  # Only W writes the register file, so it always holds the committed
+  # state.
+
+  def arch_regs( s ):
+    return [ int(x) for x in s.R.regs ]
+
+  #-----------------------------------------------------------------------
+  # pipe_events
+  #-----------------------------------------------------------------------
+  # Per-stage events of this cycle for the pipeline trace writer
+
+  pipe_stages = [ "F", "DXM", "W" ]
+
+  def pipe_events( s ):
+    status_str = { PipelineStatus.work: "work", PipelineStatus.stall: "stall" }
+    events     = []
+
+    if s.F_status != PipelineStatus.idle:
+      pc = s.pc - 4 if s.F_status == PipelineStatus.work else s.pc
+      events.append( ("F", "{:08x}".format( int(pc) ), status_str[s.F_status]) )
+
+    if s.DXM_status != PipelineStatus.idle:
+      events.append( ("DXM", disassemble_inst(s.raw_inst), status_str[s.DXM_status]) )
+
+    if s.W_status != PipelineStatus.idle:
+      events.append( ("W", "x{:02}".format( int(s.rd) ), status_str[s.W_status]) )
+
+    return events
+
+  #-----------------------------------------------------------------------
+  # profile_pcs
+  #-----------------------------------------------------------------------
+  # The instruction in DXM and whether it issued this cycle
+
+  def profile_pcs( s ):
+    if s.pc_DXM is None:
+      return []
+    return [ (int(s.pc_DXM), s.DXM_status == PipelineStatus.work) ]
+
   #-----------------------------------------------------------------------
   # line_trace
   #-----------------------------------------------------------------------
@@ -12,16 +12,114 @@ from __future__ import absolute_import, division, print_function
 from pymtl3 import *
 from pymtl3.stdlib.ifcs.XcelMsg import XcelMsgType
 
+from .perf_counters import counter_nhazards
 from .TinyRV0InstRTL import *
 
+#-------------------------------------------------------------------------
+# Control signal table
+#-------------------------------------------------------------------------
+# The symbols of the control signal table below, which ProcPipeCtrl
+# shares.
+
+# Y/N parameters
+n = b1( 0 )
+y = b1( 1 )
+
+# Branch type
+br_x  = b1( 0 ) # don't care
+br_na = b1( 0 ) # N/A, not branch
+br_ne = b1( 1 ) # branch not equal
+
+# Op2 mux select
+bm_x   = b2( 0 ) # don't care
+bm_rf  = b2( 0 ) # use data from RF
+bm_imm = b2( 1 ) # use imm
+bm_csr = b2( 2 ) # use mngr2proc/numcores/coreid based on csrnum
+bm_cnt = b2( 3 ) # use performance counters
+
+# IMM type
+imm_x = b3( 0 ) # don't care
+imm_i = b3( 0 ) # I-imm
+imm_s = b3( 1 ) # S-imm
+imm_b = b3( 2 ) # B-imm
+imm_u = b3( 3 ) # U-imm
+
+# ALU func
+
+alu_x   = b4( 0 )
+alu_cp0 = b4( 0 ) # copy in0
+alu_cp1 = b4( 1 ) # copy in1
+alu_add = b4( 2 )
+alu_sll = b4( 3 )
+alu_srl = b4( 4 )
+alu_and = b4( 5 )
+
+# Memory request type
+nr = b2( 0 )
+ld = b2( 1 )
+st = b2( 2 )
+
+# X stage result mux select
+
+xm_x = b2( 0 ) # don't care
+xm_a = b2( 0 ) # Arithmetic
+xm_m = b2( 1 ) # Multiplier
+xm_p = b2( 2 ) # Pc+4
+
+# Write-back mux select
+
+wm_x = b2( 0 )
+wm_a = b2( 0 )
+wm_m = b2( 1 )
+wm_c = b2( 2 )
+
+#-------------------------------------------------------------------------
+# control_table_D
+#-------------------------------------------------------------------------
+# Adds the control signal table of the D stage to a processor control
+# unit, which sets s.cs from the instruction type in D. ProcCtrl and
+# ProcPipeCtrl both call it from their construct, so an instruction
+# added here is decoded by every pipeline.
+
+def control_table_D( s ):
+
+  @s.update
+  def comb_control_table_D():
+    inst = s.inst_type_decoder_D.out
+    #                                     br     rs1 imm    op2    rs2 alu      dmm wbmux rf  cs cs
+    #                                 val type    en type   muxsel  en fn       typ sel   wen rr rw
+    if   inst == NOP  : s.cs = concat( y, br_na,  n, imm_x, bm_x,   n, alu_x,   nr, wm_a, n,  n, n )
+    elif inst == CSRRX: s.cs = concat( y, br_na,  n, imm_i, bm_imm, n, alu_cp1, nr, wm_c, y,  y, n )
+    elif inst == CSRR : s.cs = concat( y, br_na,  n, imm_i, bm_csr, n, alu_cp1, nr, wm_a, y,  y, n )
+    elif inst == CSRW : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_cp0, nr, wm_a, n,  n, y )
+    elif inst == ADD  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_add, nr, wm_a, y,  n, n )
+    elif inst == SLL  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_sll, nr, wm_a, y,  n, n )
+    elif inst == SRL  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_srl, nr, wm_a, y,  n, n )
+    elif inst == ADDI : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, nr, wm_a, y,  n, n )
+    elif inst == LW   : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, ld, wm_m, y,  n, n )
+    elif inst == SW   : s.cs = concat( y, br_na,  y, imm_s, bm_imm, y, alu_add, st, wm_m, n,  n, n )
+    elif inst == BNE  : s.cs = concat( y, br_ne,  y, imm_b, bm_rf,  y, alu_x,   nr, wm_x, n,  n, n )
+
+    # ''' TUTORIAL TASK ''''''''''''''''''''''''''''''''''''''''''''''''
+    # Implement instruction AND in RTL processor
+    # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+    # Add a single line to set up control signals for AND instruction.
+
+    else:               s.cs = concat( n, br_x,   n, imm_x, bm_x,   n, alu_x,   nr, wm_x, n,  n, n )
+
 
 class ProcCtrl( Component ):
 
-  def construct( s ):
+  # With wide_xcel, csrw to 0x7A0-0x7BF is a wide accelerator write. See
+  # the D stage for how it is sequenced.
+
+  def construct( s, wide_xcel=False ):
 
     XcelMsgType_READ  = XcelMsgType.READ
     XcelMsgType_WRITE = XcelMsgType.WRITE
 
+    wide_xcel_en = b1( wide_xcel )
+
     #---------------------------------------------------------------------
     # Interface
     #---------------------------------------------------------------------
@@ -55,6 +153,7 @@ class ProcCtrl( Component ):
     s.xcelreq_rdy   = InPort ( Bits1 )
     s.xcelreq_en    = OutPort( Bits1 )
     s.xcelreq_type  = OutPort( Bits1 )
+    s.xcelreq_wide  = OutPort( Bits1 )
 
     # Get interface
     s.xcelresp_rdy  = InPort ( Bits1 )
@@ -66,6 +165,9 @@ class ProcCtrl( Component ):
     s.pc_sel_F         = OutPort( Bits1 )
 
     s.reg_en_D         = OutPort( Bits1 )
+    s.rs1_addr_D       = OutPort( Bits5 )
+    s.rs2_addr_D       = OutPort( Bits5 )
+    s.wide_lo_en_D     = OutPort( Bits1 )
     s.op1_byp_sel_D    = OutPort( Bits2 )
     s.op2_byp_sel_D    = OutPort( Bits2 )
     s.op2_sel_D        = OutPort( Bits2 )
@@ -90,6 +192,16 @@ class ProcCtrl( Component ):
 
     s.commit_inst = OutPort( Bits1 )
 
+    # Performance counter events
+
+    s.perf_commit_type = OutPort( Bits8 )
+    s.perf_stall_imem  = OutPort( Bits1 )
+    s.perf_stall_dmem  = OutPort( Bits1 )
+    s.perf_stall_mngr  = OutPort( Bits1 )
+    s.perf_stall_xcel  = OutPort( Bits1 )
+    s.perf_squash      = OutPort( Bits1 )
+    s.perf_hazards     = OutPort( mk_bits( counter_nhazards ) )
+
     #-----------------------------------------------------------------------
     # Control unit logic
     #-----------------------------------------------------------------------
@@ -253,95 +365,33 @@ class ProcCtrl( Component ):
     s.mngr2proc_D      = Wire( Bits1 )
     s.wb_result_sel_D  = Wire( Bits2 )
     s.xcelreq_D        = Wire( Bits1 )
+    s.xcelwide_D       = Wire( Bits1 )
+    s.csrr_cnt_D       = Wire( Bits1 )
 
     # actual waddr, selected base on rf_waddr_sel_D
 
     s.rf_waddr_D = Wire( Bits5 )
     s.xcelreq_type_D = Wire( Bits1 )
 
-    # Control signal table
-
-    # Y/N parameters
-    n = b1( 0 )
-    y = b1( 1 )
-
-    # Branch type
-    br_x  = b1( 0 ) # don't care
-    br_na = b1( 0 ) # N/A, not branch
-    br_ne = b1( 1 ) # branch not equal
-
-    # Op2 mux select
-    bm_x   = b2( 0 ) # don't care
-    bm_rf  = b2( 0 ) # use data from RF
-    bm_imm = b2( 1 ) # use imm
-    bm_csr = b2( 2 ) # use mngr2proc/numcores/coreid based on csrnum
-
-    # IMM type
-    imm_x = b3( 0 ) # don't care
-    imm_i = b3( 0 ) # I-imm
-    imm_s = b3( 1 ) # S-imm
-    imm_b = b3( 2 ) # B-imm
-    imm_u = b3( 3 ) # U-imm
-
-    # ALU func
-
-    alu_x   = b4( 0 )
-    alu_cp0 = b4( 0 ) # copy in0
-    alu_cp1 = b4( 1 ) # copy in1
-    alu_add = b4( 2 )
-    alu_sll = b4( 3 )
-    alu_srl = b4( 4 )
-    alu_and = b4( 5 )
-
-    # Memory request type
-    nr = b2( 0 )
-    ld = b2( 1 )
-    st = b2( 2 )
-
-    # X stage result mux select
-
-    xm_x = b2( 0 ) # don't care
-    xm_a = b2( 0 ) # Arithmetic
-    xm_m = b2( 1 ) # Multiplier
-    xm_p = b2( 2 ) # Pc+4
+    # Control signal
 
-    # Write-back mux select
+    s.cs = Wire( Bits20 )
 
-    wm_x = b2( 0 )
-    wm_a = b2( 0 )
-    wm_m = b2( 1 )
-    wm_c = b2( 2 )
+    # A wide accelerator write needs four source registers but we only
+    # have two read ports, so it stays in D for two cycles. In the first
+    # one it reads R[rs1] and R[rs1+1], which the dpath keeps in the wide
+    # low register, and in the second one R[rs1+2] and R[rs1+3], after
+    # which it goes down the pipeline like a normal csrw. Both reads use
+    # the normal bypassing and hazard logic.
 
-    # Control signal
+    s.wide_phase_D = Wire( Bits1 )
 
-    s.cs = Wire( Bits20 )
+    # control signal table, see control_table_D above
 
-    # control signal table
+    control_table_D( s )
 
     @s.update
-    def comb_control_table_D():
-      inst = s.inst_type_decoder_D.out
-      #                                     br     rs1 imm    op2    rs2 alu      dmm wbmux rf  cs cs
-      #                                 val type    en type   muxsel  en fn       typ sel   wen rr rw
-      if   inst == NOP  : s.cs = concat( y, br_na,  n, imm_x, bm_x,   n, alu_x,   nr, wm_a, n,  n, n )
-      elif inst == CSRRX: s.cs = concat( y, br_na,  n, imm_i, bm_imm, n, alu_cp1, nr, wm_c, y,  y, n )
-      elif inst == CSRR : s.cs = concat( y, br_na,  n, imm_i, bm_csr, n, alu_cp1, nr, wm_a, y,  y, n )
-      elif inst == CSRW : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_cp0, nr, wm_a, n,  n, y )
-      elif inst == ADD  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_add, nr, wm_a, y,  n, n )
-      elif inst == SLL  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_sll, nr, wm_a, y,  n, n )
-      elif inst == SRL  : s.cs = concat( y, br_na,  y, imm_x, bm_rf,  y, alu_srl, nr, wm_a, y,  n, n )
-      elif inst == ADDI : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, nr, wm_a, y,  n, n )
-      elif inst == LW   : s.cs = concat( y, br_na,  y, imm_i, bm_imm, n, alu_add, ld, wm_m, y,  n, n )
-      elif inst == SW   : s.cs = concat( y, br_na,  y, imm_s, bm_imm, y, alu_add, st, wm_m, n,  n, n )
-      elif inst == BNE  : s.cs = concat( y, br_ne,  y, imm_b, bm_rf,  y, alu_x,   nr, wm_x, n,  n, n )
-
-      # ''' TUTORIAL TASK ''''''''''''''''''''''''''''''''''''''''''''''''
-      # Implement instruction AND in RTL processor
-      # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
-      # Add a single line to set up control signals for AND instruction.
-
-      else:               s.cs = concat( n, br_x,   n, imm_x, bm_x,   n, alu_x,   nr, wm_x, n,  n, n )
-
+    def comb_decode_D():
       s.inst_val_D       = s.cs[19:20]
       s.br_type_D        = s.cs[18:19]
       s.rs1_en_D         = s.cs[17:18]
@@ -364,8 +414,15 @@ class ProcCtrl( Component ):
       s.proc2mngr_en_D  = s.csrw_D & ( s.inst_D[CSRNUM] == CSR_PROC2MNGR )
       s.mngr2proc_D     = s.csrr_D & ( s.inst_D[CSRNUM] == CSR_MNGR2PROC )
 
+      # performance counters are read through op2
+
+      s.csrr_cnt_D = s.csrr_D & ( s.inst_D[FUNCT7] == CSR_COUNTER )
+      if s.csrr_cnt_D:
+        s.op2_sel_D = bm_cnt
+
       # accelerator
-      if s.csrr_D and (s.inst_D[CSRNUM] != CSR_MNGR2PROC):
+      if s.csrr_D and (s.inst_D[CSRNUM] != CSR_MNGR2PROC) and \
+                      (s.inst_D[FUNCT7] != CSR_COUNTER):
         s.xcelreq_type_D = XcelMsgType_READ
         s.xcelreq_D = b1(1)
 
@@ -376,6 +433,20 @@ class ProcCtrl( Component ):
         s.xcelreq_type_D = b1(0)
         s.xcelreq_D = b1(0)
 
+      # wide accelerator write
+
+      s.xcelwide_D = s.csrw_D & ( s.inst_D[FUNCT7] == CSR_XCEL_WIDE ) & wide_xcel_en
+
+      s.rs1_addr_D = s.inst_D[RS1]
+      s.rs2_addr_D = s.inst_D[RS2]
+      if s.xcelwide_D:
+        s.rs2_en_D = y
+        if s.wide_phase_D:
+          s.rs1_addr_D = s.inst_D[RS1] + b5(2)
+          s.rs2_addr_D = s.inst_D[RS1] + b5(3)
+        else:
+          s.rs2_addr_D = s.inst_D[RS1] + b5(1)
+
     # forward wire declaration for hazard checking
 
     s.rf_waddr_X = Wire( Bits5 )
@@ -391,6 +462,10 @@ class ProcCtrl( Component ):
 
     s.ostall_hazard_D   = Wire( Bits1 )
 
+    # ostall in the first cycle of a wide accelerator write
+
+    s.ostall_wide_D     = Wire( Bits1 )
+
     # ostall due to mngr2proc
 
     s.ostall_mngr_D     = Wire( Bits1 )
@@ -409,22 +484,22 @@ class ProcCtrl( Component ):
 
       if s.rs1_en_D:
 
-        if   s.val_X & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+        if   s.val_X & ( s.rs1_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                      & s.rf_wen_pending_X:    s.op1_byp_sel_D = byp_x
-        elif s.val_M & ( s.inst_D[ RS1 ] == s.rf_waddr_M ) & ( s.rf_waddr_M != b5(0) ) \
+        elif s.val_M & ( s.rs1_addr_D == s.rf_waddr_M ) & ( s.rf_waddr_M != b5(0) ) \
                      & s.rf_wen_pending_M:    s.op1_byp_sel_D = byp_m
-        elif s.val_W & ( s.inst_D[ RS1 ] == s.rf_waddr_W ) & ( s.rf_waddr_W != b5(0) ) \
+        elif s.val_W & ( s.rs1_addr_D == s.rf_waddr_W ) & ( s.rf_waddr_W != b5(0) ) \
                      & s.rf_wen_pending_W:    s.op1_byp_sel_D = byp_w
 
       s.op2_byp_sel_D = byp_d
 
       if s.rs2_en_D:
 
-        if   s.val_X & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+        if   s.val_X & ( s.rs2_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                      & s.rf_wen_pending_X:    s.op2_byp_sel_D = byp_x
-        elif s.val_M & ( s.inst_D[ RS2 ] == s.rf_waddr_M ) & ( s.rf_waddr_M != b5(0) ) \
+        elif s.val_M & ( s.rs2_addr_D == s.rf_waddr_M ) & ( s.rf_waddr_M != b5(0) ) \
                      & s.rf_wen_pending_M:    s.op2_byp_sel_D = byp_m
-        elif s.val_W & ( s.inst_D[ RS2 ] == s.rf_waddr_W ) & ( s.rf_waddr_W != b5(0) ) \
+        elif s.val_W & ( s.rs2_addr_D == s.rf_waddr_W ) & ( s.rf_waddr_W != b5(0) ) \
                      & s.rf_wen_pending_W:    s.op2_byp_sel_D = byp_w
 
     # hazards checking logic
@@ -434,19 +509,19 @@ class ProcCtrl( Component ):
     @s.update
     def comb_hazard_D():
       s.ostall_ld_X_rs1_D = s.rs1_en_D & s.val_X & s.rf_wen_pending_X \
-                            & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+                            & ( s.rs1_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                             & ( s.dmemreq_type_X == ld )
 
       s.ostall_ld_X_rs2_D = s.rs2_en_D & s.val_X & s.rf_wen_pending_X \
-                            & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+                            & ( s.rs2_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                             & ( s.dmemreq_type_X == ld )
 
       s.ostall_xcel_X_rs1_D = s.rs1_en_D & s.val_X & s.rf_wen_pending_X \
-                            & ( s.inst_D[ RS1 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+                            & ( s.rs1_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                             & s.xcelreq_X
 
       s.ostall_xcel_X_rs2_D = s.rs2_en_D & s.val_X & s.rf_wen_pending_X \
-                            & ( s.inst_D[ RS2 ] == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
+                            & ( s.rs2_addr_D == s.rf_waddr_X ) & ( s.rf_waddr_X != b5(0) ) \
                             & s.xcelreq_X
 
       s.ostall_hazard_D   = s.ostall_ld_X_rs1_D   | s.ostall_ld_X_rs2_D | \
@@ -454,14 +529,26 @@ class ProcCtrl( Component ):
 
     s.next_val_D = Wire( Bits1 )
 
+    @s.update_on_edge
+    def reg_wide_phase_D():
+      if s.reset:
+        s.wide_phase_D = b1( 0 )
+      elif s.wide_lo_en_D:
+        s.wide_phase_D = b1( 1 )
+      elif s.reg_en_D:
+        s.wide_phase_D = b1( 0 )
+
     @s.update
     def comb_D():
 
       # ostall due to mngr2proc not ready
       s.ostall_mngr_D = s.mngr2proc_D & ~s.mngr2proc_rdy # This is get, rdy means we can get the message
 
+      # ostall to read the upper half of a wide accelerator write
+      s.ostall_wide_D = s.xcelwide_D & ~s.wide_phase_D
+
       # put together all ostall conditions
-      s.ostall_D = s.val_D & ( s.ostall_mngr_D | s.ostall_hazard_D )
+      s.ostall_D = s.val_D & ( s.ostall_mngr_D | s.ostall_hazard_D | s.ostall_wide_D )
 
       # stall in D stage
       s.stall_D  = s.val_D & ( s.ostall_D | s.ostall_X | s.ostall_M | s.ostall_W   )
@@ -476,6 +563,12 @@ class ProcCtrl( Component ):
       # enable signal for send/get interface
       s.mngr2proc_en  = s.val_D & ~s.stall_D & ~s.squash_D & s.mngr2proc_D
 
+      # The lower half of a wide accelerator write is captured only if
+      # the operands are ready and the stages in front are moving, since
+      # an older wide write stalling in X still uses the register.
+      s.wide_lo_en_D  = s.val_D & s.ostall_wide_D & ~s.ostall_hazard_D & ~s.squash_D & \
+                        ~( s.ostall_X | s.ostall_M | s.ostall_W )
+
     #---------------------------------------------------------------------
     # X stage
     #---------------------------------------------------------------------
@@ -492,6 +585,7 @@ class ProcCtrl( Component ):
     s.br_type_X        = Wire( Bits1 )
     s.xcelreq_X        = Wire( Bits1 )
     s.xcelreq_type_X   = Wire( Bits1 )
+    s.xcelwide_X       = Wire( Bits1 )
 
     @s.update_on_edge
     def reg_X():
@@ -509,6 +603,7 @@ class ProcCtrl( Component ):
         s.br_type_X        = s.br_type_D
         s.xcelreq_X        = s.xcelreq_D
         s.xcelreq_type_X   = s.xcelreq_type_D
+        s.xcelwide_X       = s.xcelwide_D
 
     # Branch logic
 
@@ -554,6 +649,7 @@ class ProcCtrl( Component ):
 
       s.xcelreq_en = s.val_X & ~s.stall_X & s.xcelreq_X
       s.xcelreq_type = s.xcelreq_type_X
+      s.xcelreq_wide = s.xcelwide_X
 
       # next valid bit
 
@@ -659,3 +755,44 @@ class ProcCtrl( Component ):
       s.proc2mngr_en = s.val_W & ~s.stall_W & s.proc2mngr_en_W
 
       s.commit_inst = s.val_W & ~s.stall_W
+
+    #---------------------------------------------------------------------
+    # Performance counter events
+    #---------------------------------------------------------------------
+    # Each stall is attributed to the interface that caused it. Load-use
+    # and xcel-use hazards count as dmem and xcel stalls respectively.
+
+    @s.update
+    def comb_perf():
+      s.perf_commit_type = s.inst_type_W
+
+      s.perf_stall_imem  = s.ostall_F
+
+      s.perf_stall_dmem  = ( s.val_D & ( s.ostall_ld_X_rs1_D | s.ostall_ld_X_rs2_D ) ) | \
+                           ( s.val_X & s.ostall_dmem_X ) | ( s.val_M & s.ostall_dmem_M )
+
+      s.perf_stall_mngr  = ( s.val_D & s.ostall_mngr_D ) | s.ostall_W
+
+      s.perf_stall_xcel  = ( s.val_D & ( s.ostall_xcel_X_rs1_D | s.ostall_xcel_X_rs2_D ) ) | \
+                           ( s.val_X & s.ostall_xcel_X ) | ( s.val_M & s.ostall_xcel_M )
+
+      s.perf_squash      = s.squash_F | s.squash_D
+
+    # One bit per stage and cause, in the order of counter_hazard_causes.
+    # Unlike the events above, causes are not merged across stages.
+
+    @s.update
+    def comb_perf_hazards():
+      s.perf_hazards = concat(
+        s.osquash_X,
+        s.ostall_W,
+        s.val_M & s.ostall_xcel_M,
+        s.val_M & s.ostall_dmem_M,
+        s.val_X & s.ostall_xcel_X,
+        s.val_X & s.ostall_dmem_X,
+        s.val_D & s.ostall_wide_D,
+        s.val_D & s.ostall_mngr_D,
+        s.val_D & ( s.ostall_xcel_X_rs1_D | s.ostall_xcel_X_rs2_D ),
+        s.val_D & ( s.ostall_ld_X_rs1_D | s.ostall_ld_X_rs2_D ),
+        s.ostall_F,
+      )
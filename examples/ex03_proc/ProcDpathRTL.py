@@ -30,7 +30,7 @@ c_reset_inst   = 0
 
 class ProcDpath( Component ):
 
-  def construct( s ):
+  def construct( s, xcel_nbits=32 ):
 
     #---------------------------------------------------------------------
     # Interface
@@ -51,15 +51,21 @@ class ProcDpath( Component ):
 
     # xcel ports
     s.xcelreq_addr   = OutPort( Bits5 )
-    s.xcelreq_data   = OutPort( Bits32 )
+    s.xcelreq_data   = OutPort( mk_bits( xcel_nbits ) )
     s.xcelresp_data  = InPort ( Bits32 )
 
+    # performance counter read port
+    s.perf_rdata     = InPort ( Bits32 )
+
     # Control signals (ctrl->dpath)
 
     s.reg_en_F         = InPort ( Bits1 )
     s.pc_sel_F         = InPort ( Bits1 )
 
     s.reg_en_D         = InPort ( Bits1 )
+    s.rs1_addr_D       = InPort ( Bits5 )
+    s.rs2_addr_D       = InPort ( Bits5 )
+    s.wide_lo_en_D     = InPort ( Bits1 )
     s.op1_byp_sel_D    = InPort ( Bits2 )
     s.op2_byp_sel_D    = InPort ( Bits2 )
     s.op2_sel_D        = InPort ( Bits2 )
@@ -67,6 +73,7 @@ class ProcDpath( Component ):
 
     s.reg_en_X         = InPort ( Bits1 )
     s.alu_fn_X         = InPort ( Bits4 )
+    s.xcelreq_wide_X   = InPort ( Bits1 )
 
     s.reg_en_M         = InPort ( Bits1 )
     s.wb_result_sel_M  = InPort ( Bits2 )
@@ -142,8 +149,8 @@ class ProcDpath( Component ):
     s.rf_wdata_W  = Wire( Bits32 )
 
     s.rf = RegisterFile( Bits32, nregs=32, rd_ports=2, wr_ports=1, const_zero=True )(
-      raddr = { 0: s.inst_D[ RS1 ],
-                1: s.inst_D[ RS2 ], },
+      raddr = { 0: s.rs1_addr_D,
+                1: s.rs2_addr_D, },
       rdata = { 0: s.rf_rdata0_D,
                 1: s.rf_rdata1_D, },
       wen   = { 0: s.rf_wen_W },
@@ -180,13 +187,14 @@ class ProcDpath( Component ):
     )
 
     # op2 sel mux
-    # This mux chooses among RS2, imm, and the mngr2proc.
-    # Basically we are using two muxes here for pedagogy.
+    # This mux chooses among RS2, imm, the mngr2proc, and the performance
+    # counters. Basically we are using two muxes here for pedagogy.
 
-    s.op2_sel_mux_D = Mux( Bits32, 3 )(
+    s.op2_sel_mux_D = Mux( Bits32, 4 )(
       in_ = { 0: s.op2_byp_mux_D.out,
               1: s.immgen_D.imm,
-              2: s.mngr2proc_data, },
+              2: s.mngr2proc_data,
+              3: s.perf_rdata, },
       sel = s.op2_sel_D,
     )
 
@@ -225,10 +233,6 @@ class ProcDpath( Component ):
       in_ = s.op2_sel_mux_D.out,
     )
 
-    # Send out xcelreq msg
-    s.connect( s.op1_reg_X.out,      s.xcelreq_data )
-    s.connect( s.op2_reg_X.out[0:5], s.xcelreq_addr )
-
     # store data reg
     # Since the op1 is the base address and op2 is the immediate so that
     # we could utilize ALU to do address calculation, we need one more
@@ -240,6 +244,30 @@ class ProcDpath( Component ):
       out = s.dmemreq_data,
     )
 
+    # Send out xcelreq msg
+
+    s.connect( s.op2_reg_X.out[0:5], s.xcelreq_addr )
+
+    if xcel_nbits == 32:
+      s.connect( s.op1_reg_X.out, s.xcelreq_data )
+
+    else:
+
+      # A wide accelerator write reads R[rs1] and R[rs1+1] in its first
+      # cycle in D, which we keep here, and R[rs1+2] and R[rs1+3] in the
+      # second one, which end up in op1 and store data regs.
+
+      s.wide_lo_reg_D = RegEnRst( Bits64, reset_value=0 )( en = s.wide_lo_en_D )
+      s.connect( s.wide_lo_reg_D.in_[0 :32], s.op1_byp_mux_D.out )
+      s.connect( s.wide_lo_reg_D.in_[32:64], s.op2_byp_mux_D.out )
+
+      @s.update
+      def up_xcelreq_data_X():
+        if s.xcelreq_wide_X:
+          s.xcelreq_data = concat( s.store_reg_X.out, s.op1_reg_X.out, s.wide_lo_reg_D.out )
+        else:
+          s.xcelreq_data = zext( s.op1_reg_X.out, xcel_nbits )
+
     # ALU
 
     s.alu_X = AluRTL()(
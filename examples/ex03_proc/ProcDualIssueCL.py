@@ -0,0 +1,425 @@
+"""
+==========================================================================
+ProcDualIssueCL.py
+==========================================================================
+TinyRV0 dual-issue CL proc.
+
+This is a two-wide variant of ProcCL. The F stage fetches an aligned
+64-bit block (two instructions) per cycle through a 64-bit imem port.
+The DXM stage issues up to two instructions per cycle from the block:
+any instruction can go in the first slot, but the second slot is only
+filled when both instructions are independent ALU ops (nop, add, addi,
+sll, srl, and). Memory, branch, and CSR instructions always issue alone.
+The register file is modeled as a plain Python list so it is implicitly
+dual-ported (four reads and two writes per cycle). The W stage commits
+the whole issue group in one cycle, so commit_inst is a two-bit count of
+the instructions committed in the current cycle.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.cl.DelayPipeCL import DelayPipeDeqCL
+from pymtl3.stdlib.cl.queues import PipeQueueCL
+from pymtl3.stdlib.ifcs import MemMsgType, mk_mem_msg
+from pymtl3.stdlib.ifcs.mem_ifcs import MemMasterIfcCL
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcCL
+from pymtl3.stdlib.ifcs.XcelMsg import XcelMsgType, mk_xcel_msg
+
+from .perf_counters import PerfCounters, is_counter_csr
+from .ProcCL import DXM_W, PipelineStatus
+from .tinyrv0_encoding import disassemble_inst, RegisterFile, TinyRV0Inst
+
+#-------------------------------------------------------------------------
+# ALU helpers
+#-------------------------------------------------------------------------
+# Instructions that are allowed to dual issue, and the source registers
+# each of them reads.
+
+alu_inst_srcs = {
+  "nop"  : lambda inst: [],
+  "add"  : lambda inst: [ inst.rs1, inst.rs2 ],
+  "sll"  : lambda inst: [ inst.rs1, inst.rs2 ],
+  "srl"  : lambda inst: [ inst.rs1, inst.rs2 ],
+  "and"  : lambda inst: [ inst.rs1, inst.rs2 ],
+  "addi" : lambda inst: [ inst.rs1 ],
+}
+
+def alu_entry( inst, R ):
+  inst_name = inst.name
+  if   inst_name == "add":
+    return (inst.rd, R[ inst.rs1 ] + R[ inst.rs2 ], DXM_W.arith)
+  elif inst_name == "sll":
+    return (inst.rd, R[inst.rs1] << (R[inst.rs2] & 0x1F), DXM_W.arith)
+  elif inst_name == "srl":
+    return (inst.rd, R[inst.rs1] >> (R[inst.rs2].uint() & 0x1F), DXM_W.arith)
+  elif inst_name == "and":
+    return (inst.rd, R[ inst.rs1 ] & R[ inst.rs2 ], DXM_W.arith)
+  elif inst_name == "addi":
+    return (inst.rd, R[ inst.rs1 ] + inst.i_imm.int(), DXM_W.arith)
+  return None # nop
+
+#-------------------------------------------------------------------------
+# ProcDualIssueCL
+#-------------------------------------------------------------------------
+
+class ProcDualIssueCL( Component ):
+
+  # The test harness sizes its commit counter and instruction memory port
+  # based on these, so the same harness works for both single- and
+  # dual-issue processors.
+
+  commit_nbits    = 2
+  imem_ifc_dtypes = mk_mem_msg( 8,32,64 )
+
+  def construct( s ):
+
+    imemreq_cls, imemresp_cls = s.imem_ifc_dtypes
+    memreq_cls,  memresp_cls  = mk_mem_msg( 8,32,32 )
+    xreq_class,  xresp_class  = mk_xcel_msg(5,32)
+
+    # Interface
+
+    s.commit_inst = OutPort( mk_bits( s.commit_nbits ) )
+
+    s.imem = MemMasterIfcCL( imemreq_cls, imemresp_cls )
+    s.dmem = MemMasterIfcCL( memreq_cls, memresp_cls )
+
+    s.xcel = XcelMasterIfcCL( xreq_class, xresp_class )
+
+    s.proc2mngr = NonBlockingCallerIfc()
+    s.mngr2proc = NonBlockingCalleeIfc()
+
+    # Buffers to hold input messages
+
+    s.imemresp_q  = DelayPipeDeqCL(0)( enq = s.imem.resp )
+    s.dmemresp_q  = DelayPipeDeqCL(1)( enq = s.dmem.resp )
+    s.mngr2proc_q = DelayPipeDeqCL(1)( enq = s.mngr2proc )
+    s.xcelresp_q  = DelayPipeDeqCL(0)( enq = s.xcel.resp )
+
+    s.pc = b32( 0x200 )
+    s.R  = RegisterFile( 32 )
+
+    s.F_DXM_queue = PipeQueueCL(1)
+    s.DXM_W_queue = PipeQueueCL(1)
+
+    s.F_status   = PipelineStatus.idle
+    s.DXM_status = PipelineStatus.idle
+
+    # PC fetched in this cycle, since s.pc already points to the next block
+
+    s.pc_F = s.pc
+    s.W_status   = PipelineStatus.idle
+
+    # Performance counters, counted at issue like ProcCL
+
+    s.stats = PerfCounters()
+
+    # Fetch the aligned block that contains the pc. If the pc points to
+    # the second slot of the block, only one instruction is useful.
+
+    @s.update
+    def F():
+      s.F_status = PipelineStatus.idle
+
+      if s.reset:
+        s.pc = b32( 0x200 )
+        return
+
+      if s.imem.req.rdy() and s.F_DXM_queue.enq.rdy():
+        if s.redirected_pc_DXM >= 0:
+          s.pc = s.redirected_pc_DXM
+
+        s.imem.req( imemreq_cls( MemMsgType.READ, 0, s.pc & 0xfffffff8 ) )
+
+        s.F_DXM_queue.enq( s.pc )
+        s.F_status = PipelineStatus.work
+        s.pc_F     = s.pc
+        s.pc       = ( s.pc & 0xfffffff8 ) + 8
+      else:
+        s.F_status = PipelineStatus.stall
+        if not s.imem.req.rdy():
+          s.stats.stall( "imem" )
+
+    s.redirected_pc_DXM = -1
+
+    # Index of the next instruction to issue from the current fetch block
+
+    s.slot_DXM = 0
+
+    s.raw_insts = []
+    s.pcs_DXM   = [] # profiler
+
+    @s.update
+    def DXM():
+      s.redirected_pc_DXM = -1
+      s.DXM_status = PipelineStatus.idle
+      s.raw_insts  = []
+      s.pcs_DXM    = []
+
+      if s.F_DXM_queue.deq.rdy() and not s.imemresp_q.deq.rdy():
+        s.stats.stall( "imem" )
+
+      if s.F_DXM_queue.deq.rdy() and s.imemresp_q.deq.rdy():
+
+        fetch_pc = s.F_DXM_queue.peek()
+
+        slot = max( int( fetch_pc[2:3] ), s.slot_DXM )
+        pc   = ( fetch_pc & 0xfffffff8 ) + 4*slot
+
+        s.pcs_DXM.append( pc )
+
+        if not s.DXM_W_queue.enq.rdy():
+          s.DXM_status = PipelineStatus.stall
+        else:
+          block = s.imemresp_q.peek().data
+
+          raw_inst  = block[ slot*32 : (slot+1)*32 ]
+          inst      = TinyRV0Inst( raw_inst )
+          inst_name = inst.name
+
+          s.DXM_status = PipelineStatus.work
+          group        = []
+
+          if inst_name in alu_inst_srcs:
+            group.append( alu_entry( inst, s.R ) )
+
+            # Try to dual issue the next instruction in the block. It has
+            # to be an ALU op and must not read the first one's result,
+            # since both read the register file in the same cycle.
+
+            if slot == 0:
+              inst1 = TinyRV0Inst( block[32:64] )
+              if inst1.name in alu_inst_srcs:
+                srcs1 = alu_inst_srcs[ inst1.name ]( inst1 )
+                if inst_name == "nop" or inst.rd == 0 or inst.rd not in srcs1:
+                  group.append( alu_entry( inst1, s.R ) )
+                  s.stats.commit( inst1.name )
+                  s.pcs_DXM.append( pc + 4 )
+                  s.raw_insts.append( raw_inst )
+                  raw_inst = block[32:64]
+                  slot     = 1
+
+          elif inst_name == "sw":
+            if s.dmem.req.rdy():
+              s.dmem.req( memreq_cls( MemMsgType.WRITE, 0,
+                                      s.R[ inst.rs1 ] + inst.s_imm.int(),
+                                      0,
+                                      s.R[ inst.rs2 ] ) )
+              group.append( (0, 0, DXM_W.mem) )
+            else:
+              s.DXM_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
+
+          elif inst_name == "lw":
+            if s.dmem.req.rdy():
+              s.dmem.req( memreq_cls( MemMsgType.READ, 0,
+                                      s.R[ inst.rs1 ] + inst.i_imm.int(),
+                                      0 ) )
+              group.append( (inst.rd, 0, DXM_W.mem) )
+            else:
+              s.DXM_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
+
+          elif inst_name == "bne":
+            if s.R[ inst.rs1 ] != s.R[ inst.rs2 ]:
+              s.redirected_pc_DXM = pc + inst.b_imm.int()
+            group.append( None )
+
+          elif inst_name == "csrw":
+            if inst.csrnum == 0x7C0: # CSR: proc2mngr
+              # We execute csrw in W stage
+              group.append( (0, s.R[ inst.rs1 ], DXM_W.mngr) )
+
+            elif 0x7E0 <= inst.csrnum <= 0x7FF:
+              if s.xcel.req.rdy():
+                s.xcel.req( xreq_class( XcelMsgType.WRITE, inst.csrnum[0:5], s.R[inst.rs1]) )
+                group.append( (0, 0, DXM_W.xcel) )
+              else:
+                s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "xcel" )
+
+          elif inst_name == "csrr":
+            if inst.csrnum == 0xFC0: # CSR: mngr2proc
+              if s.mngr2proc_q.deq.rdy():
+                group.append( (inst.rd, s.mngr2proc_q.deq(), DXM_W.arith) )
+              else:
+                s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "mngr" )
+            elif 0x7E0 <= inst.csrnum <= 0x7FF:
+              if s.xcel.req.rdy():
+                s.xcel.req( xreq_class( XcelMsgType.READ, inst.csrnum[0:5], s.R[inst.rs1]) )
+                group.append( (inst.rd, 0, DXM_W.xcel) )
+              else:
+                s.DXM_status = PipelineStatus.stall
+                s.stats.stall( "xcel" )
+            elif is_counter_csr( inst.csrnum ):
+              group.append( (inst.rd, s.stats.read( inst.csrnum ), DXM_W.arith) )
+
+          # If we issued anything, send the group down the pipeline. We
+          # pop the fetch block once its last instruction is issued or a
+          # taken branch makes the rest of the block dead.
+
+          if s.DXM_status == PipelineStatus.work:
+            s.raw_insts.append( raw_inst )
+            s.DXM_W_queue.enq( group )
+            s.stats.commit( inst_name )
+
+            if slot == 1 or s.redirected_pc_DXM >= 0:
+              s.F_DXM_queue.deq()
+              s.imemresp_q.deq()
+              s.slot_DXM = 0
+            else:
+              s.slot_DXM = 1
+
+    s.rds = []
+
+    @s.update
+    def W():
+      s.commit_inst = mk_bits( s.commit_nbits )(0)
+      s.W_status = PipelineStatus.idle
+      s.rds = []
+
+      if s.DXM_W_queue.deq.rdy():
+        group = s.DXM_W_queue.peek()
+        entry = group[0] if group else None
+
+        if entry is not None and entry[2] != DXM_W.arith:
+          rd, data, entry_type = entry
+          s.rds.append( rd )
+
+          if entry_type == DXM_W.mem:
+            if s.dmemresp_q.deq.rdy():
+              if rd > 0: # load
+                s.R[ rd ] = Bits32( s.dmemresp_q.deq().data )
+              else: # store
+                s.dmemresp_q.deq()
+
+              s.W_status = PipelineStatus.work
+
+            else:
+              s.W_status = PipelineStatus.stall
+              s.stats.stall( "dmem" )
+
+          elif entry_type == DXM_W.xcel:
+            if s.xcelresp_q.deq.rdy():
+              if rd > 0: # csrr
+                s.R[ rd ] = Bits32( s.xcelresp_q.deq().data )
+              else: # csrw
+                s.xcelresp_q.deq()
+
+              s.W_status = PipelineStatus.work
+            else:
+              s.W_status = PipelineStatus.stall
+              s.stats.stall( "xcel" )
+
+          else:
+            assert entry_type == DXM_W.mngr
+            if s.proc2mngr.rdy():
+              s.proc2mngr( data )
+              s.W_status = PipelineStatus.work
+            else:
+              s.W_status = PipelineStatus.stall
+              s.stats.stall( "mngr" )
+
+        else: # ALU, branch, and mngr2proc insts never stall in W
+          for entry in group:
+            if entry is not None:
+              rd, data, entry_type = entry
+              s.rds.append( rd )
+              if rd > 0: s.R[ rd ] = Bits32( data )
+          s.W_status = PipelineStatus.work
+
+        if s.W_status == PipelineStatus.work:
+          s.DXM_W_queue.deq()
+          s.commit_inst = mk_bits( s.commit_nbits )( len( group ) )
+
+    @s.update
+    def up_stats():
+      if s.reset:
+        s.stats.reset()
+      else:
+        s.stats.tick()
+
+    s.add_constraints(
+      U(F)   < U(up_stats),
+      U(DXM) < U(up_stats),
+      U(W)   < U(up_stats),
+    )
+
+  #-----------------------------------------------------------------------
+  # perf_counters
+  #-----------------------------------------------------------------------
+
+  def perf_counters( s ):
+    return list( s.stats.counters )
+
+  #-----------------------------------------------------------------------
+  # arch_regs
+  #-----------------------------------------------------------------------
+
+  def arch_regs( s ):
+    return [ int(x) for x in s.R.regs ]
+
+  #-----------------------------------------------------------------------
+  # pipe_events
+  #-----------------------------------------------------------------------
+  # Per-stage events of this cycle for the pipeline trace writer. A
+  # dual-issued group shows up as a single slice in DXM and W.
+
+  pipe_stages = [ "F", "DXM", "W" ]
+
+  def pipe_events( s ):
+    status_str = { PipelineStatus.work: "work", PipelineStatus.stall: "stall" }
+    events     = []
+
+    if s.F_status != PipelineStatus.idle:
+      pc = s.pc_F if s.F_status == PipelineStatus.work else s.pc
+      events.append( ("F", "{:08x}".format( int(pc) ), status_str[s.F_status]) )
+
+    if s.DXM_status != PipelineStatus.idle:
+      label = " ; ".join( [ disassemble_inst(x) for x in s.raw_insts ] ) or "#"
+      events.append( ("DXM", label, status_str[s.DXM_status]) )
+
+    if s.W_status != PipelineStatus.idle:
+      label = ",".join( [ "x{:02}".format( int(x) ) for x in s.rds ] ) or "--"
+      events.append( ("W", label, status_str[s.W_status]) )
+
+    return events
+
+  #-----------------------------------------------------------------------
+  # profile_pcs
+  #-----------------------------------------------------------------------
+  # The instructions in DXM and whether they issued this cycle
+
+  def profile_pcs( s ):
+    issued = s.DXM_status == PipelineStatus.work
+    return [ (int(x), issued) for x in s.pcs_DXM ]
+
+  #-----------------------------------------------------------------------
+  # line_trace
+  #-----------------------------------------------------------------------
+
+  def line_trace( s ):
+    F_line_trace = " "
+    if s.F_status == PipelineStatus.work:
+      F_line_trace = str(s.pc)
+    elif s.F_status == PipelineStatus.stall:
+      F_line_trace = "#"
+
+    DXM_line_trace = " "
+    if s.DXM_status == PipelineStatus.work:
+      DXM_line_trace = " ; ".join( [ disassemble_inst(x) for x in s.raw_insts ] )
+    elif s.DXM_status == PipelineStatus.stall:
+      DXM_line_trace = "#"
+
+    W_line_trace = " "
+    if s.W_status == PipelineStatus.work:
+      W_line_trace = ",".join( [ "x{:2}".format(str(x) if x > 0 else "--")
+                                 for x in s.rds ] )
+    elif s.W_status == PipelineStatus.stall:
+      W_line_trace = "#"
+
+    return "[{:<8s}|{:<49s}|{:<7s}]".format( F_line_trace, DXM_line_trace, W_line_trace )
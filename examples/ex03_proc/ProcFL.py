@@ -18,12 +18,17 @@ from pymtl3.stdlib.ifcs.SendRecvIfc import SendIfcFL
 from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcFL
 from pymtl3.stdlib.ifcs.XcelMsg import mk_xcel_msg
 
+from .perf_counters import PerfCounters, is_counter_csr
 from .tinyrv0_encoding import RegisterFile, TinyRV0Inst, disassemble_inst
 
 
 class ProcFL( Component ):
 
-  def construct( s ):
+  # xcel_nbits is the data width of the accelerator interface. With a
+  # 128-bit interface csrw to 0x7A0-0x7BF sends R[rs1+3:rs1] at once,
+  # with the register numbers wrapping around like in ProcRTL.
+
+  def construct( s, xcel_nbits=32 ):
 
     # Interface, Buffers to hold request/response messages
 
@@ -31,7 +36,9 @@ class ProcFL( Component ):
 
     s.imem = MemMasterIfcFL()
     s.dmem = MemMasterIfcFL()
-    s.xcel = XcelMasterIfcFL( *mk_xcel_msg( 5, 32 ) )
+    s.xcel = XcelMasterIfcFL( *mk_xcel_msg( 5, xcel_nbits ) )
+
+    XcelDataType = mk_bits( xcel_nbits )
 
     s.proc2mngr = SendIfcFL()
     s.mngr2proc = GetIfcFL()
@@ -42,6 +49,13 @@ class ProcFL( Component ):
 
     s.R = RegisterFile(32)
     s.raw_inst = None
+    s.inst_pc  = None # profiler
+
+    # Performance counters. We remember which interface we are blocked
+    # on so that cycles without a commit can be attributed to it.
+
+    s.stats       = PerfCounters()
+    s.stall_cause = None
 
     @s.update
     def up_ProcFL():
@@ -50,8 +64,10 @@ class ProcFL( Component ):
         return
 
       s.commit_inst = Bits1( 0 )
+      s.inst_pc     = s.PC
 
       try:
+        s.stall_cause = "imem"
         s.raw_inst = s.imem.read( s.PC, 4 ) # line trace
 
         inst = TinyRV0Inst( s.raw_inst )
@@ -81,10 +97,12 @@ class ProcFL( Component ):
           s.PC += 4
         elif inst_name == "sw":
           addr = s.R[inst.rs1] + sext( inst.s_imm, 32 )
+          s.stall_cause = "dmem"
           s.dmem.write( addr, 4, s.R[inst.rs2] )
           s.PC += 4
         elif inst_name == "lw":
           addr = s.R[inst.rs1] + sext( inst.i_imm, 32 )
+          s.stall_cause = "dmem"
           s.R[inst.rd] = s.dmem.read( addr, 4 )
           s.PC += 4
         elif inst_name == "bne":
@@ -95,9 +113,17 @@ class ProcFL( Component ):
 
         elif inst_name == "csrw":
           if   inst.csrnum == 0x7C0:
+            s.stall_cause = "mngr"
             s.proc2mngr( s.R[inst.rs1] )
           elif 0x7E0 <= inst.csrnum <= 0x7FF:
-            s.xcel.write( inst.csrnum[0:5], s.R[inst.rs1] )
+            s.stall_cause = "xcel"
+            s.xcel.write( inst.csrnum[0:5], XcelDataType( s.R[inst.rs1] ) )
+          elif 0x7A0 <= inst.csrnum <= 0x7BF and xcel_nbits == 128:
+            rs1 = int( inst.rs1 )
+            s.stall_cause = "xcel"
+            s.xcel.write( inst.csrnum[0:5],
+                          concat( s.R[(rs1+3) & 31], s.R[(rs1+2) & 31],
+                                  s.R[(rs1+1) & 31], s.R[rs1] ) )
           else:
             raise TinyRV2Semantics.IllegalInstruction(
               "Unrecognized CSR register ({}) for csrw at PC={}" \
@@ -106,9 +132,13 @@ class ProcFL( Component ):
 
         elif inst_name == "csrr":
           if   inst.csrnum == 0xFC0:
+            s.stall_cause = "mngr"
             s.R[inst.rd] = s.mngr2proc()
           elif 0x7E0 <= inst.csrnum <= 0x7FF:
-            s.R[inst.rd] = s.xcel.read( inst.csrnum[0:5] )
+            s.stall_cause = "xcel"
+            s.R[inst.rd] = s.xcel.read( inst.csrnum[0:5] )[0:32]
+          elif is_counter_csr( inst.csrnum ):
+            s.R[inst.rd] = s.stats.read( inst.csrnum )
           else:
             raise TinyRV2Semantics.IllegalInstruction(
               "Unrecognized CSR register ({}) for csrr at PC={}" \
@@ -121,6 +151,61 @@ class ProcFL( Component ):
         raise
 
       s.commit_inst = b1( 1 )
+      s.stats.commit( inst_name )
+
+    # Count the cycle after the processor is done with it for this cycle.
+    # A cycle without a commit is a stall on whatever we are blocked on.
+
+    @s.update
+    def up_ProcFL_stats():
+      if s.reset:
+        s.stats.reset()
+        return
+
+      if not s.commit_inst and s.stall_cause is not None:
+        s.stats.stall( s.stall_cause )
+      s.stats.tick()
+
+    s.add_constraints( U(up_ProcFL) < U(up_ProcFL_stats) )
+
+  #-----------------------------------------------------------------------
+  # perf_counters
+  #-----------------------------------------------------------------------
+
+  def perf_counters( s ):
+    return list( s.stats.counters )
+
+  #-----------------------------------------------------------------------
+  # arch_regs
+  #-----------------------------------------------------------------------
+
+  def arch_regs( s ):
+    return [ int(x) for x in s.R.regs ]
+
+  #-----------------------------------------------------------------------
+  # pipe_events
+  #-----------------------------------------------------------------------
+  # The FL processor has no pipeline, so it only reports one stage that
+  # either executes an instruction or waits on some interface.
+
+  pipe_stages = [ "FL" ]
+
+  def pipe_events( s ):
+    if s.commit_inst:
+      return [ ("FL", disassemble_inst( s.raw_inst ), "work") ]
+    if s.stall_cause is not None:
+      return [ ("FL", s.stall_cause, "stall") ]
+    return []
+
+  #-----------------------------------------------------------------------
+  # profile_pcs
+  #-----------------------------------------------------------------------
+  # The instruction being executed and whether it committed this cycle
+
+  def profile_pcs( s ):
+    if s.inst_pc is None:
+      return []
+    return [ (int(s.inst_pc), bool(s.commit_inst)) ]
 
   #-----------------------------------------------------------------------
   # line_trace
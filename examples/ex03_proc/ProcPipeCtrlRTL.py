@@ -0,0 +1,485 @@
+"""
+==========================================================================
+ProcPipeCtrlRTL.py
+==========================================================================
+Control logic for the RTL TinyRV0 processor with a parameterized
+pipeline. The pipeline is
+
+  F1 .. Fn  D  X  M1 .. Mm  W
+
+with nfetch fetch stages and nmem memory stages. The first fetch stage
+talks to the imem like the F stage of ProcCtrl, the other ones only hold
+the fetched instruction. X sends the dmem and xcel requests and the last
+memory stage, or W if there is none, gets the responses. ProcCtrl is the
+same as nfetch=1 and nmem=1. The control signal table is the one of
+ProcCtrl, so an instruction added there, like AND in the tutorial, is
+decoded by every pipeline.
+
+Instead of naming every stage, the valid, stall, and squash signals are
+kept in lists indexed by stage, and the control signals of the stages
+from X to W in lists indexed from X. The bypass and stall logic in D is
+derived from the stages: an operand is bypassed from the youngest stage
+that writes its register, and D stalls if the result is not there yet,
+which is the case for a lw or an accelerator read before the stage that
+gets the response.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs.XcelMsg import XcelMsgType
+
+from .perf_counters import counter_nhazards
+from .ProcCtrlRTL import bm_cnt, br_ne, control_table_D, ld, nr, st, wm_a
+from .TinyRV0InstRTL import *
+
+
+class ProcPipeCtrl( Component ):
+
+  def construct( s, nfetch=1, nmem=1 ):
+
+    assert nfetch >= 1 and nmem >= 0
+
+    XcelMsgType_READ  = XcelMsgType.READ
+    XcelMsgType_WRITE = XcelMsgType.WRITE
+
+    # Stages from X to W and the one of them that gets the responses
+
+    nback = nmem + 2
+    resp  = max( 1, nmem )
+
+    # Stage indices, nstages in total
+
+    nstages = nfetch + 1 + nback
+    iD      = nfetch
+    iX      = nfetch + 1
+    iR      = iX + resp
+    iW      = nstages - 1
+
+    # The bypass muxes select the RF or one of the stages from X to W
+
+    BypSelType = mk_bits( clog2( nback + 1 ) )
+
+    #---------------------------------------------------------------------
+    # Interface
+    #---------------------------------------------------------------------
+
+    # imem ports
+
+    s.imemreq_en    = OutPort( Bits1 )
+    s.imemreq_rdy   = InPort ( Bits1 )
+    s.imemresp_en   = OutPort( Bits1 )
+    s.imemresp_rdy  = InPort ( Bits1 )
+    s.imemresp_drop = OutPort( Bits1 )
+
+    # dmem ports
+
+    s.dmemreq_en    = OutPort( Bits1 )
+    s.dmemreq_rdy   = InPort ( Bits1 )
+    s.dmemreq_type  = OutPort( Bits4 )
+    s.dmemresp_en   = OutPort( Bits1 )
+    s.dmemresp_rdy  = InPort ( Bits1 )
+
+    # mngr ports
+
+    s.mngr2proc_en  = OutPort( Bits1 )
+    s.mngr2proc_rdy = InPort ( Bits1 )
+
+    s.proc2mngr_en  = OutPort( Bits1 )
+    s.proc2mngr_rdy = InPort ( Bits1 )
+
+    # xcel ports
+
+    s.xcelreq_rdy   = InPort ( Bits1 )
+    s.xcelreq_en    = OutPort( Bits1 )
+    s.xcelreq_type  = OutPort( Bits1 )
+
+    s.xcelresp_rdy  = InPort ( Bits1 )
+    s.xcelresp_en   = OutPort( Bits1 )
+
+    # Control signals (ctrl->dpath)
+
+    s.reg_en           = [ OutPort( Bits1 ) for _ in range( nstages ) ]
+    s.pc_sel_F         = OutPort( Bits1 )
+
+    s.rs1_addr_D       = OutPort( Bits5 )
+    s.rs2_addr_D       = OutPort( Bits5 )
+    s.op1_byp_sel_D    = OutPort( BypSelType )
+    s.op2_byp_sel_D    = OutPort( BypSelType )
+    s.op2_sel_D        = OutPort( Bits2 )
+    s.imm_type_D       = OutPort( Bits3 )
+
+    s.alu_fn_X         = OutPort( Bits4 )
+
+    s.wb_result_sel_R  = OutPort( Bits2 )
+
+    s.rf_waddr_W       = OutPort( Bits5 )
+    s.rf_wen_W         = OutPort( Bits1 )
+
+    # Status signals (dpath->ctrl)
+
+    s.inst_D = InPort ( Bits32 )
+    s.ne_X   = InPort ( Bits1 )
+
+    # Output val_W for counting
+
+    s.commit_inst = OutPort( Bits1 )
+
+    # Performance counter events, see ProcCtrl. The events of the M stage
+    # are the ones of the stage that gets the responses.
+
+    s.perf_commit_type = OutPort( Bits8 )
+    s.perf_stall_imem  = OutPort( Bits1 )
+    s.perf_stall_dmem  = OutPort( Bits1 )
+    s.perf_stall_mngr  = OutPort( Bits1 )
+    s.perf_stall_xcel  = OutPort( Bits1 )
+    s.perf_squash      = OutPort( Bits1 )
+    s.perf_hazards     = OutPort( mk_bits( counter_nhazards ) )
+
+    #---------------------------------------------------------------------
+    # Valid, stall, and squash signals
+    #---------------------------------------------------------------------
+    # Same as ProcCtrl, one per stage. ostall_after[i] is set if stage i
+    # or any stage in front of it originates a stall.
+
+    s.val          = [ Wire( Bits1 ) for _ in range( nstages ) ]
+    s.ostall       = [ Wire( Bits1 ) for _ in range( nstages ) ]
+    s.ostall_after = [ Wire( Bits1 ) for _ in range( nstages ) ]
+    s.stall        = [ Wire( Bits1 ) for _ in range( nstages ) ]
+    s.squash       = [ Wire( Bits1 ) for _ in range( nstages ) ]
+    s.next_val     = [ Wire( Bits1 ) for _ in range( nstages ) ]
+
+    s.osquash_X    = Wire( Bits1 ) # can osquash due to taken branches
+
+    #---------------------------------------------------------------------
+    # D stage
+    #---------------------------------------------------------------------
+
+    # Decoder, translate 32-bit instructions to symbols
+
+    s.inst_type_decoder_D = DecodeInstType()( in_ = s.inst_D )
+
+    # Signals generated by control signal table
+
+    s.inst_val_D       = Wire( Bits1 )
+    s.br_type_D        = Wire( Bits1 )
+    s.rs1_en_D         = Wire( Bits1 )
+    s.rs2_en_D         = Wire( Bits1 )
+    s.alu_fn_D         = Wire( Bits4 )
+    s.dmemreq_type_D   = Wire( Bits2 )
+    s.rf_wen_pending_D = Wire( Bits1 )
+    s.csrw_D           = Wire( Bits1 )
+    s.csrr_D           = Wire( Bits1 )
+    s.proc2mngr_en_D   = Wire( Bits1 )
+    s.mngr2proc_D      = Wire( Bits1 )
+    s.wb_result_sel_D  = Wire( Bits2 )
+    s.xcelreq_D        = Wire( Bits1 )
+    s.xcelreq_type_D   = Wire( Bits1 )
+    s.csrr_cnt_D       = Wire( Bits1 )
+    s.rf_waddr_D       = Wire( Bits5 )
+
+    # Control signal table, see ProcCtrl
+
+    s.cs = Wire( Bits20 )
+
+    control_table_D( s )
+
+    @s.update
+    def comb_decode_D():
+      s.inst_val_D       = s.cs[19:20]
+      s.br_type_D        = s.cs[18:19]
+      s.rs1_en_D         = s.cs[17:18]
+      s.imm_type_D       = s.cs[14:17]
+      s.op2_sel_D        = s.cs[12:14]
+      s.rs2_en_D         = s.cs[11:12]
+      s.alu_fn_D         = s.cs[7:11]
+      s.dmemreq_type_D   = s.cs[5:7]
+      s.wb_result_sel_D  = s.cs[3:5]
+      s.rf_wen_pending_D = s.cs[2:3]
+      s.csrr_D           = s.cs[1:2]
+      s.csrw_D           = s.cs[0:1]
+
+      s.rf_waddr_D = s.inst_D[RD]
+      s.rs1_addr_D = s.inst_D[RS1]
+      s.rs2_addr_D = s.inst_D[RS2]
+
+      # csrr/csrw logic
+
+      s.proc2mngr_en_D  = s.csrw_D & ( s.inst_D[CSRNUM] == CSR_PROC2MNGR )
+      s.mngr2proc_D     = s.csrr_D & ( s.inst_D[CSRNUM] == CSR_MNGR2PROC )
+
+      # performance counters are read through op2
+
+      s.csrr_cnt_D = s.csrr_D & ( s.inst_D[FUNCT7] == CSR_COUNTER )
+      if s.csrr_cnt_D:
+        s.op2_sel_D = bm_cnt
+
+      # accelerator
+
+      if s.csrr_D and (s.inst_D[CSRNUM] != CSR_MNGR2PROC) and \
+                      (s.inst_D[FUNCT7] != CSR_COUNTER):
+        s.xcelreq_type_D = XcelMsgType_READ
+        s.xcelreq_D = b1(1)
+
+      elif s.csrw_D and (s.inst_D[CSRNUM] != CSR_PROC2MNGR):
+        s.xcelreq_type_D = XcelMsgType_WRITE
+        s.xcelreq_D = b1(1)
+      else:
+        s.xcelreq_type_D = b1(0)
+        s.xcelreq_D = b1(0)
+
+    #---------------------------------------------------------------------
+    # Pipeline registers of the stages from X to W
+    #---------------------------------------------------------------------
+    # Index k is stage iX+k, so 0 is X and nback-1 is W.
+
+    s.inst_type_B      = [ Wire( Bits8 ) for _ in range( nback ) ]
+    s.rf_wen_pending_B = [ Wire( Bits1 ) for _ in range( nback ) ]
+    s.rf_waddr_B       = [ Wire( Bits5 ) for _ in range( nback ) ]
+    s.proc2mngr_en_B   = [ Wire( Bits1 ) for _ in range( nback ) ]
+    s.dmemreq_type_B   = [ Wire( Bits2 ) for _ in range( nback ) ]
+    s.wb_result_sel_B  = [ Wire( Bits2 ) for _ in range( nback ) ]
+    s.xcelreq_B        = [ Wire( Bits1 ) for _ in range( nback ) ]
+    s.xcelreq_type_B   = [ Wire( Bits1 ) for _ in range( nback ) ]
+
+    s.br_type_X        = Wire( Bits1 )
+
+    @s.update_on_edge
+    def reg_val():
+      if s.reset:
+        for i in range( nstages ):
+          s.val[i] = b1( 0 )
+      else:
+        if s.reg_en[0]:
+          s.val[0] = b1( 1 )
+        for i in range( 1, nstages ):
+          if s.reg_en[i]:
+            s.val[i] = s.next_val[i-1]
+
+    # The registers are written from W back to X, so that every stage
+    # still reads the old value of the stage behind it.
+
+    @s.update_on_edge
+    def reg_B():
+      for j in range( nback - 1 ):
+        k = nback - 1 - j
+        if s.reg_en[iX+k]:
+          s.inst_type_B     [k] = s.inst_type_B     [k-1]
+          s.rf_wen_pending_B[k] = s.rf_wen_pending_B[k-1]
+          s.rf_waddr_B      [k] = s.rf_waddr_B      [k-1]
+          s.proc2mngr_en_B  [k] = s.proc2mngr_en_B  [k-1]
+          s.dmemreq_type_B  [k] = s.dmemreq_type_B  [k-1]
+          s.wb_result_sel_B [k] = s.wb_result_sel_B [k-1]
+          s.xcelreq_B       [k] = s.xcelreq_B       [k-1]
+          s.xcelreq_type_B  [k] = s.xcelreq_type_B  [k-1]
+
+      if s.reg_en[iX]:
+        s.inst_type_B     [0] = s.inst_type_decoder_D.out
+        s.rf_wen_pending_B[0] = s.rf_wen_pending_D
+        s.rf_waddr_B      [0] = s.rf_waddr_D
+        s.proc2mngr_en_B  [0] = s.proc2mngr_en_D
+        s.dmemreq_type_B  [0] = s.dmemreq_type_D
+        s.wb_result_sel_B [0] = s.wb_result_sel_D
+        s.xcelreq_B       [0] = s.xcelreq_D
+        s.xcelreq_type_B  [0] = s.xcelreq_type_D
+        s.br_type_X           = s.br_type_D
+        s.alu_fn_X            = s.alu_fn_D
+
+    #---------------------------------------------------------------------
+    # Bypassing and hazards in D
+    #---------------------------------------------------------------------
+    # Stage k is checked after all stages behind it, so the youngest
+    # instruction that writes the register wins. Its result can be
+    # bypassed unless it is a lw or an accelerator read that has not
+    # reached the stage that gets the response yet.
+
+    before_resp = [ b1( k < resp ) for k in range( nback ) ]
+
+    s.ostall_ld_rs1_D   = Wire( Bits1 )
+    s.ostall_ld_rs2_D   = Wire( Bits1 )
+    s.ostall_xcel_rs1_D = Wire( Bits1 )
+    s.ostall_xcel_rs2_D = Wire( Bits1 )
+    s.ostall_hazard_D   = Wire( Bits1 )
+
+    s.pending_B  = [ Wire( Bits1 ) for _ in range( nback ) ]
+    s.notready_B = [ Wire( Bits1 ) for _ in range( nback ) ]
+
+    @s.update
+    def comb_pending_B():
+      for k in range( nback ):
+        s.pending_B[k]  = s.val[iX+k] & s.rf_wen_pending_B[k] & \
+                          ( s.rf_waddr_B[k] != b5(0) )
+        s.notready_B[k] = before_resp[k] & ( s.wb_result_sel_B[k] != wm_a )
+
+    @s.update
+    def comb_bypass_D():
+      s.op1_byp_sel_D     = BypSelType( 0 )
+      s.op2_byp_sel_D     = BypSelType( 0 )
+      s.ostall_ld_rs1_D   = b1( 0 )
+      s.ostall_ld_rs2_D   = b1( 0 )
+      s.ostall_xcel_rs1_D = b1( 0 )
+      s.ostall_xcel_rs2_D = b1( 0 )
+
+      for j in range( nback ):
+        k = nback - 1 - j
+
+        if s.rs1_en_D & s.pending_B[k] & ( s.rs1_addr_D == s.rf_waddr_B[k] ):
+          s.op1_byp_sel_D     = BypSelType( k + 1 )
+          s.ostall_ld_rs1_D   = s.notready_B[k] & ( s.dmemreq_type_B[k] == ld )
+          s.ostall_xcel_rs1_D = s.notready_B[k] & s.xcelreq_B[k]
+
+        if s.rs2_en_D & s.pending_B[k] & ( s.rs2_addr_D == s.rf_waddr_B[k] ):
+          s.op2_byp_sel_D     = BypSelType( k + 1 )
+          s.ostall_ld_rs2_D   = s.notready_B[k] & ( s.dmemreq_type_B[k] == ld )
+          s.ostall_xcel_rs2_D = s.notready_B[k] & s.xcelreq_B[k]
+
+      s.ostall_hazard_D = s.ostall_ld_rs1_D   | s.ostall_ld_rs2_D | \
+                          s.ostall_xcel_rs1_D | s.ostall_xcel_rs2_D
+
+    #---------------------------------------------------------------------
+    # Branch logic
+    #---------------------------------------------------------------------
+
+    s.pc_redirect_X = Wire( Bits1 )
+
+    @s.update
+    def comb_br_X():
+      s.pc_redirect_X = s.val[iX] & ( s.br_type_X == br_ne ) & s.ne_X
+      s.pc_sel_F      = s.pc_redirect_X
+
+    #---------------------------------------------------------------------
+    # Stall conditions
+    #---------------------------------------------------------------------
+    # The first fetch stage waits for the imem response, D for mngr2proc
+    # and hazards, X for the requests, the stage that gets the responses
+    # for the responses, and W for proc2mngr. With nmem=0 the last two
+    # are the same stage.
+
+    s.ostall_mngr_D      = Wire( Bits1 )
+    s.ostall_dmem_X      = Wire( Bits1 )
+    s.ostall_xcel_X      = Wire( Bits1 )
+    s.ostall_dmem_R      = Wire( Bits1 )
+    s.ostall_xcel_R      = Wire( Bits1 )
+    s.ostall_proc2mngr_W = Wire( Bits1 )
+
+    @s.update
+    def comb_ostall():
+      s.ostall_mngr_D      = s.mngr2proc_D & ~s.mngr2proc_rdy
+      s.ostall_dmem_X      = ( s.dmemreq_type_B[0] != nr ) & ~s.dmemreq_rdy
+      s.ostall_xcel_X      = s.xcelreq_B[0] & ~s.xcelreq_rdy
+      s.ostall_dmem_R      = ( s.dmemreq_type_B[resp] != nr ) & ~s.dmemresp_rdy
+      s.ostall_xcel_R      = s.xcelreq_B[resp] & ~s.xcelresp_rdy
+      s.ostall_proc2mngr_W = s.proc2mngr_en_B[nback-1] & ~s.proc2mngr_rdy
+
+      for i in range( nstages ):
+        s.ostall[i] = b1( 0 )
+
+      s.ostall[0]  = s.val[0]  & ~s.imemresp_rdy
+      s.ostall[iD] = s.val[iD] & ( s.ostall_mngr_D | s.ostall_hazard_D )
+      s.ostall[iX] = s.val[iX] & ( s.ostall_dmem_X | s.ostall_xcel_X )
+      s.ostall[iR] = s.val[iR] & ( s.ostall_dmem_R | s.ostall_xcel_R )
+      s.ostall[iW] = s.ostall[iW] | ( s.val[iW] & s.ostall_proc2mngr_W )
+
+    # A stage stalls if it or any stage in front of it originates a
+    # stall. Only the stages before X are squashed by a taken branch.
+    # Note that osquash_X needs stall_X, as in ProcCtrl.
+
+    @s.update
+    def comb_stall():
+      s.ostall_after[nstages-1] = s.ostall[nstages-1]
+      for j in range( nstages - 1 ):
+        i = nstages - 2 - j
+        s.ostall_after[i] = s.ostall[i] | s.ostall_after[i+1]
+
+      for i in range( nstages ):
+        s.stall[i] = s.val[i] & s.ostall_after[i]
+
+      s.osquash_X = s.val[iX] & ~s.stall[iX] & s.pc_redirect_X
+
+      for i in range( nstages ):
+        if i < iX:
+          s.squash[i] = s.val[i] & s.osquash_X
+          s.reg_en[i] = ~s.stall[i] | s.squash[i]
+        else:
+          s.squash[i] = b1( 0 )
+          s.reg_en[i] = ~s.stall[i]
+        s.next_val[i] = s.val[i] & ~s.stall[i] & ~s.squash[i]
+
+    #---------------------------------------------------------------------
+    # Interface enables
+    #---------------------------------------------------------------------
+
+    @s.update
+    def comb_enables():
+
+      # imem, see ProcCtrl
+
+      s.imemreq_en    = ~s.reset & ( ~s.stall[0] | s.squash[0] ) & s.imemreq_rdy
+      s.imemresp_en   = ~s.stall[0] | s.squash[0]
+      s.imemresp_drop = s.squash[0]
+
+      # mngr2proc in D
+
+      s.mngr2proc_en  = s.val[iD] & ~s.stall[iD] & ~s.squash[iD] & s.mngr2proc_D
+
+      # requests in X
+
+      s.dmemreq_en    = s.val[iX] & ~s.stall[iX] & ( s.dmemreq_type_B[0] != nr )
+      s.dmemreq_type  = b4( s.dmemreq_type_B[0] == st )  # 0-load/DC, 1-store
+      s.xcelreq_en    = s.val[iX] & ~s.stall[iX] & s.xcelreq_B[0]
+      s.xcelreq_type  = s.xcelreq_type_B[0]
+
+      # responses
+
+      s.dmemresp_en     = s.val[iR] & ~s.stall[iR] & ( s.dmemreq_type_B[resp] != nr )
+      s.xcelresp_en     = s.val[iR] & ~s.stall[iR] & s.xcelreq_B[resp]
+      s.wb_result_sel_R = s.wb_result_sel_B[resp]
+
+      # write back and proc2mngr in W. The RF is only written when W
+      # does not stall, which with nmem=0 also waits for the response.
+
+      s.rf_waddr_W    = s.rf_waddr_B[nback-1]
+      s.rf_wen_W      = s.val[iW] & ~s.stall[iW] & s.rf_wen_pending_B[nback-1]
+      s.proc2mngr_en  = s.val[iW] & ~s.stall[iW] & s.proc2mngr_en_B[nback-1]
+      s.commit_inst   = s.val[iW] & ~s.stall[iW]
+
+    #---------------------------------------------------------------------
+    # Performance counter events
+    #---------------------------------------------------------------------
+
+    @s.update
+    def comb_perf():
+      s.perf_commit_type = s.inst_type_B[nback-1]
+
+      s.perf_stall_imem  = s.ostall[0]
+
+      s.perf_stall_dmem  = ( s.val[iD] & ( s.ostall_ld_rs1_D | s.ostall_ld_rs2_D ) ) | \
+                           ( s.val[iX] & s.ostall_dmem_X ) | ( s.val[iR] & s.ostall_dmem_R )
+
+      s.perf_stall_mngr  = ( s.val[iD] & s.ostall_mngr_D ) | \
+                           ( s.val[iW] & s.ostall_proc2mngr_W )
+
+      s.perf_stall_xcel  = ( s.val[iD] & ( s.ostall_xcel_rs1_D | s.ostall_xcel_rs2_D ) ) | \
+                           ( s.val[iX] & s.ostall_xcel_X ) | ( s.val[iR] & s.ostall_xcel_R )
+
+      s.perf_squash = b1( 0 )
+      for i in range( iX ):
+        s.perf_squash = s.perf_squash | s.squash[i]
+
+    @s.update
+    def comb_perf_hazards():
+      s.perf_hazards = concat(
+        s.osquash_X,
+        s.val[iW] & s.ostall_proc2mngr_W,
+        s.val[iR] & s.ostall_xcel_R,
+        s.val[iR] & s.ostall_dmem_R,
+        s.val[iX] & s.ostall_xcel_X,
+        s.val[iX] & s.ostall_dmem_X,
+        b1( 0 ),
+        s.val[iD] & s.ostall_mngr_D,
+        s.val[iD] & ( s.ostall_xcel_rs1_D | s.ostall_xcel_rs2_D ),
+        s.val[iD] & ( s.ostall_ld_rs1_D | s.ostall_ld_rs2_D ),
+        s.ostall[0],
+      )
@@ -0,0 +1,285 @@
+"""
+==========================================================================
+ProcPipeDpathRTL.py
+==========================================================================
+Datapath for the RTL TinyRV0 processor with a parameterized pipeline,
+see ProcPipeCtrlRTL.py for the stages. Compared to ProcDpath
+
+ - every fetch stage after the first one keeps the PC and the fetched
+   instruction in a pair of registers,
+ - every stage after X keeps the result in a register, except that the
+   stage that gets the responses selects between its result register
+   and the dmem and xcel responses like the M stage of ProcDpath,
+ - the bypass muxes have one input for every stage from X to W.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.rtl import Adder, Incrementer, Mux, RegEnRst, RegisterFile
+
+from .MiscRTL import AluRTL, ImmGenRTL
+from .ProcDpathRTL import c_reset_inst, c_reset_vector
+
+#-------------------------------------------------------------------------
+# ProcPipeDpath
+#-------------------------------------------------------------------------
+
+class ProcPipeDpath( Component ):
+
+  def construct( s, nfetch=1, nmem=1 ):
+
+    nback   = nmem + 2
+    resp    = max( 1, nmem )
+    nstages = nfetch + 1 + nback
+    iD      = nfetch
+    iX      = nfetch + 1
+
+    BypSelType = mk_bits( clog2( nback + 1 ) )
+
+    #---------------------------------------------------------------------
+    # Interface
+    #---------------------------------------------------------------------
+
+    # imem ports
+    s.imemreq_addr   = OutPort( Bits32 )
+    s.imemresp_data  = InPort ( Bits32 )
+
+    # dmem ports
+    s.dmemreq_addr   = OutPort( Bits32 )
+    s.dmemreq_data   = OutPort( Bits32 )
+    s.dmemresp_data  = InPort ( Bits32 )
+
+    # mngr ports
+    s.mngr2proc_data = InPort ( Bits32 )
+    s.proc2mngr_data = OutPort( Bits32 )
+
+    # xcel ports
+    s.xcelreq_addr   = OutPort( Bits5 )
+    s.xcelreq_data   = OutPort( Bits32 )
+    s.xcelresp_data  = InPort ( Bits32 )
+
+    # performance counter read port
+    s.perf_rdata     = InPort ( Bits32 )
+
+    # Control signals (ctrl->dpath)
+
+    s.reg_en           = [ InPort( Bits1 ) for _ in range( nstages ) ]
+    s.pc_sel_F         = InPort ( Bits1 )
+
+    s.rs1_addr_D       = InPort ( Bits5 )
+    s.rs2_addr_D       = InPort ( Bits5 )
+    s.op1_byp_sel_D    = InPort ( BypSelType )
+    s.op2_byp_sel_D    = InPort ( BypSelType )
+    s.op2_sel_D        = InPort ( Bits2 )
+    s.imm_type_D       = InPort ( Bits3 )
+
+    s.alu_fn_X         = InPort ( Bits4 )
+
+    s.wb_result_sel_R  = InPort ( Bits2 )
+
+    s.rf_waddr_W       = InPort ( Bits5 )
+    s.rf_wen_W         = InPort ( Bits1 )
+
+    # Status signals (dpath->Ctrl)
+
+    s.inst_D           = OutPort( Bits32 )
+    s.ne_X             = OutPort( Bits1 )
+
+    #---------------------------------------------------------------------
+    # Fetch stages
+    #---------------------------------------------------------------------
+    # pc_F[j] and inst_F[j] are the PC and the instruction in fetch stage
+    # j. The instruction of the first one is the imem response.
+
+    s.pc_F   = [ Wire( Bits32 ) for _ in range( nfetch ) ]
+    s.inst_F = [ Wire( Bits32 ) for _ in range( nfetch ) ]
+
+    s.pc_plus4_F = Wire( Bits32 )
+
+    # PC+4 incrementer
+
+    s.pc_incr_F = Incrementer( Bits32, amount=4 )(
+      in_ = s.pc_F[0],
+      out = s.pc_plus4_F,
+    )
+
+    # forward delaration for branch target
+
+    s.br_target_X = Wire( Bits32 )
+
+    # PC sel mux
+
+    s.pc_sel_mux_F = Mux( Bits32, 2 )(
+      in_ = { 0: s.pc_plus4_F, 1: s.br_target_X },
+      sel = s.pc_sel_F,
+      out = s.imemreq_addr,
+    )
+
+    # PC registers
+
+    s.pc_reg_F = [ RegEnRst( Bits32, reset_value=( c_reset_vector-4 if j == 0 else 0 ) )
+                   for j in range( nfetch ) ]
+
+    for j in range( nfetch ):
+      s.connect( s.pc_reg_F[j].en,  s.reg_en[j] )
+      s.connect( s.pc_reg_F[j].out, s.pc_F[j]   )
+      if j == 0:
+        s.connect( s.pc_reg_F[j].in_, s.pc_sel_mux_F.out )
+      else:
+        s.connect( s.pc_reg_F[j].in_, s.pc_F[j-1] )
+
+    # Instruction registers of the fetch stages after the first one
+
+    s.connect( s.imemresp_data, s.inst_F[0] )
+
+    s.inst_reg_F = [ RegEnRst( Bits32, reset_value=c_reset_inst )
+                     for _ in range( nfetch - 1 ) ]
+
+    for j in range( 1, nfetch ):
+      s.connect( s.inst_reg_F[j-1].en,  s.reg_en[j]  )
+      s.connect( s.inst_reg_F[j-1].in_, s.inst_F[j-1] )
+      s.connect( s.inst_reg_F[j-1].out, s.inst_F[j]   )
+
+    #---------------------------------------------------------------------
+    # D stage
+    #---------------------------------------------------------------------
+
+    s.pc_reg_D = RegEnRst( Bits32 )(
+      en  = s.reg_en[iD],
+      in_ = s.pc_F[nfetch-1],
+    )
+
+    s.inst_D_reg = RegEnRst( Bits32, reset_value=c_reset_inst )(
+      en  = s.reg_en[iD],
+      in_ = s.inst_F[nfetch-1],
+      out = s.inst_D # to ctrl
+    )
+
+    # Register File
+
+    s.rf_rdata0_D = Wire( Bits32 )
+    s.rf_rdata1_D = Wire( Bits32 )
+
+    s.rf_wdata_W  = Wire( Bits32 )
+
+    s.rf = RegisterFile( Bits32, nregs=32, rd_ports=2, wr_ports=1, const_zero=True )(
+      raddr = { 0: s.rs1_addr_D,
+                1: s.rs2_addr_D, },
+      rdata = { 0: s.rf_rdata0_D,
+                1: s.rf_rdata1_D, },
+      wen   = { 0: s.rf_wen_W },
+      waddr = { 0: s.rf_waddr_W },
+      wdata = { 0: s.rf_wdata_W },
+    )
+
+    # Immediate generator
+
+    s.immgen_D = ImmGenRTL()( imm_type = s.imm_type_D, inst = s.inst_D )
+
+    # Results of the stages from X to W, which are also the bypasses
+
+    s.result_B = [ Wire( Bits32 ) for _ in range( nback ) ]
+
+    # op1 and op2 bypass muxes, input k+1 is stage iX+k
+
+    s.op1_byp_mux_D = Mux( Bits32, nback+1 )(
+      in_ = { 0: s.rf_rdata0_D },
+      sel = s.op1_byp_sel_D,
+    )
+
+    s.op2_byp_mux_D = Mux( Bits32, nback+1 )(
+      in_ = { 0: s.rf_rdata1_D },
+      sel = s.op2_byp_sel_D,
+    )
+
+    for k in range( nback ):
+      s.connect( s.op1_byp_mux_D.in_[k+1], s.result_B[k] )
+      s.connect( s.op2_byp_mux_D.in_[k+1], s.result_B[k] )
+
+    # op2 sel mux, see ProcDpath
+
+    s.op2_sel_mux_D = Mux( Bits32, 4 )(
+      in_ = { 0: s.op2_byp_mux_D.out,
+              1: s.immgen_D.imm,
+              2: s.mngr2proc_data,
+              3: s.perf_rdata, },
+      sel = s.op2_sel_D,
+    )
+
+    # Branch target
+
+    s.pc_plus_imm_D = Adder( Bits32 )(
+      in0 = s.pc_reg_D.out,
+      in1 = s.immgen_D.imm,
+    )
+
+    #---------------------------------------------------------------------
+    # X stage
+    #---------------------------------------------------------------------
+
+    s.br_target_reg_X = RegEnRst( Bits32, reset_value=0 )(
+      en  = s.reg_en[iX],
+      in_ = s.pc_plus_imm_D.out,
+      out = s.br_target_X,
+    )
+
+    s.op1_reg_X = RegEnRst( Bits32, reset_value=0 )(
+      en  = s.reg_en[iX],
+      in_ = s.op1_byp_mux_D.out,
+      out = s.xcelreq_data,
+    )
+
+    s.op2_reg_X = RegEnRst( Bits32, reset_value=0 )(
+      en  = s.reg_en[iX],
+      in_ = s.op2_sel_mux_D.out,
+    )
+
+    s.store_reg_X = RegEnRst( Bits32, reset_value=0 )(
+      en  = s.reg_en[iX],
+      in_ = s.op2_byp_mux_D.out, # R[rs2]
+      out = s.dmemreq_data,
+    )
+
+    s.connect( s.op2_reg_X.out[0:5], s.xcelreq_addr )
+
+    # ALU
+
+    s.alu_X = AluRTL()(
+      in0     = s.op1_reg_X.out,
+      in1     = s.op2_reg_X.out,
+      fn      = s.alu_fn_X,
+      ops_ne  = s.ne_X,
+      out     = ( s.result_B[0], s.dmemreq_addr )
+    )
+
+    #---------------------------------------------------------------------
+    # Stages after X
+    #---------------------------------------------------------------------
+    # result_reg_B[k-1] is the result register of stage iX+k
+
+    s.result_reg_B = [ RegEnRst( Bits32, reset_value=0 ) for _ in range( nback - 1 ) ]
+
+    s.wb_result_sel_mux_R = Mux( Bits32, 3 )(
+      in_ = { 1: s.dmemresp_data,
+              2: s.xcelresp_data, },
+      sel = s.wb_result_sel_R,
+    )
+
+    for k in range( 1, nback ):
+      s.connect( s.result_reg_B[k-1].en,  s.reg_en[iX+k] )
+      s.connect( s.result_reg_B[k-1].in_, s.result_B[k-1] )
+
+      if k == resp:
+        s.connect( s.result_reg_B[k-1].out,     s.wb_result_sel_mux_R.in_[0] )
+        s.connect( s.wb_result_sel_mux_R.out,   s.result_B[k] )
+      else:
+        s.connect( s.result_reg_B[k-1].out,     s.result_B[k] )
+
+    # W stage
+
+    s.connect( s.result_B[nback-1], s.rf_wdata_W     )
+    s.connect( s.result_B[nback-1], s.proc2mngr_data )
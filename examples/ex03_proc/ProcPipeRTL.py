@@ -0,0 +1,343 @@
+"""
+==========================================================================
+ProcPipeRTL.py
+==========================================================================
+TinyRV0 RTL proc with a parameterized pipeline depth, built from
+ProcPipeCtrl and ProcPipeDpath. mk_proc_rtl( nfetch, nmem ) returns a
+processor class with nfetch fetch stages and nmem memory stages that can
+be used wherever ProcRTL is, including translation. The variants are
+
+  ProcPipeRTL_1f0m  F D X W       merged X/M, the response is taken in W
+  ProcPipeRTL_1f1m  F D X M W     same as ProcRTL
+  ProcPipeRTL_2f1m  F F D X M W   extra fetch stage
+  ProcPipeRTL_1f2m  F D X M M W   split memory stage
+
+A deeper pipeline shortens the logic of every stage, the extra fetch
+stage adds a cycle to every taken branch, and the split memory stage
+adds a cycle to every load-use hazard. With the CPI from proc-sim or the
+benchmark suite and the cycle time from synthesizing the translated
+variants, the two can be traded off against each other.
+
+Wide accelerator writes are not supported.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import RecvIfcRTL, SendIfcRTL, mk_mem_msg, mk_xcel_msg
+from pymtl3.stdlib.ifcs.mem_ifcs import MemMasterIfcRTL
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcRTL
+from pymtl3.stdlib.rtl.enrdy_queues import BypassQueue2RTL
+from pymtl3.stdlib.rtl.queues import BypassQueueRTL
+
+from .MiscRTL import DropUnitRTL, PerfCountersRTL
+from .ProcPipeCtrlRTL import ProcPipeCtrl
+from .ProcPipeDpathRTL import ProcPipeDpath
+from .tinyrv0_encoding import disassemble_inst
+from .TinyRV0InstRTL import inst_dict
+
+#-------------------------------------------------------------------------
+# Stage names
+#-------------------------------------------------------------------------
+
+def pipe_stage_names( nfetch=1, nmem=1 ):
+  def numbered( name, n ):
+    return [ name ] if n == 1 else [ "{}{}".format( name, i+1 ) for i in range( n ) ]
+  return numbered( "F", nfetch ) + [ "D", "X" ] + numbered( "M", nmem ) + [ "W" ]
+
+#-------------------------------------------------------------------------
+# ProcPipeRTL
+#-------------------------------------------------------------------------
+
+class ProcPipeRTL( Component ):
+
+  def construct( s, xcel_nbits=32, nfetch=1, nmem=1 ):
+
+    assert xcel_nbits == 32, \
+      "ProcPipeRTL does not support wide accelerator writes!"
+
+    req_class, resp_class = mk_mem_msg( 8, 32, 32 )
+
+    s.nfetch      = nfetch
+    s.nmem        = nmem
+    s.pipe_stages = pipe_stage_names( nfetch, nmem )
+
+    # Proc/Mngr Interface
+
+    s.mngr2proc = RecvIfcRTL( Bits32 )
+    s.proc2mngr = SendIfcRTL( Bits32 )
+
+    # Instruction Memory Request/Response Interface
+
+    s.imem = MemMasterIfcRTL( req_class, resp_class )
+
+    # Data Memory Request/Response Interface
+
+    s.dmem = MemMasterIfcRTL( req_class, resp_class )
+
+    # Xcel Request/Response Interface
+
+    xreq_class, xresp_class = mk_xcel_msg( 5, xcel_nbits )
+
+    s.xcel = XcelMasterIfcRTL( xreq_class, xresp_class )
+
+    # val_W port used for counting commited insts.
+
+    s.commit_inst = OutPort( Bits1 )
+
+    # All performance counters, see ProcRTL
+
+    s.perf_dump = OutPort( mk_bits( 32*32 ) )
+
+    # imem drop unit
+
+    s.imemresp_drop = m = DropUnitRTL( Bits32 )
+    s.connect_pairs(
+      m.in_.en,  s.imem.resp.en,
+      m.in_.rdy, s.imem.resp.rdy,
+      m.in_.msg, s.imem.resp.msg.data,
+    )
+
+    # Bypass queues
+
+    s.imemreq_q   = BypassQueue2RTL( req_class, 2 )( deq = s.imem.req )
+
+    s.imemresp_q  = BypassQueueRTL( Bits32, 1 )( enq = s.imemresp_drop.out )
+    s.dmemresp_q  = BypassQueueRTL( resp_class, 1 )( enq = s.dmem.resp )
+    s.mngr2proc_q = BypassQueueRTL( Bits32, 1 )( enq = s.mngr2proc )
+    s.xcelresp_q  = BypassQueueRTL( xresp_class, 1 )( enq = s.xcel.resp )
+
+    # Control
+
+    s.ctrl  = ProcPipeCtrl( nfetch, nmem )(
+
+      # imem port
+      imemresp_drop = s.imemresp_drop.drop,
+      imemreq_en    = s.imemreq_q.enq.en,
+      imemreq_rdy   = s.imemreq_q.enq.rdy,
+      imemresp_en   = s.imemresp_q.deq.en,
+      imemresp_rdy  = s.imemresp_q.deq.rdy,
+
+      # dmem port
+      dmemreq_en    = s.dmem.req.en,
+      dmemreq_rdy   = s.dmem.req.rdy,
+      dmemreq_type  = s.dmem.req.msg.type_,
+      dmemresp_en   = s.dmemresp_q.deq.en,
+      dmemresp_rdy  = s.dmemresp_q.deq.rdy,
+
+      # xcel port
+      xcelreq_en    = s.xcel.req.en,
+      xcelreq_rdy   = s.xcel.req.rdy,
+      xcelresp_en   = s.xcelresp_q.deq.en,
+      xcelresp_rdy  = s.xcelresp_q.deq.rdy,
+
+      # proc2mngr and mngr2proc
+      proc2mngr_en  = s.proc2mngr.en,
+      proc2mngr_rdy = s.proc2mngr.rdy,
+      mngr2proc_en  = s.mngr2proc_q.deq.en,
+      mngr2proc_rdy = s.mngr2proc_q.deq.rdy,
+
+      # commit inst for counting
+      commit_inst = s.commit_inst
+    )
+
+    # Dpath
+
+    s.dpath = ProcPipeDpath( nfetch, nmem )(
+
+      # imem ports
+      imemreq_addr  = s.imemreq_q.enq.msg.addr,
+      imemresp_data = s.imemresp_q.deq.msg,
+
+      # dmem ports
+      dmemreq_addr  = s.dmem.req.msg.addr,
+      dmemreq_data  = s.dmem.req.msg.data,
+      dmemresp_data = s.dmemresp_q.deq.msg.data,
+
+      # xcel ports
+      xcelresp_data = s.xcelresp_q.deq.msg.data,
+
+      # mngr
+      mngr2proc_data = s.mngr2proc_q.deq.msg,
+      proc2mngr_data = s.proc2mngr.msg,
+
+    )
+
+    # Performance counters, read by csrr in D stage
+
+    s.perf = PerfCountersRTL()(
+      commit_inst = s.ctrl.commit_inst,
+      commit_type = s.ctrl.perf_commit_type,
+      stall_imem  = s.ctrl.perf_stall_imem,
+      stall_dmem  = s.ctrl.perf_stall_dmem,
+      stall_mngr  = s.ctrl.perf_stall_mngr,
+      stall_xcel  = s.ctrl.perf_stall_xcel,
+      squash      = s.ctrl.perf_squash,
+      hazards     = s.ctrl.perf_hazards,
+      raddr       = s.dpath.inst_D[20:25],
+      rdata       = s.dpath.perf_rdata,
+      dump        = s.perf_dump,
+    )
+
+    @s.update
+    def up_xcelreq():
+      s.xcel.req.msg = xreq_class(
+        s.ctrl.xcelreq_type,
+        s.dpath.xcelreq_addr,
+        s.dpath.xcelreq_data,
+      )
+
+    # Ctrl <-> Dpath
+
+    for i in range( len( s.pipe_stages ) ):
+      s.connect( s.ctrl.reg_en[i], s.dpath.reg_en[i] )
+
+    s.connect_pairs(
+      s.ctrl.pc_sel_F       , s.dpath.pc_sel_F,
+
+      s.ctrl.rs1_addr_D     , s.dpath.rs1_addr_D,
+      s.ctrl.rs2_addr_D     , s.dpath.rs2_addr_D,
+      s.ctrl.op1_byp_sel_D  , s.dpath.op1_byp_sel_D,
+      s.ctrl.op2_byp_sel_D  , s.dpath.op2_byp_sel_D,
+      s.ctrl.op2_sel_D      , s.dpath.op2_sel_D,
+      s.ctrl.imm_type_D     , s.dpath.imm_type_D,
+
+      s.ctrl.alu_fn_X       , s.dpath.alu_fn_X,
+
+      s.ctrl.wb_result_sel_R, s.dpath.wb_result_sel_R,
+
+      s.ctrl.rf_waddr_W     , s.dpath.rf_waddr_W,
+      s.ctrl.rf_wen_W       , s.dpath.rf_wen_W,
+
+      s.dpath.inst_D        , s.ctrl.inst_D,
+      s.dpath.ne_X          , s.ctrl.ne_X,
+    )
+
+  #-----------------------------------------------------------------------
+  # perf_counters
+  #-----------------------------------------------------------------------
+  # See ProcRTL
+
+  def perf_counters( s ):
+    return [ int(x) for x in s.perf.counters_next ]
+
+  #-----------------------------------------------------------------------
+  # arch_regs
+  #-----------------------------------------------------------------------
+  # See ProcRTL
+
+  def arch_regs( s ):
+    regs = [ int(x) for x in s.dpath.rf.regs ]
+    if s.ctrl.rf_wen_W and s.ctrl.rf_waddr_W != 0:
+      regs[ int(s.ctrl.rf_waddr_W) ] = int( s.dpath.rf_wdata_W )
+    regs[0] = 0
+    return regs
+
+  #-----------------------------------------------------------------------
+  # Per-stage helpers
+  #-----------------------------------------------------------------------
+  # What every stage shows in the line trace and the pipeline trace:
+  # the PC in the fetch stages, the disassembly in D, and the
+  # instruction type after D. None for an empty stage.
+
+  def _stage_insts( s ):
+    ctrl   = s.ctrl
+    nfetch = s.nfetch
+    insts  = []
+
+    for i, name in enumerate( s.pipe_stages ):
+      if not ctrl.val[i]:
+        insts.append( None )
+      elif i < nfetch:
+        insts.append( "{:08x}".format( s.dpath.pc_F[i].uint() ) )
+      elif i == nfetch:
+        insts.append( disassemble_inst( ctrl.inst_D ) )
+      else:
+        insts.append( inst_dict[ ctrl.inst_type_B[ i - nfetch - 1 ] ] )
+
+    return insts
+
+  #-----------------------------------------------------------------------
+  # pipe_events
+  #-----------------------------------------------------------------------
+  # Per-stage events of this cycle for the pipeline trace writer
+
+  def pipe_events( s ):
+    ctrl   = s.ctrl
+    events = []
+
+    for i, inst in enumerate( s._stage_insts() ):
+      if inst is None:
+        continue
+      if   ctrl.squash[i]: status = "squash"
+      elif ctrl.stall[i]:  status = "stall"
+      else:                status = "work"
+      events.append( ( s.pipe_stages[i], inst, status ) )
+
+    return events
+
+  #-----------------------------------------------------------------------
+  # profile_pcs
+  #-----------------------------------------------------------------------
+  # See ProcRTL
+
+  def profile_pcs( s ):
+    ctrl = s.ctrl
+    iD   = s.nfetch
+    if not ctrl.val[iD] or ctrl.squash[iD]:
+      return []
+    return [ (s.dpath.pc_reg_D.out.uint(), not ctrl.stall[iD]) ]
+
+  #-----------------------------------------------------------------------
+  # Line tracing
+  #-----------------------------------------------------------------------
+  # Same format as ProcRTL, with one column per stage
+
+  def line_trace( s ):
+    ctrl   = s.ctrl
+    nfetch = s.nfetch
+    strs   = []
+
+    for i, inst in enumerate( s._stage_insts() ):
+      width = 8 if i < nfetch else 23 if i == nfetch else 5
+
+      if   inst is None:   inst = ' '
+      elif ctrl.squash[i]: inst = '~'
+      elif ctrl.stall[i]:  inst = '#'
+
+      strs.append( "{:<{}s}".format( inst, width ) )
+
+    return "[{}]".format( "|".join( strs ) )
+
+#-------------------------------------------------------------------------
+# mk_proc_rtl
+#-------------------------------------------------------------------------
+# Returns the processor class with nfetch fetch stages and nmem memory
+# stages. The class only takes xcel_nbits like ProcRTL, so that the test
+# harnesses can build it, and is named after its stages for translation.
+
+_proc_rtl_classes = {}
+
+def mk_proc_rtl( nfetch=1, nmem=1 ):
+  key = ( nfetch, nmem )
+
+  if key not in _proc_rtl_classes:
+
+    def construct( s, xcel_nbits=32 ):
+      ProcPipeRTL.construct( s, xcel_nbits, nfetch, nmem )
+
+    name = "ProcPipeRTL_{}f{}m".format( nfetch, nmem )
+    _proc_rtl_classes[ key ] = type( name, ( ProcPipeRTL, ), {
+      "construct"  : construct,
+      "__module__" : __name__,
+    })
+
+  return _proc_rtl_classes[ key ]
+
+ProcPipeRTL_1f0m = mk_proc_rtl( nfetch=1, nmem=0 )
+ProcPipeRTL_1f1m = mk_proc_rtl( nfetch=1, nmem=1 )
+ProcPipeRTL_2f1m = mk_proc_rtl( nfetch=2, nmem=1 )
+ProcPipeRTL_1f2m = mk_proc_rtl( nfetch=1, nmem=2 )
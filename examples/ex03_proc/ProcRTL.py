@@ -17,16 +17,29 @@ from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcRTL
 from pymtl3.stdlib.rtl.enrdy_queues import BypassQueue2RTL
 from pymtl3.stdlib.rtl.queues import BypassQueueRTL
 
-from .MiscRTL import DropUnitRTL
+from .MiscRTL import DropUnitRTL, PerfCountersRTL
 from .ProcCtrlRTL import ProcCtrl
 from .ProcDpathRTL import ProcDpath
+from .perf_counters import counter_csr_nregs, counter_hazard_base, counter_nhazards
 from .tinyrv0_encoding import disassemble_inst
 from .TinyRV0InstRTL import inst_dict
 
 
 class ProcRTL( Component ):
 
-  def construct( s ):
+  # The per-stage hazard counters (see perf_counters.py) are kept
+  #
+  #  - "hw"  : in PerfCountersRTL, readable with csrr and through perf_dump
+  #  - "sim" : in a python list updated by the simulator, which adds no
+  #            hardware but cannot be translated; csrr reads 0
+  #  - "off" : nowhere, they read 0
+  #
+  # perf_counters() returns them in the first two modes.
+
+  def construct( s, xcel_nbits=32, perf_hazards="hw" ):
+
+    assert perf_hazards in [ "hw", "sim", "off" ], \
+      "unknown perf_hazards mode {}!".format( perf_hazards )
 
     req_class, resp_class = mk_mem_msg( 8, 32, 32 )
 
@@ -45,7 +58,7 @@ class ProcRTL( Component ):
 
     # Xcel Request/Response Interface
 
-    xreq_class, xresp_class = mk_xcel_msg( 5, 32 )
+    xreq_class, xresp_class = mk_xcel_msg( 5, xcel_nbits )
 
     s.xcel = XcelMasterIfcRTL( xreq_class, xresp_class )
 
@@ -53,6 +66,11 @@ class ProcRTL( Component ):
 
     s.commit_inst = OutPort( Bits1 )
 
+    # All performance counters, so that a simulator can read them once at
+    # the end of a run instead of watching commit_inst every cycle
+
+    s.perf_dump = OutPort( mk_bits( 32*32 ) )
+
     # imem drop unit
 
     s.imemresp_drop = m = DropUnitRTL( Bits32 )
@@ -75,7 +93,7 @@ class ProcRTL( Component ):
 
     # Control
 
-    s.ctrl  = ProcCtrl()(
+    s.ctrl  = ProcCtrl( wide_xcel=( xcel_nbits == 128 ) )(
 
       # imem port
       imemresp_drop = s.imemresp_drop.drop,
@@ -107,9 +125,16 @@ class ProcRTL( Component ):
       commit_inst = s.commit_inst
     )
 
-    # Dpath
+    # Dpath. Only the low 32 bits of a wide accelerator response go to
+    # the register file. A narrow response is connected as is, since CL
+    # accelerators answer writes with a plain int.
 
-    s.dpath = ProcDpath()(
+    if xcel_nbits == 32:
+      xcelresp_data = s.xcelresp_q.deq.msg.data
+    else:
+      xcelresp_data = s.xcelresp_q.deq.msg.data[0:32]
+
+    s.dpath = ProcDpath( xcel_nbits )(
 
       # imem ports
       imemreq_addr  = s.imemreq_q.enq.msg.addr,
@@ -121,13 +146,49 @@ class ProcRTL( Component ):
       dmemresp_data = s.dmemresp_q.deq.msg.data,
 
       # xcel ports
-      xcelresp_data = s.xcelresp_q.deq.msg.data,
+      xcelresp_data = xcelresp_data,
 
       # mngr
       mngr2proc_data = s.mngr2proc_q.deq.msg,
       proc2mngr_data = s.proc2mngr.msg,
 
     )
+    # Performance counters, read by csrr in D stage
+
+    s.perf = PerfCountersRTL( hazards=( perf_hazards == "hw" ) )(
+      commit_inst = s.ctrl.commit_inst,
+      commit_type = s.ctrl.perf_commit_type,
+      stall_imem  = s.ctrl.perf_stall_imem,
+      stall_dmem  = s.ctrl.perf_stall_dmem,
+      stall_mngr  = s.ctrl.perf_stall_mngr,
+      stall_xcel  = s.ctrl.perf_stall_xcel,
+      squash      = s.ctrl.perf_squash,
+      hazards     = s.ctrl.perf_hazards,
+      raddr       = s.dpath.inst_D[20:25],
+      rdata       = s.dpath.perf_rdata,
+      dump        = s.perf_dump,
+    )
+
+    # Simulation-only hazard counters. Like the counters in PerfCountersRTL
+    # they sample the events at the clock edge, so both modes count the
+    # same cycles.
+
+    s.perf_hazards_mode = perf_hazards
+    s.hazard_counts     = hazard_counts = [ 0 ] * counter_nhazards
+
+    if perf_hazards == "sim":
+
+      @s.update_on_edge
+      def up_hazard_counts():
+        if s.reset:
+          for i in range( counter_nhazards ):
+            hazard_counts[i] = 0
+        else:
+          hazards = s.ctrl.perf_hazards
+          for i in range( counter_nhazards ):
+            if hazards[i]:
+              hazard_counts[i] += 1
+
     @s.update
     def up_xcelreq():
       s.xcel.req.msg = xreq_class(
@@ -143,6 +204,9 @@ class ProcRTL( Component ):
       s.ctrl.pc_sel_F       , s.dpath.pc_sel_F,
 
       s.ctrl.reg_en_D       , s.dpath.reg_en_D,
+      s.ctrl.rs1_addr_D     , s.dpath.rs1_addr_D,
+      s.ctrl.rs2_addr_D     , s.dpath.rs2_addr_D,
+      s.ctrl.wide_lo_en_D   , s.dpath.wide_lo_en_D,
       s.ctrl.op1_byp_sel_D  , s.dpath.op1_byp_sel_D,
       s.ctrl.op2_byp_sel_D  , s.dpath.op2_byp_sel_D,
       s.ctrl.op2_sel_D      , s.dpath.op2_sel_D,
@@ -150,6 +214,7 @@ class ProcRTL( Component ):
 
       s.ctrl.reg_en_X       , s.dpath.reg_en_X,
       s.ctrl.alu_fn_X       , s.dpath.alu_fn_X,
+      s.ctrl.xcelreq_wide   , s.dpath.xcelreq_wide_X,
 
       s.ctrl.reg_en_M       , s.dpath.reg_en_M,
       s.ctrl.wb_result_sel_M, s.dpath.wb_result_sel_M,
@@ -162,6 +227,80 @@ class ProcRTL( Component ):
       s.dpath.ne_X          , s.ctrl.ne_X,
     )
 
+  #-----------------------------------------------------------------------
+  # perf_counters
+  #-----------------------------------------------------------------------
+
+  # Like the dump port of PerfCountersRTL, this includes the events of the
+  # current cycle, so the instruction that commits in the cycle in which
+  # the simulation stops is counted.
+
+  def perf_counters( s ):
+    counters = [ int(x) for x in s.perf.counters_next ]
+    counters += [ 0 ] * ( counter_csr_nregs - len( counters ) )
+    if s.perf_hazards_mode == "sim":
+      hazards = s.ctrl.perf_hazards
+      counters[ counter_hazard_base : counter_hazard_base + counter_nhazards ] = \
+        [ x + int( hazards[i] ) for i, x in enumerate( s.hazard_counts ) ]
+    return counters
+
+  #-----------------------------------------------------------------------
+  # arch_regs
+  #-----------------------------------------------------------------------
+  # The register file is written at the end of the cycle in which the
+  # instruction in W commits, so that pending write is part of the
+  # committed state.
+
+  def arch_regs( s ):
+    regs = [ int(x) for x in s.dpath.rf.regs ]
+    if s.ctrl.rf_wen_W and s.ctrl.rf_waddr_W != 0:
+      regs[ int(s.ctrl.rf_waddr_W) ] = int( s.dpath.rf_wdata_W )
+    regs[0] = 0
+    return regs
+
+  #-----------------------------------------------------------------------
+  # pipe_events
+  #-----------------------------------------------------------------------
+  # Per-stage events of this cycle for the pipeline trace writer
+
+  pipe_stages = [ "F", "D", "X", "M", "W" ]
+
+  def pipe_events( s ):
+    ctrl   = s.ctrl
+    events = []
+
+    def status( squash, stall ):
+      if squash: return "squash"
+      if stall:  return "stall"
+      return "work"
+
+    if ctrl.val_F:
+      events.append( ("F", "{:08x}".format( s.dpath.pc_reg_F.out.uint() ),
+                      status( ctrl.squash_F, ctrl.stall_F )) )
+    if ctrl.val_D:
+      events.append( ("D", disassemble_inst( ctrl.inst_D ),
+                      status( ctrl.squash_D, ctrl.stall_D )) )
+    if ctrl.val_X:
+      events.append( ("X", inst_dict[ ctrl.inst_type_X ], status( 0, ctrl.stall_X )) )
+    if ctrl.val_M:
+      events.append( ("M", inst_dict[ ctrl.inst_type_M ], status( 0, ctrl.stall_M )) )
+    if ctrl.val_W:
+      events.append( ("W", inst_dict[ ctrl.inst_type_W ], status( 0, ctrl.stall_W )) )
+
+    return events
+
+  #-----------------------------------------------------------------------
+  # profile_pcs
+  #-----------------------------------------------------------------------
+  # The instruction in D and whether it leaves D this cycle. Once an
+  # instruction leaves D it can no longer be squashed, so it will commit.
+
+  def profile_pcs( s ):
+    ctrl = s.ctrl
+    if not ctrl.val_D or ctrl.squash_D:
+      return []
+    return [ (s.dpath.pc_reg_D.out.uint(), not ctrl.stall_D) ]
+
   #-----------------------------------------------------------------------
   # Line tracing
   #-----------------------------------------------------------------------
@@ -4,7 +4,9 @@
 # This is a basic class representing a sparse memory image using
 # "sections" and "symbols". Sections are tuples of <name,addr,data> where
 # the addr specifies where the data lives in a flat memory space. Symbols
-# are simply name to address mappings.
+# are simply name to address mappings. Each symbol can also remember the
+# section it belongs to. We keep a reverse index from addresses to
+# symbols so that tools like profilers can cheaply symbolize a PC.
 #
 # Author : Christopher Batten
 # Date   : May 20, 2014
@@ -12,6 +14,7 @@
 from __future__ import absolute_import, division, print_function
 
 import binascii
+import bisect
 import struct
 
 
@@ -42,8 +45,14 @@ class SparseMemoryImage (object):
   #-----------------------------------------------------------------------
 
   def __init__( self ):
-    self.sections = []
-    self.symbols  = {}
+    self.sections        = []
+    self.symbols         = {}
+    self.symbol_sections = {}
+
+    # Reverse index, rebuilt lazily after symbols are added
+
+    self.addr_symbols = None
+    self.sorted_addrs = None
 
   #-----------------------------------------------------------------------
   # add/get sections
@@ -81,12 +90,58 @@ class SparseMemoryImage (object):
   # add/get symbols
   #-----------------------------------------------------------------------
 
-  def add_symbol( self, symbol_name, symbol_addr ):
+  def add_symbol( self, symbol_name, symbol_addr, section_name=None ):
     self.symbols[ symbol_name ] = symbol_addr
+    if section_name is not None:
+      self.symbol_sections[ symbol_name ] = section_name
+    self.addr_symbols = None
 
   def get_symbol( self, symbol_name ):
     return self.symbols[ symbol_name ]
 
+  def get_symbol_section( self, symbol_name ):
+    return self.symbol_sections.get( symbol_name )
+
+  #-----------------------------------------------------------------------
+  # reverse lookup
+  #-----------------------------------------------------------------------
+
+  def _build_addr_index( self ):
+    self.addr_symbols = {}
+    for name, addr in self.symbols.items():
+      self.addr_symbols.setdefault( addr, [] ).append( name )
+    for names in self.addr_symbols.values():
+      names.sort()
+    self.sorted_addrs = sorted( self.addr_symbols )
+
+  # All symbols that point exactly to addr
+
+  def get_symbols_at( self, addr ):
+    if self.addr_symbols is None:
+      self._build_addr_index()
+    return self.addr_symbols.get( addr, [] )
+
+  # Closest symbol at or before addr, returned as a ( name, offset ) pair.
+  # Returns None if there is no symbol before addr.
+
+  def lookup_symbol( self, addr ):
+    if self.addr_symbols is None:
+      self._build_addr_index()
+    idx = bisect.bisect_right( self.sorted_addrs, addr )
+    if idx == 0:
+      return None
+    sym_addr = self.sorted_addrs[ idx-1 ]
+    return self.addr_symbols[ sym_addr ][0], addr - sym_addr
+
+  def symbolize( self, addr ):
+    sym = self.lookup_symbol( addr )
+    if sym is None:
+      return "{:0>8x}".format( addr )
+    name, offset = sym
+    if offset == 0:
+      return name
+    return "{}+0x{:x}".format( name, offset )
+
   #-----------------------------------------------------------------------
   # equality
   #-----------------------------------------------------------------------
@@ -100,8 +155,8 @@ class SparseMemoryImage (object):
   #-----------------------------------------------------------------------
 
   def print_symbol_table( self ):
-    for key,value in self.symbols.iteritems():
-      print( " {:0>8x} {}".format( value, key ) )
+    for key,value in sorted( self.symbols.items(), key=lambda x: x[1] ):
+      print( " {:0>8x} {:<10} {}".format( value, self.symbol_sections.get( key, "" ), key ) )
 
 #-------------------------------------------------------------------------
 # mk_section
@@ -100,6 +100,12 @@ CSR_PROC2MNGR = b12(0x7C0)
 # R/O
 CSR_MNGR2PROC = b12(0xFC0)
 
+# R/O performance counters 0xC00-0xC1F, matched on csrnum[5:12]
+CSR_COUNTER   = b7(0b1100000)
+
+# W/O wide accelerator registers 0x7A0-0x7BF, matched on csrnum[5:12]
+CSR_XCEL_WIDE = b7(0b0111101)
+
 #-----------------------------------------------------------------------
 # DecodeInstType
 #-----------------------------------------------------------------------
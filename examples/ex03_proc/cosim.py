@@ -0,0 +1,156 @@
+"""
+==========================================================================
+cosim.py
+==========================================================================
+Lockstep co-simulation of a processor against ProcFL. Both processors
+run the same program in their own test harness. Every time the
+processor under test commits instructions, ProcFL is ticked until it has
+committed the same number of instructions, and the architectural
+register files of the two processors are compared through arch_regs().
+The co-simulation stops at the first divergence and reports the
+instruction that ProcFL committed last together with the registers that
+differ.
+
+The run ends once ProcFL has left the .text section and the processor
+under test has committed as many instructions as ProcFL did, so the
+program does not need any proc2mngr outputs to be checked. If it does
+have them, the test sinks check them as usual.
+
+Only processors that implement arch_regs() can be co-simulated, which
+excludes translated and imported processors.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+
+from .NullXcel import NullXcelRTL
+from .ProcFL import ProcFL
+from .test.harness import TestHarness
+from .tinyrv0_encoding import disassemble_inst
+
+#-------------------------------------------------------------------------
+# CosimDivergence
+#-------------------------------------------------------------------------
+
+class CosimDivergence( Exception ):
+
+  def __init__( self, ncycles, ninsts, pc, inst, diffs, reason=None ):
+    self.ncycles = ncycles
+    self.ninsts  = ninsts
+    self.pc      = pc
+    self.inst    = inst
+    self.diffs   = diffs
+    self.reason  = reason
+
+    where = "after {} commits, cycle {}".format( ninsts, ncycles )
+    if pc is not None:
+      where += ", last ref commit {:08x} {}".format( pc, disassemble_inst( inst ) )
+
+    lines = [ "Co-simulation diverged {}".format( where ) ]
+    if reason:
+      lines.append( "  " + reason )
+    for idx, ref, dut in diffs:
+      lines.append( "  x{:02}: ref {:08x} dut {:08x}".format( idx, ref, dut ) )
+
+    super( CosimDivergence, self ).__init__( "\n".join( lines ) )
+
+#-------------------------------------------------------------------------
+# LockstepCosim
+#-------------------------------------------------------------------------
+
+class LockstepCosim( object ):
+
+  def __init__( self, DutType, mem_image, xcel_cls=NullXcelRTL,
+                src_delay=0, sink_delay=0, mem_stall_prob=0, mem_latency=1,
+                max_ref_cycles=1000 ):
+
+    assert hasattr( DutType, "arch_regs" ), \
+      "{} does not implement arch_regs()!".format( DutType.__name__ )
+
+    # The reference always runs without delays
+
+    self.ref = TestHarness( ProcFL, xcel_cls )
+    self.dut = TestHarness( DutType, xcel_cls, False, src_delay, sink_delay,
+                            mem_stall_prob, mem_latency )
+
+    for th in [ self.ref, self.dut ]:
+      th.elaborate()
+      th.load( mem_image )
+      th.apply( SimulationPass )
+      th.sim_reset()
+
+    text = mem_image.get_section( ".text" )
+    self.text_begin = text.addr
+    self.text_end   = text.addr + len( text.data )
+
+    self.max_ref_cycles = max_ref_cycles
+    self.ncycles        = 0
+    self.ninsts         = 0
+    self.ref_ninsts     = 0
+
+  # ProcFL executes one instruction per commit, so its PC tells us
+  # whether it has run off the end of the program
+
+  def ref_finished( self ):
+    return not ( self.text_begin <= int( self.ref.proc.PC ) < self.text_end )
+
+  def done( self ):
+    return self.ref_finished() and self.ninsts == self.ref_ninsts
+
+  def _diverged( self, diffs, reason=None ):
+    proc = self.ref.proc
+    pc   = None if proc.inst_pc is None else int( proc.inst_pc )
+    raise CosimDivergence( self.ncycles, self.ninsts, pc, proc.raw_inst, diffs, reason )
+
+  #-----------------------------------------------------------------------
+  # step
+  #-----------------------------------------------------------------------
+  # Tick the processor under test once and bring the reference to the
+  # same number of committed instructions.
+
+  def step( self ):
+    self.dut.tick()
+    self.ncycles += 1
+
+    ncommits = int( self.dut.proc.commit_inst )
+    if not ncommits:
+      return
+
+    self.ninsts += ncommits
+
+    while self.ref_ninsts < self.ninsts:
+      if self.ref_finished():
+        self._diverged( [], "dut committed more instructions than ref" )
+
+      for _ in range( self.max_ref_cycles ):
+        self.ref.tick()
+        if self.ref.proc.commit_inst:
+          break
+      else:
+        self._diverged( [], "ref did not commit within {} cycles".format(
+                            self.max_ref_cycles ) )
+
+      self.ref_ninsts += 1
+
+    ref_regs = self.ref.proc.arch_regs()
+    dut_regs = self.dut.proc.arch_regs()
+    if ref_regs != dut_regs:
+      self._diverged( [ ( i, x, y ) for i, ( x, y ) in enumerate( zip( ref_regs, dut_regs ) )
+                        if x != y ] )
+
+  #-----------------------------------------------------------------------
+  # run
+  #-----------------------------------------------------------------------
+  # Returns the number of cycles and committed instructions of the
+  # processor under test.
+
+  def run( self, max_cycles=100000 ):
+    while not self.done():
+      assert self.ncycles < max_cycles, \
+        "Co-simulation timed out after {} cycles".format( max_cycles )
+      self.step()
+
+    return self.ncycles, self.ninsts
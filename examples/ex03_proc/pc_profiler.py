@@ -0,0 +1,99 @@
+"""
+==========================================================================
+pc_profiler.py
+==========================================================================
+Hot-PC profiler for the TinyRV0 processors. Every cycle, the profiler
+asks the processor which instructions occupy its issue stage (D for
+ProcRTL, DXM for the CL models, and the executing instruction for
+ProcFL) through profile_pcs(). It returns a list of ( pc, issued )
+pairs, oldest first. The profiler then
+
+ - counts one commit for every instruction that issued,
+ - charges the cycle to the oldest instruction in the issue stage, or
+   to the last issued instruction if the issue stage is empty.
+
+In other words, an instruction is charged for every cycle it waits in
+the issue stage, plus the bubbles behind it, e.g., the cycles lost to a
+taken branch or an imem stall. The charged cycles add up to the total
+number of cycles of the run.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import struct
+from collections import defaultdict
+
+from pymtl3 import *
+
+from .tinyrv0_encoding import disassemble_inst
+
+#-------------------------------------------------------------------------
+# PcProfiler
+#-------------------------------------------------------------------------
+
+class PcProfiler( object ):
+
+  def __init__( self ):
+    self.commits  = defaultdict( int )
+    self.cycles   = defaultdict( int )
+    self.last_pc  = None
+    self.ncycles  = 0
+
+  def tick( self, pcs ):
+    self.ncycles += 1
+
+    if pcs:
+      self.cycles[ pcs[0][0] ] += 1
+    else:
+      self.cycles[ self.last_pc ] += 1
+
+    for pc, issued in pcs:
+      if issued:
+        self.commits[ pc ] += 1
+        self.last_pc = pc
+
+  #-----------------------------------------------------------------------
+  # print_listing
+  #-----------------------------------------------------------------------
+  # Print the .text section of the memory image annotated with commits and
+  # cycles per PC, followed by the hottest PCs.
+
+  def print_listing( self, mem_image, nhot=10 ):
+
+    text  = mem_image.get_section( ".text" )
+    total = max( self.ncycles, 1 )
+    disasm_dict = {}
+
+    print( "  {:>8} {:>8} {:>6}  {:<8}  {}".format(
+           "commits", "cycles", "%", "pc", "inst" ) )
+
+    if self.cycles[ None ]:
+      print( "  {:>8} {:>8} {:>5.1f}%  {:<8}  (before first issue)".format(
+             "", self.cycles[ None ], 100.0 * self.cycles[ None ] / total, "" ) )
+
+    for i in range( 0, len(text.data), 4 ):
+      addr = text.addr + i
+      bits = struct.unpack_from( "<I", bytes( text.data[i:i+4] ) )[0]
+      disasm_dict[ addr ] = disassemble_inst( Bits32( bits ) )
+
+      for name in mem_image.get_symbols_at( addr ):
+        print( "{}:".format( name ) )
+
+      commits = self.commits.get( addr, 0 )
+      cycles  = self.cycles.get( addr, 0 )
+      print( "  {:>8} {:>8} {:>5.1f}%  {:0>8x}  {}".format(
+             commits, cycles, 100.0 * cycles / total, addr, disasm_dict[ addr ] ) )
+
+    print()
+    print( "  Hottest PCs" )
+
+    hot = sorted( [ x for x in self.cycles if x is not None ],
+                  key=lambda x: -self.cycles[ x ] )[:nhot]
+
+    for addr in hot:
+      print( "  {:>8} {:>8} {:>5.1f}%  {:0>8x}  {:<24} <{}>".format(
+             self.commits.get( addr, 0 ), self.cycles[ addr ],
+             100.0 * self.cycles[ addr ] / total, addr,
+             disasm_dict.get( addr, "?" ), mem_image.symbolize( addr ) ) )
@@ -0,0 +1,178 @@
+"""
+==========================================================================
+perf_counters.py
+==========================================================================
+Performance counters shared by the TinyRV0 processors. Each processor
+keeps a bank of 32 counters that can be read with csrr from the CSR
+range 0xC00-0xC1F (the same range RISC-V uses for its read-only user
+counters). The counter at csrnum 0xC00+i lives at index i:
+
+  0       cycles
+  2       committed instructions
+  3-13    committed instructions per opcode (see counter_inst_names)
+  16-20   stall cycles per cause (see counter_stall_causes)
+  21-31   RTL pipeline hazards per stage and cause (see counter_hazard_causes)
+
+A stall counter is incremented at most once per cycle no matter how many
+pipeline stages stall for the same cause in that cycle.
+
+The hazard counters break the stalls and squashes of the RTL pipeline
+down by the stage they originate from, so one cycle can count in several
+of them. They are only kept by ProcRTL, and read 0 in the FL and CL
+processors. ProcRTL can keep them in hardware, where csrr reads them,
+or only in simulation, where they cost no hardware and csrr reads 0.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+
+#-------------------------------------------------------------------------
+# Counter map
+#-------------------------------------------------------------------------
+
+counter_csr_base  = 0xC00
+counter_csr_nregs = 32
+
+counter_idx_cycles  = 0
+counter_idx_instret = 2
+
+counter_inst_names = [
+  "nop", "lw", "sw", "sll", "srl", "add", "addi", "and", "bne", "csrr", "csrw",
+]
+counter_inst_base = 3
+
+counter_stall_causes = [ "imem", "dmem", "mngr", "xcel", "squash" ]
+counter_stall_base   = 16
+
+# ostall_A/osquash_A conditions of ProcCtrl, bit i of perf_hazards is
+# counted at index counter_hazard_base + i
+
+counter_hazard_causes = [
+  "F_imem",     # imem response not there yet
+  "D_ld_use",   # operand is loaded by the lw in X
+  "D_xcel_use", # operand is returned by the accelerator read in X
+  "D_mngr",     # mngr2proc message not there yet
+  "D_wide",     # first cycle of a wide accelerator write
+  "X_dmem",     # dmem request not accepted
+  "X_xcel",     # xcel request not accepted
+  "M_dmem",     # dmem response not there yet
+  "M_xcel",     # xcel response not there yet
+  "W_mngr",     # proc2mngr message not accepted
+  "X_squash",   # taken branch squashes F and D
+]
+counter_hazard_base = 21
+counter_nhazards    = len( counter_hazard_causes )
+
+counter_inst_idx  = { name: counter_inst_base + i
+                      for i, name in enumerate( counter_inst_names ) }
+counter_stall_idx = { cause: counter_stall_base + i
+                      for i, cause in enumerate( counter_stall_causes ) }
+counter_hazard_idx = { cause: counter_hazard_base + i
+                       for i, cause in enumerate( counter_hazard_causes ) }
+
+def is_counter_csr( csrnum ):
+  return counter_csr_base <= csrnum < counter_csr_base + counter_csr_nregs
+
+#-------------------------------------------------------------------------
+# PerfCounters
+#-------------------------------------------------------------------------
+# Counter bank used by the FL and CL processors. Processors call stall()
+# for every stall they observe during a cycle and tick() once at the end
+# of the cycle.
+
+class PerfCounters( object ):
+
+  def __init__( self ):
+    self.counters = [ 0 ] * counter_csr_nregs
+    self.stalls   = set()
+
+  def reset( self ):
+    self.counters = [ 0 ] * counter_csr_nregs
+    self.stalls   = set()
+
+  def commit( self, inst_name ):
+    self.counters[ counter_idx_instret ] += 1
+    if inst_name in counter_inst_idx:
+      self.counters[ counter_inst_idx[ inst_name ] ] += 1
+
+  def stall( self, cause ):
+    self.stalls.add( cause )
+
+  def tick( self ):
+    self.counters[ counter_idx_cycles ] += 1
+    for cause in self.stalls:
+      self.counters[ counter_stall_idx[ cause ] ] += 1
+    self.stalls.clear()
+
+  def read( self, csrnum ):
+    return Bits32( self.counters[ int(csrnum) - counter_csr_base ] )
+
+#-------------------------------------------------------------------------
+# print_perf_counters
+#-------------------------------------------------------------------------
+# Pretty print a list of counter values in the same format proc-sim uses
+# for its other stats. The hazard counters are left out when they are all
+# zero, which is the case for the FL and CL processors.
+
+def print_perf_counters( counters ):
+  print( "  num_cycles            = {}".format( counters[ counter_idx_cycles ] ) )
+  print( "  num_insts             = {}".format( counters[ counter_idx_instret ] ) )
+  for name in counter_inst_names:
+    print( "  num_insts_{:<11} = {}".format( name, counters[ counter_inst_idx[ name ] ] ) )
+  for cause in counter_stall_causes:
+    print( "  num_stalls_{:<10} = {}".format( cause, counters[ counter_stall_idx[ cause ] ] ) )
+  hazards = counters[ counter_hazard_base : counter_hazard_base + counter_nhazards ]
+  if not any( hazards ):
+    return
+  for cause in counter_hazard_causes:
+    print( "  num_hazard_{:<10} = {}".format( cause, counters[ counter_hazard_idx[ cause ] ] ) )
+
+#-------------------------------------------------------------------------
+# read_perf_counters
+#-------------------------------------------------------------------------
+# Read the counter bank of a processor as a list of ints. An imported
+# processor only has its ports left, so we unpack perf_dump instead.
+
+def read_perf_counters( proc ):
+  if hasattr( proc, "perf_counters" ):
+    return proc.perf_counters()
+
+  dump = proc.perf_dump
+  return [ int( dump[i*32:(i+1)*32] ) for i in range( counter_csr_nregs ) ]
+
+#-------------------------------------------------------------------------
+# run_and_read_counters
+#-------------------------------------------------------------------------
+# Tick the harness ncycles times, or until it is done if ncycles is None,
+# and read the counters of its processor once at the end. This is the
+# usual Python simulation loop without the per-cycle reads of
+# commit_inst and the line trace, since the processor counts its
+# committed instructions and stalls itself. The counters are totals
+# since the last reset, so they keep adding up over several calls.
+
+def run_and_read_counters( model, ncycles=None, max_cycles=1000000 ):
+  tick  = model.tick
+  count = 0
+
+  if ncycles is not None:
+    while count < ncycles:
+      tick()
+      count += 1
+  else:
+    done = model.done
+    while not done() and count < max_cycles:
+      tick()
+      count += 1
+
+  counters = read_perf_counters( model.proc )
+
+  return {
+    "ncycles"    : count,
+    "done"       : model.done(),
+    "num_cycles" : counters[ counter_idx_cycles  ],
+    "num_insts"  : counters[ counter_idx_instret ],
+    "counters"   : counters,
+  }
@@ -0,0 +1,125 @@
+"""
+==========================================================================
+pipe_trace.py
+==========================================================================
+Structured pipeline trace in Chrome trace event format. The file can be
+opened in chrome://tracing or https://ui.perfetto.dev, where every
+pipeline stage shows up as a track and every instruction as a slice on
+the tracks of the stages it went through. One cycle is one microsecond
+on the time axis.
+
+Processors describe their pipeline through pipe_events(), which returns
+a list of ( stage, label, status ) tuples for the current cycle where
+status is one of "work", "stall", or "squash". Stages that are idle are
+simply left out. An instruction that stalls in a stage stays there in
+the next cycle, so the writer merges it into a single slice and records
+the number of stall cycles as an argument of the slice.
+
+Events are buffered and written out in batches. The JSON array is only
+closed in close(), but trace viewers also accept an unterminated array
+so a trace of a run that crashed can still be loaded. A file name that
+ends with .gz is compressed on the fly.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import gzip
+import json
+
+#-------------------------------------------------------------------------
+# PipeTraceWriter
+#-------------------------------------------------------------------------
+
+class PipeTraceWriter( object ):
+
+  def __init__( self, filename, stages, buffer_nevents=4096 ):
+
+    if filename.endswith( ".gz" ):
+      self.out = gzip.open( filename, "wb" )
+    else:
+      self.out = open( filename, "wb" )
+
+    self.stages         = list( stages )
+    self.stage_tid      = { x: i for i, x in enumerate( self.stages ) }
+    self.buffer_nevents = buffer_nevents
+    self.buffer         = []
+    self.nevents        = 0
+
+    # Currently open slice of each stage
+
+    self.open_slices = {}
+
+    self.out.write( b'{"displayTimeUnit":"ns","traceEvents":[\n' )
+
+    for stage in self.stages:
+      self._emit({ "name": "thread_name", "ph": "M", "pid": 0,
+                   "tid": self.stage_tid[ stage ], "args": { "name": stage } })
+
+  def _emit( self, event ):
+    self.buffer.append( json.dumps( event, separators=(',',':') ) )
+    if len( self.buffer ) >= self.buffer_nevents:
+      self.flush()
+
+  def _close_slice( self, stage ):
+    slice_ = self.open_slices.pop( stage )
+    self._emit({ "name": slice_["label"],
+                 "cat" : "squash" if slice_["squashed"] else "inst",
+                 "ph"  : "X", "pid": 0, "tid": self.stage_tid[ stage ],
+                 "ts"  : slice_["start"], "dur": slice_["end"] - slice_["start"],
+                 "args": { "stall_cycles": slice_["nstalls"] } })
+
+  #-----------------------------------------------------------------------
+  # cycle
+  #-----------------------------------------------------------------------
+  # Record the pipe_events() of one cycle.
+
+  def cycle( self, ncycle, events ):
+    seen = set()
+
+    for stage, label, status in events:
+      seen.add( stage )
+
+      # Extend the open slice if the same instruction stalled in this
+      # stage last cycle, otherwise the previous instruction has left.
+
+      if stage in self.open_slices:
+        slice_ = self.open_slices[ stage ]
+        if slice_["stalled"] and slice_["label"] == label and \
+           slice_["end"] == ncycle:
+          slice_["end"]      = ncycle + 1
+          slice_["stalled"]  = status == "stall"
+          slice_["nstalls"] += status == "stall"
+          slice_["squashed"] = status == "squash"
+          continue
+        self._close_slice( stage )
+
+      self.open_slices[ stage ] = {
+        "label"   : label,
+        "start"   : ncycle,
+        "end"     : ncycle + 1,
+        "stalled" : status == "stall",
+        "nstalls" : int( status == "stall" ),
+        "squashed": status == "squash",
+      }
+
+    # A slice ends as soon as its instruction leaves the stage
+
+    for stage in list( self.open_slices ):
+      if stage not in seen:
+        self._close_slice( stage )
+
+  def flush( self ):
+    if self.buffer:
+      sep = b",\n" if self.nevents else b""
+      self.out.write( sep + ",\n".join( self.buffer ).encode( "utf-8" ) )
+      self.nevents += len( self.buffer )
+      self.buffer   = []
+
+  def close( self ):
+    for stage in list( self.open_slices ):
+      self._close_slice( stage )
+    self.flush()
+    self.out.write( b"\n]}\n" )
+    self.out.close()
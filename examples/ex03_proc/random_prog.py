@@ -0,0 +1,320 @@
+"""
+==========================================================================
+random_prog.py
+==========================================================================
+Constrained-random TinyRV0 program generator. gen_random_program emits a
+long assembly program out of a weighted mix of
+
+ - alu    : add, addi, sll, srl (and optionally and) on a small pool of
+            working registers, reading a recently written register with
+            probability dep_prob to create back-to-back dependencies
+ - mem    : lw and sw to a random word of a data array based at x1,
+            which is at 0x2000 or, for programs too long for that,
+            right after the text
+ - branch : a forward bne over a short shadow, which is taken with
+            probability taken_prob, or a counted loop of up to
+            max_loop_iters iterations
+ - csr    : csrr from mngr2proc or csrw to proc2mngr
+
+Termination is guaranteed by construction: all branches inside a block
+jump forward, and loops count down x2, which nothing else writes. CSR
+instructions are only placed outside loops and branch shadows, so every
+one of them executes exactly once and in program order. That lets us
+annotate them with "<" and ">" like the hand-written tests. The values
+for ">" are obtained by running the program on ProcFL. The program ends
+by writing every working register to proc2mngr, so the final state is
+checked as well.
+
+Note that "and" is left out of the default ALU mix since implementing it
+is a tutorial task for the processors.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import random
+import struct
+from collections import defaultdict
+
+from pymtl3 import *
+from pymtl3.stdlib.cl.MemoryCL import MemoryCL
+from pymtl3.stdlib.ifcs import mk_mem_msg
+from pymtl3.stdlib.test import TestSrcCL
+
+from .NullXcel import NullXcelRTL
+from .perf_counters import counter_idx_instret, counter_inst_idx
+from .ProcFL import ProcFL
+from .tinyrv0_encoding import assemble
+
+#-------------------------------------------------------------------------
+# RandomProgram
+#-------------------------------------------------------------------------
+# The generated assembly together with some coverage numbers: a
+# histogram of RAW dependency distances (in instructions, 4 means 4 or
+# more), the number of load-use pairs, the number of static instructions
+# per kind, and the dynamic instruction counts of the ProcFL run.
+
+class RandomProgram( object ):
+
+  def __init__( self, asm, coverage ):
+    self.asm      = asm
+    self.coverage = coverage
+
+  def __str__( self ):
+    return self.asm
+
+#-------------------------------------------------------------------------
+# RecordSinkCL
+#-------------------------------------------------------------------------
+# Accepts and records every message.
+
+class RecordSinkCL( Component ):
+
+  def construct( s ):
+    s.msgs = []
+
+  @non_blocking( lambda s: True )
+  def recv( s, msg ):
+    s.msgs.append( msg )
+
+  def line_trace( s ):
+    return "{}".format( s.recv )
+
+#-------------------------------------------------------------------------
+# RecordHarness
+#-------------------------------------------------------------------------
+# Like the test harness, but the sink records proc2mngr instead of
+# checking it.
+
+class RecordHarness( Component ):
+
+  def construct( s, proc_cls=ProcFL ):
+
+    req, resp = mk_mem_msg( 8, 32, 32 )
+
+    s.src  = TestSrcCL( Bits32, [] )
+    s.sink = RecordSinkCL()
+    s.proc = proc_cls()
+    s.xcel = NullXcelRTL()
+    s.mem  = MemoryCL( 2, [ (req, resp), (req, resp) ] )
+
+    s.connect( s.src.send,      s.proc.mngr2proc )
+    s.connect( s.proc.proc2mngr, s.sink.recv     )
+    s.connect( s.proc.imem,     s.mem.ifc[0]     )
+    s.connect( s.proc.dmem,     s.mem.ifc[1]     )
+    s.connect( s.proc.xcel,     s.xcel.xcel      )
+
+  def load( s, mem_image ):
+    for section in mem_image.get_sections():
+      if section.name == ".mngr2proc":
+        for i in range( 0, len(section.data), 4 ):
+          bits = struct.unpack_from( "<I", bytes( section.data[i:i+4] ) )[0]
+          s.src.msgs.append( Bits32( bits ) )
+      elif section.name != ".proc2mngr":
+        s.mem.write_mem( section.addr, section.data )
+
+  def line_trace( s ):
+    return s.src.line_trace()  + " > " + \
+           s.proc.line_trace() + " > " + \
+           s.sink.line_trace()
+
+#-------------------------------------------------------------------------
+# gen_random_program
+#-------------------------------------------------------------------------
+
+default_mix = { "alu": 6, "mem": 2, "branch": 1, "csr": 1 }
+
+# Size of the memory in the test harnesses
+
+mem_nbytes = 2**20
+
+def gen_random_program( ninsts=1000, seed=0, mix=None,
+                        alu_ops=( "add", "addi", "sll", "srl" ),
+                        nregs=8, dep_prob=0.5, taken_prob=0.5,
+                        loop_prob=0.3, max_loop_iters=8, max_block_insts=4,
+                        ndata_words=64, max_cycles=1000000 ):
+
+  assert 1 <= nregs <= 29
+  assert 1 <= ndata_words <= 512 # offsets have to fit in 12 bits
+
+  rng = random.Random( seed )
+
+  mix   = dict( default_mix if mix is None else mix )
+  kinds = sorted( mix )
+
+  # x1 holds the base of the data array and x2 counts loop iterations
+
+  regs = [ "x{}".format( i ) for i in range( 3, 3 + nregs ) ]
+
+  lines      = []
+  recent     = [] # ( reg, is_load ) of the last writes, newest last
+  coverage   = {
+    "raw_dist" : defaultdict( int ),
+    "load_use" : 0,
+    "static"   : defaultdict( int ),
+  }
+  nlabels = [ 0 ]
+  nemitted = [ 0 ]
+
+  def new_label():
+    nlabels[0] += 1
+    return "L{}".format( nlabels[0] )
+
+  def emit( line, kind=None ):
+    lines.append( "    " + line )
+    nemitted[0] += 1
+    if kind is not None:
+      coverage["static"][ kind ] += 1
+
+  def wrote( reg, is_load=False ):
+    recent.append( ( reg, is_load ) )
+    del recent[:-8]
+
+  def src():
+    candidates = [ x for x, _ in recent[-3:] if x is not None ]
+    if candidates and rng.random() < dep_prob:
+      reg = rng.choice( candidates )
+    else:
+      reg = rng.choice( regs )
+
+    for dist, ( x, is_load ) in enumerate( reversed( recent ), 1 ):
+      if x == reg:
+        coverage["raw_dist"][ min( dist, 4 ) ] += 1
+        if dist == 1 and is_load:
+          coverage["load_use"] += 1
+        break
+
+    return reg
+
+  def gen_alu():
+    op = rng.choice( alu_ops )
+    rd = rng.choice( regs )
+    if op == "addi":
+      emit( "addi {}, {}, {:#05x}".format( rd, src(), rng.getrandbits( 12 ) ), op )
+    else:
+      emit( "{} {}, {}, {}".format( op, rd, src(), src() ), op )
+    wrote( rd )
+
+  def gen_mem():
+    offset = 4 * rng.randrange( ndata_words )
+    if rng.random() < 0.5:
+      rd = rng.choice( regs )
+      emit( "lw {}, {}(x1)".format( rd, offset ), "lw" )
+      wrote( rd, True )
+    else:
+      emit( "sw {}, {}(x1)".format( src(), offset ), "sw" )
+      wrote( None )
+
+  def gen_block():
+    for _ in range( rng.randint( 1, max_block_insts ) ):
+      if mix.get( "mem", 0 ) and rng.random() < mix["mem"] / float( mix["mem"] + mix.get( "alu", 0 ) ):
+        gen_mem()
+      else:
+        gen_alu()
+
+  def gen_branch():
+    if rng.random() < loop_prob:
+      label = new_label()
+      emit( "addi x2, x0, {}".format( rng.randint( 1, max_loop_iters ) ) )
+      lines.append( "  {}:".format( label ) )
+      gen_block()
+      emit( "addi x2, x2, 0xfff" ) # -1
+      emit( "bne x2, x0, {}".format( label ), "loop" )
+    else:
+      label = new_label()
+      rs1   = src()
+      # bne of a register with itself is never taken
+      rs2   = rng.choice( [ x for x in regs if x != rs1 ] or regs ) \
+              if rng.random() < taken_prob else rs1
+      emit( "bne {}, {}, {}".format( rs1, rs2, label ), "bne" )
+      gen_block()
+      lines.append( "  {}:".format( label ) )
+
+    # The instructions after a join can be reached from several places
+
+    del recent[:]
+
+  def gen_csr():
+    if rng.random() < 0.5:
+      rd = rng.choice( regs )
+      emit( "csrr {}, mngr2proc < {:#x}".format( rd, rng.getrandbits( 32 ) ), "csrr" )
+      wrote( rd )
+    else:
+      emit( "csrw proc2mngr, {} > ?".format( src() ), "csrw" )
+
+  gen_kind = {
+    "alu"   : gen_alu,
+    "mem"   : gen_mem,
+    "branch": gen_branch,
+    "csr"   : gen_csr,
+  }
+
+  # Prologue: initialize the data base and the working registers. The
+  # data base is filled in at the end, once we know how long the text is.
+
+  emit( "csrr x1, mngr2proc < {data_base:#x}" )
+  for reg in regs:
+    emit( "csrr {}, mngr2proc < {:#x}".format( reg, rng.getrandbits( 32 ) ) )
+
+  total = float( sum( mix.values() ) )
+  while nemitted[0] < ninsts:
+    x = rng.random() * total
+    for kind in kinds:
+      x -= mix[ kind ]
+      if x < 0:
+        break
+    gen_kind[ kind ]()
+
+  # Epilogue: check the final state of every working register
+
+  for reg in regs:
+    emit( "csrw proc2mngr, {} > ?".format( reg ) )
+
+  # The data array normally lives at 0x2000 like in the hand-written
+  # tests. Long programs would run into it, so their data goes right
+  # after the text instead.
+
+  text_end  = 0x200 + 4 * nemitted[0]
+  data_base = max( 0x2000, ( text_end + 0xff ) & ~0xff )
+  assert data_base + 4 * ndata_words <= mem_nbytes, \
+    "Random program does not fit in the test memory!"
+
+  lines[0] = lines[0].format( data_base=data_base )
+
+  lines.append( ".data {:#x}".format( data_base ) )
+  for _ in range( ndata_words ):
+    lines.append( ".word {:#x}".format( rng.getrandbits( 32 ) ) )
+
+  # Run the program on ProcFL to fill in the expected outputs
+
+  skeleton = "\n".join( [ x.replace( " > ?", "" ) for x in lines ] )
+  mem_image = assemble( skeleton )
+
+  th = RecordHarness( ProcFL )
+  th.elaborate()
+  th.load( mem_image )
+  th.apply( SimulationPass )
+  th.sim_reset()
+
+  text = mem_image.get_section( ".text" )
+  assert text.addr + len( text.data ) == text_end
+
+  ncycles = 0
+  while int( th.proc.PC ) < text_end and ncycles < max_cycles:
+    th.tick()
+    ncycles += 1
+  assert ncycles < max_cycles, "Random program did not terminate!"
+
+  outputs = iter( th.sink.msgs )
+  for i, line in enumerate( lines ):
+    if line.endswith( " > ?" ):
+      lines[i] = line[:-1] + "{:#x}".format( int( next( outputs ) ) )
+
+  counters = th.proc.perf_counters()
+  coverage["dynamic"] = { name: counters[ idx ] for name, idx in counter_inst_idx.items() }
+  coverage["dynamic"]["total"] = counters[ counter_idx_instret ]
+  coverage["raw_dist"] = dict( coverage["raw_dist"] )
+  coverage["static"]   = dict( coverage["static"] )
+
+  return RandomProgram( "\n".join( lines ) + "\n", coverage )
@@ -24,6 +24,8 @@ import inst_lw
 import inst_sw
 import inst_csr
 import inst_xcel
+import inst_perf
+from examples.ex03_proc.perf_counters import run_and_read_counters
 
 #-------------------------------------------------------------------------
 # ProcFL_Tests
@@ -43,6 +45,9 @@ class ProcFL_Tests( object ):
   def setup_class( cls ):
     cls.ProcType = ProcFL
 
+  # The largest number of instructions the processor commits per cycle
+  issue_width = 1
+
   # [run_sim] is a helper function in the test suite that creates a
   # simulator and runs test. We can overwrite this function when
   # inheriting from the test class to apply different passes to the DUT.
@@ -258,3 +263,35 @@ class ProcFL_Tests( object ):
     th = TestHarness( s.ProcType, src_delay=3, sink_delay=14,
                       mem_stall_prob =0.5, mem_latency=3 )
     s.run_sim( th, inst_xcel.gen_multiple_test )
+
+  #-----------------------------------------------------------------------
+  # perf
+  #-----------------------------------------------------------------------
+
+  @pytest.mark.parametrize( "name,test", [
+    asm_test( inst_perf.gen_basic_test ),
+  ])
+  def test_perf( s, name, test, dump_vcd ):
+    th = TestHarness( s.ProcType )
+    s.run_sim( th, test )
+
+  #-----------------------------------------------------------------------
+  # run_and_read_counters
+  #-----------------------------------------------------------------------
+
+  def test_run_and_read_counters( s ):
+    th = TestHarness( s.ProcType )
+    th.elaborate()
+    th.load( assemble( inst_perf.gen_basic_test() ) )
+    th.apply( SimulationPass )
+    th.sim_reset()
+
+    stats = run_and_read_counters( th, ncycles=5 )
+    assert stats["ncycles"] == 5
+    assert stats["num_cycles"] == 5
+    assert not stats["done"]
+
+    stats = run_and_read_counters( th, max_cycles=10000 )
+    assert stats["done"]
+    assert stats["num_cycles"] == stats["ncycles"] + 5
+    assert 0 < stats["num_insts"] <= stats["num_cycles"] * s.issue_width
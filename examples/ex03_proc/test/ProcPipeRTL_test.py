@@ -0,0 +1,96 @@
+"""
+=========================================================================
+ProcPipeRTL_test.py
+=========================================================================
+Includes test cases for the RTL TinyRV0 processors with other pipeline
+depths.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from pymtl3  import *
+from harness import assemble, TestHarness
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.ProcPipeRTL import (ProcPipeRTL_1f0m, ProcPipeRTL_1f1m,
+                                            ProcPipeRTL_1f2m, ProcPipeRTL_2f1m,
+                                            mk_proc_rtl)
+from examples.ex03_proc.perf_counters import counter_hazard_idx
+import inst_perf
+
+#-------------------------------------------------------------------------
+# ProcPipeRTL_*_Tests
+#-------------------------------------------------------------------------
+# Every variant runs the same tests as ProcRTL.
+
+from .ProcRTL_test import ProcRTL_Tests as BaseTests
+
+class ProcPipeRTL_1f0m_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcPipeRTL_1f0m
+
+class ProcPipeRTL_1f1m_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcPipeRTL_1f1m
+
+class ProcPipeRTL_2f1m_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcPipeRTL_2f1m
+
+class ProcPipeRTL_1f2m_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcPipeRTL_1f2m
+
+#-------------------------------------------------------------------------
+# test_mk_proc_rtl
+#-------------------------------------------------------------------------
+
+def test_mk_proc_rtl():
+  assert mk_proc_rtl() is ProcPipeRTL_1f1m
+  assert mk_proc_rtl( nfetch=2, nmem=1 ) is ProcPipeRTL_2f1m
+  assert ProcPipeRTL_1f0m.__name__ == "ProcPipeRTL_1f0m"
+
+#-------------------------------------------------------------------------
+# test_hazards
+#-------------------------------------------------------------------------
+# The default variant has the same pipeline as ProcRTL, so it takes the
+# same cycles. The merged X/M stage bypasses a load from W so a load-use
+# hazard still costs one cycle, and the split memory stage makes it two.
+
+def run_hazard_test( ProcType ):
+  th = TestHarness( ProcType )
+  th.elaborate()
+  th.load( assemble( inst_perf.gen_hazard_test() ) )
+  th.apply( SimulationPass )
+  th.sim_reset()
+
+  ncycles = 0
+  while not th.done() and ncycles < 10000:
+    th.tick()
+    ncycles += 1
+  assert ncycles < 10000
+
+  return th.proc.perf_counters()
+
+def test_same_as_proc_rtl():
+  assert run_hazard_test( ProcPipeRTL_1f1m ) == run_hazard_test( ProcRTL )
+
+@pytest.mark.parametrize( "ProcType,nld_use", [
+  ( ProcPipeRTL_1f0m, 4 ),
+  ( ProcPipeRTL_1f1m, 4 ),
+  ( ProcPipeRTL_2f1m, 4 ),
+  ( ProcPipeRTL_1f2m, 8 ),
+])
+def test_hazards( ProcType, nld_use ):
+  counters = run_hazard_test( ProcType )
+  assert counters[ counter_hazard_idx[ "D_ld_use" ] ] == nld_use
+  assert counters[ counter_hazard_idx[ "X_squash" ] ] == 3
@@ -7,12 +7,22 @@ Includes test cases for the register transfer level TinyRV0 processor.
 Author : Shunning Jiang, Yanghui Ou
   Date : June 15, 2019
 """
+import functools
 import pytest
 import random
 random.seed(0xdeadbeef)
 
 from pymtl3  import *
+from harness import assemble, TestHarness
+from examples.ex03_proc.ProcFL import ProcFL
 from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.perf_counters import (counter_hazard_base,
+                                              counter_hazard_idx,
+                                              counter_idx_instret,
+                                              counter_inst_base,
+                                              counter_inst_names,
+                                              run_and_read_counters)
+import inst_perf
 
 #-------------------------------------------------------------------------
 # ProcRTL_Tests
@@ -27,3 +37,56 @@ class ProcRTL_Tests( BaseTests ):
   @classmethod
   def setup_class( cls ):
     cls.ProcType = ProcRTL
+
+  # The counters include the instruction that commits in the cycle in
+  # which the harness is done, so they agree with ProcFL
+
+  def test_run_and_read_counters_instret( s ):
+    insts = []
+    for ProcType in [ ProcFL, s.ProcType ]:
+      th = TestHarness( ProcType )
+      th.elaborate()
+      th.load( assemble( inst_perf.gen_basic_test() ) )
+      th.apply( SimulationPass )
+      th.sim_reset()
+
+      stats = run_and_read_counters( th, max_cycles=10000 )
+      assert stats["done"]
+      insts.append( stats["counters"][ counter_idx_instret :
+                                       counter_inst_base + len( counter_inst_names ) ] )
+
+    assert insts[0] == insts[1]
+
+#-------------------------------------------------------------------------
+# test_perf_hazards
+#-------------------------------------------------------------------------
+# The hazard counters count the same cycles whether they are kept in
+# hardware or only in simulation, and the other counters do not depend
+# on them. Only the hardware counters can be read with csrr.
+
+def run_perf_hazards( mode, nsquash ):
+  th = TestHarness( functools.partial( ProcRTL, perf_hazards=mode ) )
+  th.elaborate()
+  th.load( assemble( inst_perf.gen_hazard_test( nsquash ) ) )
+  th.apply( SimulationPass )
+  th.sim_reset()
+
+  ncycles = 0
+  while not th.done() and ncycles < 10000:
+    th.tick()
+    ncycles += 1
+  assert ncycles < 10000
+
+  return th.proc.perf_counters()
+
+def test_perf_hazards():
+  hw  = run_perf_hazards( "hw",  3 )
+  sim = run_perf_hazards( "sim", 0 )
+  off = run_perf_hazards( "off", 0 )
+
+  assert hw[ counter_hazard_idx[ "D_ld_use" ] ] == 4
+  assert hw[ counter_hazard_idx[ "X_squash" ] ] == 3
+
+  assert sim == hw
+  assert off[ :counter_hazard_base ] == hw[ :counter_hazard_base ]
+  assert not any( off[ counter_hazard_base: ] )
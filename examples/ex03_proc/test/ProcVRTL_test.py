@@ -12,8 +12,10 @@ import random
 random.seed(0xdeadbeef)
 
 from pymtl3  import *
-from harness import asm_test, assemble 
+from harness import asm_test, assemble, TestHarness
 from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.perf_counters import run_and_read_counters
+import inst_perf
 
 #-------------------------------------------------------------------------
 # ProcVRTL_Tests
@@ -25,6 +27,15 @@ from .ProcRTL_test import ProcRTL_Tests as BaseTests
 
 class ProcVRTL_Tests( BaseTests ):
 
+  # Translate the processor and import it back in
+  def translate_import( s, th ):
+    from examples.translation_cache import cached_translate, cached_import
+
+    th.proc.yosys_translate = True
+    th.proc.yosys_import = True
+    cached_translate( th )
+    return cached_import( th )
+
   def run_sim( s, th, gen_test, max_cycles=10000 ):
 
     th.elaborate()
@@ -36,12 +47,7 @@ class ProcVRTL_Tests( BaseTests ):
     th.load( mem_image )
 
     # Translate the processor and import it back in
-    from pymtl3.passes.yosys import TranslationPass, ImportPass
-
-    th.proc.yosys_translate = True
-    th.proc.yosys_import = True
-    th.apply( TranslationPass() )
-    th = ImportPass()( th )
+    th = s.translate_import( th )
 
     # Create a simulator and run simulation
     th.apply( SimulationPass )
@@ -57,3 +63,24 @@ class ProcVRTL_Tests( BaseTests ):
     # Force a test failure if we timed out
     assert ncycles < max_cycles
 
+  # The imported processor has no perf_counters(), so
+  # run_and_read_counters reads its counters through perf_dump. They
+  # match the ones of the Python model.
+
+  def test_run_and_read_counters( s ):
+    stats = []
+    for translate in [ False, True ]:
+      th = TestHarness( s.ProcType )
+      th.elaborate()
+      th.load( assemble( inst_perf.gen_basic_test() ) )
+      if translate:
+        th = s.translate_import( th )
+        assert not hasattr( th.proc, "perf_counters" )
+      th.apply( SimulationPass )
+      th.sim_reset()
+
+      stats.append( run_and_read_counters( th, max_cycles=10000 ) )
+      assert stats[-1]["done"]
+
+    assert stats[0]["num_insts"] > 0
+    assert stats[1] == stats[0]
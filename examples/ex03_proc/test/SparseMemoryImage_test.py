@@ -0,0 +1,140 @@
+"""
+=========================================================================
+SparseMemoryImage_test.py
+=========================================================================
+Tests for the symbol table of SparseMemoryImage and the labels that the
+assembler records in it.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+from examples.ex03_proc.tinyrv0_encoding import assemble
+
+#-------------------------------------------------------------------------
+# Reverse index
+#-------------------------------------------------------------------------
+
+def mk_image():
+  mem_image = SparseMemoryImage()
+  mem_image.add_symbol( "main",  0x200, ".text" )
+  mem_image.add_symbol( "_start", 0x200, ".text" )
+  mem_image.add_symbol( "loop",  0x210, ".text" )
+  mem_image.add_symbol( "src",   0x2000 )
+  return mem_image
+
+def test_symbols_at():
+  mem_image = mk_image()
+
+  # Symbols at the same address are returned sorted by name
+
+  assert mem_image.get_symbols_at( 0x200 ) == [ "_start", "main" ]
+  assert mem_image.get_symbols_at( 0x210 ) == [ "loop" ]
+  assert mem_image.get_symbols_at( 0x204 ) == []
+
+def test_lookup_symbol():
+  mem_image = mk_image()
+
+  assert mem_image.lookup_symbol( 0x1fc  ) is None
+  assert mem_image.lookup_symbol( 0x0    ) is None
+  assert mem_image.lookup_symbol( 0x200  ) == ( "_start", 0 )
+  assert mem_image.lookup_symbol( 0x20c  ) == ( "_start", 0xc )
+  assert mem_image.lookup_symbol( 0x210  ) == ( "loop", 0 )
+  assert mem_image.lookup_symbol( 0x1ffc ) == ( "loop", 0x1dec )
+  assert mem_image.lookup_symbol( 0x2008 ) == ( "src", 8 )
+
+def test_symbolize():
+  mem_image = mk_image()
+
+  assert mem_image.symbolize( 0x1fc ) == "000001fc"
+  assert mem_image.symbolize( 0x200 ) == "_start"
+  assert mem_image.symbolize( 0x214 ) == "loop+0x4"
+
+def test_index_rebuilt():
+  mem_image = mk_image()
+  assert mem_image.lookup_symbol( 0x100 ) is None
+
+  mem_image.add_symbol( "vec", 0x100 )
+  assert mem_image.lookup_symbol( 0x104 ) == ( "vec", 4 )
+  assert mem_image.get_symbols_at( 0x100 ) == [ "vec" ]
+
+  # Moving a symbol drops it from its old address
+
+  mem_image.add_symbol( "vec", 0x300 )
+  assert mem_image.get_symbols_at( 0x100 ) == []
+  assert mem_image.symbolize( 0x304 ) == "vec+0x4"
+
+#-------------------------------------------------------------------------
+# Assembler
+#-------------------------------------------------------------------------
+
+asm = """
+  main:
+    lw   x1, 0(x2)
+  loop:
+    addi x1, x1, -1
+    bne  x1, x0, loop
+    csrw proc2mngr, x1 > 0
+  .data
+  words:
+    .word 1
+    .word 2
+  hwords:
+    .hword 3
+    .hword 4
+    .hword 5
+  bytes:
+    .byte 6
+  tail:
+    .byte 7
+  end:
+    .word 8
+"""
+
+def test_assemble_symbols():
+  mem_image = assemble( asm )
+
+  assert mem_image.get_symbol( "main" ) == 0x200
+  assert mem_image.get_symbol( "loop" ) == 0x204
+
+  # .data labels follow the sizes of .word, .hword and .byte
+
+  assert mem_image.get_symbol( "words"  ) == 0x2000
+  assert mem_image.get_symbol( "hwords" ) == 0x2008
+  assert mem_image.get_symbol( "bytes"  ) == 0x200e
+  assert mem_image.get_symbol( "tail"   ) == 0x200f
+  assert mem_image.get_symbol( "end"    ) == 0x2010
+
+  # The labels agree with where the data actually ends up
+
+  data = mem_image.get_section( ".data" )
+  assert data.addr == 0x2000
+  for name, value in [ ( "words", 1 ), ( "hwords", 3 ), ( "bytes", 6 ),
+                       ( "tail", 7 ), ( "end", 8 ) ]:
+    assert data.data[ mem_image.get_symbol( name ) - data.addr ] == value
+
+def test_assemble_sections():
+  mem_image = assemble( asm )
+
+  for name in [ "main", "loop" ]:
+    assert mem_image.get_symbol_section( name ) == ".text"
+  for name in [ "words", "hwords", "bytes", "tail", "end" ]:
+    assert mem_image.get_symbol_section( name ) == ".data"
+
+  assert mem_image.get_symbol_section( "nonexistent" ) is None
+  assert mem_image.symbolize( 0x208 ) == "loop+0x4"
+  assert mem_image.symbolize( 0x2009 ) == "hwords+0x1"
+
+def test_assemble_data_base():
+  mem_image = assemble( """
+    lw   x1, 0(x2)
+  .data 0x8000
+  src:
+    .word 1
+  dst:
+    .word 2
+  """ )
+
+  assert mem_image.get_section( ".data" ).addr == 0x8000
+  assert mem_image.get_symbol( "src" ) == 0x8000
+  assert mem_image.get_symbol( "dst" ) == 0x8004
@@ -0,0 +1,141 @@
+"""
+=========================================================================
+bmark_suite_test.py
+=========================================================================
+Tests for the configurations, history, and regression flags of the
+benchmark suite.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import json
+import os
+
+import pytest
+
+from examples.bmark_suite import (BmarkConfig, append_history, bmarks,
+                                  find_regressions, gen_bmark_configs,
+                                  load_history, proc_impls, xcel_impls)
+
+def mk_result( name, cycles=100, cycles_per_sec=1000.0, passed=True ):
+  return { "name": name, "passed": passed, "cycles": cycles, "insts": 50,
+           "cpi": 2.0, "wall_time": 0.1, "cycles_per_sec": cycles_per_sec }
+
+#-------------------------------------------------------------------------
+# gen_bmark_configs
+#-------------------------------------------------------------------------
+
+def test_gen_bmark_configs():
+  configs = gen_bmark_configs()
+  names   = [ x.name for x in configs ]
+
+  assert len( set( names ) ) == len( names )
+  for config in configs:
+    assert config.bmark in bmarks and config.proc in proc_impls
+    assert config.xcel is None or config.xcel in xcel_impls
+    if config.translate:
+      assert config.proc == "rtl"
+      assert config.xcel is None or config.xcel.startswith( "rtl" )
+
+  assert "vvadd-opt/cl-dual" in names
+  assert "cksum-xcel/rtl+rtl/translate" in names
+  assert "mmult-xcel/cl+cl-mul" in names
+
+  no_translate = [ x.name for x in gen_bmark_configs( translate=False ) ]
+  assert no_translate == [ x.name for x in configs if not x.translate ]
+
+def test_config_name():
+  assert BmarkConfig( "cksum", "rtl", "null", translate=True, size=12 ).name == \
+         "cksum/rtl+null/translate@12"
+
+#-------------------------------------------------------------------------
+# find_regressions
+#-------------------------------------------------------------------------
+
+def test_cycles_regression():
+  baseline = [ mk_result( "a", cycles=100 ), mk_result( "b", cycles=100 ),
+               mk_result( "c", cycles=100 ) ]
+  results  = [ mk_result( "a", cycles=105 ), mk_result( "b", cycles=111 ),
+               mk_result( "c", cycles=90 ) ]
+
+  assert find_regressions( results, baseline, cycles_tol=0.1 ) == \
+         [ ( "b", "cycles 100 -> 111" ) ]
+
+  # Without a tolerance any extra cycle is a regression
+
+  assert [ x for x, _ in find_regressions( results, baseline ) ] == [ "a", "b" ]
+
+def test_speed_regression():
+  baseline = [ mk_result( "a" ), mk_result( "b" ), mk_result( "c" ) ]
+  results  = [ mk_result( "a", cycles_per_sec=850.0 ),
+               mk_result( "b", cycles_per_sec=700.0 ),
+               mk_result( "c", cycles_per_sec=None ) ]
+
+  assert find_regressions( results, baseline, speed_tol=0.2 ) == \
+         [ ( "b", "cycles/sec 1000 -> 700" ) ]
+  assert [ x for x, _ in find_regressions( results, baseline, speed_tol=0.1 ) ] == \
+         [ "a", "b" ]
+
+def test_missing_baseline():
+  baseline = [ mk_result( "a" ), mk_result( "b", passed=False ) ]
+  results  = [ mk_result( "a" ), mk_result( "b", cycles=500 ),
+               mk_result( "new", cycles=500 ) ]
+
+  # Neither a new configuration nor one that failed in the baseline is
+  # flagged, and an empty baseline flags nothing
+
+  assert find_regressions( results, baseline ) == []
+  assert find_regressions( results, [] ) == []
+
+def test_failed_regression():
+  results = [ mk_result( "a", passed=False ), mk_result( "b", passed=False ) ]
+  results[1]["error"] = "KeyError: 'nosuch'"
+
+  assert find_regressions( results, [] ) == \
+         [ ( "a", "failed" ), ( "b", "KeyError: 'nosuch'" ) ]
+
+#-------------------------------------------------------------------------
+# History
+#-------------------------------------------------------------------------
+
+def test_append_history( tmpdir ):
+  path = str( tmpdir.join( "history.json" ) )
+  assert load_history( path ) == []
+
+  append_history( path, { "results": [ mk_result( "a" ) ] } )
+  history = append_history( path, { "results": [ mk_result( "b" ) ] } )
+
+  assert history == load_history( path )
+  assert [ x["results"][0]["name"] for x in history ] == [ "a", "b" ]
+  assert os.listdir( str( tmpdir ) ) == [ "history.json" ]
+
+# A corrupt history is neither overwritten nor extended
+
+def test_append_corrupt_history( tmpdir ):
+  path = str( tmpdir.join( "history.json" ) )
+  with open( path, "w" ) as f:
+    f.write( '[ { "results": [' )
+
+  with pytest.raises( ValueError ):
+    append_history( path, { "results": [] } )
+
+  with open( path ) as f:
+    assert f.read() == '[ { "results": ['
+  assert os.listdir( str( tmpdir ) ) == [ "history.json" ]
+
+# A failed write leaves the old history and no temporary file behind
+
+def test_append_history_interrupted( tmpdir, monkeypatch ):
+  path = str( tmpdir.join( "history.json" ) )
+  append_history( path, { "results": [ mk_result( "a" ) ] } )
+
+  def broken_dump( *args, **kwargs ):
+    raise IOError( "disk full" )
+  monkeypatch.setattr( json, "dump", broken_dump )
+
+  with pytest.raises( IOError ):
+    append_history( path, { "results": [ mk_result( "b" ) ] } )
+
+  monkeypatch.undo()
+  assert [ x["results"][0]["name"] for x in load_history( path ) ] == [ "a" ]
+  assert os.listdir( str( tmpdir ) ) == [ "history.json" ]
@@ -0,0 +1,62 @@
+"""
+=========================================================================
+cosim_test.py
+=========================================================================
+Lockstep co-simulation of the CL and RTL processors against ProcFL.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from pymtl3 import *
+from harness import assemble
+from examples.ex03_proc.cosim import CosimDivergence, LockstepCosim
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcDualIssueCL import ProcDualIssueCL
+from examples.ex03_proc.ProcRTL import ProcRTL
+import inst_add
+import inst_bne
+import inst_lw
+import inst_sw
+
+#-------------------------------------------------------------------------
+# Cosim_Tests
+#-------------------------------------------------------------------------
+
+@pytest.mark.parametrize( "ProcType", [ ProcCL, ProcDualIssueCL, ProcRTL ] )
+class Cosim_Tests( object ):
+
+  @pytest.mark.parametrize( "gen_test", [
+    inst_add.gen_random_test,
+    inst_bne.gen_random_test,
+    inst_lw.gen_random_test,
+    inst_sw.gen_random_test,
+  ])
+  def test_lockstep( s, ProcType, gen_test ):
+    cosim = LockstepCosim( ProcType, assemble( gen_test() ) )
+    ncycles, ninsts = cosim.run()
+    assert ninsts == cosim.ref_ninsts
+    assert cosim.dut.done()
+
+  def test_lockstep_delay( s, ProcType ):
+    cosim = LockstepCosim( ProcType, assemble( inst_lw.gen_random_test() ),
+                           src_delay=3, sink_delay=5,
+                           mem_stall_prob=0.5, mem_latency=3 )
+    cosim.run()
+
+  # Corrupt a register of the reference that the program never writes
+  # and make sure the next commit reports it
+
+  def test_divergence( s, ProcType ):
+    cosim = LockstepCosim( ProcType, assemble( inst_add.gen_basic_test() ) )
+    while cosim.ninsts < 3:
+      cosim.step()
+
+    cosim.ref.proc.R[31] = 0xdeadbeef
+
+    with pytest.raises( CosimDivergence ) as e:
+      cosim.run()
+
+    assert e.value.diffs == [ ( 31, 0xdeadbeef, 0 ) ]
+    assert "x31: ref deadbeef dut 00000000" in str( e.value )
@@ -3,7 +3,7 @@
 harness.py
 =========================================================================
 Includes a test harness that composes a processor, src/sink, and test
-memory, and a run_test function.
+memory, and the run_test and run_ubmark functions.
 
 Author : Shunning Jiang
   Date : June 15, 2019
@@ -15,6 +15,7 @@ import struct
 
 from examples.ex03_proc.NullXcel import NullXcelRTL
 from examples.ex03_proc.tinyrv0_encoding import assemble
+from examples.ex03_proc.ubmark.ubmark_data import mem_image_nbytes
 from pymtl3 import *
 from pymtl3.passes import DynamicSim
 from pymtl3.stdlib.cl.MemoryCL import MemoryCL
@@ -58,17 +59,29 @@ class TestHarness(Component):
 
   def construct( s, proc_cls, xcel_cls=NullXcelRTL, dump_vcd=False,
                  src_delay=0, sink_delay=0,
-                 mem_stall_prob=0, mem_latency=1 ):
+                 mem_stall_prob=0, mem_latency=1, mem_nbytes=2**20,
+                 xcel_nbits=32 ):
 
-    s.commit_inst = OutPort( Bits1 )
+    # Wide processors commit more than one instruction per cycle and
+    # fetch through a wider imem port, so we size both from the proc.
+
+    commit_nbits    = getattr( proc_cls, "commit_nbits", 1 )
+    imem_ifc_dtypes = getattr( proc_cls, "imem_ifc_dtypes", mk_mem_msg( 8, 32, 32 ) )
+
+    s.commit_inst = OutPort( mk_bits( commit_nbits ) )
     req, resp = mk_mem_msg( 8, 32, 32 )
 
     s.src  = TestSrcCL ( Bits32, [], src_delay, src_delay  )
     s.sink = TestSinkCL( Bits32, [], sink_delay, sink_delay )
-    s.proc = proc_cls()
-    s.xcel = xcel_cls()
+    if xcel_nbits == 32:
+      s.proc = proc_cls()
+      s.xcel = xcel_cls()
+    else:
+      s.proc = proc_cls( xcel_nbits )
+      s.xcel = xcel_cls( xcel_nbits )
 
-    s.mem  = MemoryCL(2, latency = mem_latency)
+    s.mem  = MemoryCL(2, [ imem_ifc_dtypes, (req, resp) ], latency = mem_latency,
+                      mem_nbytes = mem_nbytes)
 
     # Processor <-> Proc/Mngr
     s.connect( s.proc.commit_inst, s.commit_inst )
@@ -189,3 +202,27 @@ def run_test( ProcModel, gen_test, dump_vcd=None,
   th.tick()
   th.tick()
   th.tick()
+
+#=========================================================================
+# run_ubmark
+#=========================================================================
+# Runs a ubmark without line tracing and checks its result with the
+# ubmark's own verify function.
+
+def run_ubmark( ProcModel, bmark, max_cycles=100000 ):
+
+  mem_image = bmark.gen_mem_image()
+
+  th = TestHarness( ProcModel, mem_nbytes=mem_image_nbytes( mem_image ) )
+  th.elaborate()
+  th.load( mem_image )
+  th.apply( DynamicSim )
+  th.sim_reset()
+
+  T = 0
+  while not th.done() and T < max_cycles:
+    th.tick()
+    T += 1
+
+  assert T < max_cycles
+  assert bmark.verify( th.mem.mem.mem )
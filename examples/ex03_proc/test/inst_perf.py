@@ -0,0 +1,65 @@
+#=========================================================================
+# perf: csrr from the performance counters
+#=========================================================================
+
+import random
+
+from pymtl3 import *
+from inst_utils import *
+
+#-------------------------------------------------------------------------
+# gen_basic_test
+#-------------------------------------------------------------------------
+# The nops make sure the counted instructions have committed before the
+# csrr reads the counters in every processor model.
+
+def gen_basic_test():
+  return """
+    csrr x1, mngr2proc < 5
+    csrr x2, mngr2proc < 4
+    add  x3, x1, x2
+    add  x3, x3, x2
+    add  x3, x3, x1
+    {nops_8}
+    csrr x5, 0xC0C
+    csrr x4, 0xC08
+    csrw proc2mngr, x4 > 3
+    csrw proc2mngr, x5 > 2
+    csrw proc2mngr, x3 > 18
+  """.format(
+    nops_8=gen_nops(8)
+  )
+
+#-------------------------------------------------------------------------
+# gen_hazard_test
+#-------------------------------------------------------------------------
+# Every iteration has a load-use hazard and all but the last end with a
+# taken branch. The csrr reads the X_squash counter of the RTL processor,
+# which is nsquash if the processor keeps it in hardware and 0 if not.
+
+def gen_hazard_test( nsquash=3 ):
+  return """
+    csrr x1, mngr2proc < 0x00002000
+    csrr x2, mngr2proc < 4
+    addi x4, x0, 0
+    {nops_8}
+  loop:
+    lw   x3, 0(x1)
+    add  x4, x4, x3
+    addi x1, x1, 4
+    addi x2, x2, -1
+    bne  x2, x0, loop
+    {nops_8}
+    csrr x5, 0xC1F
+    csrw proc2mngr, x5 > {nsquash}
+    csrw proc2mngr, x4 > 10
+
+    .data
+    .word 1
+    .word 2
+    .word 3
+    .word 4
+  """.format(
+    nops_8=gen_nops(8),
+    nsquash=nsquash,
+  )
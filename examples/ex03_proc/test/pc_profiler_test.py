@@ -0,0 +1,100 @@
+"""
+=========================================================================
+pc_profiler_test.py
+=========================================================================
+Tests for the hot-PC profiler.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from harness import TestHarness, assemble
+from examples.ex03_proc.pc_profiler import PcProfiler
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcDualIssueCL import ProcDualIssueCL
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from pymtl3.passes import DynamicSim
+
+asm = """
+    csrr x1, mngr2proc < 5
+    addi x2, x0, 3
+  loop:
+    add  x3, x1, x2
+    addi x1, x1, -1
+    bne  x1, x0, loop
+    csrw proc2mngr, x3 > 4
+"""
+
+def run_profiler( ProcType ):
+  mem_image = assemble( asm )
+
+  th = TestHarness( ProcType )
+  th.elaborate()
+  th.load( mem_image )
+  th.apply( DynamicSim )
+  th.sim_reset()
+
+  profiler = PcProfiler()
+  while not th.done() and profiler.ncycles < 1000:
+    th.tick()
+    profiler.tick( th.proc.profile_pcs() )
+
+  assert profiler.ncycles < 1000
+  return mem_image, profiler
+
+#-------------------------------------------------------------------------
+# Processors
+#-------------------------------------------------------------------------
+
+@pytest.mark.parametrize( "ProcType", [ ProcFL, ProcCL, ProcDualIssueCL, ProcRTL ] )
+def test_profile( ProcType ):
+  mem_image, profiler = run_profiler( ProcType )
+
+  loop  = mem_image.get_symbol( "loop" )
+  setup = [ 0x200, 0x204 ]
+  body  = [ loop, loop + 4, loop + 8 ]
+
+  assert [ profiler.commits[x] for x in setup ] == [ 1, 1 ]
+  assert [ profiler.commits[x] for x in body  ] == [ 5, 5, 5 ]
+  assert profiler.commits[ loop + 12 ] == 1
+
+  # Every cycle is charged to exactly one PC, and the loop body is hotter
+  # than the setup code. A dual-issued pair is charged to its older
+  # instruction.
+
+  assert sum( profiler.cycles.values() ) == profiler.ncycles
+  assert profiler.cycles[ loop ] >= 5
+  assert sum( profiler.cycles[x] for x in body ) > \
+         sum( profiler.cycles[x] for x in setup )
+
+#-------------------------------------------------------------------------
+# Listing
+#-------------------------------------------------------------------------
+
+def test_print_listing( capsys ):
+  mem_image, profiler = run_profiler( ProcCL )
+  loop = mem_image.get_symbol( "loop" )
+
+  profiler.print_listing( mem_image, nhot=3 )
+  lines = capsys.readouterr().out.splitlines()
+
+  # The label is printed right before the first instruction of the loop,
+  # and every instruction shows its commits
+
+  idx    = lines.index( "loop:" )
+  fields = lines[idx+1].split()
+  assert fields[0] == "5"
+  assert fields[1] == str( profiler.cycles[ loop ] )
+  assert fields[3:5] == [ "{:0>8x}".format( loop ), "add" ]
+  assert lines[idx-1].split()[0] == "1"
+
+  # The hottest PCs are all in the loop body and symbolized relative to
+  # the label
+
+  hot = lines[ lines.index( "  Hottest PCs" ) + 1 : ]
+  assert len( hot ) == 3
+  for line in hot:
+    assert int( line.split()[3], 16 ) in [ loop, loop + 4, loop + 8 ]
+    assert "<loop" in line
@@ -0,0 +1,52 @@
+"""
+=========================================================================
+pipe_trace_test.py
+=========================================================================
+Tests for the pipeline trace writer.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import gzip
+import json
+
+from examples.ex03_proc.pipe_trace import PipeTraceWriter
+
+def gen_events():
+  return [
+    [ ("F", "00000200", "work") ],
+    [ ("F", "00000204", "stall"), ("D", "add", "stall") ],
+    [ ("F", "00000204", "stall"), ("D", "add", "stall") ],
+    [ ("F", "00000204", "work"),  ("D", "add", "work") ],
+    [ ("D", "lw", "squash") ],
+  ]
+
+def check_trace( trace ):
+  slices = [ (x["tid"], x["name"], x["ts"], x["dur"], x["args"]["stall_cycles"], x["cat"])
+             for x in trace["traceEvents"] if x["ph"] == "X" ]
+  assert sorted( slices ) == sorted([
+    (0, "00000200", 0, 1, 0, "inst"),
+    (0, "00000204", 1, 3, 2, "inst"),
+    (1, "add",      1, 3, 2, "inst"),
+    (1, "lw",       4, 1, 0, "squash"),
+  ])
+
+def test_json( tmpdir ):
+  filename = str( tmpdir.join( "trace.json" ) )
+  writer   = PipeTraceWriter( filename, [ "F", "D" ], buffer_nevents=2 )
+  for i, events in enumerate( gen_events() ):
+    writer.cycle( i, events )
+  writer.close()
+
+  with open( filename ) as f:
+    check_trace( json.load( f ) )
+
+def test_gzip( tmpdir ):
+  filename = str( tmpdir.join( "trace.json.gz" ) )
+  writer   = PipeTraceWriter( filename, [ "F", "D" ] )
+  for i, events in enumerate( gen_events() ):
+    writer.cycle( i, events )
+  writer.close()
+
+  with gzip.open( filename ) as f:
+    check_trace( json.loads( f.read().decode( "utf-8" ) ) )
@@ -0,0 +1,74 @@
+"""
+=========================================================================
+random_prog_test.py
+=========================================================================
+Tests for the constrained-random program generator.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from pymtl3 import *
+from harness import assemble, run_test
+from examples.ex03_proc.cosim import LockstepCosim
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcDualIssueCL import ProcDualIssueCL
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.random_prog import gen_random_program
+
+#-------------------------------------------------------------------------
+# RandomProgram_Tests
+#-------------------------------------------------------------------------
+
+class RandomProgram_Tests( object ):
+
+  def test_deterministic( s ):
+    assert gen_random_program( 200, seed=1 ).asm == \
+           gen_random_program( 200, seed=1 ).asm
+    assert gen_random_program( 200, seed=1 ).asm != \
+           gen_random_program( 200, seed=2 ).asm
+
+  def test_coverage( s ):
+    prog = gen_random_program( 300, seed=3, dep_prob=1.0,
+                               mix={ "alu": 1, "mem": 1 } )
+    cov  = prog.coverage
+    assert cov["raw_dist"][1] > 0
+    assert cov["load_use"] > 0
+    assert "bne" not in cov["static"] and "csrr" not in cov["static"]
+    assert cov["dynamic"]["total"] >= 300
+
+  def test_loops( s ):
+    prog = gen_random_program( 300, seed=4, mix={ "alu": 1, "branch": 1 },
+                               loop_prob=1.0, max_loop_iters=4 )
+    assert prog.coverage["static"]["loop"] > 0
+    assert prog.coverage["dynamic"]["total"] > 300
+
+  # The expected outputs come from ProcFL, so the other processors are
+  # checked against them through the normal test harness
+
+  @pytest.mark.parametrize( "ProcType", [ ProcFL, ProcCL, ProcDualIssueCL, ProcRTL ] )
+  @pytest.mark.parametrize( "seed", [ 0, 1 ] )
+  def test_run( s, ProcType, seed ):
+    prog = gen_random_program( 300, seed=seed )
+    run_test( ProcType, lambda: prog.asm, mem_stall_prob=0.3, mem_latency=2 )
+
+  # Long programs do not fit below 0x2000, so the data array moves after
+  # the text instead of overwriting it
+
+  def test_long( s ):
+    prog      = gen_random_program( 2500, seed=6 )
+    mem_image = assemble( prog.asm )
+
+    text = mem_image.get_section( ".text" )
+    data = mem_image.get_section( ".data" )
+    assert text.addr + len( text.data ) > 0x2000
+    assert data.addr >= text.addr + len( text.data )
+    assert prog.asm.startswith( "    csrr x1, mngr2proc < {:#x}\n".format( data.addr ) )
+
+    run_test( ProcCL, lambda: prog.asm )
+
+  def test_cosim( s ):
+    prog = gen_random_program( 300, seed=5 )
+    LockstepCosim( ProcRTL, assemble( prog.asm ) ).run()
@@ -0,0 +1,190 @@
+"""
+=========================================================================
+trace_trigger_test.py
+=========================================================================
+Tests for the trigger-based windowed tracer.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import io
+
+from harness import TestHarness, assemble
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.trace_trigger import (Proc2MngrProbe, TraceTrigger,
+                                              WindowedTracer, mk_disasm,
+                                              parse_pc)
+from pymtl3.passes import DynamicSim
+
+def mk_out():
+  return io.StringIO() if str is not bytes else io.BytesIO()
+
+def traced_cycles( out ):
+  return [ int( x.split( ":" )[0] ) for x in out.getvalue().splitlines()
+           if not x.startswith( "---" ) ]
+
+#-------------------------------------------------------------------------
+# Tracer
+#-------------------------------------------------------------------------
+
+def test_cycle_trigger():
+  out    = mk_out()
+  tracer = WindowedTracer( TraceTrigger( cycle=10 ), npre=3, npost=4, out=out )
+
+  lines = []
+  def get_line():
+    lines.append( True )
+    return "line"
+
+  for ncycle in range( 30 ):
+    tracer.cycle( ncycle, get_line )
+
+  assert tracer.fired == 10 and tracer.done
+  assert traced_cycles( out ) == [ 7, 8, 9, 10, 11, 12, 13 ]
+  assert out.getvalue().splitlines()[0] == "--- trigger: cycle 10 at cycle 10 ---"
+
+  # Nothing is formatted after the window
+
+  assert len( lines ) == 14
+
+def test_no_pre_trigger_formatting():
+  out    = mk_out()
+  tracer = WindowedTracer( TraceTrigger( cycle=5 ), npre=0, npost=None, out=out )
+
+  def get_line():
+    assert tracer.fired is not None
+    return "line"
+
+  for ncycle in range( 8 ):
+    tracer.cycle( ncycle, get_line )
+
+  assert traced_cycles( out ) == [ 5, 6, 7 ]
+  assert not tracer.done
+
+def test_pc_and_proc2mngr_trigger():
+  trigger = TraceTrigger( pc=0x208, proc2mngr=0x42 )
+
+  assert trigger.check( 0, [ ( 0x204, True ) ] ) is None
+  assert trigger.check( 1, [ ( 0x208, True ) ] ) == "pc 00000208"
+
+  # Like the instruction trigger, the PC trigger ignores an instruction
+  # that is stalled or squashed in the issue stage
+
+  assert trigger.check( 1, [ ( 0x208, False ) ] ) is None
+  assert trigger.check( 2, [], [ 0x41 ] ) is None
+  assert trigger.check( 3, [], [ 0x41, 0x42 ] ) == "proc2mngr 0x42"
+
+def test_abort():
+  out    = mk_out()
+  tracer = WindowedTracer( TraceTrigger( cycle=100 ), npre=2, npost=4, out=out )
+  for ncycle in range( 10 ):
+    tracer.cycle( ncycle, lambda: "line" )
+  tracer.abort( "timeout" )
+
+  assert traced_cycles( out ) == [ 8, 9 ]
+  assert "timeout before the trigger" in out.getvalue()
+
+#-------------------------------------------------------------------------
+# Instruction trigger
+#-------------------------------------------------------------------------
+
+asm = """
+    csrr x1, mngr2proc < 5
+    addi x2, x0, 3
+  loop:
+    add  x3, x1, x2
+    addi x1, x1, -1
+    bne  x1, x0, loop
+    csrw proc2mngr, x3 > 4
+"""
+
+def test_inst_trigger():
+  mem_image = assemble( asm )
+  disasm    = mk_disasm( mem_image )
+  loop      = parse_pc( mem_image, "loop" )
+
+  assert disasm( loop ).split()[0] == "add"
+  assert disasm( 0 ) is None
+  assert parse_pc( mem_image, "0x200" ) == 0x200
+
+  trigger = TraceTrigger( inst="csrw", disasm=disasm )
+  assert trigger.check( 0, [ ( loop, True ) ] ) is None
+  assert trigger.check( 1, [ ( loop + 12, False ) ] ) is None
+  assert trigger.check( 2, [ ( loop + 12, True ) ] ).startswith( "inst csrw" )
+
+  # A prefix with operands only matches the same operands
+
+  trigger = TraceTrigger( inst="addi x1,  x1", disasm=disasm )
+  assert trigger.check( 0, [ ( loop - 4, True ) ] ) is None
+  assert trigger.check( 1, [ ( loop + 4, True ) ] ) is not None
+
+#-------------------------------------------------------------------------
+# Processor
+#-------------------------------------------------------------------------
+
+def test_proc_fl():
+  mem_image = assemble( asm )
+
+  th = TestHarness( ProcFL )
+  th.elaborate()
+  th.load( mem_image )
+  th.apply( DynamicSim )
+  th.sim_reset()
+
+  out     = mk_out()
+  trigger = TraceTrigger( pc=parse_pc( mem_image, "loop" ) + 8 )
+  tracer  = WindowedTracer( trigger, npre=2, npost=3, out=out )
+  probe   = Proc2MngrProbe( th.sink )
+
+  ncycles = 0
+  values  = []
+  while not th.done() and ncycles < 1000:
+    th.tick()
+    ncycles += 1
+    received = probe()
+    values.extend( received )
+    tracer.cycle( ncycles, th.line_trace, th.proc.profile_pcs(), received )
+
+  assert values == [ 4 ]
+  assert tracer.done
+  assert len( traced_cycles( out ) ) == 5
+
+# The addi waits in D for the data of the lw, and only fires the trigger
+# in the cycle it issues
+
+def test_proc_rtl_stalled_pc():
+  mem_image = assemble( """
+    csrr x2, mngr2proc < 0x2000
+    lw   x1, 0(x2)
+  use:
+    addi x3, x1, 1
+    csrw proc2mngr, x3 > 8
+    .data
+    .word 7
+  """ )
+  use = parse_pc( mem_image, "use" )
+
+  th = TestHarness( ProcRTL )
+  th.elaborate()
+  th.load( mem_image )
+  th.apply( DynamicSim )
+  th.sim_reset()
+
+  out    = mk_out()
+  tracer = WindowedTracer( TraceTrigger( pc=use ), npre=0, npost=1, out=out )
+
+  ncycles = 0
+  stalled = []
+  issued  = []
+  while not th.done() and ncycles < 1000:
+    th.tick()
+    ncycles += 1
+    pcs = th.proc.profile_pcs()
+    stalled.extend( ncycles for x in pcs if x == ( use, False ) )
+    issued.extend ( ncycles for x in pcs if x == ( use, True  ) )
+    tracer.cycle( ncycles, th.line_trace, pcs )
+
+  assert stalled and issued and stalled[0] < issued[0]
+  assert tracer.fired == issued[0]
+  assert traced_cycles( out ) == [ issued[0] ]
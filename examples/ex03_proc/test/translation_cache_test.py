@@ -0,0 +1,56 @@
+"""
+==========================================================================
+translation_cache_test.py
+==========================================================================
+Tests for the persistent translation cache.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import os
+
+from pymtl3 import *
+
+from examples.translation_cache import cached_translate, get_source_files
+from ..MiscRTL import AluRTL
+from ..ProcRTL import ProcRTL
+
+#-------------------------------------------------------------------------
+# get_source_files
+#-------------------------------------------------------------------------
+# The helper modules that ProcRTL only imports constants and functions
+# from are part of the hash.
+
+def test_source_files():
+  m = ProcRTL()
+  m.elaborate()
+  names = [ os.path.basename( x ) for x in get_source_files( m ) ]
+  for x in [ "ProcRTL.py", "ProcDpathRTL.py", "MiscRTL.py",
+             "TinyRV0InstRTL.py", "perf_counters.py" ]:
+    assert x in names
+
+#-------------------------------------------------------------------------
+# cached_translate
+#-------------------------------------------------------------------------
+# The first run creates exactly one entry without leaving temporary
+# directories behind, and the second run reuses it.
+
+def test_cached_translate( tmpdir, capsys ):
+  tmpdir.chdir()
+  cache_dir = str( tmpdir.join( "cache" ) )
+
+  m = AluRTL( 32 )
+  m.yosys_translate = True
+  paths = cached_translate( m, cache_dir )
+  assert len( paths ) == 1 and os.path.isfile( paths[0] )
+  entries = os.listdir( cache_dir )
+  assert len( entries ) == 1 and not entries[0].startswith( ".tmp-" )
+  capsys.readouterr()
+
+  m = AluRTL( 32 )
+  m.yosys_translate = True
+  cached_translate( m, cache_dir )
+  assert "Reusing cached translation" in capsys.readouterr().out
+  assert os.listdir( cache_dir ) == entries
@@ -0,0 +1,160 @@
+"""
+=========================================================================
+ubmark_data_test.py
+=========================================================================
+Tests for the seeded ubmark data generators and the scaled ubmarks.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from pymtl3 import *
+from harness import run_ubmark
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ubmark import ubmark_data
+from examples.ex03_proc.ubmark.ubmark_data import (
+  cksum_blk_ref, cksum_roll_ref, find_mismatches, fmt_ranges,
+  gen_bsearch_data, gen_cksum_blk_data, gen_cksum_roll_data, gen_memcpy_data,
+  gen_mmult_data, gen_ptrchase_data, gen_reduce_data, gen_stride_data,
+  gen_vvadd_data, gen_words, mem_image_nbytes, mk_words_section, to_words,
+  verify_words, vvadd_ref, words_to_bytes )
+from examples.ex03_proc.ubmark.proc_ubmark_cksum_blk import ubmark_cksum_blk
+from examples.ex03_proc.ubmark.proc_ubmark_cksum_roll import ubmark_cksum_roll
+from examples.ex03_proc.ubmark.proc_ubmark_vvadd_opt import ubmark_vvadd_opt
+from examples.ex03_proc.ubmark.proc_ubmark_vvadd_unopt import ubmark_vvadd_unopt
+from examples.ex03_proc.ubmark.proc_ubmark_bsearch import ubmark_bsearch
+from examples.ex03_proc.ubmark.proc_ubmark_memcpy import ubmark_memcpy
+from examples.ex03_proc.ubmark.proc_ubmark_mmult import ubmark_mmult
+from examples.ex03_proc.ubmark.proc_ubmark_ptrchase import ubmark_ptrchase
+from examples.ex03_proc.ubmark.proc_ubmark_reduce import ubmark_reduce
+from examples.ex03_proc.ubmark.proc_ubmark_stride import ubmark_stride
+
+# Turns the arrays returned by a generator into lists of ints
+
+def as_lists( data ):
+  return [ [ int( w ) for w in x ] if hasattr( x, "__len__" ) else x for x in data ]
+
+#-------------------------------------------------------------------------
+# UbmarkData_Tests
+#-------------------------------------------------------------------------
+
+class UbmarkData_Tests( object ):
+
+  # The references of the hand-written datasets
+
+  def test_ref( s ):
+    assert list( vvadd_ref( ubmark_vvadd_unopt.src0, ubmark_vvadd_unopt.src1 ) ) == \
+           list( ubmark_vvadd_unopt.ref )
+    assert list( cksum_blk_ref ( ubmark_cksum_blk.src  ) ) == list( ubmark_cksum_blk.ref  )
+    assert list( cksum_roll_ref( ubmark_cksum_roll.src ) ) == list( ubmark_cksum_roll.ref )
+
+  def test_deterministic( s ):
+    assert list( gen_words( 100, 1 ) ) == list( gen_words( 100, 1 ) )
+    assert list( gen_words( 100, 1 ) ) != list( gen_words( 100, 2 ) )
+    assert list( gen_words( 100, 1 ) )[:10] == list( gen_words( 10, 1 ) )
+
+  # Without NumPy we have to get exactly the same data and references
+
+  @pytest.mark.skipif( ubmark_data.np is None, reason="requires numpy" )
+  def test_fallback( s, monkeypatch ):
+    gen = lambda: [
+      gen_vvadd_data( 100, 3 ), gen_cksum_blk_data( 25, 3 ),
+      gen_cksum_roll_data( 600, 3 ), gen_memcpy_data( 100, 3 ),
+      gen_stride_data( 100, 3, 3 ), gen_reduce_data( 100, 3 ),
+      gen_ptrchase_data( 100, 0x2000, 3 ), gen_bsearch_data( 100, 50, 3 ),
+      gen_mmult_data( 5, 3 ),
+    ]
+    ref = gen()
+    monkeypatch.setattr( ubmark_data, "np", None )
+    dut = gen()
+    for x, y in zip( ref, dut ):
+      assert as_lists( x ) == as_lists( y )
+
+  def test_kernel_refs( s ):
+    _, _, ref = gen_ptrchase_data( 1, 0x2000 )
+    assert list( ref )[1] == 0x2000
+
+    arr, keys, ref = gen_bsearch_data( 100, 50 )
+    for key, idx in zip( keys, ref ):
+      key = -int( key ) & 0xffffffff
+      assert all( x < key for x in arr[:idx] ) and all( x >= key for x in arr[idx:] )
+
+    a, b, ref = gen_mmult_data( 2 )
+    assert list( ref ) == [ a[0]*b[0] + a[1]*b[2], a[0]*b[1] + a[1]*b[3],
+                            a[2]*b[0] + a[3]*b[2], a[2]*b[1] + a[3]*b[3] ]
+
+  def test_words_section( s ):
+    section = mk_words_section( ".data", 0x2000, to_words( [ 1, -1 ] ) )
+    assert section.addr == 0x2000
+    assert section.data == bytearray( b"\x01\x00\x00\x00\xff\xff\xff\xff" )
+
+  # Corrupt a few words of the destination and make sure we find all of
+  # them, with and without NumPy
+
+  @pytest.mark.parametrize( "use_numpy", [ True, False ] )
+  def test_verify( s, monkeypatch, use_numpy ):
+    if not use_numpy:
+      monkeypatch.setattr( ubmark_data, "np", None )
+    elif ubmark_data.np is None:
+      pytest.skip( "requires numpy" )
+
+    _, _, ref = gen_vvadd_data( 1000, 7 )
+    memory = bytearray( 0x8000 )
+    memory[0x4000:0x4000+4000] = words_to_bytes( ref )
+
+    assert find_mismatches( memory, 0x4000, ref ) == []
+    assert verify_words( "vvadd", memory, 0x4000, ref )
+
+    for i in [ 3, 4, 5, 999 ]:
+      memory[0x4000 + 4*i] ^= 0xff
+
+    assert find_mismatches( memory, 0x4000, ref ) == [ 3, 4, 5, 999 ]
+    assert not verify_words( "vvadd", memory, 0x4000, ref )
+    assert fmt_ranges( [ 3, 4, 5, 999 ] ) == "3-5, 999"
+
+  # The checksum ubmarks are left out since they use "and", which is a
+  # tutorial task for the processors. test_scaled_cksum checks their
+  # scaled datasets without simulating them.
+
+  @pytest.mark.parametrize( "bmark, size", [
+    ( ubmark_vvadd_unopt, 300  ),
+    ( ubmark_vvadd_opt,   2048 ),
+    ( ubmark_memcpy,      300  ),
+    ( ubmark_stride,      50   ),
+    ( ubmark_reduce,      300  ),
+    ( ubmark_ptrchase,    300  ),
+    ( ubmark_bsearch,     1000 ),
+    ( ubmark_mmult,       5    ),
+  ])
+  def test_scaled( s, bmark, size ):
+    run_ubmark( ProcFL, bmark.scaled( size, seed=5 ) )
+
+  # The scaled checksum ubmarks load the generated source, keep it clear
+  # of the destination, and verify against the reference of that source
+
+  @pytest.mark.parametrize( "bmark, ref_func, size", [
+    ( ubmark_cksum_roll, cksum_roll_ref, 600 ),
+    ( ubmark_cksum_blk,  cksum_blk_ref,  50  ),
+  ])
+  def test_scaled_cksum( s, bmark, ref_func, size ):
+    bmark = bmark.scaled( size, seed=5 )
+    assert bmark.size == size
+    assert list( bmark.ref ) == list( ref_func( bmark.src ) )
+    assert list( bmark.src ) != list( bmark.scaled( size, seed=6 ).src )
+
+    mem_image = bmark.gen_mem_image()
+    memory    = bytearray( mem_image_nbytes( mem_image ) )
+    for section in mem_image.get_sections():
+      if section.name not in [ ".mngr2proc", ".proc2mngr" ]:
+        assert section.addr + len( section.data ) <= bmark.dst_ptr or \
+               section.addr >= bmark.dst_ptr + 4 * len( bmark.ref )
+        memory[ section.addr : section.addr + len( section.data ) ] = section.data
+
+    src = words_to_bytes( bmark.src )
+    assert memory[ bmark.src_ptr : bmark.src_ptr + len( src ) ] == src
+
+    assert not bmark.verify( memory )
+    ref = words_to_bytes( bmark.ref )
+    memory[ bmark.dst_ptr : bmark.dst_ptr + len( ref ) ] = ref
+    assert bmark.verify( memory )
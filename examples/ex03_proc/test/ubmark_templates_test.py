@@ -0,0 +1,72 @@
+"""
+=========================================================================
+ubmark_templates_test.py
+=========================================================================
+Tests for the unrolled and software-pipelined kernel templates.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import pytest
+
+from pymtl3 import *
+from harness import run_ubmark
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.ubmark.ubmark_templates import (
+  gen_kernel_asm, kernel_templates, lookup_template_ubmark,
+  mk_template_ubmark, template_ubmarks )
+
+#-------------------------------------------------------------------------
+# UbmarkTemplates_Tests
+#-------------------------------------------------------------------------
+
+class UbmarkTemplates_Tests( object ):
+
+  def test_registered( s ):
+    for kernel in kernel_templates:
+      for name in [ "{}-u1", "{}-u8", "{}-u4-swp" ]:
+        assert name.format( kernel ) in template_ubmarks
+
+  def test_lookup( s ):
+    assert lookup_template_ubmark( "vvadd-u4" ) is template_ubmarks[ "vvadd-u4" ]
+
+    bmark = lookup_template_ubmark( "memcpy-u6-swp" )
+    assert bmark.unroll == 6 and bmark.pipeline and bmark.size % 6 == 0
+
+    assert lookup_template_ubmark( "vvadd-u0" ) is None
+    assert lookup_template_ubmark( "foo-u2"   ) is None
+    assert lookup_template_ubmark( "vvadd"    ) is None
+
+  # The unrolled loop has one load per element and source, the pipelined
+  # one issues the first group of loads in the prologue
+
+  @pytest.mark.parametrize( "unroll", [ 1, 3, 8 ] )
+  def test_asm( s, unroll ):
+    asm = gen_kernel_asm( kernel_templates[ "vvadd" ], unroll, False,
+                          4 * unroll, [ 0x2000, 0x3000 ], 0x4000 )
+    assert asm.count( "lw" ) == 2 * unroll
+    assert asm.split( "loop:" )[0].count( "lw" ) == 0
+
+    asm = gen_kernel_asm( kernel_templates[ "vvadd" ], unroll, True,
+                          4 * unroll, [ 0x2000, 0x3000 ], 0x4000 )
+    assert asm.count( "lw" ) == 4 * unroll
+    assert asm.split( "loop:" )[0].count( "lw" ) == 2 * unroll
+
+  def test_too_many_regs( s ):
+    with pytest.raises( AssertionError ):
+      mk_template_ubmark( "vvadd", 9 ).gen_mem_image()
+
+  @pytest.mark.parametrize( "ProcType", [ ProcFL, ProcCL, ProcRTL ] )
+  @pytest.mark.parametrize( "name", [
+    "vvadd-u1", "vvadd-u4", "vvadd-u4-swp", "vvadd-u8-swp", "memcpy-u2-swp",
+  ])
+  def test_run( s, ProcType, name ):
+    run_ubmark( ProcType, template_ubmarks[ name ] )
+
+  # A single group leaves the pipelined loop without any iterations
+
+  @pytest.mark.parametrize( "pipeline", [ False, True ] )
+  def test_single_group( s, pipeline ):
+    run_ubmark( ProcFL, mk_template_ubmark( "vvadd", 4, pipeline, size=4 ) )
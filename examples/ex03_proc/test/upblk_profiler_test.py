@@ -0,0 +1,88 @@
+"""
+=========================================================================
+upblk_profiler_test.py
+=========================================================================
+Tests for the update block profiler.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from harness import TestHarness
+from examples.upblk_profiler import UpblkProfiler
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.ubmark.proc_ubmark_vvadd_unopt import ubmark_vvadd_unopt
+from pymtl3.passes import DynamicSim
+
+# Profiles ProcType running vvadd and returns the profiler and the number
+# of times the tick function ran, including the reset cycles
+
+def run_profiler( ProcType ):
+  model    = TestHarness( ProcType )
+  profiler = UpblkProfiler()
+  profiler.apply( model )
+  model.load( ubmark_vvadd_unopt.gen_mem_image() )
+
+  ticks = [ 0 ]
+  tick  = model.tick
+  def counted_tick():
+    ticks[0] += 1
+    tick()
+  model.tick = counted_tick
+
+  model.sim_reset()
+  while not model.done() and ticks[0] < 100000:
+    model.tick()
+
+  assert ubmark_vvadd_unopt.verify( model.mem.mem.mem )
+  return profiler, ticks[0]
+
+#-------------------------------------------------------------------------
+# Blocks
+#-------------------------------------------------------------------------
+# Every block in the schedule runs exactly once per cycle, and the update
+# blocks are named after their host component.
+
+def test_proc_cl():
+  profiler, ncycles = run_profiler( ProcCL )
+
+  assert len( profiler.pass_times ) == len( DynamicSim )
+  assert all( x.ncalls == ncycles for x in profiler.stats )
+
+  names = [ x.name for x in profiler.stats ]
+  for blk in [ "F", "DXM", "W" ]:
+    assert "s.proc.{}".format( blk ) in names
+    stats = profiler.stats[ names.index( "s.proc.{}".format( blk ) ) ]
+    assert stats.cls_name == "ProcCL.{}".format( blk )
+    assert stats.time > 0
+
+  ranked = profiler.ranked()
+  assert len( ranked ) == len( profiler.stats )
+  assert [ x[2] for x in ranked ] == sorted( [ x[2] for x in ranked ], reverse=True )
+
+#-------------------------------------------------------------------------
+# by_class
+#-------------------------------------------------------------------------
+# ProcRTL has many instances of the same register class, which are added
+# up when grouping by class.
+
+def test_by_class():
+  profiler, ncycles = run_profiler( ProcRTL )
+  assert all( x.ncalls == ncycles for x in profiler.stats )
+
+  nblks = {}
+  times = {}
+  for x in profiler.stats:
+    nblks[ x.cls_name ] = nblks.get( x.cls_name, 0 ) + 1
+    times[ x.cls_name ] = times.get( x.cls_name, 0.0 ) + x.time
+
+  by_class = profiler.ranked( by_class=True )
+  assert sorted( [ x[0] for x in by_class ] ) == sorted( nblks )
+  assert max( nblks.values() ) > 1
+
+  for name, ncalls, time in by_class:
+    assert ncalls == nblks[ name ] * ncycles
+    assert abs( time - times[ name ] ) < 1e-9
+
+  assert sum( [ x[1] for x in by_class ] ) == \
+         sum( [ x[1] for x in profiler.ranked() ] )
@@ -0,0 +1,147 @@
+"""
+=========================================================================
+wave_recorder_test.py
+=========================================================================
+Tests for the compact value-change recorder.
+
+Author : agent
+  Date : October 19, 2026
+"""
+import re
+
+from pymtl3 import *
+from pymtl3.stdlib.rtl.registers import Reg
+
+from harness import TestHarness, assemble
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.wave_recorder import (WaveRecorder, _get_varint,
+                                              _put_varint, read_wave,
+                                              wave_to_vcd)
+import inst_add
+
+#-------------------------------------------------------------------------
+# Counter with one signal that never changes
+#-------------------------------------------------------------------------
+
+class Counter( Component ):
+
+  def construct( s ):
+    s.count = OutPort( Bits8 )
+    s.idle  = OutPort( Bits8 )
+    s.reg   = Reg( Bits8 )
+
+    s.connect( s.reg.out, s.count )
+
+    @s.update
+    def up_count():
+      s.reg.in_ = s.reg.out + b8(1)
+
+    @s.update
+    def up_idle():
+      s.idle = b8(42)
+
+# Replays the changes on top of the initial values
+
+def replay( meta, changes ):
+  values = { x["id"]: x["init"] for x in meta["nets"] }
+  for _, x in changes:
+    values.update( x )
+  return values
+
+#-------------------------------------------------------------------------
+# test_varint
+#-------------------------------------------------------------------------
+
+def test_varint():
+  xs  = [ 0, 1, 0x7f, 0x80, 0x3fff, 0x4000, 2**32 - 1, 2**128 - 1 ]
+  buf = bytearray()
+  for x in xs:
+    _put_varint( buf, x )
+
+  i = 0
+  for x in xs:
+    y, i = _get_varint( buf, i )
+    assert x == y
+  assert i == len( buf )
+
+#-------------------------------------------------------------------------
+# test_window
+#-------------------------------------------------------------------------
+
+def test_window( tmpdir ):
+  filename = str( tmpdir.join( "counter.wave" ) )
+
+  top = Counter()
+  top.apply( DynamicSim )
+  top.sim_reset()
+
+  wave = WaveRecorder( top, filename, start=5, end=15, chunk_nbytes=8 )
+  for ncycle in range( 20 ):
+    top.tick()
+    wave.cycle( ncycle )
+  wave.close()
+
+  meta, changes = read_wave( filename )
+
+  # Only the counter and the input of its register toggled, once per
+  # cycle of the window
+
+  names = {}
+  for net in meta["nets"]:
+    for scope, name in net["signals"]:
+      names[ "{}.{}".format( scope, name ) ] = net
+
+  assert meta["first"] == 5 and meta["ncycles"] == 10
+  assert len( meta["nets"] ) == 2
+  assert "s.idle" not in names
+  assert names[ "s.count" ] is names[ "s.reg.out" ]
+
+  net = names[ "s.count" ]
+  assert net["toggles"] == 9
+
+  assert [ x[0] for x in changes ] == list( range( 6, 15 ) )
+  for i, ( _, values ) in enumerate( changes ):
+    assert ( net["id"], ( net["init"] + i + 1 ) % 256 ) in values
+
+  vcd_filename = str( tmpdir.join( "counter.vcd" ) )
+  wave_to_vcd( filename, vcd_filename )
+  with open( vcd_filename ) as f:
+    vcd = f.read()
+  assert re.search( r"\$var reg 8 \S+ count \$end", vcd )
+  assert "idle" not in vcd
+
+#-------------------------------------------------------------------------
+# test_proc_rtl
+#-------------------------------------------------------------------------
+# The values replayed from the file match the processor at the end of
+# the run.
+
+def test_proc_rtl( tmpdir ):
+  filename = str( tmpdir.join( "proc.wave" ) )
+
+  th = TestHarness( ProcRTL )
+  th.elaborate()
+  th.load( assemble( inst_add.gen_random_test() ) )
+  th.apply( DynamicSim )
+  th.sim_reset()
+
+  wave = WaveRecorder( th, filename, prefix="s.proc" )
+
+  ncycles = 0
+  wave.cycle( ncycles )
+  while not th.done() and ncycles < 10000:
+    th.tick()
+    ncycles += 1
+    wave.cycle( ncycles )
+  wave.close()
+
+  assert ncycles < 10000
+
+  meta, changes = read_wave( filename )
+
+  assert 0 < len( meta["nets"] ) < meta["nnets"]
+  assert all( x["toggles"] > 0 for x in meta["nets"] )
+  assert meta["ncycles"] == ncycles + 1
+
+  for net_id, value in replay( meta, changes ).items():
+    assert wave.last[ net_id ] == value
@@ -467,6 +467,9 @@ tinyrv0_isa_impl = IsaImpl( 32, tinyrv0_encoding_table, tinyrv0_fields )
 def assemble_inst( sym, pc, inst_str ):
   return tinyrv0_isa_impl.assemble_inst( sym, pc, inst_str )
 
+# The data section starts at 0x2000 unless the .data directive gives its
+# base address, e.g. ".data 0x8000".
+
 def assemble( asm_code ):
 
   # If asm_code is a single string, then put it in a list to simplify the
@@ -485,8 +488,10 @@ def assemble( asm_code ):
   # First pass to create symbol table. This is obviously very simplistic.
   # We can maybe make it more robust in the future.
 
-  addr = 0x00000200
-  sym  = {}
+  addr        = 0x00000200
+  section     = ".text"
+  sym         = {}
+  sym_section = {}
   for line in asm_list:
     line = line.partition('#')[0]
     line = line.strip()
@@ -499,12 +504,21 @@ def assemble( asm_code ):
       addr = int(addr_str,0)
 
     elif line.startswith(".data"):
-      pass
+      (cmd,sep,addr_str) = line.partition(' ')
+      addr    = int(addr_str,0) if addr_str.strip() else 0x00002000
+      section = ".data"
+
+    elif line.startswith(".hword"):
+      addr += 2
+
+    elif line.startswith(".byte"):
+      addr += 1
 
     else:
       (label,sep,rest) = line.partition(':')
       if sep != "":
         sym[label.strip()] = addr
+        sym_section[label.strip()] = section
       else:
         addr += 4
 
@@ -512,6 +526,7 @@ def assemble( asm_code ):
 
   asm_list_idx    = 0
   addr            = 0x00000200
+  data_addr       = 0x00002000
   text_bytes      = bytearray()
   mngr2proc_bytes = bytearray()
   proc2mngr_bytes = bytearray()
@@ -567,6 +582,9 @@ def assemble( asm_code ):
       addr = int(addr_str,0)
 
     elif line.startswith(".data"):
+      (cmd,sep,addr_str) = line.partition(' ')
+      if addr_str.strip():
+        data_addr = int(addr_str,0)
       break
 
     else:
@@ -674,13 +692,18 @@ def assemble( asm_code ):
   text_section = \
     SparseMemoryImage.Section( ".text", 0x0200, text_bytes )
 
-  data_section = SparseMemoryImage.Section( ".data", 0x2000, data_bytes )
+  data_section = SparseMemoryImage.Section( ".data", data_addr, data_bytes )
 
   # Build a sparse memory image
 
   mem_image = SparseMemoryImage()
   mem_image.add_section( text_section )
 
+  # Keep the labels from the first pass for symbolizing addresses later
+
+  for label, label_addr in sym.items():
+    mem_image.add_symbol( label, label_addr, sym_section[ label ] )
+
   if len(data_section.data) > 0:
     mem_image.add_section( data_section )
 
@@ -0,0 +1,217 @@
+"""
+==========================================================================
+trace_trigger.py
+==========================================================================
+Trigger-based windowed line tracing for the processor simulators.
+Printing the line trace of every cycle from reset is slow, and for a bug
+near the end of a long run almost all of it is never read. Instead, a
+TraceTrigger watches the run for one of
+
+ - a cycle number : fires at the first cycle at or after it,
+ - a PC           : fires when the instruction at that PC issues, see
+                    profile_pcs() in pc_profiler.py, so a stalled or
+                    squashed instruction does not fire it,
+ - an instruction : fires when an issued instruction disassembles to it,
+                    either a mnemonic ("csrw") or a prefix of the whole
+                    disassembly ("lw x5, 0x0000(x2)"),
+ - a proc2mngr value that the processor sends to the manager,
+
+and a WindowedTracer prints the line traces of the npre cycles before
+the trigger, which it keeps in a ring buffer, and of the npost cycles
+from the trigger on. Cycles before the trigger are only formatted when
+npre > 0, and nothing is formatted once the window is over.
+
+If the run fails before the trigger fired, abort() prints the ring
+buffer so that the cycles right before the failure are still shown.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import re
+import struct
+import sys
+from collections import deque
+
+from pymtl3 import *
+
+from .tinyrv0_encoding import disassemble_inst
+
+#-------------------------------------------------------------------------
+# mk_disasm
+#-------------------------------------------------------------------------
+# Returns a function that disassembles the instruction at a PC of the
+# .text section of mem_image, or returns None outside of it.
+
+def mk_disasm( mem_image ):
+  text  = mem_image.get_section( ".text" )
+  cache = {}
+
+  def disasm( pc ):
+    if pc not in cache:
+      i = pc - text.addr
+      if 0 <= i <= len( text.data ) - 4:
+        bits = struct.unpack_from( "<I", bytes( text.data[i:i+4] ) )[0]
+        cache[ pc ] = disassemble_inst( Bits32( bits ) )
+      else:
+        cache[ pc ] = None
+    return cache[ pc ]
+
+  return disasm
+
+# A PC is given either as a number or as a label of mem_image
+
+def parse_pc( mem_image, pc ):
+  if pc in mem_image.symbols:
+    return mem_image.get_symbol( pc )
+  return int( pc, 0 )
+
+# Instructions are compared without leading zeros in register names and
+# with single spaces, so that "addi x1,x1" matches "addi   x01, x01, ..."
+
+def normalize_inst( text ):
+  text = re.sub( r"\bx0*(\d+)", r"x\1", text.strip().lower() )
+  text = re.sub( r"\s*,\s*", ", ", text )
+  return " ".join( text.split() )
+
+#-------------------------------------------------------------------------
+# Proc2MngrProbe
+#-------------------------------------------------------------------------
+# Returns the proc2mngr values the test sink received since the last
+# call. TestSinkCL checks every message against its list as it arrives,
+# so the received values are the ones up to its index.
+
+class Proc2MngrProbe( object ):
+
+  def __init__( self, sink ):
+    self.sink = sink
+    self.idx  = 0
+
+  def __call__( self ):
+    idx = self.sink.idx
+    if idx == self.idx:
+      return ()
+    values = [ int( x ) for x in self.sink.msgs[ self.idx:idx ] ]
+    self.idx = idx
+    return values
+
+#-------------------------------------------------------------------------
+# TraceTrigger
+#-------------------------------------------------------------------------
+# Conditions that are None are ignored. check() returns a description of
+# the condition that fired, or None.
+
+class TraceTrigger( object ):
+
+  def __init__( self, cycle=None, pc=None, inst=None, proc2mngr=None,
+                disasm=None ):
+
+    assert inst is None or disasm is not None, \
+      "an instruction trigger needs a disassembler!"
+
+    self.cycle     = cycle
+    self.pc        = pc
+    self.inst      = None if inst is None else normalize_inst( inst )
+    self.proc2mngr = proc2mngr
+    self.disasm    = disasm
+
+  # The PC and instruction conditions look at the instructions issued in
+  # this cycle, the proc2mngr condition at the values received in it
+
+  @property
+  def needs_pcs( self ):
+    return self.pc is not None or self.inst is not None
+
+  def match_inst( self, pc ):
+    text = self.disasm( pc )
+    if text is None:
+      return False
+    text = normalize_inst( text )
+    return text.split( " " )[0] == self.inst or \
+           ( " " in self.inst and text.startswith( self.inst ) )
+
+  def check( self, ncycle, pcs=(), proc2mngr=() ):
+
+    if self.cycle is not None and ncycle >= self.cycle:
+      return "cycle {}".format( self.cycle )
+
+    for pc, issued in pcs:
+      if not issued:
+        continue
+      if pc == self.pc:
+        return "pc {:0>8x}".format( pc )
+      if self.inst is not None and self.match_inst( pc ):
+        return "inst {} at pc {:0>8x}".format( self.disasm( pc ), pc )
+
+    if self.proc2mngr is not None and self.proc2mngr in proc2mngr:
+      return "proc2mngr {:#x}".format( self.proc2mngr )
+
+    return None
+
+#-------------------------------------------------------------------------
+# WindowedTracer
+#-------------------------------------------------------------------------
+# Call cycle() once per cycle with a function that returns the line
+# trace. npost=None traces until the end of the run.
+
+class WindowedTracer( object ):
+
+  def __init__( self, trigger, npre=16, npost=64, out=None ):
+    self.trigger = trigger
+    self.npre    = npre
+    self.npost   = npost
+    self.out     = out or sys.stdout
+
+    self.ring      = deque( maxlen=max( npre, 1 ) )
+    self.fired     = None
+    self.remaining = None
+
+  @property
+  def done( self ):
+    return self.remaining == 0
+
+  def _print( self, ncycle, line ):
+    print( "{:3}: {}".format( ncycle, line ), file=self.out )
+
+  def _dump_ring( self ):
+    for ncycle, line in self.ring:
+      self._print( ncycle, line )
+    self.ring.clear()
+
+  def cycle( self, ncycle, get_line, pcs=(), proc2mngr=() ):
+
+    if self.remaining == 0:
+      return
+
+    # Waiting for the trigger
+
+    if self.fired is None:
+      reason = self.trigger.check( ncycle, pcs, proc2mngr )
+      if reason is None:
+        if self.npre:
+          self.ring.append( ( ncycle, get_line() ) )
+        return
+
+      self.fired = ncycle
+      print( "--- trigger: {} at cycle {} ---".format( reason, ncycle ),
+             file=self.out )
+      if self.npre:
+        self._dump_ring()
+      self.remaining = self.npost
+
+    # Inside the window
+
+    self._print( ncycle, get_line() )
+    if self.remaining is not None:
+      self.remaining -= 1
+      if self.remaining == 0:
+        print( "--- end of trace window ---", file=self.out )
+
+  # Prints the ring buffer if the run ends before the trigger fired
+
+  def abort( self, reason ):
+    if self.fired is None and self.ring:
+      print( "--- {} before the trigger, last {} cycles ---".format(
+             reason, len( self.ring ) ), file=self.out )
+      self._dump_ring()
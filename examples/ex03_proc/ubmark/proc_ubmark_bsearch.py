@@ -0,0 +1,136 @@
+"""
+==========================================================================
+ubmark-bsearch: binary search of a sorted array
+==========================================================================
+This code looks up a number of keys in a sorted array with a binary
+search and stores the index of the first element that is not less than
+each key. Whether the search goes left or right depends on the data, so
+the branches are hard to predict.
+
+TinyRV0 has neither compare nor subtract instructions. The keys are thus
+stored negated, and arr[mid] < key is the sign bit of arr[mid] + (-key),
+which cannot overflow since all values fit in 30 bits. "bne x6, x0" is
+an unconditional branch since x6 holds 1.
+
+void bsearch( int *dest, int *arr, int size, int *keys, int nkeys ) {
+  for ( int i = 0; i < nkeys; i++ ) {
+    int lo = 0, len = size;
+    while ( len > 0 ) {
+      int half = len >> 1;
+      if ( arr[lo+half] < keys[i] ) { lo += half + 1; len = (len - 1) >> 1; }
+      else                          { len = half; }
+    }
+    dest[i] = lo;
+  }
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_bsearch_data, mk_words_section, verify_words
+
+c_bsearch_arr_ptr = 0x2000;
+c_bsearch_size    = 100;
+c_bsearch_nkeys   = 32;
+
+class ubmark_bsearch( object ):
+
+  # default dataset and where it lives in memory
+
+  size           = c_bsearch_size
+  nkeys          = c_bsearch_nkeys
+  arr, keys, ref = gen_bsearch_data( c_bsearch_size, c_bsearch_nkeys )
+  arr_ptr        = c_bsearch_arr_ptr
+  key_ptr        = align( c_bsearch_arr_ptr + 4 * c_bsearch_size )
+  dst_ptr        = align( key_ptr + 4 * c_bsearch_nkeys )
+
+  # returns a copy of the ubmark searching an array of the given size
+
+  @classmethod
+  def scaled( cls, size, seed=0, nkeys=None ):
+    nkeys = cls.nkeys if nkeys is None else nkeys
+    assert size > 0 and nkeys > 0
+    arr, keys, ref = gen_bsearch_data( size, nkeys, seed )
+    key_ptr = align( cls.arr_ptr + 4 * size )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, nkeys=nkeys, arr=arr, keys=keys, ref=ref,
+      key_ptr=key_ptr, dst_ptr=align( key_ptr + 4 * nkeys ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "bsearch", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # nkeys
+        csrr  x2,  mngr2proc < {:#x} # arr pointer
+        csrr  x3,  mngr2proc < {:#x} # key pointer
+        csrr  x4,  mngr2proc < {:#x} # dst pointer
+        csrr  x5,  mngr2proc < {}     # size
+
+        addi  x6,  x0,  1         # shift amount 1
+        addi  x7,  x0,  2         # shift amount 2
+        addi  x8,  x0,  31        # shift amount 31
+
+      loop_i:
+        lw    x9,  0(x3)          # -key
+        add   x10, x0,  x0        # lo = 0
+        add   x11, x0,  x5        # len = size
+
+      search:
+        srl   x12, x11, x6        # half = len >> 1
+        add   x13, x10, x12       # mid = lo + half
+        sll   x14, x13, x7
+        add   x14, x14, x2
+        lw    x15, 0(x14)         # arr[mid]
+        add   x15, x15, x9        # arr[mid] - key
+        srl   x15, x15, x8        # arr[mid] < key
+        bne   x15, x0,  less
+
+        add   x11, x0,  x12       # len = half
+        bne   x11, x0,  search
+        bne   x6,  x0,  found
+
+      less:
+        addi  x10, x13, 1         # lo = mid + 1
+        addi  x11, x11, -1
+        srl   x11, x11, x6        # len = (len - 1) >> 1
+        bne   x11, x0,  search
+
+      found:
+        sw    x10, 0(x4)          # dest[i] = lo
+        addi  x3,  x3,  4
+        addi  x4,  x4,  4
+        addi  x1,  x1,  -1
+        bne   x1,  x0,  loop_i
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.nkeys, cls.arr_ptr, cls.key_ptr, cls.dst_ptr, cls.size ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.arr_ptr, cls.arr  ) )
+    mem_image.add_section( mk_words_section( ".data", cls.key_ptr, cls.keys ) )
+
+    return mem_image
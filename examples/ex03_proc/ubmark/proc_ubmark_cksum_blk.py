@@ -26,46 +26,54 @@ from string import translate, maketrans
 from examples.ex03_proc.tinyrv0_encoding  import assemble
 from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage, mk_section
 
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_cksum_blk_data, mk_words_section, to_words, verify_words
 from proc_ubmark_cksum_blk_data import src, ref, mask, dataset_size
 
 c_cksum_src_ptr = 0x2000;
 c_cksum_msk_ptr = 0x3000;
 c_cksum_dst_ptr = 0x4000;
 c_cksum_size    = dataset_size;
-    
-class ubmark_cksum_blk:
 
-  # verification function, argument is a bytearray from TestMemory instance
+class ubmark_cksum_blk( object ):
+
+  # default dataset and where it lives in memory
 
-  @staticmethod
-  def verify( memory ):
+  size    = c_cksum_size
+  src     = to_words( src  )
+  ref     = to_words( ref  )
+  mask    = to_words( mask )
+  src_ptr = c_cksum_src_ptr
+  msk_ptr = c_cksum_msk_ptr
+  dst_ptr = c_cksum_dst_ptr
 
-    is_pass      = True
-    first_failed = -1
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given number of 16-byte blocks
 
-    for i in range(c_cksum_size):
-      x = struct.unpack('i', memory[c_cksum_dst_ptr + i * 4 : c_cksum_dst_ptr + (i+1) * 4] )[0]
-      if not ( x == ref[i] ):
-        is_pass     = False
-        first_faild = i
-        print( " [ failed ] dest[{i}]: {x} != ref[{i}]: {ref} ".format( i=i, x=hex(x), ref=hex(ref[i]) ) )
-        return False
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    src, ref = gen_cksum_blk_data( size, seed )
+    msk_ptr = align( c_cksum_src_ptr + 16 * size )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src=src, ref=ref, msk_ptr=msk_ptr, dst_ptr=msk_ptr + 0x1000 ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
 
-    if is_pass:
-      print( " [ passed ]: cksum-blk" )
-      return True
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "cksum-blk", memory, cls.dst_ptr, cls.ref )
 
-  @staticmethod
-  def gen_mem_image():
+  @classmethod
+  def gen_mem_image( cls ):
 
     # text section
 
     text =( """
         # load array pointers
         csrr  x1,  mngr2proc < {}     # size
-        csrr  x2,  mngr2proc < 0x2000 # src pointer
-        csrr  x14, mngr2proc < 0x3000 # mask pointer
-        csrr  x3,  mngr2proc < 0x4000 # dst pointer
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x14, mngr2proc < {:#x} # mask pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
         add   x4,  x0,  x1            # loop var i
         addi  x5,  x0,  16            # shift amount
         lw    x13, 0(x14)             # mask = 0xffff
@@ -110,14 +118,14 @@ class ubmark_cksum_blk:
         nop
         nop
         nop
-    """.format( c_cksum_size ) )
+    """.format( cls.size, cls.src_ptr, cls.msk_ptr, cls.dst_ptr ) )
 
     mem_image = assemble( text )
 
     # load data by manually create data sections using binutils
 
-    src_section = mk_section( ".data", c_cksum_src_ptr, src )
-    msk_section = mk_section( ".data", c_cksum_msk_ptr, mask )
+    src_section = mk_words_section( ".data", cls.src_ptr, cls.src  )
+    msk_section = mk_words_section( ".data", cls.msk_ptr, cls.mask )
 
     # load data
 
@@ -0,0 +1,86 @@
+"""
+==========================================================================
+ubmark-memcpy: copy an array of words
+==========================================================================
+This code copies an array of words to the destination array. It does
+almost no computation, so its performance is bound by the memory system.
+
+void memcpy( int *dest, int *src, int size ) {
+  for ( int i = 0; i < size; i++ )
+    *dest++ = *src++;
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_memcpy_data, mk_words_section, verify_words
+
+c_memcpy_src_ptr = 0x2000;
+c_memcpy_size    = 100;
+
+class ubmark_memcpy( object ):
+
+  # default dataset and where it lives in memory
+
+  size     = c_memcpy_size
+  src, ref = gen_memcpy_data( c_memcpy_size )
+  src_ptr  = c_memcpy_src_ptr
+  dst_ptr  = align( c_memcpy_src_ptr + 4 * c_memcpy_size )
+
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given size
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    src, ref = gen_memcpy_data( size, seed )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src=src, ref=ref, dst_ptr=align( cls.src_ptr + 4 * size ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "memcpy", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # size
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+
+      loop:
+        lw    x4,  0(x2)
+        sw    x4,  0(x3)
+        addi  x2,  x2,  4
+        addi  x3,  x3,  4
+        addi  x1,  x1,  -1
+        bne   x1,  x0,  loop
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.src_ptr, cls.dst_ptr ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
@@ -0,0 +1,153 @@
+"""
+==========================================================================
+ubmark-mmult: matrix multiplication with shifts and adds
+==========================================================================
+This code multiplies two n x n matrices of 8-bit values in row-major
+order. TinyRV0 has no multiply instruction, so every product is computed
+with a shift-and-add loop that runs once per bit of b. The loop exits as
+soon as b becomes zero and adds a only for the one bits, so the branches
+depend on the data. "bne x5, x0" is an unconditional branch since x5
+holds 1.
+
+int mul( int a, int b ) {
+  int p = 0;
+  while ( b != 0 ) {
+    if ( b & 1 ) p += a;
+    a <<= 1;
+    b >>= 1;
+  }
+  return p;
+}
+
+void mmult( int *dest, int *a, int *b, int n ) {
+  for ( int i = 0; i < n; i++ )
+    for ( int j = 0; j < n; j++ ) {
+      int sum = 0;
+      for ( int k = 0; k < n; k++ )
+        sum += mul( a[i*n+k], b[k*n+j] );
+      dest[i*n+j] = sum;
+    }
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_mmult_data, mk_words_section, verify_words
+
+c_mmult_a_ptr = 0x2000;
+c_mmult_size  = 8;
+
+class ubmark_mmult( object ):
+
+  # default dataset and where it lives in memory
+
+  size      = c_mmult_size
+  a, b, ref = gen_mmult_data( c_mmult_size )
+  a_ptr     = c_mmult_a_ptr
+  b_ptr     = align( c_mmult_a_ptr + 4 * c_mmult_size * c_mmult_size )
+  dst_ptr   = align( b_ptr         + 4 * c_mmult_size * c_mmult_size )
+
+  # returns a copy of the ubmark multiplying matrices of the given size
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    a, b, ref = gen_mmult_data( size, seed )
+    b_ptr = align( cls.a_ptr + 4 * size * size )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, a=a, b=b, ref=ref,
+      b_ptr=b_ptr, dst_ptr=align( b_ptr + 4 * size * size ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "mmult", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # n
+        csrr  x2,  mngr2proc < {:#x} # a pointer
+        csrr  x3,  mngr2proc < {:#x} # b pointer
+        csrr  x4,  mngr2proc < {:#x} # dst pointer
+
+        addi  x5,  x0,  1         # shift amount 1
+        addi  x6,  x0,  31        # shift amount 31
+        addi  x7,  x0,  2         # shift amount 2
+        sll   x8,  x1,  x7        # row size in bytes
+        add   x9,  x0,  x1        # i = n
+
+      loop_i:
+        add   x10, x0,  x3        # column of b
+        add   x11, x0,  x1        # j = n
+
+      loop_j:
+        add   x12, x0,  x0        # sum = 0
+        add   x13, x0,  x2        # pa = &a[i][0]
+        add   x14, x0,  x10       # pb = &b[0][j]
+        add   x15, x0,  x1        # k = n
+
+      loop_k:
+        lw    x16, 0(x13)         # a[i][k]
+        lw    x17, 0(x14)         # b[k][j]
+        bne   x17, x0,  mul
+        bne   x5,  x0,  next_k
+
+      mul:
+        sll   x18, x17, x6        # nonzero if b is odd
+        bne   x18, x0,  mul_add
+
+      mul_shift:
+        sll   x16, x16, x5        # a <<= 1
+        srl   x17, x17, x5        # b >>= 1
+        bne   x17, x0,  mul
+        bne   x5,  x0,  next_k
+
+      mul_add:
+        add   x12, x12, x16       # sum += a
+        bne   x5,  x0,  mul_shift
+
+      next_k:
+        addi  x13, x13, 4
+        add   x14, x14, x8
+        addi  x15, x15, -1
+        bne   x15, x0,  loop_k
+
+        sw    x12, 0(x4)          # dest[i][j] = sum
+        addi  x4,  x4,  4
+        addi  x10, x10, 4
+        addi  x11, x11, -1
+        bne   x11, x0,  loop_j
+
+        add   x2,  x2,  x8        # next row of a
+        addi  x9,  x9,  -1
+        bne   x9,  x0,  loop_i
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.a_ptr, cls.b_ptr, cls.dst_ptr ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.a_ptr, cls.a ) )
+    mem_image.add_section( mk_words_section( ".data", cls.b_ptr, cls.b ) )
+
+    return mem_image
@@ -0,0 +1,98 @@
+"""
+==========================================================================
+ubmark-ptrchase: walk a linked list in random order
+==========================================================================
+This code follows a cyclic linked list whose nodes are shuffled in
+memory and sums up the values of the nodes. Every load depends on the
+previous one, so the processor cannot hide any memory latency.
+
+struct node { struct node *next; int value; };
+
+void ptrchase( int *dest, struct node *p, int size ) {
+  int sum = 0;
+  for ( int i = 0; i < size; i++ ) {
+    sum += p->value;
+    p = p->next;
+  }
+  dest[0] = sum;
+  dest[1] = (int) p;
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_ptrchase_data, mk_words_section, verify_words
+
+c_ptrchase_src_ptr = 0x2000;
+c_ptrchase_size    = 100;
+
+class ubmark_ptrchase( object ):
+
+  # default dataset and where it lives in memory
+
+  size           = c_ptrchase_size
+  src, head, ref = gen_ptrchase_data( c_ptrchase_size, c_ptrchase_src_ptr )
+  src_ptr        = c_ptrchase_src_ptr
+  dst_ptr        = align( c_ptrchase_src_ptr + 8 * c_ptrchase_size )
+
+  # returns a copy of the ubmark running on a generated list of the given
+  # number of nodes
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    src, head, ref = gen_ptrchase_data( size, cls.src_ptr, seed )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src=src, head=head, ref=ref,
+      dst_ptr=align( cls.src_ptr + 8 * size ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "ptrchase", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # size
+        csrr  x2,  mngr2proc < {:#x} # head pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+        add   x4,  x0,  x0        # sum = 0
+
+      loop:
+        lw    x5,  4(x2)          # p->value
+        lw    x2,  0(x2)          # p = p->next
+        add   x4,  x4,  x5        # sum += value
+        addi  x1,  x1,  -1
+        bne   x1,  x0,  loop
+
+        sw    x4,  0(x3)
+        sw    x2,  4(x3)
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.head, cls.dst_ptr ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
@@ -0,0 +1,90 @@
+"""
+==========================================================================
+ubmark-reduce: sum of an array
+==========================================================================
+This code sums up an array of words. Every iteration depends on the
+previous one through the running sum.
+
+void reduce( int *dest, int *src, int size ) {
+  int sum = 0;
+  for ( int i = 0; i < size; i++ )
+    sum += src[i];
+  *dest = sum;
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_reduce_data, mk_words_section, verify_words
+
+c_reduce_src_ptr = 0x2000;
+c_reduce_size    = 100;
+
+class ubmark_reduce( object ):
+
+  # default dataset and where it lives in memory
+
+  size     = c_reduce_size
+  src, ref = gen_reduce_data( c_reduce_size )
+  src_ptr  = c_reduce_src_ptr
+  dst_ptr  = align( c_reduce_src_ptr + 4 * c_reduce_size )
+
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given size
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    src, ref = gen_reduce_data( size, seed )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src=src, ref=ref, dst_ptr=align( cls.src_ptr + 4 * size ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "reduce", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # size
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+        add   x4,  x0,  x0        # sum = 0
+
+      loop:
+        lw    x5,  0(x2)
+        add   x4,  x4,  x5        # sum += src[i]
+        addi  x2,  x2,  4
+        addi  x1,  x1,  -1
+        bne   x1,  x0,  loop
+
+        sw    x4,  0(x3)
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.src_ptr, cls.dst_ptr ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
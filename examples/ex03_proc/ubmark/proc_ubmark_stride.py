@@ -0,0 +1,92 @@
+"""
+==========================================================================
+ubmark-stride: gather every stride-th word of an array
+==========================================================================
+This code copies every stride-th word of the source array to the
+destination array. With a stride of at least a cache line every load
+touches a new line, which stresses caches and prefetchers.
+
+void stride( int *dest, int *src, int size, int stride ) {
+  for ( int i = 0; i < size; i++ )
+    dest[i] = src[i*stride];
+}
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_stride_data, mk_words_section, verify_words
+
+c_stride_src_ptr = 0x2000;
+c_stride_size    = 100;
+c_stride_stride  = 4;
+
+class ubmark_stride( object ):
+
+  # default dataset and where it lives in memory
+
+  size     = c_stride_size
+  stride   = c_stride_stride
+  src, ref = gen_stride_data( c_stride_size, c_stride_stride )
+  src_ptr  = c_stride_src_ptr
+  dst_ptr  = align( c_stride_src_ptr + 4 * c_stride_size * c_stride_stride )
+
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given size, the stride is given in words
+
+  @classmethod
+  def scaled( cls, size, seed=0, stride=None ):
+    stride = cls.stride if stride is None else stride
+    assert size > 0 and stride > 0
+    src, ref = gen_stride_data( size, stride, seed )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, stride=stride, src=src, ref=ref,
+      dst_ptr=align( cls.src_ptr + 4 * size * stride ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "stride", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # size
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+        csrr  x4,  mngr2proc < {}     # stride in bytes
+
+      loop:
+        lw    x5,  0(x2)
+        sw    x5,  0(x3)
+        add   x2,  x2,  x4
+        addi  x3,  x3,  4
+        addi  x1,  x1,  -1
+        bne   x1,  x0,  loop
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.src_ptr, cls.dst_ptr, 4 * cls.stride ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
@@ -16,6 +16,7 @@ from pymtl3                      import *
 from string                      import translate, maketrans
 from examples.ex03_proc.tinyrv0_encoding  import assemble
 from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage, mk_section
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_vvadd_data, mk_words_section, to_words, verify_words
 from proc_ubmark_vvadd_data      import src0, src1, ref
 
 c_vvadd_src0_ptr = 0x2000;
@@ -23,39 +24,48 @@ c_vvadd_src1_ptr = 0x3000;
 c_vvadd_dest_ptr = 0x4000;
 c_vvadd_size     = 100;
 
-class ubmark_vvadd_opt:
+class ubmark_vvadd_opt( object ):
 
-  # verification function, argument is a bytearray from TestMemory instance
+  # default dataset and where it lives in memory
+
+  size     = c_vvadd_size
+  src0     = to_words( src0 )
+  src1     = to_words( src1 )
+  ref      = to_words( ref  )
+  src0_ptr = c_vvadd_src0_ptr
+  src1_ptr = c_vvadd_src1_ptr
+  dest_ptr = c_vvadd_dest_ptr
 
-  @staticmethod
-  def verify( memory ):
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given size, with the arrays placed back to back. The loop is
+  # unrolled four times, so the size has to be a multiple of four.
 
-    is_pass      = True
-    first_failed = -1
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0 and size % 4 == 0, "vvadd-opt size must be a multiple of 4!"
+    src0, src1, ref = gen_vvadd_data( size, seed )
+    src1_ptr = align( c_vvadd_src0_ptr + 4 * size )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src0=src0, src1=src1, ref=ref,
+      src1_ptr=src1_ptr, dest_ptr=align( src1_ptr + 4 * size ) ) )
 
-    for i in range(c_vvadd_size):
-      x = struct.unpack('i', memory[c_vvadd_dest_ptr + i * 4 : c_vvadd_dest_ptr + (i+1) * 4] )[0]
-      if not ( x == ref[i] ):
-        is_pass     = False
-        first_faild = i
-        print( " [ failed ] dest[{i}]: {x} != ref[{i}]: {ref} ".format( i=i, x=x, ref=ref[i] ) )
-        return False
+  # verification function, argument is a bytearray from TestMemory instance
 
-    if is_pass:
-      print( " [ passed ]: vvadd-opt" )
-      return True
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "vvadd-opt", memory, cls.dest_ptr, cls.ref )
 
-  @staticmethod
-  def gen_mem_image():
+  @classmethod
+  def gen_mem_image( cls ):
 
     # text section
 
     text = """
     # load array pointers
-    csrr  x1, mngr2proc < 100
-    csrr  x2, mngr2proc < 0x2000
-    csrr  x3, mngr2proc < 0x3000
-    csrr  x4, mngr2proc < 0x4000
+    csrr  x1, mngr2proc < {}
+    csrr  x2, mngr2proc < {:#x}
+    csrr  x3, mngr2proc < {:#x}
+    csrr  x4, mngr2proc < {:#x}
     add   x5, x0, x1
 
     # main loop
@@ -90,15 +100,15 @@ class ubmark_vvadd_opt:
     nop
     nop
     nop
-"""
+""".format( cls.size, cls.src0_ptr, cls.src1_ptr, cls.dest_ptr )
 
     mem_image = assemble( text )
 
     # load data by manually create data sections using binutils
 
-    src0_section = mk_section( ".data", c_vvadd_src0_ptr, src0 )
+    src0_section = mk_words_section( ".data", cls.src0_ptr, cls.src0 )
 
-    src1_section = mk_section( ".data", c_vvadd_src1_ptr, src1 )
+    src1_section = mk_words_section( ".data", cls.src1_ptr, cls.src1 )
 
     # load data
 
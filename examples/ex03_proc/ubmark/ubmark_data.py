@@ -0,0 +1,386 @@
+"""
+==========================================================================
+ubmark_data.py
+==========================================================================
+Seeded data generators for the ubmarks. Inputs and references of any
+size are produced directly as packed arrays of 32-bit words, which are
+turned into memory image sections without going through Python lists.
+
+The inputs come from a counter-based generator (splitmix64 of the seed
+and the element index), so the same seed gives the same data whether or
+not NumPy is installed. With NumPy, inputs and references are computed
+with vectorized operations and the words are numpy.uint32 arrays.
+Without it, we fall back to plain loops over array.array('I'), which is
+fine for small datasets but slow for millions of elements.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import bisect
+import sys
+from array import array
+
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+#-------------------------------------------------------------------------
+# Packed words
+#-------------------------------------------------------------------------
+
+def _words_array( values ):
+  words = array( "I", values )
+  assert words.itemsize == 4, "array('I') is not 32-bit on this host!"
+  return words
+
+def to_words( values ):
+  if np is not None:
+    return ( np.asarray( values, dtype=np.int64 ) & 0xffffffff ).astype( np.uint32 )
+  return _words_array( [ x & 0xffffffff for x in values ] )
+
+def words_to_bytes( words ):
+  if np is not None:
+    return bytearray( np.asarray( words, dtype=np.uint32 ).astype( "<u4" ).tobytes() )
+  words = _words_array( words )
+  if sys.byteorder == "big":
+    words.byteswap()
+  return bytearray( words.tostring() if sys.version_info[0] < 3 else words.tobytes() )
+
+def mk_words_section( name, addr, words ):
+  return SparseMemoryImage.Section( name, addr, words_to_bytes( words ) )
+
+#-------------------------------------------------------------------------
+# Verification
+#-------------------------------------------------------------------------
+# The ubmarks are verified against the bytearray of the test memory. We
+# reinterpret the destination range as an array of 32-bit words in place
+# and compare it with the reference as a whole, instead of unpacking one
+# word at a time.
+
+def load_words( memory, addr, nwords ):
+  if np is not None:
+    return np.frombuffer( memory, dtype="<u4", count=nwords, offset=addr )
+
+  view = memoryview( memory )[ addr : addr + 4 * nwords ]
+  if hasattr( view, "cast" ) and sys.byteorder == "little":
+    return view.cast( "I" )
+  return _bytes_to_words( view.tobytes() )
+
+def _bytes_to_words( data ):
+  words = _words_array( [] )
+  if hasattr( words, "frombytes" ):
+    words.frombytes( data )
+  else:
+    words.fromstring( data )
+  if sys.byteorder == "big":
+    words.byteswap()
+  return words
+
+# Returns the indices of all words that differ from the reference
+
+def find_mismatches( memory, addr, ref ):
+  if np is not None:
+    got = load_words( memory, addr, len( ref ) )
+    return np.flatnonzero( got != np.asarray( ref, dtype=np.uint32 ) ).tolist()
+
+  got = _bytes_to_words( memoryview( memory )[ addr : addr + 4 * len( ref ) ].tobytes() )
+  ref = _words_array( ref )
+  if got == ref:
+    return []
+  return [ i for i, ( x, y ) in enumerate( zip( got, ref ) ) if x != y ]
+
+# Prints the first max_print mismatches and the ranges of all of them
+
+def verify_words( name, memory, addr, ref, max_print=10 ):
+  mismatches = find_mismatches( memory, addr, ref )
+
+  if not mismatches:
+    print( " [ passed ]: {}".format( name ) )
+    return True
+
+  got = load_words( memory, addr, len( ref ) )
+  for i in mismatches[:max_print]:
+    print( " [ failed ] dest[{i}]: {x:#010x} != ref[{i}]: {ref:#010x} ".format(
+           i=i, x=int( got[i] ), ref=int( ref[i] ) ) )
+  if len( mismatches ) > max_print:
+    print( " [ failed ] ... {} more mismatches".format( len( mismatches ) - max_print ) )
+  print( " [ failed ]: {}, {} of {} words differ at {}".format(
+         name, len( mismatches ), len( ref ), fmt_ranges( mismatches ) ) )
+  return False
+
+# Formats sorted indices as ranges, e.g. "3, 8-15, 42"
+
+def fmt_ranges( indices ):
+  ranges = []
+  for i in indices:
+    if ranges and ranges[-1][1] == i - 1:
+      ranges[-1][1] = i
+    else:
+      ranges.append( [ i, i ] )
+  return ", ".join( [ str( x ) if x == y else "{}-{}".format( x, y ) for x, y in ranges ] )
+
+#-------------------------------------------------------------------------
+# Memory layout
+#-------------------------------------------------------------------------
+
+def align( addr, nbytes=0x1000 ):
+  return ( addr + nbytes - 1 ) // nbytes * nbytes
+
+# Smallest power of two that holds every section of the image, but at
+# least the default 1MB of the test memory
+
+def mem_image_nbytes( mem_image, min_nbytes=2**20 ):
+  end = max( [ x.addr + len( x.data ) for x in mem_image.get_sections() ] + [ 0 ] )
+  nbytes = min_nbytes
+  while nbytes < end:
+    nbytes *= 2
+  return nbytes
+
+#-------------------------------------------------------------------------
+# gen_words
+#-------------------------------------------------------------------------
+# n random 32-bit words: the upper half of splitmix64( seed, i ).
+
+_golden = 0x9e3779b97f4a7c15
+_mix1   = 0xbf58476d1ce4e5b9
+_mix2   = 0x94d049bb133111eb
+_mask64 = 0xffffffffffffffff
+
+def gen_words( n, seed=0 ):
+  base = ( seed * _golden ) & _mask64
+
+  if np is not None:
+    z = np.arange( 1, n + 1, dtype=np.uint64 ) * np.uint64( _golden ) + np.uint64( base )
+    z = ( z ^ ( z >> np.uint64( 30 ) ) ) * np.uint64( _mix1 )
+    z = ( z ^ ( z >> np.uint64( 27 ) ) ) * np.uint64( _mix2 )
+    z =   z ^ ( z >> np.uint64( 31 ) )
+    return ( z >> np.uint64( 32 ) ).astype( np.uint32 )
+
+  words = []
+  for i in range( 1, n + 1 ):
+    z = ( base + i * _golden ) & _mask64
+    z = ( ( z ^ ( z >> 30 ) ) * _mix1 ) & _mask64
+    z = ( ( z ^ ( z >> 27 ) ) * _mix2 ) & _mask64
+    z =     z ^ ( z >> 31 )
+    words.append( z >> 32 )
+  return _words_array( words )
+
+#-------------------------------------------------------------------------
+# References
+#-------------------------------------------------------------------------
+
+def vvadd_ref( src0, src1 ):
+  if np is not None:
+    return np.asarray( src0, dtype=np.uint32 ) + np.asarray( src1, dtype=np.uint32 )
+  return _words_array( [ ( x + y ) & 0xffffffff for x, y in zip( src0, src1 ) ] )
+
+# Every word holds two 16-bit elements, the lower half first
+
+def _halves( src ):
+  src = np.asarray( src, dtype=np.uint32 )
+  return np.stack( [ src & 0xffff, src >> 16 ], axis=1 ).reshape( -1 ).astype( np.uint64 )
+
+def _halves_py( src ):
+  for word in src:
+    yield word & 0xffff
+    yield word >> 16
+
+# Each block of eight elements gets its own checksum. Since all sums are
+# taken modulo 2^16, sum1 is the total of the block and sum2 is the total
+# of its prefix sums.
+
+def cksum_blk_ref( src ):
+  if np is not None:
+    prefix = np.cumsum( _halves( src ).reshape( -1, 8 ), axis=1 )
+    sum1   = prefix[:,-1]        & 0xffff
+    sum2   = prefix.sum( axis=1 ) & 0xffff
+    return ( ( sum2 << np.uint64( 16 ) ) | sum1 ).astype( np.uint32 )
+
+  ref    = []
+  halves = list( _halves_py( src ) )
+  for i in range( 0, len( halves ), 8 ):
+    sum1 = sum2 = 0
+    for x in halves[i:i+8]:
+      sum1 = ( sum1 + x    ) & 0xffff
+      sum2 = ( sum2 + sum1 ) & 0xffff
+    ref.append( ( sum2 << 16 ) | sum1 )
+  return _words_array( ref )
+
+# The rolling checksum carries ( sum1, sum2 ) from one block of six
+# elements to the next. Block k maps ( a, b ) to
+#
+#   ( a + b + X_k, 8a + 7b + W_k ) = M ( a, b ) + u_k,  M = [ [1,1], [8,7] ]
+#
+# where X_k is the total of the block and W_k = sum_j (6-j) x_j. The final
+# state is then sum_k M^(n-1-k) u_k, for which we compute all powers of M
+# by repeated doubling.
+
+def cksum_roll_ref( src ):
+  if np is not None:
+    blocks = _halves( src ).reshape( -1, 6 )
+    nblocks = blocks.shape[0]
+    u = np.stack( [ blocks.sum( axis=1 ),
+                    blocks.dot( np.arange( 6, 0, -1, dtype=np.uint64 ) ) ], axis=1 ) & 0xffff
+
+    powers = np.empty( ( nblocks, 2, 2 ), dtype=np.uint64 )
+    powers[:1] = np.eye( 2, dtype=np.uint64 )
+    power  = np.array( [ [ 1, 1 ], [ 8, 7 ] ], dtype=np.uint64 )
+    filled = 1
+    while filled < nblocks:
+      n = min( filled, nblocks - filled )
+      powers[filled:filled+n] = np.matmul( powers[:n], power ) & 0xffff
+      power   = np.matmul( power, power ) & 0xffff
+      filled += n
+
+    sum1, sum2 = ( powers[::-1] * u[:,None,:] ).sum( axis=( 0, 2 ) ) & 0xffff
+    return np.array( [ ( sum2 << np.uint64( 16 ) ) | sum1 ], dtype=np.uint32 )
+
+  halves = list( _halves_py( src ) )
+  sum1_prev = sum2_prev = 0
+  for i in range( 0, len( halves ), 6 ):
+    sum1 = sum1_prev
+    sum2 = sum1
+    sum1 = ( sum1 + sum2_prev ) & 0xffff
+    sum2 = ( sum2 + sum1      ) & 0xffff
+    for x in halves[i:i+6]:
+      sum1 = ( sum1 + x    ) & 0xffff
+      sum2 = ( sum2 + sum1 ) & 0xffff
+    sum1_prev = sum1
+    sum2_prev = sum2
+  return _words_array( [ ( sum2_prev << 16 ) | sum1_prev ] )
+
+#-------------------------------------------------------------------------
+# Generators
+#-------------------------------------------------------------------------
+# Each generator returns the input arrays followed by the reference.
+
+def gen_vvadd_data( size, seed=0 ):
+  src0 = gen_words( size, 2 * seed     )
+  src1 = gen_words( size, 2 * seed + 1 )
+  return src0, src1, vvadd_ref( src0, src1 )
+
+# size is the number of 16-bit elements, which the kernel processes six
+# at a time
+
+def gen_cksum_roll_data( size, seed=0 ):
+  assert size > 0 and size % 6 == 0, "cksum-roll size must be a multiple of 6!"
+  src = gen_words( size // 2, seed )
+  return src, cksum_roll_ref( src )
+
+# nblocks is the number of 16-byte blocks
+
+def gen_cksum_blk_data( nblocks, seed=0 ):
+  src = gen_words( 4 * nblocks, seed )
+  return src, cksum_blk_ref( src )
+
+#-------------------------------------------------------------------------
+# Memory-bound and branch-heavy kernels
+#-------------------------------------------------------------------------
+
+def _shr( words, nbits ):
+  if np is not None:
+    return np.asarray( words, dtype=np.uint32 ) >> nbits
+  return _words_array( [ x >> nbits for x in words ] )
+
+def _sum_words( words ):
+  if np is not None:
+    return int( np.asarray( words, dtype=np.uint64 ).sum() ) & 0xffffffff
+  return sum( words ) & 0xffffffff
+
+def _argsort( keys ):
+  if np is not None:
+    return np.argsort( np.asarray( keys ), kind="stable" )
+  return sorted( range( len( keys ) ), key=keys.__getitem__ )
+
+# memcpy copies the source, so the reference is the source itself
+
+def gen_memcpy_data( size, seed=0 ):
+  src = gen_words( size, seed )
+  return src, src
+
+# Every stride-th word of the source
+
+def stride_ref( src, stride ):
+  if np is not None:
+    return np.array( np.asarray( src, dtype=np.uint32 )[::stride] )
+  return _words_array( src[::stride] )
+
+def gen_stride_data( size, stride, seed=0 ):
+  src = gen_words( size * stride, seed )
+  return src, stride_ref( src, stride )
+
+def gen_reduce_data( size, seed=0 ):
+  src = gen_words( size, seed )
+  return src, to_words( [ _sum_words( src ) ] )
+
+# Nodes of two words, the address of the next node followed by a value,
+# linked into a single cycle in a random order starting at head. After
+# visiting all nodes we are back at head, so the reference is the sum of
+# all values followed by head.
+
+def gen_ptrchase_data( nnodes, base, seed=0 ):
+  order  = _argsort( gen_words( nnodes, 2 * seed ) )
+  values = gen_words( nnodes, 2 * seed + 1 )
+  head   = base + 8 * int( order[0] )
+
+  if np is not None:
+    nexts = np.empty( nnodes, dtype=np.uint32 )
+    nexts[ order ] = base + 8 * np.roll( order, -1 )
+    nodes = np.stack( [ nexts, values ], axis=1 ).reshape( -1 )
+  else:
+    nexts = [ 0 ] * nnodes
+    for i in range( nnodes ):
+      nexts[ order[i] ] = base + 8 * order[ ( i + 1 ) % nnodes ]
+    nodes = _words_array( [ x for pair in zip( nexts, values ) for x in pair ] )
+
+  return nodes, head, to_words( [ _sum_words( values ), head ] )
+
+# A sorted array of 30-bit values and a set of keys, every other one
+# taken from the array. The reference is the index of the first element
+# that is not less than the key. TinyRV0 has no compare instructions, so
+# the kernel gets the keys negated and checks the sign of arr[i] - key,
+# which cannot overflow for 30-bit values.
+
+def bsearch_ref( arr, keys ):
+  if np is not None:
+    return np.searchsorted( arr, keys, side="left" ).astype( np.uint32 )
+  return _words_array( [ bisect.bisect_left( arr, x ) for x in keys ] )
+
+def gen_bsearch_data( size, nkeys, seed=0 ):
+  arr = _shr( gen_words( size, 3 * seed ), 2 )
+  idx = gen_words( nkeys, 3 * seed + 1 )
+  rnd = _shr( gen_words( nkeys, 3 * seed + 2 ), 2 )
+
+  if np is not None:
+    arr  = np.sort( arr )
+    keys = np.where( np.arange( nkeys ) % 2 == 0, arr[ idx % size ], rnd )
+    neg  = to_words( -keys.astype( np.int64 ) )
+  else:
+    arr  = _words_array( sorted( arr ) )
+    keys = [ arr[ x % size ] if i % 2 == 0 else y
+             for i, ( x, y ) in enumerate( zip( idx, rnd ) ) ]
+    neg  = to_words( [ -x for x in keys ] )
+
+  return arr, neg, bsearch_ref( arr, keys )
+
+# Two n x n matrices of 8-bit values in row-major order. The kernel
+# multiplies with shifts and adds, so the number of iterations depends on
+# the values.
+
+def mmult_ref( a, b, n ):
+  if np is not None:
+    c = np.asarray( a, dtype=np.uint64 ).reshape( n, n ).dot(
+        np.asarray( b, dtype=np.uint64 ).reshape( n, n ) )
+    return ( c & 0xffffffff ).astype( np.uint32 ).reshape( -1 )
+  return _words_array( [ sum( [ a[i*n+k] * b[k*n+j] for k in range( n ) ] ) & 0xffffffff
+                         for i in range( n ) for j in range( n ) ] )
+
+def gen_mmult_data( n, seed=0 ):
+  a = _shr( gen_words( n * n, 2 * seed     ), 24 )
+  b = _shr( gen_words( n * n, 2 * seed + 1 ), 24 )
+  return a, b, mmult_ref( a, b, n )
@@ -0,0 +1,217 @@
+"""
+==========================================================================
+ubmark_templates.py
+==========================================================================
+Kernel templates for element-wise ubmarks. A KernelTemplate describes
+what happens to a single element: which source arrays are loaded, the
+instruction that computes the result, and the reference generator. From
+that, mk_template_ubmark generates the TinyRV0 loop for any unroll
+factor, either
+
+ - unrolled  : every iteration loads, computes and stores unroll
+               elements, so the loop overhead is amortized and the loads
+               of one element hide the latency of the others
+
+ - pipelined : software-pipelined version of the above. The loads for
+               the next group of elements are issued right after the
+               current group is computed, so they have a whole iteration
+               to come back. A prologue loads the first group and an
+               epilogue computes and stores the last one.
+
+Every element gets its own registers, so the unroll factor is bounded by
+the register file: ( nsrcs + 1 ) * unroll registers starting from x8.
+The size has to be a multiple of the unroll factor.
+
+Generated ubmarks behave like the hand-written ones. The ones in
+template_ubmarks, every kernel with unroll factors 1, 2, 4 and 8 with
+and without pipelining, are registered in proc-sim as, e.g., vvadd-u4
+and vvadd-u4-swp.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+import re
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_memcpy_data, gen_vvadd_data, mk_words_section, verify_words
+
+c_template_src_ptr = 0x2000
+c_template_size    = 100
+
+#-------------------------------------------------------------------------
+# KernelTemplate
+#-------------------------------------------------------------------------
+# gen_data( size, seed ) returns the source arrays followed by the
+# reference, and compute( dst, srcs ) returns the instruction computing
+# one element from registers.
+
+class KernelTemplate( object ):
+
+  def __init__( s, name, nsrcs, gen_data, compute ):
+    s.name     = name
+    s.nsrcs    = nsrcs
+    s.gen_data = gen_data
+    s.compute  = compute
+
+kernel_templates = {
+  "vvadd" : KernelTemplate( "vvadd", 2, gen_vvadd_data,
+                            lambda dst, srcs: "add   {}, {}, {}".format( dst, *srcs ) ),
+  "memcpy": KernelTemplate( "memcpy", 1, gen_memcpy_data,
+                            lambda dst, srcs: "add   {}, {}, x0".format( dst, *srcs ) ),
+}
+
+#-------------------------------------------------------------------------
+# gen_kernel_asm
+#-------------------------------------------------------------------------
+# x1 counts the remaining elements, x2.. hold the source pointers
+# followed by the destination pointer, and x8.. hold the elements.
+
+def gen_kernel_asm( kernel, unroll, pipeline, size, src_ptrs, dst_ptr ):
+  nsrcs = kernel.nsrcs
+  assert size > 0 and size % unroll == 0, \
+    "size {} is not a multiple of the unroll factor {}!".format( size, unroll )
+  assert 8 + ( nsrcs + 1 ) * unroll <= 32, \
+    "unroll factor {} needs more than 32 registers!".format( unroll )
+
+  src_regs = [ "x{}".format( 2 + k ) for k in range( nsrcs ) ]
+  dst_reg  = "x{}".format( 2 + nsrcs )
+  in_regs  = [ [ "x{}".format( 8 + u * nsrcs + k ) for k in range( nsrcs ) ]
+               for u in range( unroll ) ]
+  out_regs = [ "x{}".format( 8 + unroll * nsrcs + u ) for u in range( unroll ) ]
+
+  lines = []
+  def emit( line ):
+    lines.append( "        " + line )
+
+  def loads():
+    for u in range( unroll ):
+      for k in range( nsrcs ):
+        emit( "lw    {}, {}({})".format( in_regs[u][k], 4 * u, src_regs[k] ) )
+    for reg in src_regs:
+      emit( "addi  {}, {}, {}".format( reg, reg, 4 * unroll ) )
+
+  def computes():
+    for u in range( unroll ):
+      emit( kernel.compute( out_regs[u], in_regs[u] ) )
+
+  def stores():
+    for u in range( unroll ):
+      emit( "sw    {}, {}({})".format( out_regs[u], 4 * u, dst_reg ) )
+    emit( "addi  {}, {}, {}".format( dst_reg, dst_reg, 4 * unroll ) )
+
+  emit( "csrr  x1, mngr2proc < {}".format( size ) )
+  for reg, ptr in zip( src_regs + [ dst_reg ], list( src_ptrs ) + [ dst_ptr ] ):
+    emit( "csrr  {}, mngr2proc < {:#x}".format( reg, ptr ) )
+
+  if not pipeline:
+    lines.append( "      loop:" )
+    loads()
+    computes()
+    stores()
+    emit( "addi  x1, x1, -{}".format( unroll ) )
+    emit( "bne   x1, x0, loop" )
+
+  else:
+    loads()
+    if size > unroll:
+      emit( "addi  x1, x1, -{}".format( unroll ) )
+      lines.append( "      loop:" )
+      computes()
+      loads()
+      stores()
+      emit( "addi  x1, x1, -{}".format( unroll ) )
+      emit( "bne   x1, x0, loop" )
+    computes()
+    stores()
+
+  emit( "csrw  proc2mngr, x0 > 0" )
+  for _ in range( 6 ):
+    emit( "nop" )
+
+  return "\n".join( lines ) + "\n"
+
+#-------------------------------------------------------------------------
+# TemplateUbmark
+#-------------------------------------------------------------------------
+# Base class of the generated ubmarks. The source arrays are placed back
+# to back starting at 0x2000, followed by the destination array.
+
+class TemplateUbmark( object ):
+
+  kernel   = None
+  unroll   = 1
+  pipeline = False
+
+  @classmethod
+  def bmark_name( cls ):
+    return "{}-u{}{}".format( cls.kernel.name, cls.unroll, "-swp" if cls.pipeline else "" )
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0 and size % cls.unroll == 0, \
+      "size {} is not a multiple of the unroll factor {}!".format( size, cls.unroll )
+    data = cls.kernel.gen_data( size, seed )
+    ptrs = [ c_template_src_ptr ]
+    for _ in range( cls.kernel.nsrcs ):
+      ptrs.append( align( ptrs[-1] + 4 * size ) )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, srcs=data[:-1], ref=data[-1], src_ptrs=ptrs[:-1], dst_ptr=ptrs[-1] ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( cls.bmark_name(), memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    text = gen_kernel_asm( cls.kernel, cls.unroll, cls.pipeline,
+                           cls.size, cls.src_ptrs, cls.dst_ptr )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    for ptr, src in zip( cls.src_ptrs, cls.srcs ):
+      mem_image.add_section( mk_words_section( ".data", ptr, src ) )
+
+    return mem_image
+
+#-------------------------------------------------------------------------
+# mk_template_ubmark
+#-------------------------------------------------------------------------
+# Returns a ubmark for the given kernel, unroll factor and schedule. The
+# default dataset size is rounded up to a multiple of the unroll factor.
+
+def mk_template_ubmark( kernel, unroll=1, pipeline=False, size=None, seed=0 ):
+  if size is None:
+    size = ( c_template_size + unroll - 1 ) // unroll * unroll
+
+  name = "ubmark_{}_u{}{}".format( kernel, unroll, "_swp" if pipeline else "" )
+  base = type( name, ( TemplateUbmark, ), dict(
+    kernel=kernel_templates[ kernel ], unroll=unroll, pipeline=pipeline ) )
+  return base.scaled( size, seed )
+
+template_ubmarks = {}
+for kernel in sorted( kernel_templates ):
+  for unroll in [ 1, 2, 4, 8 ]:
+    for pipeline in [ False, True ]:
+      bmark = mk_template_ubmark( kernel, unroll, pipeline )
+      template_ubmarks[ bmark.bmark_name() ] = bmark
+
+# Looks up a ubmark by name, e.g. vvadd-u6-swp, for any unroll factor.
+# Returns None if the name does not match a kernel template.
+
+def lookup_template_ubmark( name ):
+  if name in template_ubmarks:
+    return template_ubmarks[ name ]
+
+  m = re.match( r"^(\w+)-u(\d+)(-swp)?$", name )
+  if m is None or m.group(1) not in kernel_templates or int( m.group(2) ) < 1:
+    return None
+  return mk_template_ubmark( m.group(1), int( m.group(2) ), m.group(3) is not None )
@@ -0,0 +1,381 @@
+"""
+==========================================================================
+wave_recorder.py
+==========================================================================
+Compact value-change recorder for long RTL simulations. A VCD of a long
+ProcRTL run is mostly the same signals printed over and over in text,
+and writing it dominates the simulation time. The recorder here keeps
+the values of all nets in a tuple of ints, compares them once per cycle,
+and only records the nets that changed:
+
+ - Capture can be restricted to a window of cycles [start, end), so a
+   failure deep into a long run can be captured without recording
+   everything before it. The values at the first cycle of the window
+   are kept as the initial values.
+ - Changes are packed into a binary stream of varints and the stream is
+   cut into chunks, which a background thread compresses with zlib and
+   writes out while the simulation goes on.
+ - Only nets that toggled at least once in the window are kept in the
+   file. All other nets are dropped, together with their names.
+
+A file is a magic string followed by chunks, each of them a one-byte tag,
+a 32-bit little-endian length, and zlib-compressed data. "C" chunks hold
+cycle records, each a varint cycle delta, a varint number of changes,
+and ( net id, value ) varint pairs. The last chunk is an "F" chunk with a
+JSON description of the window and of the kept nets: their ids, widths,
+initial values, toggle counts, and the ( scope, name ) pairs of all
+signals in the net. read_wave() reads a file back and wave_to_vcd()
+converts it into a VCD for waveform viewers.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import json
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+
+from pymtl3.datatypes import BitStruct
+from pymtl3.dsl import Const
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue
+
+c_wave_magic = b"PYMTLWV1"
+
+#-------------------------------------------------------------------------
+# Varints
+#-------------------------------------------------------------------------
+
+def _put_varint( buf, x ):
+  while x >= 0x80:
+    buf.append( ( x & 0x7f ) | 0x80 )
+    x >>= 7
+  buf.append( x )
+
+def _get_varint( data, i ):
+  x = shift = 0
+  while True:
+    byte = data[i]
+    i += 1
+    x |= ( byte & 0x7f ) << shift
+    shift += 7
+    if byte < 0x80:
+      return x, i
+
+#-------------------------------------------------------------------------
+# collect_nets
+#-------------------------------------------------------------------------
+# Returns a list of nets of top, where every net is a list of the
+# signals that always carry the same value, with the signal used to read
+# the value first. Like VcdGenerationPass, we skip constants and sliced
+# signals. Only nets with a signal under prefix are returned, and the
+# clock is left out since it is not simulated.
+
+def collect_nets( top, prefix="s" ):
+
+  def is_under( x ):
+    name = repr( x )
+    return name == prefix or name.startswith( prefix + "." ) or \
+           name.startswith( prefix + "[" )
+
+  nets   = []
+  net_of = set()
+
+  for _, net in top.get_all_value_nets():
+    signals = [ x for x in net if not isinstance( x, Const ) and
+                                  not x.is_sliced_signal() ]
+    net_of.update( signals )
+    if signals and any( is_under( x ) for x in signals ):
+      nets.append( signals )
+
+  for x in top._dsl.all_signals:
+    for y in x.get_leaf_signals():
+      if y not in net_of and is_under( y ):
+        net_of.add( y )
+        nets.append( [ y ] )
+
+  return [ net for net in nets if not any( repr( x ) == "s.clk" for x in net ) ]
+
+#-------------------------------------------------------------------------
+# WaveWriterThread
+#-------------------------------------------------------------------------
+# Compresses and writes chunks in the background. A None chunk stops
+# the thread. An exception is kept and raised again by the recorder.
+
+class WaveWriterThread( threading.Thread ):
+
+  def __init__( self, out, max_nchunks=16 ):
+    super( WaveWriterThread, self ).__init__()
+    self.daemon = True
+    self.out    = out
+    self.chunks = queue.Queue( max_nchunks )
+    self.error  = None
+
+  def run( self ):
+    while True:
+      chunk = self.chunks.get()
+      if chunk is None:
+        return
+      if self.error is not None:
+        continue
+      try:
+        tag, data = chunk
+        data = zlib.compress( data, 6 )
+        self.out.write( tag + struct.pack( "<I", len( data ) ) + data )
+      except Exception as e:
+        self.error = e
+
+#-------------------------------------------------------------------------
+# WaveRecorder
+#-------------------------------------------------------------------------
+# Call cycle() after every tick of an elaborated and simulated top. The
+# cycle numbers have to increase. end=None records until close().
+
+class WaveRecorder( object ):
+
+  def __init__( self, top, filename, start=0, end=None, prefix="s",
+                chunk_nbytes=1<<18 ):
+
+    self.start        = start
+    self.end          = end
+    self.chunk_nbytes = chunk_nbytes
+
+    self.nets = collect_nets( top, prefix )
+
+    # We read all values with one generated function. Bit structs are
+    # flattened into Bits first.
+
+    exprs = []
+    for net in self.nets:
+      expr = repr( net[0] )
+      if issubclass( net[0]._dsl.Type, BitStruct ):
+        expr += ".to_bits()"
+      exprs.append( expr )
+
+    src = "def sample():\n  return ( {} )".format(
+          "".join( [ "int({}), ".format( x ) for x in exprs ] ) )
+    namespace = { "s": top }
+    exec( compile( src, filename="wave_sample", mode="exec" ), namespace )
+    self.sample = namespace["sample"]
+
+    self.nbits = [ eval( x, { "s": top } ).nbits for x in exprs ]
+
+    # Recording state
+
+    self.init       = None
+    self.first      = None
+    self.last       = None
+    self.last_cycle = None
+    self.toggles    = [ 0 ] * len( self.nets )
+    self.buf        = bytearray()
+    self.ncycles    = 0
+
+    self.out    = open( filename, "wb" )
+    self.out.write( c_wave_magic )
+    self.writer = WaveWriterThread( self.out )
+    self.writer.start()
+
+  def _push( self, tag, data ):
+    if self.writer.error is not None:
+      raise self.writer.error
+    self.writer.chunks.put( ( tag, bytes( data ) ) )
+
+  #-----------------------------------------------------------------------
+  # cycle
+  #-----------------------------------------------------------------------
+
+  def cycle( self, ncycle ):
+    if ncycle < self.start or ( self.end is not None and ncycle >= self.end ):
+      return
+
+    values = self.sample()
+    self.ncycles += 1
+
+    if self.init is None:
+      self.init  = self.last = values
+      self.first = self.last_cycle = ncycle
+      return
+
+    if values == self.last:
+      return
+
+    changes = [ ( i, x ) for i, ( x, y ) in
+                enumerate( zip( values, self.last ) ) if x != y ]
+
+    buf = self.buf
+    _put_varint( buf, ncycle - self.last_cycle )
+    _put_varint( buf, len( changes ) )
+    for i, x in changes:
+      _put_varint( buf, i )
+      _put_varint( buf, x )
+      self.toggles[i] += 1
+
+    self.last       = values
+    self.last_cycle = ncycle
+
+    if len( buf ) >= self.chunk_nbytes:
+      self._push( b"C", buf )
+      self.buf = bytearray()
+
+  #-----------------------------------------------------------------------
+  # close
+  #-----------------------------------------------------------------------
+
+  def close( self ):
+    if self.buf:
+      self._push( b"C", self.buf )
+      self.buf = bytearray()
+
+    nets = []
+    for i, net in enumerate( self.nets ):
+      if self.toggles[i]:
+        nets.append({
+          "id"     : i,
+          "nbits"  : self.nbits[i],
+          "init"   : self.init[i],
+          "toggles": self.toggles[i],
+          "signals": [ [ repr( x.get_host_component() ),
+                         repr( x )[ len( repr( x.get_host_component() ) ) + 1: ] ]
+                       for x in net ],
+        })
+
+    self._push( b"F", json.dumps({
+      "date"    : time.asctime(),
+      "start"   : self.start,
+      "end"     : self.end,
+      "first"   : self.first,
+      "ncycles" : self.ncycles,
+      "nnets"   : len( self.nets ),
+      "nets"    : nets,
+    }).encode( "utf-8" ) )
+
+    self.writer.chunks.put( None )
+    self.writer.join()
+    self.out.close()
+
+    if self.writer.error is not None:
+      raise self.writer.error
+
+#-------------------------------------------------------------------------
+# read_wave
+#-------------------------------------------------------------------------
+# Returns the JSON description of the file and a list of ( cycle,
+# [ ( net id, value ), ... ] ) tuples. The cycles of the changes are
+# absolute.
+
+def read_wave( filename ):
+  with open( filename, "rb" ) as f:
+    data = f.read()
+
+  assert data[:len( c_wave_magic )] == c_wave_magic, \
+    "{} is not a wave file!".format( filename )
+
+  meta    = None
+  records = bytearray()
+  i       = len( c_wave_magic )
+
+  while i < len( data ):
+    tag = data[i:i+1]
+    n   = struct.unpack_from( "<I", data, i+1 )[0]
+    raw = zlib.decompress( data[i+5:i+5+n] )
+    i  += 5 + n
+    if tag == b"C":
+      records.extend( raw )
+    elif tag == b"F":
+      meta = json.loads( raw.decode( "utf-8" ) )
+
+  assert meta is not None, "{} has no footer, was it closed?".format( filename )
+
+  # Cycle deltas are relative to the first recorded cycle
+
+  changes = []
+  cycle   = meta["first"]
+  j       = 0
+  while j < len( records ):
+    delta, j = _get_varint( records, j )
+    n,     j = _get_varint( records, j )
+    cycle += delta
+    values = []
+    for _ in range( n ):
+      net,   j = _get_varint( records, j )
+      value, j = _get_varint( records, j )
+      values.append( ( net, value ) )
+    changes.append( ( cycle, values ) )
+
+  return meta, changes
+
+#-------------------------------------------------------------------------
+# wave_to_vcd
+#-------------------------------------------------------------------------
+# Writes a VCD with the kept nets. Every signal of a net shows up in the
+# scope of its host component. One cycle is 100 time units.
+
+def wave_to_vcd( filename, vcd_filename, timescale="10ps" ):
+  meta, changes = read_wave( filename )
+
+  def gen_symbol( n ):
+    code = ""
+    while True:
+      n, r = divmod( n, 94 )
+      code = chr( 33 + r ) + code
+      if n == 0:
+        return code
+      n -= 1
+
+  def mangle( name ):
+    return name.replace( "[", "(" ).replace( "]", ")" )
+
+  symbols = {}
+  nbits   = {}
+  scopes  = defaultdict( list )
+
+  for k, net in enumerate( meta["nets"] ):
+    symbols[ net["id"] ] = gen_symbol( k )
+    nbits  [ net["id"] ] = net["nbits"]
+    for scope, name in net["signals"]:
+      scopes[ scope ].append( ( net["id"], name ) )
+
+  def fmt( net, value ):
+    return "b{:0{}b} {}".format( value, nbits[ net ], symbols[ net ] )
+
+  with open( vcd_filename, "w" ) as f:
+    print( "$date\n    {}\n$end\n$version\n    PyMTL 3 (Mamba)\n$end\n"
+           "$timescale {}\n$end\n".format( meta["date"], timescale ), file=f )
+
+    # Scopes are nested by their dotted names
+
+    opened = []
+    for scope in sorted( scopes ):
+      path = [ "top" ] + [ mangle( x ) for x in scope.split( "." )[1:] ]
+      while opened and opened != path[:len( opened )]:
+        print( "$upscope $end", file=f )
+        opened.pop()
+      while len( opened ) < len( path ):
+        opened.append( path[ len( opened ) ] )
+        print( "$scope module {} $end".format( opened[-1] ), file=f )
+      for net, name in scopes[ scope ]:
+        print( "$var reg {} {} {} $end".format( nbits[ net ], symbols[ net ],
+                                                mangle( name ) ), file=f )
+    for _ in opened:
+      print( "$upscope $end", file=f )
+    print( "$enddefinitions $end\n", file=f )
+
+    first = meta["start"] if meta["first"] is None else meta["first"]
+    print( "#{}".format( 100 * first ), file=f )
+    print( "$dumpvars", file=f )
+    for net in meta["nets"]:
+      print( fmt( net["id"], net["init"] ), file=f )
+    print( "$end", file=f )
+
+    for cycle, values in changes:
+      print( "#{}".format( 100 * cycle ), file=f )
+      for net, value in values:
+        if net in symbols:
+          print( fmt( net, value ), file=f )
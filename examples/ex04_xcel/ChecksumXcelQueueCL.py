@@ -0,0 +1,121 @@
+"""
+==========================================================================
+ChecksumXcelQueueCL.py
+==========================================================================
+Cycle level implementation of a checksum accelerator with multiple jobs
+in flight. Instead of blocking all requests until the checksum is done,
+writing the go bit pushes the contents of xr0~3 into a job queue and
+returns right away, so the processor can configure the next job while
+the checksum unit works on the current one. Results are pushed into a
+completion queue in the order the jobs were issued. The address space is
+the same as in ChecksumXcelQueueFL:
+
+ - xr0~3 : checksum input of the next job
+ - xr4   : go bit, writing it issues a job
+ - xr5   : reading it pops the oldest result
+ - xr6   : number of results waiting in the completion queue
+ - xr7   : wide issue, writing it issues a job on the written data
+
+A go write waits while the job queue is full and a read of xr5 waits
+until a result is ready, so at most njobs jobs should be outstanding
+before the processor reads back a result.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.cl.queues import NormalQueueCL
+from pymtl3.stdlib.ifcs import mk_xcel_msg, XcelMsgType
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcCL
+
+from examples.ex02_cksum.ChecksumCL import ChecksumCL
+from examples.ex02_cksum.utils import words_to_b128
+
+#-------------------------------------------------------------------------
+# ChecksumXcelQueueCL
+#-------------------------------------------------------------------------
+
+class ChecksumXcelQueueCL( Component ):
+
+  def construct( s, nbits=32, njobs=2 ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, nbits )
+    s.RespType = RespType
+    s.DataType = mk_bits( nbits )
+
+    s.xcel = XcelMinionIfcCL( ReqType, RespType )
+
+    # Local paramters
+
+    RD = XcelMsgType.READ
+    WR = XcelMsgType.WRITE
+
+    # Components
+
+    s.in_q          = NormalQueueCL( num_entries=2 )
+    s.reg_file      = [ b32(0) for _ in range(4) ]
+    s.job_q         = NormalQueueCL( num_entries=njobs )
+    s.checksum_unit = ChecksumCL()
+    s.result_q      = NormalQueueCL( num_entries=njobs )
+
+    s.connect( s.xcel.req, s.in_q.enq )
+    s.connect( s.checksum_unit.send, s.result_q.enq )
+
+    # Send the oldest job to the checksum unit
+
+    @s.update
+    def up_issue():
+      if s.job_q.deq.rdy() and s.checksum_unit.recv.rdy():
+        s.checksum_unit.recv( s.job_q.deq() )
+
+    # Serve the request at the head of the input queue. We only peek at
+    # it so that go writes and result reads can wait for the queues.
+
+    @s.update
+    def up_tick():
+      if s.in_q.deq.rdy() and s.xcel.resp.rdy():
+        req  = s.in_q.peek()
+        addr = int( req.addr )
+
+        if req.type_ == WR:
+          if addr == 4 or addr == 7:
+            if s.job_q.enq.rdy():
+              s.in_q.deq()
+              s.job_q.enq( words_to_b128( s.get_words() ) if addr == 4 else
+                           b128( req.data ) )
+              s.xcel.resp( s.RespType( WR, s.DataType( 0 ) ) )
+          else:
+            s.in_q.deq()
+            if addr < 4:
+              s.reg_file[ addr ] = req.data[0:32]
+            s.xcel.resp( s.RespType( WR, s.DataType( 0 ) ) )
+
+        elif req.type_ == RD:
+          if addr == 5:
+            if s.result_q.deq.rdy():
+              s.in_q.deq()
+              s.xcel.resp( s.RespType( RD, s.result_q.deq() ) )
+          else:
+            s.in_q.deq()
+            s.xcel.resp( s.RespType( RD,
+              b32( len( s.result_q.queue ) ) if addr == 6 else
+              s.reg_file[ addr ]             if addr <  4 else
+              b32( 0 ) ) )
+
+  #-----------------------------------------------------------------------
+  # [get_words] is a helper function that extracts the 128-bit input from
+  # the register file.
+  def get_words( s ):
+    words = []
+    for i in range( 4 ):
+      words.append( s.reg_file[i][0 :16] )
+      words.append( s.reg_file[i][16:32] )
+    return words
+
+  def line_trace( s ):
+    return "{}(CL :j{}r{}){}".format( s.xcel.req, len( s.job_q.queue ),
+                                      len( s.result_q.queue ), s.xcel.resp )
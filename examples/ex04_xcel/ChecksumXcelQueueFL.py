@@ -0,0 +1,89 @@
+"""
+==========================================================================
+ChecksumXcelQueueFL.py
+==========================================================================
+Functional level implementation of a checksum accelerator that accepts
+new jobs while earlier ones are still being computed. Writing the go bit
+queues a job with the current contents of xr0~3 and the results are
+collected in order from a completion queue.
+
+Address space:
+
+ - xr0~3 : checksum input of the next job
+ - xr4   : go bit, writing it issues a job
+ - xr5   : reading it pops the oldest result
+ - xr6   : number of results waiting in the completion queue
+ - xr7   : wide issue, writing it issues a job on the written data
+
+xr7 is meant for a 128-bit accelerator interface (nbits=128), over which
+the processor sends the whole checksum input in one request. Writes to
+the other registers only use the low 32 bits.
+
+The FL model computes the checksum as soon as the go bit is written, so
+the result of a job is always ready by the time it is read.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from collections import deque
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcFL
+from examples.ex02_cksum.ChecksumFL import checksum
+from examples.ex02_cksum.utils import b128_to_words
+
+class ChecksumXcelQueueFL( Component ):
+
+  def construct( s, nbits=32 ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, nbits )
+    s.DataType = mk_bits( nbits )
+
+    s.xcel = XcelMinionIfcFL( ReqType, RespType,
+                              read=s.read, write=s.write)
+
+    # Components
+
+    s.reg_file = [ b32(0) for _ in range(4) ]
+    s.results  = deque()
+
+    s.trace = "            "
+    @s.update
+    def up_clear_trace():
+      s.trace = "            "
+
+    s.add_constraints( U(up_clear_trace) < M(s.read) )
+    s.add_constraints( U(up_clear_trace) < M(s.write) )
+
+  def read( s, addr ):
+    s.trace = "fl:<rd xr{:02}>".format(int(addr))
+    if   addr == 5: data = s.results.popleft() if s.results else b32(0)
+    elif addr == 6: data = b32( len( s.results ) )
+    elif addr <  4: data = s.reg_file[ int(addr) ]
+    else:           data = b32(0)
+    return s.DataType( data )
+
+  def write( s, addr, data ):
+    s.trace = "fl:<wr xr{:02}>".format(int(addr))
+    if addr < 4:
+      s.reg_file[ int(addr) ] = b32( data[0:32] )
+
+    # If go bit is written
+    elif addr == 4:
+      words = []
+      for i in range( 4 ):
+        words.append( s.reg_file[i][0 :16] )
+        words.append( s.reg_file[i][16:32] )
+      s.results.append( checksum( words ) )
+
+    # If a job is issued with wide data
+    elif addr == 7:
+      s.results.append( checksum( b128_to_words( mk_bits(128)( data ) ) ) )
+
+  def line_trace( s ):
+    return s.trace
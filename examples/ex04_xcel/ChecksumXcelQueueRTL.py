@@ -0,0 +1,139 @@
+"""
+==========================================================================
+ChecksumXcelQueueRTL.py
+==========================================================================
+Register transfer level implementation of a checksum accelerator with
+multiple jobs in flight. There is no FSM: a go write pushes xr0~3 into an
+njobs-deep job queue which feeds the checksum unit, and the results go
+into a completion queue that the processor pops by reading xr5. Reading
+xr6 returns the number of results that are ready, and a write to xr7
+pushes the written data into the job queue directly. See
+ChecksumXcelQueueCL for the address space.
+
+The request at the head of the input queue is held while it is a go
+write and the job queue is full, or a read of xr5 and the completion
+queue is empty.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg, XcelMsgType
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcRTL
+from pymtl3.stdlib.rtl.queues import NormalQueueRTL
+from pymtl3.stdlib.rtl.registers import Reg
+
+from examples.ex02_cksum.ChecksumRTL import ChecksumRTL
+
+class ChecksumXcelQueueRTL( Component ):
+  def construct( s, nbits=32, njobs=2 ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, nbits )
+    s.xcel = XcelMinionIfcRTL( ReqType, RespType )
+
+    # Local parameters
+
+    s.RD = XcelMsgType.READ
+    s.WR = XcelMsgType.WRITE
+
+    # Components
+
+    s.in_q          = NormalQueueRTL( ReqType, num_entries=2 )
+    s.reg_file      = [ Reg( Bits32 ) for _ in range(4) ]
+    s.job_q         = NormalQueueRTL( Bits128, num_entries=njobs )
+    s.checksum_unit = ChecksumRTL()
+    s.result_q      = NormalQueueRTL( Bits32, num_entries=njobs )
+
+    s.go        = Wire( Bits1 )
+    s.go_wide   = Wire( Bits1 )
+    s.pop       = Wire( Bits1 )
+    s.xfer      = Wire( Bits1 )
+    s.wide_data = Wire( Bits128 )
+    s.resp_data = Wire( Bits32 )
+
+    # Connections
+
+    s.connect( s.xcel.req, s.in_q.enq )
+    s.connect( s.job_q.deq.msg, s.checksum_unit.recv.msg )
+    s.connect( s.checksum_unit.send, s.result_q.enq )
+
+    # The request and response data are nbits wide, the registers are
+    # always 32 bits.
+
+    if nbits == 128:
+      s.connect( s.wide_data, s.in_q.deq.msg.data )
+    else:
+      @s.update
+      def up_wide_data():
+        s.wide_data = zext( s.in_q.deq.msg.data, 128 )
+
+    if nbits == 32:
+      s.connect( s.xcel.resp.msg.data, s.resp_data )
+    else:
+      @s.update
+      def up_resp_data():
+        s.xcel.resp.msg.data = zext( s.resp_data, nbits )
+
+    # Logic
+
+    @s.update
+    def up_issue():
+      s.checksum_unit.recv.en = s.job_q.deq.rdy & s.checksum_unit.recv.rdy
+      s.job_q.deq.en          = s.job_q.deq.rdy & s.checksum_unit.recv.rdy
+
+    @s.update
+    def up_ctrl():
+      s.go      = ( s.in_q.deq.msg.type_ == s.WR ) & ( s.in_q.deq.msg.addr == b5(4) )
+      s.go_wide = ( s.in_q.deq.msg.type_ == s.WR ) & ( s.in_q.deq.msg.addr == b5(7) )
+      s.pop     = ( s.in_q.deq.msg.type_ == s.RD ) & ( s.in_q.deq.msg.addr == b5(5) )
+
+      s.xfer = (
+        s.in_q.deq.rdy & s.xcel.resp.rdy &
+        ~( ( s.go | s.go_wide ) & ~s.job_q.enq.rdy ) &
+        ~( s.pop & ~s.result_q.deq.rdy )
+      )
+
+      s.in_q.deq.en     = s.xfer
+      s.xcel.resp.en    = s.xfer
+      s.job_q.enq.en    = s.xfer & ( s.go | s.go_wide )
+      s.result_q.deq.en = s.xfer & s.pop
+
+    @s.update
+    def up_job_msg():
+      if s.go_wide:
+        s.job_q.enq.msg = s.wide_data
+      else:
+        s.job_q.enq.msg = concat( s.reg_file[3].out, s.reg_file[2].out,
+                                  s.reg_file[1].out, s.reg_file[0].out )
+
+    @s.update
+    def up_resp_msg():
+      s.xcel.resp.msg.type_ = s.in_q.deq.msg.type_
+      s.resp_data           = b32(0)
+      if s.in_q.deq.msg.type_ == s.RD:
+        if s.in_q.deq.msg.addr == b5(5):
+          s.resp_data = s.result_q.deq.msg
+        elif s.in_q.deq.msg.addr == b5(6):
+          s.resp_data = zext( s.result_q.count, 32 )
+        elif s.in_q.deq.msg.addr < b5(4):
+          s.resp_data = s.reg_file[ s.in_q.deq.msg.addr[0:2] ].out
+
+    @s.update
+    def up_wr_regfile():
+      for i in range(4):
+        s.reg_file[i].in_ = s.reg_file[i].out
+
+      if s.in_q.deq.en and s.in_q.deq.msg.type_ == s.WR:
+        for i in range(4):
+          s.reg_file[i].in_ = (
+            s.in_q.deq.msg.data[0:32] if b5(i) == s.in_q.deq.msg.addr else
+            s.reg_file[i].out
+          )
+
+  def line_trace( s ):
+    return "{}(RTL:j{}r{}){}".format( s.xcel.req, s.job_q.count,
+                                      s.result_q.count, s.xcel.resp )
@@ -0,0 +1,89 @@
+"""
+==========================================================================
+MulXcelCL.py
+==========================================================================
+Cycle level implementation of a multiply accelerator with a configurable
+latency. Writing xr1 starts a multiply whose product can be read from xr2
+latency cycles later. The address space is the same as in MulXcelFL.
+
+The operands are latched when the multiply starts, so the processor can
+write the next multiplicand into xr0 while a multiply is in flight. A
+write to xr1 or a read of xr2 waits until the multiply is done.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.cl.queues import NormalQueueCL
+from pymtl3.stdlib.ifcs import mk_xcel_msg, XcelMsgType
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcCL
+
+from examples.ex04_xcel.MulXcelFL import mul
+
+#-------------------------------------------------------------------------
+# MulXcelCL
+#-------------------------------------------------------------------------
+
+class MulXcelCL( Component ):
+
+  def construct( s, latency=4 ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, 32 )
+    s.RespType = RespType
+
+    s.xcel = XcelMinionIfcCL( ReqType, RespType )
+
+    # Local paramters
+
+    RD = XcelMsgType.READ
+    WR = XcelMsgType.WRITE
+
+    # Components
+
+    s.in_q     = NormalQueueCL( num_entries=2 )
+    s.reg_file = [ b32(0) for _ in range(3) ]
+    s.latency  = latency
+    s.count    = 0 # cycles until the product is ready
+
+    s.connect( s.xcel.req, s.in_q.enq )
+
+    # Serve the request at the head of the input queue. We only peek at
+    # it so that a multiply or a product read can wait for the current
+    # multiply.
+
+    @s.update
+    def up_tick():
+      if s.count > 0:
+        s.count -= 1
+
+      if s.in_q.deq.rdy() and s.xcel.resp.rdy():
+        req  = s.in_q.peek()
+        addr = int( req.addr )
+
+        if ( addr == 1 or addr == 2 ) and s.count > 0:
+          return
+
+        s.in_q.deq()
+
+        if req.type_ == WR:
+          if addr < 2:
+            s.reg_file[ addr ] = req.data
+
+          # If the multiplier is written
+          if addr == 1:
+            s.reg_file[2] = mul( s.reg_file[0], s.reg_file[1] )
+            s.count       = s.latency
+
+          s.xcel.resp( s.RespType( WR, b32( 0 ) ) )
+
+        elif req.type_ == RD:
+          s.xcel.resp( s.RespType( RD,
+            s.reg_file[ addr ] if addr < 3 else b32( 0 ) ) )
+
+  def line_trace( s ):
+    return "{}(CL :{}){}".format( s.xcel.req,
+      "BUSY" if s.count > 0 else "    ", s.xcel.resp )
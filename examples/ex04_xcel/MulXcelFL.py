@@ -0,0 +1,68 @@
+"""
+==========================================================================
+MulXcelFL.py
+==========================================================================
+Functional level implementation of a multiply accelerator. TinyRV0 has
+no multiply instruction, so a product otherwise takes a shift-and-add
+loop on the processor.
+
+Address space:
+
+ - xr0 : multiplicand a
+ - xr1 : multiplier b, writing it starts a multiply of xr0 and xr1
+ - xr2 : the low 32 bits of the product of the last multiply
+
+The FL model computes the product as soon as xr1 is written.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcFL
+
+# Low 32 bits of a*b, which is what a multiply instruction would return
+
+def mul( a, b ):
+  return b32( ( int(a) * int(b) ) & 0xffffffff )
+
+class MulXcelFL( Component ):
+
+  def construct( s ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, 32 )
+
+    s.xcel = XcelMinionIfcFL( ReqType, RespType,
+                              read=s.read, write=s.write)
+
+    # Components
+
+    s.reg_file = [ b32(0) for _ in range(3) ]
+
+    s.trace = "            "
+    @s.update
+    def up_clear_trace():
+      s.trace = "            "
+
+    s.add_constraints( U(up_clear_trace) < M(s.read) )
+    s.add_constraints( U(up_clear_trace) < M(s.write) )
+
+  def read( s, addr ):
+    s.trace = "fl:<rd xr{:02}>".format(int(addr))
+    return s.reg_file[ int(addr) ] if addr < 3 else b32(0)
+
+  def write( s, addr, data ):
+    s.trace = "fl:<wr xr{:02}>".format(int(addr))
+    if addr < 2:
+      s.reg_file[ int(addr) ] = b32(data)
+
+    # If the multiplier is written
+    if addr == 1:
+      s.reg_file[2] = mul( s.reg_file[0], s.reg_file[1] )
+
+  def line_trace( s ):
+    return s.trace
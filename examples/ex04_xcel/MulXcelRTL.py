@@ -0,0 +1,121 @@
+"""
+==========================================================================
+MulXcelRTL.py
+==========================================================================
+Register transfer level implementation of a multiply accelerator with an
+iterative shift-and-add multiplier. Writing xr1 latches xr0 and the
+written data into the multiplier, which then adds the multiplicand into
+the product for every one bit of the multiplier, one bit per cycle. It
+stops as soon as the remaining bits of the multiplier are zero, so a
+multiply takes as many cycles as the position of the highest one bit of
+b plus one. See MulXcelFL for the address space.
+
+The request at the head of the input queue is held while it is a write
+to xr1 or a read of xr2 and the multiplier is busy.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg, XcelMsgType
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMinionIfcRTL
+from pymtl3.stdlib.rtl.queues import NormalQueueRTL
+from pymtl3.stdlib.rtl.registers import Reg
+
+class MulXcelRTL( Component ):
+  def construct( s ):
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, 32 )
+    s.xcel = XcelMinionIfcRTL( ReqType, RespType )
+
+    # Local parameters
+
+    s.RD = XcelMsgType.READ
+    s.WR = XcelMsgType.WRITE
+
+    # Components
+
+    s.in_q     = NormalQueueRTL( ReqType, num_entries=2 )
+    s.reg_file = [ Reg( Bits32 ) for _ in range(2) ]
+
+    s.go   = Wire( Bits1 )
+    s.pop  = Wire( Bits1 )
+    s.xfer = Wire( Bits1 )
+
+    # Multiplier state: the multiplicand shifted left and the multiplier
+    # shifted right once per cycle, and the partial product
+
+    s.a    = Wire( Bits32 )
+    s.b    = Wire( Bits32 )
+    s.prod = Wire( Bits32 )
+    s.busy = Wire( Bits1 )
+
+    # Connections
+
+    s.connect( s.xcel.req, s.in_q.enq )
+
+    # Logic
+
+    @s.update
+    def up_ctrl():
+      s.go  = ( s.in_q.deq.msg.type_ == s.WR ) & ( s.in_q.deq.msg.addr == b5(1) )
+      s.pop = ( s.in_q.deq.msg.type_ == s.RD ) & ( s.in_q.deq.msg.addr == b5(2) )
+
+      s.xfer = (
+        s.in_q.deq.rdy & s.xcel.resp.rdy &
+        ~( ( s.go | s.pop ) & s.busy )
+      )
+
+      s.in_q.deq.en  = s.xfer
+      s.xcel.resp.en = s.xfer
+
+    # The busy bit is computed from the multiplier before it is shifted,
+    # since writes in on-edge blocks take effect right away.
+
+    @s.update_on_edge
+    def up_mul():
+      if s.reset:
+        s.busy = b1(0)
+
+      elif s.xfer & s.go:
+        s.a    = s.reg_file[0].out
+        s.b    = s.in_q.deq.msg.data
+        s.prod = b32(0)
+        s.busy = b1(1)
+
+      elif s.busy:
+        if s.b[0]:
+          s.prod = s.prod + s.a
+        s.busy = s.b[1:32] != b31(0)
+        s.a    = concat( s.a[0:31], b1(0) )
+        s.b    = concat( b1(0), s.b[1:32] )
+
+    @s.update
+    def up_resp_msg():
+      s.xcel.resp.msg.type_ = s.in_q.deq.msg.type_
+      s.xcel.resp.msg.data  = b32(0)
+      if s.in_q.deq.msg.type_ == s.RD:
+        if s.in_q.deq.msg.addr == b5(2):
+          s.xcel.resp.msg.data = s.prod
+        elif s.in_q.deq.msg.addr < b5(2):
+          s.xcel.resp.msg.data = s.reg_file[ s.in_q.deq.msg.addr[0:1] ].out
+
+    @s.update
+    def up_wr_regfile():
+      for i in range(2):
+        s.reg_file[i].in_ = s.reg_file[i].out
+
+      if s.in_q.deq.en and s.in_q.deq.msg.type_ == s.WR:
+        for i in range(2):
+          s.reg_file[i].in_ = (
+            s.in_q.deq.msg.data if b5(i) == s.in_q.deq.msg.addr else
+            s.reg_file[i].out
+          )
+
+  def line_trace( s ):
+    return "{}(RTL:{}){}".format( s.xcel.req, "BUSY" if s.busy else "    ",
+                                  s.xcel.resp )
@@ -2,7 +2,12 @@
 ==========================================================================
  ProcXcel.py
 ==========================================================================
-Processor-accelerator compostion.
+Processor-accelerator compostion. xcel_nbits is the data width of the
+accelerator interface and is passed to both the processor and the
+accelerator unless it is the default 32 bits. With nxcels > 1 the
+processor talks to nxcels copies of the accelerator through an
+XcelRouterRTL, which selects the accelerator with the upper xr address
+bits.
 
 Author : Shunning Jiang
   Date : June 12, 2019
@@ -16,9 +21,11 @@ from pymtl3.stdlib.ifcs.SendRecvIfc  import SendIfcFL
 
 from pymtl3.stdlib.ifcs import mk_mem_msg
 
+from .XcelRouterRTL import XcelRouterRTL
+
 class ProcXcel( Component ):
 
-  def construct( s, ProcClass, XcelClass ):
+  def construct( s, ProcClass, XcelClass, xcel_nbits=32, nxcels=1 ):
 
     req_class, resp_class = mk_mem_msg( 8, 32, 32 )
 
@@ -26,8 +33,20 @@ class ProcXcel( Component ):
 
     # Instruction Memory Request/Response Interface
 
-    s.proc = ProcClass()( commit_inst = s.commit_inst )
-    s.xcel = XcelClass()( xcel = s.proc.xcel )
+    if xcel_nbits == 32:
+      s.proc = ProcClass()( commit_inst = s.commit_inst )
+      mk_xcel = lambda: XcelClass()
+    else:
+      s.proc = ProcClass( xcel_nbits )( commit_inst = s.commit_inst )
+      mk_xcel = lambda: XcelClass( xcel_nbits )
+
+    if nxcels == 1:
+      s.xcel = mk_xcel()( xcel = s.proc.xcel )
+    else:
+      s.router = XcelRouterRTL( nxcels, xcel_nbits )( xcel = s.proc.xcel )
+      s.xcels  = [ mk_xcel() for _ in range( nxcels ) ]
+      for i in range( nxcels ):
+        s.connect( s.router.xcel_out[i], s.xcels[i].xcel )
 
     if   isinstance( s.proc.imem, MemMasterIfcRTL ): # RTL proc
       s.mngr2proc = RecvIfcRTL( Bits32 )
@@ -55,4 +74,7 @@ class ProcXcel( Component ):
     )
 
   def line_trace( s ):
+    if hasattr( s, "router" ):
+      return "{}|{}|{}".format( s.proc.line_trace(), s.router.line_trace(),
+                                " ".join( x.line_trace() for x in s.xcels ) )
     return "{}|{}".format( s.proc.line_trace(), s.xcel.line_trace() )
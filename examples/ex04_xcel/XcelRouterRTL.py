@@ -0,0 +1,98 @@
+"""
+==========================================================================
+XcelRouterRTL.py
+==========================================================================
+Register transfer level xcel router that lets one processor talk to
+nports accelerators. The upper clog2(nports) bits of the xr address
+select the accelerator and the remaining bits are the register within
+it, so with four accelerators xr0~7 go to the first one, xr8~15 to the
+second one, and so on. An accelerator only sees the lower bits, e.g. a
+write to xr12 becomes a write to xr4 of accelerator 1.
+
+Requests are forwarded as soon as the selected accelerator is ready, so
+accelerators work on their jobs in parallel. Since they may take
+different times to respond, the router remembers the order in which
+requests were sent in a route queue and returns the responses in that
+order. The accelerators do not have to respect the rdy of their
+response interface: every accelerator has a response queue as deep as
+the route queue, which bounds the number of outstanding requests.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg
+from pymtl3.stdlib.ifcs.xcel_ifcs import XcelMasterIfcRTL, XcelMinionIfcRTL
+from pymtl3.stdlib.rtl.queues import BypassQueueRTL, NormalQueueRTL
+
+class XcelRouterRTL( Component ):
+
+  def construct( s, nports=4, nbits=32, nentries=4 ):
+
+    assert nports in [ 2, 4, 8, 16, 32 ], \
+      "number of accelerators must be a power of two between 2 and 32!"
+
+    sel_nbits = clog2( nports )
+    SelType   = mk_bits( sel_nbits )
+
+    # Interface
+
+    ReqType, RespType = mk_xcel_msg( 5, nbits )
+
+    s.xcel     = XcelMinionIfcRTL( ReqType, RespType )
+    s.xcel_out = [ XcelMasterIfcRTL( ReqType, RespType ) for _ in range( nports ) ]
+
+    # Components
+
+    s.route_q = NormalQueueRTL( SelType, num_entries=nentries )
+    s.resp_q  = [ BypassQueueRTL( RespType, num_entries=nentries )
+                  for _ in range( nports ) ]
+
+    s.sel = Wire( SelType )
+
+    # Connections
+
+    s.connect( s.sel,             s.xcel.req.msg.addr[5-sel_nbits:5] )
+    s.connect( s.route_q.enq.msg, s.sel )
+
+    for i in range( nports ):
+      s.connect( s.xcel_out[i].resp, s.resp_q[i].enq )
+
+    # Forward the request to the selected accelerator
+
+    @s.update
+    def up_req():
+      s.xcel.req.rdy   = b1(0)
+      s.route_q.enq.en = s.xcel.req.en
+
+      for i in range( nports ):
+        s.xcel_out[i].req.en        = s.xcel.req.en & ( s.sel == SelType(i) )
+        s.xcel_out[i].req.msg.type_ = s.xcel.req.msg.type_
+        s.xcel_out[i].req.msg.addr  = zext( s.xcel.req.msg.addr[0:5-sel_nbits], 5 )
+        s.xcel_out[i].req.msg.data  = s.xcel.req.msg.data
+
+        if s.sel == SelType(i):
+          s.xcel.req.rdy = s.route_q.enq.rdy & s.xcel_out[i].req.rdy
+
+    # Return the response of the accelerator at the head of the route
+    # queue
+
+    @s.update
+    def up_resp():
+      s.xcel.resp.en  = b1(0)
+      s.xcel.resp.msg = s.resp_q[0].deq.msg
+
+      for i in range( nports ):
+        s.resp_q[i].deq.en = b1(0)
+
+        if s.route_q.deq.rdy & ( s.route_q.deq.msg == SelType(i) ):
+          s.xcel.resp.msg    = s.resp_q[i].deq.msg
+          s.xcel.resp.en     = s.resp_q[i].deq.rdy & s.xcel.resp.rdy
+          s.resp_q[i].deq.en = s.resp_q[i].deq.rdy & s.xcel.resp.rdy
+
+      s.route_q.deq.en = s.xcel.resp.en
+
+  def line_trace( s ):
+    return "{}(r{}){}".format( s.xcel.req, s.route_q.count, s.xcel.resp )
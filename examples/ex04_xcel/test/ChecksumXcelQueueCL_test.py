@@ -0,0 +1,193 @@
+"""
+==========================================================================
+ChecksumXcelQueueCL_test.py
+==========================================================================
+Tests for the cycle level checksum accelerator with a completion queue.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import XcelMsgType, mk_xcel_msg
+from pymtl3.stdlib.test import TestSrcCL, TestSinkCL
+
+from examples.ex02_cksum.ChecksumFL import checksum
+from examples.ex02_cksum.utils import words_to_b128
+from .ChecksumXcelCL_test import mk_xcel_transaction
+from ..ChecksumXcelQueueCL import ChecksumXcelQueueCL
+
+#-------------------------------------------------------------------------
+# Helper functions to create a sequence of req/resp msg
+#-------------------------------------------------------------------------
+
+Req, Resp = mk_xcel_msg( 5, 32 )
+WideReq, WideResp = mk_xcel_msg( 5, 128 )
+rd = XcelMsgType.READ
+wr = XcelMsgType.WRITE
+
+seq = [
+  [ 1, 2, 3, 4, 5, 6, 7, 8 ],
+  [ 8, 7, 6, 5, 4, 3, 2, 1 ],
+  [ 0xf000, 0xff00, 0x1000, 0x2000, 0x5000, 0x6000, 0x7000, 0x8000 ],
+  [ 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff ],
+  [ 0, 0, 0, 0, 0, 0, 0, 1 ],
+]
+
+def mk_issue( words ):
+  words = [ b16(x) for x in words ]
+  bits = words_to_b128( words )
+  reqs  = [ Req( wr, b5(i), bits[i*32:(i+1)*32] ) for i in range( 4 ) ]
+  reqs.append( Req( wr, b5(4), b32(1) ) )
+  resps = [ Resp( wr, b32(0) ) for _ in range( 5 ) ]
+  return reqs, resps
+
+def mk_collect( words ):
+  words = [ b16(x) for x in words ]
+  return [ Req( rd, b5(5), b32(0) ) ], [ Resp( rd, checksum( words ) ) ]
+
+# Over a 128-bit interface a job is issued with a single write to xr7
+
+def mk_wide_issue( words ):
+  bits = words_to_b128( [ b16(x) for x in words ] )
+  return [ WideReq( wr, b5(7), bits ) ], [ WideResp( wr, b128(0) ) ]
+
+def mk_wide_collect( words ):
+  words = [ b16(x) for x in words ]
+  return [ WideReq( rd, b5(5), b128(0) ) ], \
+         [ WideResp( rd, zext( checksum( words ), 128 ) ) ]
+
+# Issues ndepth jobs before reading back the first result and then keeps
+# ndepth jobs in flight, which is how a processor would use the queue.
+# Finally checks that the completion queue is empty.
+
+def mk_pipelined_transaction( seq, ndepth, wide=False ):
+  src_msgs  = []
+  sink_msgs = []
+  def add( msgs ):
+    src_msgs.extend( msgs[0] )
+    sink_msgs.extend( msgs[1] )
+
+  issue   = mk_wide_issue   if wide else mk_issue
+  collect = mk_wide_collect if wide else mk_collect
+
+  for i, words in enumerate( seq ):
+    add( issue( words ) )
+    if i >= ndepth - 1:
+      add( collect( seq[ i - ndepth + 1 ] ) )
+  for words in seq[ max( len( seq ) - ndepth + 1, 0 ): ]:
+    add( collect( words ) )
+
+  if wide:
+    add( ( [ WideReq( rd, b5(6), b128(0) ) ], [ WideResp( rd, b128(0) ) ] ) )
+  else:
+    add( ( [ Req( rd, b5(6), b32(0) ) ], [ Resp( rd, b32(0) ) ] ) )
+  return src_msgs, sink_msgs
+
+#-------------------------------------------------------------------------
+# Test Harness for src/sink based tests
+#-------------------------------------------------------------------------
+
+class TestHarness( Component ):
+
+  def construct( s, DutType, nbits, njobs, src_msgs, sink_msgs,
+                 src_delay=0, sink_delay=0 ):
+
+    ReqType, RespType = mk_xcel_msg( 5, nbits )
+
+    s.src  = TestSrcCL( ReqType, src_msgs, src_delay, src_delay )
+    s.dut  = DutType( nbits, njobs )
+    s.sink = TestSinkCL( RespType, sink_msgs, sink_delay, sink_delay )
+
+    s.connect( s.src.send,      s.dut.xcel.req )
+    s.connect( s.dut.xcel.resp, s.sink.recv    )
+
+  def done( s ):
+    return s.src.done() and s.sink.done()
+
+  def line_trace( s ):
+    return "{}>{}>{}".format(
+      s.src.line_trace(), s.dut.line_trace(), s.sink.line_trace()
+    )
+
+#-------------------------------------------------------------------------
+# Src/sink based tests
+#-------------------------------------------------------------------------
+
+class ChecksumXcelQueueCL_Tests( object ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.DutType = ChecksumXcelQueueCL
+
+  def run_sim( s, th, max_cycles=1000 ):
+
+    # Create a simulator
+    th.elaborate()
+    th.apply( SimulationPass )
+    ncycles = 0
+    th.sim_reset()
+    print( "" )
+
+    # Tick the simulator
+    print("{:3}: {}".format( ncycles, th.line_trace() ))
+    while not th.done() and ncycles < max_cycles:
+      th.tick()
+      ncycles += 1
+      print("{:3}: {}".format( ncycles, th.line_trace() ))
+
+    # Check timeout
+    assert ncycles < max_cycles
+
+  # The accelerator is a drop-in replacement for the single job one
+
+  def test_single_job( s ):
+    src_msgs  = []
+    sink_msgs = []
+    for words in seq:
+      reqs, resps = mk_xcel_transaction( words )
+      src_msgs.extend( reqs )
+      sink_msgs.extend( resps )
+
+    th = TestHarness( s.DutType, 32, 2, src_msgs, sink_msgs )
+    s.run_sim( th )
+
+  @pytest.mark.parametrize( "njobs, ndepth, src_delay, sink_delay", [
+    ( 2, 2, 0, 0 ),
+    ( 2, 2, 3, 0 ),
+    ( 2, 2, 0, 3 ),
+    ( 4, 4, 0, 0 ),
+    ( 4, 2, 1, 2 ),
+  ])
+  def test_pipelined( s, njobs, ndepth, src_delay, sink_delay ):
+    src_msgs, sink_msgs = mk_pipelined_transaction( seq, ndepth )
+    th = TestHarness( s.DutType, 32, njobs, src_msgs, sink_msgs,
+                      src_delay, sink_delay )
+    s.run_sim( th )
+
+  # Jobs issued over a 128-bit interface, mixed with ones configured
+  # through xr0~3
+
+  @pytest.mark.parametrize( "njobs, ndepth, src_delay, sink_delay", [
+    ( 2, 2, 0, 0 ),
+    ( 2, 2, 3, 0 ),
+    ( 4, 4, 0, 3 ),
+  ])
+  def test_wide( s, njobs, ndepth, src_delay, sink_delay ):
+    src_msgs, sink_msgs = mk_pipelined_transaction( seq, ndepth, wide=True )
+
+    for words in seq[:2]:
+      reqs, resps = mk_issue( words )
+      src_msgs.extend( [ WideReq( m.type_, m.addr, zext( m.data, 128 ) ) for m in reqs ] )
+      sink_msgs.extend( [ WideResp( m.type_, zext( m.data, 128 ) ) for m in resps ] )
+    for words in seq[:2]:
+      reqs, resps = mk_wide_collect( words )
+      src_msgs.extend( reqs )
+      sink_msgs.extend( resps )
+
+    th = TestHarness( s.DutType, 128, njobs, src_msgs, sink_msgs,
+                      src_delay, sink_delay )
+    s.run_sim( th )
@@ -0,0 +1,28 @@
+"""
+==========================================================================
+ChecksumXcelQueueRTL_test.py
+==========================================================================
+Test cases for RTL checksum accelerator with a completion queue.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from pymtl3 import *
+
+from ..ChecksumXcelQueueRTL import ChecksumXcelQueueRTL
+
+#-------------------------------------------------------------------------
+# Src/sink based tests
+#-------------------------------------------------------------------------
+# Here we directly reuse all test cases in ChecksumXcelQueueCL_test. We
+# only need to provide a different DutType in the setup_class.
+
+from .ChecksumXcelQueueCL_test import ChecksumXcelQueueCL_Tests as BaseTests
+
+class ChecksumXcelQueueRTL_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.DutType = ChecksumXcelQueueRTL
@@ -10,7 +10,7 @@ Author : Yanghui Ou
 from __future__ import absolute_import, division, print_function
 
 from pymtl3 import *
-from pymtl3.passes.yosys import TranslationPass, ImportPass
+from examples.translation_cache import cached_translate, cached_import
 
 from ..ChecksumXcelRTL import ChecksumXcelRTL
 from .ChecksumXcelCL_test import mk_xcel_transaction
@@ -33,8 +33,8 @@ def checksum_xcel_vrtl( words ):
   # backend
   dut.yosys_translate = True
   dut.yosys_import = True
-  dut.apply( TranslationPass() )
-  dut = ImportPass()( dut )
+  cached_translate( dut )
+  dut = cached_import( dut )
 
   # Create a simulator
   dut.elaborate()
@@ -94,8 +94,8 @@ class ChecksumXcelVRTLSrcSink_Tests( BaseTests ):
     th.elaborate()
     th.dut.yosys_translate = True
     th.dut.yosys_import = True
-    th.apply( TranslationPass() )
-    th = ImportPass()( th )
+    cached_translate( th )
+    th = cached_import( th )
 
     # Create a simulator
     th.apply( SimulationPass )
@@ -0,0 +1,82 @@
+"""
+==========================================================================
+MulXcelRTL_test.py
+==========================================================================
+Test cases for the RTL multiply accelerator, and for the matrix
+multiplication ubmark running on the processors with the multiply
+accelerators.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from pymtl3 import *
+
+from examples.bmark_suite import BmarkConfig, run_bmark_config
+from ..MulXcelRTL import MulXcelRTL
+
+#-------------------------------------------------------------------------
+# Src/sink based tests
+#-------------------------------------------------------------------------
+# Here we directly reuse all test cases in MulXcelCL_test. We only need
+# to provide a different DutType in the setup_class.
+
+from .MulXcelCL_test import MulXcelCL_Tests as BaseTests
+from .MulXcelCL_test import TestHarness, mk_mul
+
+class MulXcelRTL_Tests( BaseTests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.DutType = MulXcelRTL
+
+#-------------------------------------------------------------------------
+# Early termination
+#-------------------------------------------------------------------------
+# The multiplier stops after the highest one bit of b, so a small b takes
+# fewer cycles than a large one.
+
+def run_mul( a, b ):
+  src_msgs, sink_msgs = mk_mul( a, b )
+  th = TestHarness( MulXcelRTL, src_msgs, sink_msgs )
+  th.elaborate()
+  th.apply( SimulationPass )
+  th.sim_reset()
+
+  ncycles = 0
+  while not th.done() and ncycles < 1000:
+    th.tick()
+    ncycles += 1
+
+  assert ncycles < 1000
+  return ncycles
+
+def test_early_termination():
+  assert run_mul( 0x1234, 1 ) < run_mul( 0x1234, 0x8000 ) < \
+         run_mul( 0x1234, 0x80000000 )
+  assert run_mul( 0x1234, 0x8000 ) == run_mul( 0x1234, 0xffff )
+
+#-------------------------------------------------------------------------
+# mmult-xcel
+#-------------------------------------------------------------------------
+# The ubmark computes the same matrices as mmult on every processor and
+# accelerator, and the accelerator beats the shift-and-add loop.
+
+@pytest.mark.parametrize( "proc, xcel", [
+  ( "fl",  "fl-mul"  ),
+  ( "cl",  "cl-mul"  ),
+  ( "rtl", "rtl-mul" ),
+  ( "rtl", "cl-mul"  ),
+])
+def test_mmult_xcel( proc, xcel ):
+  result = run_bmark_config( BmarkConfig( "mmult-xcel", proc, xcel, size=3 ) )
+  assert result["passed"]
+
+def test_mmult_xcel_speedup():
+  mmult      = run_bmark_config( BmarkConfig( "mmult", "rtl", "null", size=4 ) )
+  mmult_xcel = run_bmark_config( BmarkConfig( "mmult-xcel", "rtl", "rtl-mul", size=4 ) )
+  assert mmult["passed"] and mmult_xcel["passed"]
+  assert mmult_xcel["cycles"] < mmult["cycles"]
@@ -0,0 +1,278 @@
+"""
+==========================================================================
+ProcXcelWide_test.py
+==========================================================================
+Tests for wide accelerator writes. The processors are composed with the
+queued checksum accelerator over a 128-bit interface and issue jobs with
+csrw to xcelwide07, which sends four registers in one request.
+The RTL processor is also run with the CL checksum accelerators, which
+answer writes with a plain int.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import pytest
+import random
+random.seed(0xdeadbeef)
+
+from pymtl3 import *
+
+from examples.bmark_suite import BmarkConfig, run_bmark_config
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcCL import ProcCL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from examples.ex03_proc.test.harness import asm_test, assemble, TestHarness
+from examples.ex03_proc.test.inst_utils import gen_nops
+from examples.ex03_proc.ubmark.ubmark_data import cksum_blk_ref
+from ..ChecksumXcelQueueFL import ChecksumXcelQueueFL
+from ..ChecksumXcelQueueCL import ChecksumXcelQueueCL
+from ..ChecksumXcelQueueRTL import ChecksumXcelQueueRTL
+
+#-------------------------------------------------------------------------
+# Helper functions
+#-------------------------------------------------------------------------
+
+def cksum( words ):
+  return int( cksum_blk_ref( words )[0] )
+
+def rand_words():
+  return [ random.randint( 0, 0xffffffff ) for _ in range( 4 ) ]
+
+# Loads the block into x1~x4, issues it and checks the result
+
+def gen_wide_block( words ):
+  return """
+    csrr x1, mngr2proc < {:#x}
+    csrr x2, mngr2proc < {:#x}
+    csrr x3, mngr2proc < {:#x}
+    csrr x4, mngr2proc < {:#x}
+    csrw 0x7A7, x1
+    csrr x5, 0x7E5
+    csrw proc2mngr, x5 > {:#x}
+  """.format( *( words + [ cksum( words ) ] ) )
+
+#-------------------------------------------------------------------------
+# gen_basic_test
+#-------------------------------------------------------------------------
+
+def gen_basic_test():
+  return gen_wide_block( [ 0x00020001, 0x00040003, 0x00060005, 0x00080007 ] )
+
+#-------------------------------------------------------------------------
+# gen_src_dep_test
+#-------------------------------------------------------------------------
+# The first and the last source register are written right before the
+# wide write, with 0 to 3 nops in between, to test bypassing in both
+# halves of the read.
+
+def gen_src_dep_test():
+  asm = []
+  for reg in [ 1, 4 ]:
+    for nops in range( 4 ):
+      words = [ 0x1000 * nops + i for i in range( 4 ) ]
+      dep   = list( words )
+      dep[ reg-1 ] += 1
+      asm.append( """
+        csrr x1, mngr2proc < {:#x}
+        csrr x2, mngr2proc < {:#x}
+        csrr x3, mngr2proc < {:#x}
+        csrr x4, mngr2proc < {:#x}
+        addi x{}, x{}, 1
+        {}
+        csrw 0x7A7, x1
+        csrr x5, 0x7E5
+        csrw proc2mngr, x5 > {:#x}
+      """.format( *( words + [ reg, reg, gen_nops( nops ), cksum( dep ) ] ) ) )
+  return "".join( asm )
+
+#-------------------------------------------------------------------------
+# gen_load_dep_test
+#-------------------------------------------------------------------------
+# Load-use dependencies on the first and last source register
+
+def gen_load_dep_test():
+  words = [ 0x11112222, 0x33334444, 0x55556666, 0x77778888 ]
+  return """
+    csrr x6, mngr2proc < 0x2000
+    csrr x1, mngr2proc < 0
+    csrr x2, mngr2proc < {w[1]:#x}
+    csrr x3, mngr2proc < {w[2]:#x}
+    csrr x4, mngr2proc < {w[3]:#x}
+    lw   x1, 0(x6)
+    csrw 0x7A7, x1
+    csrr x5, 0x7E5
+    csrw proc2mngr, x5 > {ref:#x}
+
+    csrr x4, mngr2proc < 0
+    lw   x4, 12(x6)
+    csrw 0x7A7, x1
+    csrr x5, 0x7E5
+    csrw proc2mngr, x5 > {ref:#x}
+
+    .data
+    .word {w[0]:#x}
+    .word {w[1]:#x}
+    .word {w[2]:#x}
+    .word {w[3]:#x}
+  """.format( w=words, ref=cksum( words ) )
+
+#-------------------------------------------------------------------------
+# gen_pipelined_test
+#-------------------------------------------------------------------------
+# Back-to-back wide writes from overlapping registers keep two jobs in
+# flight, and a job configured through xr0~3 in between still works.
+
+def gen_pipelined_test():
+  w = [ 0x00010002, 0x00030004, 0x00050006, 0x00070008, 0x0009000a ]
+  return """
+    csrr x1, mngr2proc < {w[0]:#x}
+    csrr x2, mngr2proc < {w[1]:#x}
+    csrr x3, mngr2proc < {w[2]:#x}
+    csrr x4, mngr2proc < {w[3]:#x}
+    csrr x5, mngr2proc < {w[4]:#x}
+    csrw 0x7A7, x1
+    csrw 0x7A7, x2
+    csrr x6, 0x7E5
+    csrr x7, 0x7E5
+    csrw proc2mngr, x6 > {r0:#x}
+    csrw proc2mngr, x7 > {r1:#x}
+
+    csrw 0x7E0, x4
+    csrw 0x7E1, x3
+    csrw 0x7E2, x2
+    csrw 0x7E3, x1
+    csrw 0x7E4, x0
+    csrw 0x7A7, x2
+    csrr x6, 0x7E5
+    csrr x7, 0x7E5
+    csrr x8, 0x7E6
+    csrw proc2mngr, x6 > {r2:#x}
+    csrw proc2mngr, x7 > {r1:#x}
+    csrw proc2mngr, x8 > 0
+  """.format( w=w, r0=cksum( w[0:4] ), r1=cksum( w[1:5] ),
+              r2=cksum( w[3::-1] ) )
+
+#-------------------------------------------------------------------------
+# gen_wrap_test
+#-------------------------------------------------------------------------
+# The source registers of a wide write starting above x28 wrap around to
+# x0, which always reads zero.
+
+def gen_wrap_test():
+  w = [ 0x00010002, 0x00030004, 0x00050006, 0x00070008 ]
+  return """
+    csrr x29, mngr2proc < {w[0]:#x}
+    csrr x30, mngr2proc < {w[1]:#x}
+    csrr x31, mngr2proc < {w[2]:#x}
+    csrr x1,  mngr2proc < {w[3]:#x}
+    csrw 0x7A7, x29
+    csrr x5, 0x7E5
+    csrw proc2mngr, x5 > {r0:#x}
+    csrw 0x7A7, x31
+    csrr x5, 0x7E5
+    csrw proc2mngr, x5 > {r1:#x}
+  """.format( w=w, r0=cksum( [ w[0], w[1], w[2], 0 ] ),
+              r1=cksum( [ w[2], 0, w[3], 0 ] ) )
+
+#-------------------------------------------------------------------------
+# gen_random_test
+#-------------------------------------------------------------------------
+
+def gen_random_test():
+  return "".join( gen_wide_block( rand_words() ) for _ in range( 20 ) )
+
+#-------------------------------------------------------------------------
+# ProcXcelWideFL_Tests
+#-------------------------------------------------------------------------
+
+class ProcXcelWideFL_Tests( object ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcFL
+    cls.XcelType = ChecksumXcelQueueFL
+
+  def run_sim( s, th, gen_test, max_cycles=10000 ):
+
+    th.elaborate()
+    th.load( assemble( gen_test() ) )
+    th.apply( SimulationPass )
+    th.sim_reset()
+
+    print()
+    ncycles = 0
+    while not th.done() and ncycles < max_cycles:
+      th.tick()
+      print("{:3}: {}".format( ncycles, th.line_trace() ))
+      ncycles += 1
+
+    assert ncycles < max_cycles
+
+  @pytest.mark.parametrize( "name,test", [
+    asm_test( gen_basic_test     ),
+    asm_test( gen_src_dep_test   ),
+    asm_test( gen_load_dep_test  ),
+    asm_test( gen_pipelined_test ),
+    asm_test( gen_wrap_test      ),
+    asm_test( gen_random_test    ),
+  ])
+  def test_wide( s, name, test ):
+    th = TestHarness( s.ProcType, s.XcelType, xcel_nbits=128 )
+    s.run_sim( th, test )
+
+  def test_wide_rand_delays( s ):
+    th = TestHarness( s.ProcType, s.XcelType, src_delay=3, sink_delay=14,
+                      mem_stall_prob=0.5, mem_latency=3, xcel_nbits=128 )
+    s.run_sim( th, gen_random_test )
+
+#-------------------------------------------------------------------------
+# ProcXcelWideCL_Tests
+#-------------------------------------------------------------------------
+
+class ProcXcelWideCL_Tests( ProcXcelWideFL_Tests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcCL
+    cls.XcelType = ChecksumXcelQueueCL
+
+#-------------------------------------------------------------------------
+# ProcXcelWideRTL_Tests
+#-------------------------------------------------------------------------
+
+class ProcXcelWideRTL_Tests( ProcXcelWideFL_Tests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcRTL
+    cls.XcelType = ChecksumXcelQueueRTL
+
+#-------------------------------------------------------------------------
+# ProcXcelWideRTLCL_Tests
+#-------------------------------------------------------------------------
+# The RTL processor with the CL accelerator runs the same tests against
+# the same accelerator as the FL and CL processors.
+
+class ProcXcelWideRTLCL_Tests( ProcXcelWideFL_Tests ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.ProcType = ProcRTL
+    cls.XcelType = ChecksumXcelQueueCL
+
+#-------------------------------------------------------------------------
+# RTL processor with CL accelerators
+#-------------------------------------------------------------------------
+# CL accelerators answer writes with a plain int, which the RTL processor
+# has to accept on both the narrow and the wide interface.
+
+@pytest.mark.parametrize( "bmark, xcel", [
+  ( "cksum-xcel",      "cl"       ),
+  ( "cksum-xcel-blk",  "cl-queue" ),
+  ( "cksum-xcel-wide", "cl-wide"  ),
+])
+def test_rtl_proc_cl_xcel( bmark, xcel ):
+  result = run_bmark_config( BmarkConfig( bmark, "rtl", xcel ) )
+  assert result["passed"]
@@ -0,0 +1,174 @@
+"""
+==========================================================================
+XcelRouterRTL_test.py
+==========================================================================
+Tests for the xcel router with several checksum accelerators behind it.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from pymtl3 import *
+from pymtl3.stdlib.ifcs import mk_xcel_msg
+from pymtl3.stdlib.test import TestSrcCL, TestSinkCL
+
+from examples.ex03_proc.ProcFL import ProcFL
+from examples.ex03_proc.ProcRTL import ProcRTL
+from .ChecksumXcelCL_test import mk_xcel_transaction
+from .harness import TestHarness as ProcXcelTestHarness
+from ..ChecksumXcelFL import ChecksumXcelFL
+from ..ChecksumXcelRTL import ChecksumXcelRTL
+from ..XcelRouterRTL import XcelRouterRTL
+from ..ubmark.proc_ubmark_cksum_xcel_multi import ubmark_cksum_xcel_multi
+
+#-------------------------------------------------------------------------
+# Helper functions to create a sequence of req/resp msg
+#-------------------------------------------------------------------------
+
+Req, Resp = mk_xcel_msg( 5, 32 )
+
+seq = [
+  [ 1, 2, 3, 4, 5, 6, 7, 8 ],
+  [ 8, 7, 6, 5, 4, 3, 2, 1 ],
+  [ 0xf000, 0xff00, 0x1000, 0x2000, 0x5000, 0x6000, 0x7000, 0x8000 ],
+  [ 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff, 0xffff ],
+  [ 0, 0, 0, 0, 0, 0, 0, 1 ],
+]
+
+# Moves the requests of a transaction to accelerator u. The checksum
+# accelerator uses xr0~5, so there can be at most four of them.
+
+def to_unit( reqs, u, nports ):
+  offset = u * ( 32 // nports )
+  return [ Req( m.type_, m.addr + offset, m.data ) for m in reqs ]
+
+# Configures and starts a job on every accelerator before reading back
+# any result, so all of them work at the same time
+
+def mk_parallel_transaction( seq, nports ):
+  src_msgs  = []
+  sink_msgs = []
+  for i in range( 0, len( seq ), nports ):
+    jobs = [ mk_xcel_transaction( words ) for words in seq[ i:i+nports ] ]
+    for u, ( reqs, resps ) in enumerate( jobs ):
+      src_msgs.extend( to_unit( reqs[:-1], u, nports ) )
+      sink_msgs.extend( resps[:-1] )
+    for u, ( reqs, resps ) in enumerate( jobs ):
+      src_msgs.extend( to_unit( reqs[-1:], u, nports ) )
+      sink_msgs.extend( resps[-1:] )
+  return src_msgs, sink_msgs
+
+#-------------------------------------------------------------------------
+# Test Harness for src/sink based tests
+#-------------------------------------------------------------------------
+
+class TestHarness( Component ):
+
+  def construct( s, XcelType, nports, src_msgs, sink_msgs,
+                 src_delay=0, sink_delay=0 ):
+
+    s.src    = TestSrcCL( Req, src_msgs, src_delay, src_delay )
+    s.router = XcelRouterRTL( nports )
+    s.xcels  = [ XcelType() for _ in range( nports ) ]
+    s.sink   = TestSinkCL( Resp, sink_msgs, sink_delay, sink_delay )
+
+    s.connect( s.src.send,         s.router.xcel.req )
+    s.connect( s.router.xcel.resp, s.sink.recv      )
+    for i in range( nports ):
+      s.connect( s.router.xcel_out[i], s.xcels[i].xcel )
+
+  def done( s ):
+    return s.src.done() and s.sink.done()
+
+  def line_trace( s ):
+    return "{}>{}>{}>{}".format(
+      s.src.line_trace(), s.router.line_trace(),
+      " ".join( x.line_trace() for x in s.xcels ), s.sink.line_trace()
+    )
+
+#-------------------------------------------------------------------------
+# Src/sink based tests
+#-------------------------------------------------------------------------
+
+class XcelRouterRTL_Tests( object ):
+
+  @classmethod
+  def setup_class( cls ):
+    cls.XcelType = ChecksumXcelRTL
+
+  def run_sim( s, th, max_cycles=1000 ):
+
+    # Create a simulator
+    th.elaborate()
+    th.apply( SimulationPass )
+    ncycles = 0
+    th.sim_reset()
+    print( "" )
+
+    # Tick the simulator
+    print("{:3}: {}".format( ncycles, th.line_trace() ))
+    while not th.done() and ncycles < max_cycles:
+      th.tick()
+      ncycles += 1
+      print("{:3}: {}".format( ncycles, th.line_trace() ))
+
+    # Check timeout
+    assert ncycles < max_cycles
+
+  # One job at a time on every accelerator
+
+  @pytest.mark.parametrize( "nports", [ 2, 4 ] )
+  def test_serial( s, nports ):
+    src_msgs  = []
+    sink_msgs = []
+    for u in range( nports ):
+      for words in seq:
+        reqs, resps = mk_xcel_transaction( words )
+        src_msgs.extend( to_unit( reqs, u, nports ) )
+        sink_msgs.extend( resps )
+
+    th = TestHarness( s.XcelType, nports, src_msgs, sink_msgs )
+    s.run_sim( th )
+
+  @pytest.mark.parametrize( "nports, src_delay, sink_delay", [
+    ( 2, 0, 0 ),
+    ( 4, 0, 0 ),
+    ( 4, 3, 0 ),
+    ( 4, 0, 3 ),
+    ( 4, 1, 2 ),
+  ])
+  def test_parallel( s, nports, src_delay, sink_delay ):
+    src_msgs, sink_msgs = mk_parallel_transaction( seq * 2, nports )
+    th = TestHarness( s.XcelType, nports, src_msgs, sink_msgs,
+                      src_delay, sink_delay )
+    s.run_sim( th )
+
+#-------------------------------------------------------------------------
+# ProcXcel with multiple accelerators
+#-------------------------------------------------------------------------
+
+@pytest.mark.parametrize( "ProcType, XcelType", [
+  ( ProcFL,  ChecksumXcelFL  ),
+  ( ProcFL,  ChecksumXcelRTL ),
+  ( ProcRTL, ChecksumXcelRTL ),
+])
+def test_proc_multi_xcel( ProcType, XcelType ):
+  bmark = ubmark_cksum_xcel_multi.scaled( 12, seed=1 )
+
+  th = ProcXcelTestHarness( ProcType, XcelType, False, 0, 0, 0, 1,
+                            nxcels=bmark.nxcels )
+  th.elaborate()
+  th.load( bmark.gen_mem_image() )
+  th.apply( SimulationPass )
+  th.sim_reset()
+
+  ncycles = 0
+  while not th.done() and ncycles < 10000:
+    th.tick()
+    ncycles += 1
+
+  assert ncycles < 10000
+  assert bmark.verify( th.mem.mem.mem )
@@ -19,6 +19,7 @@ from pymtl3.stdlib.cl.MemoryCL import MemoryCL
 
 from examples.ex03_proc.NullXcel import NullXcelRTL
 from examples.ex03_proc.tinyrv0_encoding import assemble
+from examples.ex04_xcel.ProcXcel import ProcXcel
 
 #=========================================================================
 # TestHarness
@@ -57,7 +58,7 @@ class TestHarness(Component):
 
   def construct( s, proc_cls, xcel_cls, dump_vcd,
                  src_delay, sink_delay,
-                 mem_stall_prob, mem_latency ):
+                 mem_stall_prob, mem_latency, xcel_nbits=32, nxcels=1 ):
 
     s.commit_inst = OutPort( Bits1 )
     req, resp = mk_mem_msg( 8, 32, 32 )
@@ -65,7 +66,7 @@ class TestHarness(Component):
     s.src  = TestSrcCL ( Bits32, [], src_delay, src_delay  )
     s.sink = TestSinkCL( Bits32, [], sink_delay, sink_delay )
 
-    s.dut  = ProcXcel( proc_cls, xcel_cls )
+    s.dut  = ProcXcel( proc_cls, xcel_cls, xcel_nbits, nxcels )
 
     s.mem  = MemoryCL(2, latency = mem_latency)
 
@@ -77,8 +78,8 @@ class TestHarness(Component):
 
     # Processor <-> Memory
 
-    s.connect( s.proc.imem,  s.mem.ifc[0] )
-    s.connect( s.proc.dmem,  s.mem.ifc[1] )
+    s.connect( s.dut.imem,  s.mem.ifc[0] )
+    s.connect( s.dut.dmem,  s.mem.ifc[1] )
 
   #-----------------------------------------------------------------------
   # load
@@ -136,13 +137,13 @@ class TestHarness(Component):
 def run_test( ProcModel, XcelModel, gen_test, dump_vcd=None,
               src_delay=0, sink_delay=0,
               mem_stall_prob=0, mem_latency=1,
-              max_cycles=10000 ):
+              max_cycles=10000, xcel_nbits=32, nxcels=1 ):
 
   # Instantiate and elaborate the model
 
   th = TestHarness( ProcModel, XcelModel, dump_vcd,
                     src_delay, sink_delay,
-                    mem_stall_prob, mem_latency )
+                    mem_stall_prob, mem_latency, xcel_nbits, nxcels )
 
   th.elaborate()
 
@@ -0,0 +1,124 @@
+"""
+==========================================================================
+xcel_sweep_test.py
+==========================================================================
+Tests for the speedup sweep of proc-xcel-sim.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import io
+
+from examples.bmark_suite import BmarkConfig
+from ..xcel_sweep import (find_crossover, gen_sweep_configs, run_sweep,
+                          sweep_speedups, write_sweep_csv)
+
+def mk_row( size, speedup, proc="rtl", xcel="rtl" ):
+  return { "size": size, "proc": proc, "xcel": xcel, "proc_cycles": 0,
+           "xcel_cycles": 0, "speedup": speedup, "passed": speedup is not None }
+
+#-------------------------------------------------------------------------
+# gen_sweep_configs
+#-------------------------------------------------------------------------
+
+def test_gen_sweep_configs():
+  configs = gen_sweep_configs( [ 6, 12 ], [ ( "fl", "fl" ), ( "fl", "rtl" ),
+                                            ( "rtl", "rtl" ) ], seed=3 )
+  names = [ x.name for x in configs ]
+
+  # The processor-only run is shared by all pairs with the same processor
+
+  assert names == [
+    "cksum/fl+null@6",  "cksum/rtl+null@6",
+    "cksum-xcel/fl+fl@6", "cksum-xcel/fl+rtl@6", "cksum-xcel/rtl+rtl@6",
+    "cksum/fl+null@12", "cksum/rtl+null@12",
+    "cksum-xcel/fl+fl@12", "cksum-xcel/fl+rtl@12", "cksum-xcel/rtl+rtl@12",
+  ]
+  assert all( x.seed == 3 for x in configs )
+
+#-------------------------------------------------------------------------
+# sweep_speedups
+#-------------------------------------------------------------------------
+
+def test_sweep_speedups():
+  configs = gen_sweep_configs( [ 6 ], [ ( "cl", "cl" ), ( "cl", "rtl" ) ] )
+  results = [
+    { "passed": True,  "cycles": 300 },
+    { "passed": True,  "cycles": 200 },
+    { "passed": False, "cycles": 100 },
+  ]
+  rows = sweep_speedups( configs, results )
+
+  assert len( rows ) == 2
+  assert rows[0]["xcel"] == "cl" and rows[0]["proc_cycles"] == 300
+  assert rows[0]["speedup"] == 1.5 and rows[0]["passed"]
+  assert rows[1]["xcel"] == "rtl" and rows[1]["speedup"] is None
+  assert not rows[1]["passed"]
+
+#-------------------------------------------------------------------------
+# find_crossover
+#-------------------------------------------------------------------------
+
+def test_find_crossover():
+  rows = [ mk_row( 6, 0.5 ), mk_row( 12, 1.2 ), mk_row( 24, 0.9 ),
+           mk_row( 48, 1.0 ), mk_row( 96, 1.8 ) ]
+  rows += [ mk_row( 6, 0.2, "fl" ), mk_row( 12, 0.7, "fl" ) ]
+  rows += [ mk_row( 6, 1.1, "cl" ), mk_row( 12, 1.3, "cl" ) ]
+  rows += [ mk_row( 6, 1.5, "fl", "cl" ), mk_row( 12, None, "fl", "cl" ) ]
+
+  crossover = find_crossover( rows )
+  assert crossover[ ( "rtl", "rtl" ) ] == 48
+  assert crossover[ ( "fl",  "rtl" ) ] is None
+  assert crossover[ ( "cl",  "rtl" ) ] == 6
+  assert crossover[ ( "fl",  "cl"  ) ] is None
+
+#-------------------------------------------------------------------------
+# write_sweep_csv
+#-------------------------------------------------------------------------
+
+def test_write_sweep_csv():
+  f = io.StringIO() if str is not bytes else io.BytesIO()
+  write_sweep_csv( [ mk_row( 6, 0.5 ), mk_row( 12, None ) ], f )
+
+  assert f.getvalue().splitlines() == [
+    "size,proc,xcel,proc_cycles,xcel_cycles,speedup,passed",
+    "6,rtl,rtl,0,0,0.500,True",
+    "12,rtl,rtl,0,0,,False",
+  ]
+
+#-------------------------------------------------------------------------
+# run_sweep
+#-------------------------------------------------------------------------
+# The results of the worker processes come back in the order of the
+# configurations and match a serial run. The processor-only checksum
+# kernel needs the AND tutorial task, so we run the matrix multiplication
+# kernels instead.
+
+def test_run_sweep():
+  configs = []
+  for size in [ 3, 4 ]:
+    configs.append( BmarkConfig( "mmult", "fl", "null", size=size ) )
+    configs.append( BmarkConfig( "mmult-xcel", "fl", "fl-mul", size=size ) )
+
+  serial   = run_sweep( configs, njobs=1, limit=100000 )
+  parallel = run_sweep( configs, njobs=2, limit=100000 )
+
+  assert [ x["name"] for x in parallel ] == [ x.name for x in configs ]
+  assert [ x["cycles"] for x in parallel ] == [ x["cycles"] for x in serial ]
+  assert all( x["passed"] for x in parallel )
+
+# A configuration that raises is recorded as failed and does not stop the
+# others.
+
+def test_run_sweep_error():
+  configs = [ BmarkConfig( "mmult-xcel", "cl", "fl-mul", size=3 ),
+              BmarkConfig( "mmult-xcel", "nosuch", "fl-mul", size=3 ),
+              BmarkConfig( "mmult-xcel", "cl", "cl-mul", size=3 ) ]
+
+  results = run_sweep( configs, njobs=1, limit=100000 )
+
+  assert [ x["name"] for x in results ] == [ x.name for x in configs ]
+  assert not results[1]["passed"] and "KeyError" in results[1]["error"]
+  assert results[0]["passed"] and results[2]["passed"]
@@ -0,0 +1,127 @@
+"""
+==========================================================================
+ubmark-checksum-xcel-block: block checksums on a queued accelerator
+==========================================================================
+This code computes the checksum of every 16 byte block of the source
+using ChecksumXcelQueue. The blocks are independent, so the loop is
+software pipelined: the next block is issued before the result of the
+current one is read back, which keeps two jobs in flight and overlaps
+configuring the accelerator with computing the checksum.
+
+void cksum_xcel_blk( int *dest, int *src, int size ) {
+  xcel_issue( &src[0] );
+  for ( int i = 1; i < size; i++ ) {
+    xcel_issue( &src[i*4] );
+    dest[i-1] = xcel_result();
+  }
+  dest[size-1] = xcel_result();
+}
+
+It needs an accelerator with a completion queue at least two deep, the
+single job accelerators return the wrong results.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import align, gen_cksum_blk_data, mk_words_section, verify_words
+
+c_cksum_src_ptr = 0x2000;
+c_cksum_size    = 64;
+
+class ubmark_cksum_xcel_blk( object ):
+
+  name = "cksum-xcel-blk"
+
+  # issues the block x2 points to
+
+  issue = """
+        lw    x5,  0(x2)
+        lw    x6,  4(x2)
+        lw    x7,  8(x2)
+        lw    x8,  12(x2)
+        csrw  0x7E0, x5
+        csrw  0x7E1, x6
+        csrw  0x7E2, x7
+        csrw  0x7E3, x8
+        csrw  0x7E4, x4           # go
+        addi  x2,  x2,  16
+    """
+
+  # default dataset and where it lives in memory
+
+  size     = c_cksum_size
+  src, ref = gen_cksum_blk_data( c_cksum_size )
+  src_ptr  = c_cksum_src_ptr
+  dst_ptr  = align( c_cksum_src_ptr + 16 * c_cksum_size )
+
+  # returns a copy of the ubmark running on a generated dataset of the
+  # given number of 16-byte blocks
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size > 0
+    src, ref = gen_cksum_blk_data( size, seed )
+    return type( cls.__name__, ( cls, ), dict(
+      size=size, src=src, ref=ref, dst_ptr=align( c_cksum_src_ptr + 16 * size ) ) )
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( cls.name, memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    issue = cls.issue
+
+    # reads back the oldest result
+
+    collect = """
+        csrr  x9,  0x7E5
+        sw    x9,  0(x3)
+        addi  x3,  x3,  4
+    """
+
+    # text section
+
+    text = """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # size
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+        addi  x4,  x0,  1         # go bit
+    """.format( cls.size, cls.src_ptr, cls.dst_ptr ) + issue
+
+    if cls.size > 1:
+      text += """
+        addi  x1,  x1,  -1
+      loop_i:
+      """ + issue + collect + """
+        addi  x1,  x1,  -1        # decrement loop counter i
+        bne   x1,  x0,  loop_i
+      """
+
+    text += collect + """
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
@@ -0,0 +1,117 @@
+"""
+==========================================================================
+ubmark-checksum-xcel-multi: block checksums on several accelerators
+==========================================================================
+Same kernel as ubmark-checksum-xcel-block, but the blocks are spread
+round robin over nxcels single job checksum accelerators behind an
+XcelRouterRTL. Accelerator u has its registers at xr(8u)~xr(8u+7). The
+loop is software pipelined per accelerator: the result of one block is
+read back right before the next block is issued to the same accelerator,
+so all accelerators work in parallel.
+
+void cksum_xcel_multi( int *dest, int *src, int size ) {
+  for ( int u = 0; u < nxcels; u++ )
+    xcel_issue( u, &src[u*4] );
+  for ( int i = nxcels; i < size; i += nxcels ) {
+    for ( int u = 0; u < nxcels; u++ ) {
+      dest[i-nxcels+u] = xcel_result( u );
+      xcel_issue( u, &src[(i+u)*4] );
+    }
+  }
+  for ( int u = 0; u < nxcels; u++ )
+    dest[size-nxcels+u] = xcel_result( u );
+}
+
+The size has to be a multiple of nxcels.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+
+from examples.ex03_proc.ubmark.ubmark_data import mk_words_section
+from examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_blk import ubmark_cksum_xcel_blk
+
+c_cksum_nxcels = 4
+
+class ubmark_cksum_xcel_multi( ubmark_cksum_xcel_blk ):
+
+  name   = "cksum-xcel-multi"
+  nxcels = c_cksum_nxcels
+
+  @classmethod
+  def scaled( cls, size, seed=0 ):
+    assert size % cls.nxcels == 0, \
+      "size {} is not a multiple of {} accelerators!".format( size, cls.nxcels )
+    return super( ubmark_cksum_xcel_multi, cls ).scaled( size, seed )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # issues the block x2 points to on accelerator u
+
+    def issue( u ):
+      return """
+        lw    x5,  0(x2)
+        lw    x6,  4(x2)
+        lw    x7,  8(x2)
+        lw    x8,  12(x2)
+        csrw  {0:#x}, x5
+        csrw  {1:#x}, x6
+        csrw  {2:#x}, x7
+        csrw  {3:#x}, x8
+        csrw  {4:#x}, x4          # go
+        addi  x2,  x2,  16
+      """.format( *[ 0x7E0 + 8*u + i for i in range( 5 ) ] )
+
+    # reads back the result of accelerator u
+
+    def collect( u ):
+      return """
+        csrr  x9,  {:#x}
+        sw    x9,  0(x3)
+        addi  x3,  x3,  4
+      """.format( 0x7E5 + 8*u )
+
+    units = range( cls.nxcels )
+
+    # text section
+
+    text = """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # number of groups
+        csrr  x2,  mngr2proc < {:#x} # src pointer
+        csrr  x3,  mngr2proc < {:#x} # dst pointer
+        addi  x4,  x0,  1         # go bit
+    """.format( cls.size // cls.nxcels, cls.src_ptr, cls.dst_ptr )
+
+    text += "".join( issue( u ) for u in units )
+
+    if cls.size > cls.nxcels:
+      text += """
+        addi  x1,  x1,  -1
+      loop_i:
+      """ + "".join( collect( u ) + issue( u ) for u in units ) + """
+        addi  x1,  x1,  -1        # decrement loop counter i
+        bne   x1,  x0,  loop_i
+      """
+
+    text += "".join( collect( u ) for u in units ) + """
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.src_ptr, cls.src ) )
+
+    return mem_image
@@ -0,0 +1,32 @@
+"""
+==========================================================================
+ubmark-checksum-xcel-wide: block checksums over a wide xcel interface
+==========================================================================
+Same kernel as ubmark-checksum-xcel-block, but every block is issued
+with a single wide accelerator write. csrw 0x7A7, x5 sends x8, x7, x6
+and x5 to xr7 of ChecksumXcelQueue in one request, so issuing a block
+takes one accelerator instruction instead of five.
+
+It needs a processor and a queued accelerator with a 128-bit
+accelerator interface.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from examples.ex04_xcel.ubmark.proc_ubmark_cksum_xcel_blk import ubmark_cksum_xcel_blk
+
+class ubmark_cksum_xcel_wide( ubmark_cksum_xcel_blk ):
+
+  name = "cksum-xcel-wide"
+
+  # issues the block x2 points to
+
+  issue = """
+        lw    x5,  0(x2)
+        lw    x6,  4(x2)
+        lw    x7,  8(x2)
+        lw    x8,  12(x2)
+        csrw  0x7A7, x5           # wide issue of x8:x5
+        addi  x2,  x2,  16
+    """
@@ -0,0 +1,116 @@
+"""
+==========================================================================
+ubmark-mmult-xcel: matrix multiplication with the multiply accelerator
+==========================================================================
+This code multiplies two n x n matrices of 8-bit values in row-major
+order like ubmark-mmult, but every product is computed by the multiply
+accelerator instead of a shift-and-add loop. The pointer updates are
+placed between starting the multiply and reading back the product, so
+they overlap with the multiply.
+
+void mmult( int *dest, int *a, int *b, int n ) {
+  for ( int i = 0; i < n; i++ )
+    for ( int j = 0; j < n; j++ ) {
+      int sum = 0;
+      for ( int k = 0; k < n; k++ ) {
+        xr0 = a[i*n+k];
+        xr1 = b[k*n+j]; // starts the multiply
+        sum += xr2;
+      }
+      dest[i*n+j] = sum;
+    }
+}
+
+It uses the same datasets as ubmark-mmult, so the two can be compared
+cycle for cycle.
+
+Author : agent
+  Date : October 19, 2026
+"""
+
+from pymtl3 import *
+from examples.ex03_proc.tinyrv0_encoding  import assemble
+from examples.ex03_proc.SparseMemoryImage import SparseMemoryImage
+
+from examples.ex03_proc.ubmark.ubmark_data import mk_words_section, verify_words
+from examples.ex03_proc.ubmark.proc_ubmark_mmult import ubmark_mmult
+
+class ubmark_mmult_xcel( ubmark_mmult ):
+
+  # verification function, argument is a bytearray from TestMemory instance
+
+  @classmethod
+  def verify( cls, memory ):
+    return verify_words( "mmult-xcel", memory, cls.dst_ptr, cls.ref )
+
+  @classmethod
+  def gen_mem_image( cls ):
+
+    # text section
+
+    text =( """
+        # load array pointers
+        csrr  x1,  mngr2proc < {}     # n
+        csrr  x2,  mngr2proc < {:#x} # a pointer
+        csrr  x3,  mngr2proc < {:#x} # b pointer
+        csrr  x4,  mngr2proc < {:#x} # dst pointer
+
+        addi  x7,  x0,  2         # shift amount 2
+        sll   x8,  x1,  x7        # row size in bytes
+        add   x9,  x0,  x1        # i = n
+
+      loop_i:
+        add   x10, x0,  x3        # column of b
+        add   x11, x0,  x1        # j = n
+
+      loop_j:
+        add   x12, x0,  x0        # sum = 0
+        add   x13, x0,  x2        # pa = &a[i][0]
+        add   x14, x0,  x10       # pb = &b[0][j]
+        add   x15, x0,  x1        # k = n
+
+      loop_k:
+        lw    x16, 0(x13)         # a[i][k]
+        lw    x17, 0(x14)         # b[k][j]
+
+        # start the multiply
+        csrw  0x7E0, x16
+        csrw  0x7E1, x17
+
+        addi  x13, x13, 4
+        add   x14, x14, x8
+        addi  x15, x15, -1
+
+        # read back the product
+        csrr  x18, 0x7E2
+        add   x12, x12, x18       # sum += a * b
+        bne   x15, x0,  loop_k
+
+        sw    x12, 0(x4)          # dest[i][j] = sum
+        addi  x4,  x4,  4
+        addi  x10, x10, 4
+        addi  x11, x11, -1
+        bne   x11, x0,  loop_j
+
+        add   x2,  x2,  x8        # next row of a
+        addi  x9,  x9,  -1
+        bne   x9,  x0,  loop_i
+
+        # End of program
+        csrw  proc2mngr, x0 > 0
+        nop
+        nop
+        nop
+        nop
+        nop
+        nop
+    """.format( cls.size, cls.a_ptr, cls.b_ptr, cls.dst_ptr ) )
+
+    mem_image = assemble( text )
+
+    # load data
+
+    mem_image.add_section( mk_words_section( ".data", cls.a_ptr, cls.a ) )
+    mem_image.add_section( mk_words_section( ".data", cls.b_ptr, cls.b ) )
+
+    return mem_image
@@ -0,0 +1,149 @@
+"""
+==========================================================================
+xcel_sweep.py
+==========================================================================
+Sweeps the checksum ubmark over a range of data sizes and compares the
+processor-only kernel (ubmark-checksum on the processor with a null
+accelerator) against the accelerated one (ubmark-checksum-xcel) for a
+list of proc/xcel implementation pairs. The speedup of a pair at a size
+is the number of cycles of the processor-only kernel on the same
+processor divided by the number of cycles of the accelerated kernel.
+The processor-only kernel uses "and", so the processors only run it
+once the AND tutorial task is done; until then its runs fail and the
+speedups are empty.
+
+The configurations are independent, so they are farmed out to a pool
+of worker processes. The results are written as one CSV row per pair
+and size, and find_crossover reports the smallest size from which on
+the accelerator always wins.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import csv
+import multiprocessing
+
+from examples.bmark_suite import BmarkConfig, try_bmark_config
+
+# Both kernels need a multiple of 6 elements
+
+c_sweep_sizes = [ 6, 12, 24, 48, 96, 192, 384 ]
+c_sweep_pairs = [ ( "fl", "fl" ), ( "cl", "cl" ), ( "rtl", "rtl" ) ]
+
+c_sweep_fields = [ "size", "proc", "xcel", "proc_cycles", "xcel_cycles",
+                   "speedup", "passed" ]
+
+#-------------------------------------------------------------------------
+# gen_sweep_configs
+#-------------------------------------------------------------------------
+# One processor-only configuration per processor and size, which is
+# shared by all pairs with that processor, and one accelerated
+# configuration per pair and size.
+
+def gen_sweep_configs( sizes=c_sweep_sizes, pairs=c_sweep_pairs, seed=0 ):
+  configs = []
+
+  procs = []
+  for proc, _ in pairs:
+    if proc not in procs:
+      procs.append( proc )
+
+  for size in sizes:
+    for proc in procs:
+      configs.append( BmarkConfig( "cksum", proc, "null", size=size, seed=seed ) )
+    for proc, xcel in pairs:
+      configs.append( BmarkConfig( "cksum-xcel", proc, xcel, size=size, seed=seed ) )
+
+  return configs
+
+#-------------------------------------------------------------------------
+# run_sweep
+#-------------------------------------------------------------------------
+# Returns the results of try_bmark_config in the order of configs, so a
+# configuration that raises only fails itself. With njobs > 1 the
+# configurations run in that many worker processes.
+
+def _run_config( config_and_limit ):
+  config, limit = config_and_limit
+  return try_bmark_config( config, limit )
+
+def run_sweep( configs, njobs=1, limit=1000000 ):
+  args = [ ( config, limit ) for config in configs ]
+
+  if njobs <= 1:
+    return [ _run_config( x ) for x in args ]
+
+  pool = multiprocessing.Pool( njobs )
+  try:
+    return pool.map( _run_config, args, chunksize=1 )
+  finally:
+    pool.close()
+    pool.join()
+
+#-------------------------------------------------------------------------
+# sweep_speedups
+#-------------------------------------------------------------------------
+# Pairs every accelerated result with the processor-only result of the
+# same processor and size. The speedup is None if either run failed.
+
+def sweep_speedups( configs, results ):
+  base = {}
+  for config, result in zip( configs, results ):
+    if config.bmark == "cksum":
+      base[ ( config.proc, config.size ) ] = result
+
+  rows = []
+  for config, result in zip( configs, results ):
+    if config.bmark == "cksum":
+      continue
+    ref    = base[ ( config.proc, config.size ) ]
+    passed = ref["passed"] and result["passed"]
+    rows.append({
+      "size"       : config.size,
+      "proc"       : config.proc,
+      "xcel"       : config.xcel,
+      "proc_cycles": ref["cycles"],
+      "xcel_cycles": result["cycles"],
+      "speedup"    : ref["cycles"] / float( result["cycles"] )
+                     if passed and result["cycles"] else None,
+      "passed"     : passed,
+    })
+
+  return rows
+
+#-------------------------------------------------------------------------
+# find_crossover
+#-------------------------------------------------------------------------
+# Returns a dict from ( proc, xcel ) to the smallest swept size from
+# which on the speedup is at least one for every larger size, or None if
+# the accelerator does not win at the largest size.
+
+def find_crossover( rows ):
+  curves = {}
+  for row in rows:
+    curves.setdefault( ( row["proc"], row["xcel"] ), [] ).append( row )
+
+  crossover = {}
+  for pair, curve in curves.items():
+    crossover[ pair ] = None
+    for row in sorted( curve, key=lambda x: x["size"], reverse=True ):
+      if row["speedup"] is None or row["speedup"] < 1:
+        break
+      crossover[ pair ] = row["size"]
+
+  return crossover
+
+#-------------------------------------------------------------------------
+# write_sweep_csv
+#-------------------------------------------------------------------------
+
+def write_sweep_csv( rows, f ):
+  writer = csv.DictWriter( f, fieldnames=c_sweep_fields, lineterminator="\n" )
+  writer.writeheader()
+  for row in rows:
+    row = dict( row )
+    if row["speedup"] is not None:
+      row["speedup"] = "{:.3f}".format( row["speedup"] )
+    writer.writerow( row )
@@ -0,0 +1,330 @@
+"""
+==========================================================================
+translation_cache.py
+==========================================================================
+Persistent cache for yosys translation and import. The yosys
+TranslationPass and ImportPass always start from scratch in the current
+directory, so every translated run pays for a full translation and
+Verilator build even when the design did not change.
+
+Here every component tagged with yosys_translate gets a cache entry
+keyed by a hash of its elaborated structure: the source files of all
+component classes in its hierarchy and of the project modules they
+import, directly or through other modules, their construction
+arguments, their ports and wires, and their connections. Translation
+writes the SystemVerilog into a temporary directory which is then
+renamed to the entry, so that concurrent runs never see a half-written
+entry, and import builds the Verilator model in the entry while holding
+a lock on it. A later run with the same key skips translation, and the
+existing ImportPass caching then reuses the compiled library as long as
+the SystemVerilog is marked unchanged.
+
+The cache lives in $PYMTL_TRANSLATION_CACHE, or in
+~/.cache/pymtl-tutorial/translation if the variable is not set. Entries
+are never evicted; simply delete the directory to clear the cache.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+import ast
+import errno
+import fcntl
+import hashlib
+import inspect
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+import pymtl3
+from pymtl3.passes.BasePass import PassMetadata
+from pymtl3.passes.rtlir import get_component_ifc_rtlir
+from pymtl3.passes.sverilog.util.utility import get_component_unique_name
+from pymtl3.passes.yosys import ImportPass, TranslationPass
+
+#-------------------------------------------------------------------------
+# Helpers
+#-------------------------------------------------------------------------
+
+def get_cache_dir():
+  cache_dir = os.environ.get( "PYMTL_TRANSLATION_CACHE" )
+  if not cache_dir:
+    cache_dir = os.path.join( os.path.expanduser( "~" ), ".cache",
+                              "pymtl-tutorial", "translation" )
+  return cache_dir
+
+# Object addresses in reprs change from run to run
+
+_addr_re = re.compile( r" at 0x[0-9a-fA-F]+" )
+
+def _stable_repr( obj ):
+  return _addr_re.sub( "", repr( obj ) )
+
+# Modules outside of the project are covered by the pymtl3 version
+
+_project_root = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+def _source_file( module ):
+  path = getattr( module, "__file__", None )
+  if not path:
+    return None
+  path = os.path.abspath( path )
+  if path.endswith( ( ".pyc", ".pyo" ) ):
+    path = path[:-1]
+  return path
+
+def _get_tagged_components( m, attr ):
+  if getattr( m, attr, False ):
+    return [ m ]
+  ret = []
+  for child in sorted( m.get_child_components(), key=str ):
+    ret.extend( _get_tagged_components( child, attr ) )
+  return ret
+
+#-------------------------------------------------------------------------
+# get_source_files
+#-------------------------------------------------------------------------
+# The source files of the component classes in the hierarchy of m and of
+# their base classes, plus every project module that these modules reach
+# through their import statements, e.g. the instruction tables and the
+# performance counter layout that ProcRTL imports. Only modules that are
+# already loaded are followed.
+
+def _imported_modules( module, path ):
+  with open( path ) as f:
+    tree = ast.parse( f.read(), path )
+
+  package = module.__name__
+  if not path.endswith( "__init__.py" ):
+    package = package.rpartition( "." )[0]
+
+  names = []
+  for node in ast.walk( tree ):
+    if isinstance( node, ast.Import ):
+      names.extend( [ x.name for x in node.names ] )
+
+    elif isinstance( node, ast.ImportFrom ):
+      base = node.module or ""
+      if node.level:
+        parts = package.split( "." )
+        parts = parts[ :len( parts ) - node.level + 1 ]
+        base  = ".".join( parts + ( [ base ] if base else [] ) )
+      names.append( base )
+      names.extend( [ base + "." + x.name for x in node.names ] )
+
+  return [ sys.modules.get( x ) for x in names ]
+
+def get_source_files( m ):
+  src_files = set()
+  modules   = []
+
+  stack = [ m ]
+  while stack:
+    c = stack.pop()
+    for cls in inspect.getmro( type(c) ):
+      try:
+        src_files.add( os.path.abspath( inspect.getsourcefile( cls ) ) )
+      except TypeError:
+        pass
+      modules.append( sys.modules.get( cls.__module__ ) )
+    stack.extend( c.get_child_components() )
+
+  seen = set()
+  while modules:
+    module = modules.pop()
+    if module is None or id( module ) in seen:
+      continue
+    seen.add( id( module ) )
+
+    path = _source_file( module )
+    if path is None or not path.startswith( _project_root + os.sep ):
+      continue
+    src_files.add( path )
+
+    modules.extend( _imported_modules( module, path ) )
+
+  return sorted( src_files )
+
+#-------------------------------------------------------------------------
+# structure_hash
+#-------------------------------------------------------------------------
+# Hash of everything that the translated SystemVerilog depends on. The
+# component has to be elaborated.
+
+def structure_hash( m ):
+  h = hashlib.sha1()
+
+  h.update( "pymtl3 {} python {}\n".format(
+            pymtl3.__version__, sys.version_info[:2] ).encode( "utf-8" ) )
+
+  def update( *args ):
+    h.update( ( " ".join( [ str(x) for x in args ] ) + "\n" ).encode( "utf-8" ) )
+
+  # Names are taken relative to m so that the same component gets the
+  # same hash no matter where it is instantiated
+
+  prefix = str(m)
+
+  def name( x ):
+    x = _stable_repr( x ) if not hasattr( x, "_dsl" ) else str(x)
+    if x.startswith( prefix ):
+      return "s" + x[ len(prefix): ]
+    return x
+
+  stack = [ m ]
+  while stack:
+    c = stack.pop()
+
+    cls = type(c)
+    update( "component", name(c), cls.__module__, cls.__name__ )
+    update( "args", _stable_repr( c._dsl.args ),
+            _stable_repr( sorted( c._dsl.kwargs.items() ) ) )
+
+    for kind, signals in [ ( "in",   c.get_input_value_ports()  ),
+                           ( "out",  c.get_output_value_ports() ),
+                           ( "wire", c.get_wires()              ) ]:
+      for x in sorted( signals, key=str ):
+        update( kind, name(x), _stable_repr( x._dsl.Type ) )
+
+    for x, y in c.get_connect_order():
+      update( "connect", name(x), name(y) )
+
+    stack.extend( sorted( c.get_child_components(), key=str ) )
+
+  for src_file in get_source_files( m ):
+    with open( src_file, "rb" ) as f:
+      h.update( f.read() )
+
+  return h.hexdigest()
+
+#-------------------------------------------------------------------------
+# get_cache_entry
+#-------------------------------------------------------------------------
+# The entry only exists once a translation has been completely written
+# into it.
+
+def get_cache_entry( m, cache_dir=None ):
+  if cache_dir is None:
+    cache_dir = get_cache_dir()
+
+  full_name = get_component_unique_name( get_component_ifc_rtlir( m ) )
+  entry     = os.path.join( cache_dir, "{}-{}".format( type(m).__name__,
+                                                       structure_hash( m )[:16] ) )
+  return entry, full_name
+
+# Translates m into a temporary directory next to the entry and renames
+# it to the entry. If another run created the entry in the meantime its
+# translation is kept.
+
+def _translate_into( m, entry ):
+  cache_dir = os.path.dirname( entry )
+  if not os.path.isdir( cache_dir ):
+    try:
+      os.makedirs( cache_dir )
+    except OSError as e:
+      if e.errno != errno.EEXIST:
+        raise
+
+  tmp_dir = tempfile.mkdtemp( prefix=".tmp-", dir=cache_dir )
+  cwd     = os.getcwd()
+  os.chdir( tmp_dir )
+  try:
+    TranslationPass()( m )
+  finally:
+    os.chdir( cwd )
+
+  try:
+    os.rename( tmp_dir, entry )
+  except OSError:
+    if not os.path.isdir( entry ):
+      shutil.rmtree( tmp_dir, ignore_errors=True )
+      raise
+    shutil.rmtree( tmp_dir, ignore_errors=True )
+    return False
+
+  return True
+
+# Exclusive lock on an entry, held while Verilator builds in it
+
+class _EntryLock( object ):
+
+  def __init__( self, entry ):
+    self.path = os.path.join( entry, ".lock" )
+
+  def __enter__( self ):
+    self.f = open( self.path, "a" )
+    fcntl.flock( self.f, fcntl.LOCK_EX )
+    return self
+
+  def __exit__( self, *args ):
+    fcntl.flock( self.f, fcntl.LOCK_UN )
+    self.f.close()
+
+#-------------------------------------------------------------------------
+# cached_translate
+#-------------------------------------------------------------------------
+# Translate every component tagged with yosys_translate, reusing cached
+# SystemVerilog when possible. The translated file is also copied to the
+# current directory, where TranslationPass would have put it. Returns a
+# list of the paths of the copies.
+
+def cached_translate( top, cache_dir=None, verbose=True ):
+  if not top._dsl.constructed:
+    top.elaborate()
+
+  cwd   = os.getcwd()
+  paths = []
+
+  for m in _get_tagged_components( top, "yosys_translate" ):
+    entry, full_name = get_cache_entry( m, cache_dir )
+    sv_file = full_name + ".sv"
+
+    if os.path.isfile( os.path.join( entry, sv_file ) ) or \
+       not _translate_into( m, entry ):
+      if verbose:
+        print( "Reusing cached translation of {} in {}".format( full_name, entry ) )
+      m._pass_yosys_translation            = PassMetadata()
+      m._pass_yosys_translation.is_same    = True
+      m._pass_yosys_translation.translated = True
+
+    m._translation_cache_entry = entry
+
+    path = os.path.join( cwd, sv_file )
+    shutil.copyfile( os.path.join( entry, sv_file ), path )
+    paths.append( path )
+
+  return paths
+
+#-------------------------------------------------------------------------
+# cached_import
+#-------------------------------------------------------------------------
+# Import every component tagged with yosys_import from its cache entry,
+# so the Verilator build products are kept next to the cached
+# SystemVerilog. cached_translate has to be applied first. Returns the
+# new top component like ImportPass does.
+
+def cached_import( top ):
+  cwd = os.getcwd()
+  ret = top
+
+  import_pass = ImportPass()
+  import_pass.top = top
+
+  for m in _get_tagged_components( top, "yosys_import" ):
+    assert hasattr( m, "_translation_cache_entry" ), \
+      "Please apply cached_translate to {} before cached_import!".format( m )
+
+    with _EntryLock( m._translation_cache_entry ):
+      os.chdir( m._translation_cache_entry )
+      try:
+        imp = import_pass.do_import( m )
+      finally:
+        os.chdir( cwd )
+
+    if m is top:
+      ret = imp
+
+  return ret
@@ -0,0 +1,150 @@
+"""
+==========================================================================
+upblk_profiler.py
+==========================================================================
+Update block profiler for models simulated with DynamicSim. The
+profiler applies the simulation passes one by one and records how long
+each of them takes, which is the one-time cost of elaborating and
+scheduling the model. It then replaces every block in the schedule with
+a wrapper that counts the calls to the block and accumulates the host
+time spent in it, so the simulation runs as usual through tick() and
+the profile fills in along the way.
+
+The schedule holds three kinds of blocks:
+
+ - update blocks of the components, named after their host component,
+   e.g., s.proc.dpath.up_alu_X or s.dut.steps[3].up_step,
+ - blocks generated for connections, named after the net they drive,
+ - blocks generated for strongly connected components of the schedule,
+   which call their members in a loop and are profiled as a whole.
+
+Timing every block adds host overhead, so the absolute numbers are
+pessimistic, but the ranking tells which blocks to look at first when
+simulation speed drops. Blocks can also be grouped by component class
+and block name to add up, e.g., the eight step units of ChecksumRTL.
+
+Author : agent
+  Date : October 19, 2026
+"""
+from __future__ import absolute_import, division, print_function
+
+from timeit import default_timer as timer
+
+from pymtl3.passes import DynamicSim
+
+#-------------------------------------------------------------------------
+# UpblkStats
+#-------------------------------------------------------------------------
+
+class UpblkStats( object ):
+
+  def __init__( self, name, cls_name ):
+    self.name     = name
+    self.cls_name = cls_name
+    self.ncalls   = 0
+    self.time     = 0.0
+
+#-------------------------------------------------------------------------
+# UpblkProfiler
+#-------------------------------------------------------------------------
+
+class UpblkProfiler( object ):
+
+  def __init__( self ):
+    self.pass_times = []
+    self.stats      = []
+
+  #-----------------------------------------------------------------------
+  # apply
+  #-----------------------------------------------------------------------
+  # Applies the passes to the model, timing each of them, and wraps the
+  # resulting schedule.
+
+  def apply( self, model, passes=DynamicSim ):
+    for step in passes:
+      start = timer()
+      model.apply( step )
+      name = getattr( step, "__name__", type( step ).__name__ )
+      self.pass_times.append( ( name, timer() - start ) )
+
+    self.wrap_schedule( model )
+
+  #-----------------------------------------------------------------------
+  # wrap_schedule
+  #-----------------------------------------------------------------------
+  # The tick function generated by SimpleTickPass iterates over the
+  # schedule list, so we wrap the blocks in place. CLLineTracePass puts
+  # its own copy of the schedule in _cl_trace.
+
+  def wrap_schedule( self, model ):
+    if hasattr( model, "_cl_trace" ):
+      schedule = model._cl_trace.schedule
+    else:
+      schedule = model._sched.schedule
+
+    hostobj = model._dsl.all_upblk_hostobj
+    genblks = model._dag.genblks
+
+    for i, blk in enumerate( schedule ):
+      if blk in hostobj:
+        host  = hostobj[ blk ]
+        stats = UpblkStats( "{}.{}".format( repr( host ), blk.__name__ ),
+                            "{}.{}".format( type( host ).__name__, blk.__name__ ) )
+      elif blk in genblks:
+        stats = UpblkStats( "<net> " + blk.__name__, "<net>" )
+      else:
+        stats = UpblkStats( "<sched> " + blk.__name__, "<sched>" )
+
+      self.stats.append( stats )
+      schedule[i] = self._wrap( blk, stats )
+
+  @staticmethod
+  def _wrap( blk, stats ):
+    def profiled_blk():
+      start = timer()
+      blk()
+      stats.time   += timer() - start
+      stats.ncalls += 1
+    profiled_blk.__name__ = blk.__name__
+    return profiled_blk
+
+  #-----------------------------------------------------------------------
+  # ranked
+  #-----------------------------------------------------------------------
+  # Returns ( name, ncalls, time ) tuples with the most expensive first.
+  # With by_class, blocks of the same component class and name are
+  # added up.
+
+  def ranked( self, by_class=False ):
+    totals = {}
+    for x in self.stats:
+      name  = x.cls_name if by_class else x.name
+      entry = totals.setdefault( name, [ 0, 0.0 ] )
+      entry[0] += x.ncalls
+      entry[1] += x.time
+
+    return sorted( [ ( name, ncalls, time ) for name, ( ncalls, time )
+                     in totals.items() ], key=lambda x: ( -x[2], x[0] ) )
+
+  #-----------------------------------------------------------------------
+  # print_profile
+  #-----------------------------------------------------------------------
+
+  def print_profile( self, ntop=None, by_class=False ):
+
+    print( "  {:<24} {:>10}".format( "pass", "time(ms)" ) )
+    for name, time in self.pass_times:
+      print( "  {:<24} {:>10.1f}".format( name, time * 1e3 ) )
+    print( "  {} blocks in the schedule".format( len( self.stats ) ) )
+    print()
+
+    rows  = self.ranked( by_class )
+    total = sum( [ x[2] for x in rows ] ) or 1.0
+
+    print( "  {:>10} {:>10} {:>6} {:>9}  {}".format(
+           "calls", "time(ms)", "%", "us/call", "block" ) )
+
+    for name, ncalls, time in rows[:ntop]:
+      print( "  {:>10} {:>10.1f} {:>5.1f}% {:>9.2f}  {}".format(
+             ncalls, time * 1e3, 100.0 * time / total,
+             time * 1e6 / ncalls if ncalls else 0.0, name ) )